@@ -34,6 +34,7 @@ class AgentB_BatchFactory:
         self.max_parallel = max_parallel
         self.output_dir = Path("output/batch_factory")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.projects_dir = project_root / "prometheus_novel" / "data" / "projects"
         
         self.queue = []
         self.in_progress = []
@@ -65,88 +66,62 @@ class AgentB_BatchFactory:
         from development_agents.agent_t_template_manager import AgentT_TemplateManager
         template_mgr = AgentT_TemplateManager()
         
-        # Apply template to each topic
+        # Apply template to each topic -> one pipeline project per book
         print("📋 Applying templates...")
-        configs = []
+        project_paths = []
         for topic in topics:
             print(f"   Configuring: {topic}")
-            config_path = f"configs/{topic.lower().replace(' ', '_')}_batch.yaml"
-            config = template_mgr.apply_template(template_name, topic, config_path)
+            slug = topic.lower().replace(' ', '-')
+            project_dir = self.projects_dir / slug
+            config_path = project_dir / "config.yaml"
+            if config_path.exists():
+                # Keep existing config (and its checkpoint) so reruns resume
+                project_paths.append(project_dir)
+                continue
+            config = template_mgr.apply_template(template_name, topic, str(config_path))
             if config:
-                configs.append({
-                    "topic": topic,
-                    "config_path": config_path,
-                    "config": config
-                })
-        
-        print(f"\n✅ Configured {len(configs)} books")
-        
-        # Generate books in parallel batches
+                config.setdefault("project_name", slug)
+                config.setdefault("title", config.get("metadata", {}).get("title", topic))
+                with open(config_path, 'w') as f:
+                    yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                project_paths.append(project_dir)
+
+        print(f"\n✅ Configured {len(project_paths)} books")
+
+        # Continuous queue: each worker picks up the next book as soon as it
+        # finishes one; model limits and caches are shared across all books
         print(f"\n🏭 Starting batch generation...")
-        
+        from batch.engine import BatchEngine
+        engine = BatchEngine(project_paths, output_dir=self.output_dir, max_books=parallel)
+        report = await engine.run()
+
         results = []
-        for i in range(0, len(configs), parallel):
-            batch = configs[i:i+parallel]
-            
-            print(f"\n📦 Batch {i//parallel + 1}: Generating {len(batch)} books in parallel...")
-            
-            # Create tasks for parallel execution
-            tasks = [
-                self.generate_single_book(config['topic'], config['config_path'])
-                for config in batch
-            ]
-            
-            # Execute in parallel
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for config, result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    print(f"   ❌ {config['topic']}: {result}")
-                    self.failed.append(config['topic'])
-                else:
-                    print(f"   ✅ {config['topic']}: {result['total_words']} words")
-                    self.completed.append(result)
-                    results.append(result)
-            
-            # Brief pause between batches
-            if i + parallel < len(configs):
-                print(f"\n⏸️  Pausing 30 seconds before next batch...")
-                await asyncio.sleep(30)
-        
+        for job in engine.jobs:
+            topic = job.name
+            if job.status == "completed":
+                result = {
+                    "topic": topic,
+                    "status": "completed",
+                    "total_words": job.words,
+                    "tokens": job.tokens,
+                    "cost_usd": job.cost_usd,
+                    "generated_at": datetime.now().isoformat()
+                }
+                print(f"   ✅ {topic}: {job.words} words")
+                self.completed.append(result)
+                results.append(result)
+            else:
+                print(f"   ❌ {topic}: {job.error}")
+                self.failed.append(topic)
+
+        print(f"\n⚡ Throughput: {report.books_per_hour:.2f} books/hour, "
+              f"{report.tokens_per_sec:.1f} tokens/sec")
+
         # Generate batch report
         self.generate_batch_report(results)
-        
+
         return results
-    
-    async def generate_single_book(self, topic: str, config_path: str):
-        """Generate a single book"""
-        
-        print(f"\n   📖 Generating: {topic}")
-        
-        try:
-            # Use Agent 02 to generate all chapters
-            from prometheus_lib.agents.agent_02_technical_writer_pro import Agent02TechnicalWriterPro
-            
-            writer = Agent02TechnicalWriterPro(config_path)
-            
-            # Generate all chapters
-            results = await writer.write_all_chapters()
-            
-            total_words = sum(r['word_count'] for r in results if r)
-            
-            return {
-                "topic": topic,
-                "status": "completed",
-                "chapters": len(results),
-                "total_words": total_words,
-                "generated_at": datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            print(f"   ❌ Error generating {topic}: {e}")
-            raise
-    
+
     def generate_batch_report(self, results: List[Dict]):
         """Generate comprehensive batch report"""
         
@@ -295,7 +270,7 @@ if __name__ == "__main__":
         print("  python agent_b_batch_factory.py batch technical_mastery 'Excel' 'SQL' 'Python'")
         print("  python agent_b_batch_factory.py series 'Power BI'")
         print("")
-        print("⚠️  Note: Requires Agent T templates and Agent 02 writer to be set up")
+        print("⚠️  Note: Requires Agent T templates; books run through the full pipeline")
         print("")
         print("First, create templates with:")
         print("  python agent_t_template_manager.py create-defaults")
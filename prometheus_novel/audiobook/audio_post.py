@@ -220,6 +220,24 @@ def export_chapter_mp3(audio: AudioSegment, output_path: Path) -> Path:
     return output_path
 
 
+# ---------------------------------------------------------------------------
+# Chapter assembly (process-pool entry point)
+# ---------------------------------------------------------------------------
+
+def render_chapter_audio(chunk_paths: List[str], output_path: str) -> Dict[str, Any]:
+    """Assemble cached chunk files into one ACX-ready MP3 and validate it.
+
+    Top-level and argument-only so it can run in a ProcessPoolExecutor:
+    decoding, normalization and MP3 encoding are CPU-bound.
+    """
+    chunks = [Path(p).read_bytes() for p in chunk_paths]
+    combined = concatenate_chunks(chunks)
+    combined = add_room_tone(combined)
+    combined = normalize_to_acx(combined)
+    export_chapter_mp3(combined, Path(output_path))
+    return validate_acx_compliance(combined)
+
+
 # ---------------------------------------------------------------------------
 # Filename sanitization
 # ---------------------------------------------------------------------------
@@ -0,0 +1,47 @@
+"""Content-addressed cache for synthesized TTS chunks.
+
+Every SSML chunk is keyed by a hash of exactly what the TTS service sees
+(SSML, voice, rate, pitch). Reruns — including ``--force`` after editing a
+single scene — re-synthesize only the chunks whose key changed.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+
+def chunk_key(ssml: str, voice_name: str, speaking_rate: float, pitch: float) -> str:
+    """Stable content hash for one synthesis request."""
+    payload = json.dumps(
+        [ssml, voice_name, round(float(speaking_rate), 4), round(float(pitch), 4)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ChunkCache:
+    """On-disk MP3 chunk store: ``<root>/<key[:2]>/<key>.mp3``."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.mp3"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached chunk path, or None on a miss."""
+        path = self.path_for(key)
+        if path.exists() and path.stat().st_size > 0:
+            return path
+        return None
+
+    def put(self, key: str, audio_bytes: bytes) -> Path:
+        """Write a chunk atomically so an interrupted run never leaves a torn file."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(audio_bytes)
+        os.replace(tmp, path)
+        return path
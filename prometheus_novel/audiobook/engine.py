@@ -2,22 +2,30 @@
 
 Uses Google Cloud Text-to-Speech (Neural2 voices) with multi-voice support
 for dual-POV novels. Follows the BookOpsEngine pattern.
+
+SSML chunks from all chapters are synthesized concurrently and persisted to
+a content-addressed chunk cache, so reruns only pay for changed text.
+Chapter assembly and ACX normalization run in a process pool.
 """
 
+import asyncio
 import json
 import logging
+import os
 import re
 import shutil
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 _SSML_TAG_RE = re.compile(r'<[^>]+>')
 
 import yaml
 
 from prometheus_novel.audiobook.tts_client import TTSClient
+from prometheus_novel.audiobook.chunk_cache import ChunkCache, chunk_key
 from prometheus_novel.audiobook.ssml import (
     build_chapter_ssml,
     chunk_ssml,
@@ -27,16 +35,28 @@ from prometheus_novel.audiobook.ssml import (
     CLOSING_CREDITS_SSML,
 )
 from prometheus_novel.audiobook.audio_post import (
-    concatenate_chunks,
-    normalize_to_acx,
-    validate_acx_compliance,
-    add_room_tone,
-    export_chapter_mp3,
+    render_chapter_audio,
     sanitize_filename,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+
+@dataclass(frozen=True)
+class _ChunkJob:
+    """One TTS request: an SSML chunk plus the voice settings it is spoken with."""
+
+    ssml: str
+    voice: str
+    speaking_rate: float
+    pitch: float
+
+    @property
+    def key(self) -> str:
+        return chunk_key(self.ssml, self.voice, self.speaking_rate, self.pitch)
+
 
 # ---------------------------------------------------------------------------
 # AudiobookEngine
@@ -52,17 +72,41 @@ class AudiobookEngine:
     audiobook_config: Dict[str, Any]
     tts_client: Optional[TTSClient] = None
     output_dir: Optional[Path] = None
+    chunk_cache: Optional[ChunkCache] = None
+    # Chapter assembly runs here; a ProcessPoolExecutor is created per run if unset
+    assembly_executor: Optional[Executor] = None
 
     # Progress tracking
     _generated_files: List[str] = field(default_factory=list)
     _skipped_files: List[str] = field(default_factory=list)
     _errors: List[str] = field(default_factory=list)
     _total_chars: int = 0
+    _chunks_synthesized: int = 0
+    _chunks_cached: int = 0
+    _synth_tasks: Dict[str, "asyncio.Future"] = field(default_factory=dict)
+    _synth_semaphore: Optional[asyncio.Semaphore] = None
+    _executor: Optional[Executor] = None
+
+    def __post_init__(self):
+        if self.chunk_cache is None and self.project_path is not None:
+            cache_dir = self.audiobook_config.get("chunk_cache_dir")
+            self.chunk_cache = ChunkCache(
+                Path(cache_dir) if cache_dir else Path(self.project_path) / "audiobook_cache"
+            )
 
     @classmethod
-    def from_config_path(cls, config_path: Path) -> "AudiobookEngine":
+    def from_config_path(
+        cls,
+        config_path: Path,
+        tts_client: Optional[TTSClient] = None,
+    ) -> "AudiobookEngine":
         """Factory: load config + scenes, validate prerequisites.
 
+        Args:
+            config_path: Project config.yaml.
+            tts_client: Any object with TTSClient's async ``synthesize``
+                signature. Defaults to the Google Cloud client.
+
         Raises:
             FileNotFoundError: config or pipeline_state.json missing.
             ValueError: No scenes with content found.
@@ -106,6 +150,7 @@ class AudiobookEngine:
         ab_config.setdefault("speaking_rate", 0.95)
         ab_config.setdefault("pitch", 0)
         ab_config.setdefault("narrator_credit", "AI Narrator")
+        ab_config.setdefault("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS)
 
         # Validate FFmpeg
         _check_ffmpeg()
@@ -113,7 +158,8 @@ class AudiobookEngine:
         output_dir = project_path / "audiobook"
 
         # Initialize TTS client
-        tts_client = TTSClient.create()
+        if tts_client is None:
+            tts_client = TTSClient.create()
 
         engine = cls(
             project_path=project_path,
@@ -172,85 +218,143 @@ class AudiobookEngine:
         return dict(sorted(chapters.items()))
 
     # ------------------------------------------------------------------
-    # Chapter audio generation
+    # Chunk planning
     # ------------------------------------------------------------------
 
-    async def _generate_chapter_audio(
+    def _plan_chapter_chunks(
         self,
         chapter_num: int,
         scenes: List[Dict[str, Any]],
-    ) -> Path:
-        """Generate a single chapter MP3 file.
+    ) -> List[_ChunkJob]:
+        """Split a chapter into TTS requests.
 
-        Handles multi-voice chapters by processing scene-by-scene
-        when different POV characters use different voices.
+        Mixed-voice chapters are planned scene by scene so each POV keeps
+        its own voice; single-voice chapters are chunked as a whole.
         """
-        logger.info(f"  Generating Chapter {chapter_num} ({len(scenes)} scenes)...")
+        rate = self.audiobook_config["speaking_rate"]
+        pitch = self.audiobook_config["pitch"]
 
-        # Check if chapter has mixed voices
         voices_in_chapter = set(self._resolve_voice(s) for s in scenes)
-        is_multi_voice = len(voices_in_chapter) > 1
-
-        all_audio_chunks: List[bytes] = []
-
-        if is_multi_voice:
-            # Process scene by scene to switch voices
+        if len(voices_in_chapter) > 1:
+            jobs: List[_ChunkJob] = []
             for i, scene in enumerate(scenes):
                 voice = self._resolve_voice(scene)
                 scene_ssml = build_chapter_ssml(
                     chapter_num if i == 0 else None,  # Header only on first scene
                     [scene],
                 )
-                chunks = chunk_ssml(scene_ssml)
-                for chunk in chunks:
-                    audio_bytes = await self.tts_client.synthesize(
-                        ssml=chunk,
-                        voice_name=voice,
-                        speaking_rate=self.audiobook_config["speaking_rate"],
-                        pitch=self.audiobook_config["pitch"],
-                    )
-                    all_audio_chunks.append(audio_bytes)
-                    self._total_chars += len(_SSML_TAG_RE.sub('', chunk))
-        else:
-            # Single voice — process entire chapter at once
-            voice = self._resolve_voice(scenes[0])
-            chapter_ssml = build_chapter_ssml(chapter_num, scenes)
-            chunks = chunk_ssml(chapter_ssml)
-            for chunk in chunks:
-                audio_bytes = await self.tts_client.synthesize(
-                    ssml=chunk,
-                    voice_name=voice,
-                    speaking_rate=self.audiobook_config["speaking_rate"],
-                    pitch=self.audiobook_config["pitch"],
+                jobs.extend(
+                    _ChunkJob(chunk, voice, rate, pitch) for chunk in chunk_ssml(scene_ssml)
                 )
-                all_audio_chunks.append(audio_bytes)
-                self._total_chars += len(_SSML_TAG_RE.sub('', chunk))
+            return jobs
 
-        # Concatenate + post-process
-        combined = concatenate_chunks(all_audio_chunks)
-        combined = add_room_tone(combined)
-        combined = normalize_to_acx(combined)
+        voice = self._resolve_voice(scenes[0])
+        chapter_ssml = build_chapter_ssml(chapter_num, scenes)
+        return [_ChunkJob(chunk, voice, rate, pitch) for chunk in chunk_ssml(chapter_ssml)]
 
-        # Validate
-        compliance = validate_acx_compliance(combined)
-        if not compliance["compliant"]:
-            for issue in compliance["issues"]:
-                logger.warning(f"  ACX issue in Ch{chapter_num}: {issue}")
+    def _plan_credits_chunks(self, credits_type: str) -> List[_ChunkJob]:
+        """Opening or closing credits as a single TTS request."""
+        title = self.config.get("title", "Untitled")
+        author = self.config.get("author", "the author")
+        narrator = self.audiobook_config.get("narrator_credit", "the narrator")
+
+        if credits_type == "opening":
+            ssml = OPENING_CREDITS_SSML.format(
+                title=title, author=author, narrator=narrator,
+            )
+        else:
+            year = datetime.now().year
+            ssml = CLOSING_CREDITS_SSML.format(
+                title=title, author=author, narrator=narrator, year=year,
+            )
+
+        # Slower for credits
+        return [_ChunkJob(ssml, self.audiobook_config["voice_default"], 0.9, 0.0)]
+
+    # ------------------------------------------------------------------
+    # Chunk synthesis (concurrent, content-addressed)
+    # ------------------------------------------------------------------
+
+    async def _synthesize_chunk(self, job: _ChunkJob) -> Path:
+        """Return the cached MP3 for a chunk, synthesizing it at most once.
+
+        Identical chunks requested by several chapters share one in-flight task.
+        """
+        key = job.key
+        task = self._synth_tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._synthesize_uncached(job, key))
+            self._synth_tasks[key] = task
+        return await asyncio.shield(task)
+
+    async def _synthesize_uncached(self, job: _ChunkJob, key: str) -> Path:
+        cached = self.chunk_cache.get(key)
+        if cached is not None:
+            self._chunks_cached += 1
+            return cached
+
+        if self._synth_semaphore is None:
+            self._synth_semaphore = asyncio.Semaphore(
+                max(1, int(self.audiobook_config.get(
+                    "max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS)))
+            )
+        async with self._synth_semaphore:
+            audio_bytes = await self.tts_client.synthesize(
+                ssml=job.ssml,
+                voice_name=job.voice,
+                speaking_rate=job.speaking_rate,
+                pitch=job.pitch,
+            )
+
+        self._total_chars += len(_SSML_TAG_RE.sub('', job.ssml))
+        self._chunks_synthesized += 1
+        return self.chunk_cache.put(key, audio_bytes)
+
+    async def _render(self, jobs: List[_ChunkJob], output_path: Path) -> Dict[str, Any]:
+        """Synthesize (or reuse) every chunk, then assemble off the event loop."""
+        chunk_paths = await asyncio.gather(*(self._synthesize_chunk(j) for j in jobs))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            render_chapter_audio,
+            [str(p) for p in chunk_paths],
+            str(output_path),
+        )
+
+    # ------------------------------------------------------------------
+    # Chapter audio generation
+    # ------------------------------------------------------------------
+
+    async def _generate_chapter_audio(
+        self,
+        chapter_num: int,
+        scenes: List[Dict[str, Any]],
+    ) -> Tuple[Path, Dict[str, Any]]:
+        """Generate a single chapter MP3 file.
+
+        Returns the output path and the ACX compliance measurements.
+        """
+        logger.info(f"  Generating Chapter {chapter_num} ({len(scenes)} scenes)...")
 
-        # Export
         project_name = self.config.get("project_name", "novel")
         filename = sanitize_filename(f"{project_name}_ch{chapter_num:02d}")
         output_path = self.output_dir / f"{filename}.mp3"
-        export_chapter_mp3(combined, output_path)
 
-        duration_min = compliance["duration_minutes"]
+        compliance = await self._render(
+            self._plan_chapter_chunks(chapter_num, scenes), output_path
+        )
+
+        if not compliance["compliant"]:
+            for issue in compliance["issues"]:
+                logger.warning(f"  ACX issue in Ch{chapter_num}: {issue}")
+
         logger.info(
-            f"  Chapter {chapter_num}: {duration_min:.1f} min, "
+            f"  Chapter {chapter_num}: {compliance['duration_minutes']:.1f} min, "
             f"RMS={compliance['rms_db']:.1f}dB, "
             f"Peak={compliance['peak_db']:.1f}dB"
         )
 
-        return output_path
+        return output_path, compliance
 
     # ------------------------------------------------------------------
     # Credits generation
@@ -262,34 +366,11 @@ class AudiobookEngine:
         Args:
             credits_type: "opening" or "closing"
         """
-        title = self.config.get("title", "Untitled")
-        author = self.config.get("author", "the author")
-        narrator = self.audiobook_config.get("narrator_credit", "the narrator")
-
-        if credits_type == "opening":
-            ssml = OPENING_CREDITS_SSML.format(
-                title=title, author=author, narrator=narrator,
-            )
-        else:
-            year = datetime.now().year
-            ssml = CLOSING_CREDITS_SSML.format(
-                title=title, author=author, narrator=narrator, year=year,
-            )
-
-        audio_bytes = await self.tts_client.synthesize(
-            ssml=ssml,
-            voice_name=self.audiobook_config["voice_default"],
-            speaking_rate=0.9,  # Slower for credits
-        )
-
-        combined = concatenate_chunks([audio_bytes])
-        combined = add_room_tone(combined)
-        combined = normalize_to_acx(combined)
-
         project_name = self.config.get("project_name", "novel")
         filename = sanitize_filename(f"{project_name}_{credits_type}_credits")
         output_path = self.output_dir / f"{filename}.mp3"
-        export_chapter_mp3(combined, output_path)
+
+        await self._render(self._plan_credits_chunks(credits_type), output_path)
 
         logger.info(f"  {credits_type.title()} credits: {output_path.name}")
         return output_path
@@ -328,7 +409,8 @@ class AudiobookEngine:
         """Generate all audiobook files.
 
         Args:
-            force: Overwrite existing MP3 files.
+            force: Overwrite existing MP3 files. Unchanged chunks are
+                still served from the chunk cache.
             chapter_filter: Only generate specific chapters (None = all).
             dry_run: Only estimate cost, don't synthesize.
 
@@ -359,61 +441,75 @@ class AudiobookEngine:
         chapters = self._group_scenes_by_chapter()
         compliance_results: Dict[str, Any] = {}
 
-        # --- Opening credits ---
         project_name = self.config.get("project_name", "novel")
-        opening_name = sanitize_filename(f"{project_name}_opening_credits")
-        opening_path = self.output_dir / f"{opening_name}.mp3"
-
-        if force or not opening_path.exists():
-            try:
-                path = await self._generate_credits("opening")
-                self._generated_files.append(str(path))
-            except Exception as e:
-                logger.error(f"Failed to generate opening credits: {e}")
-                self._errors.append(f"opening_credits: {e}")
-        else:
-            self._skipped_files.append(str(opening_path))
 
-        # --- Chapters ---
+        # Work units in output order: (label, existing path, coroutine factory).
+        # All units run concurrently — chunks from every chapter share the TTS
+        # semaphore, and each chapter is assembled as soon as its chunks land.
+        units: List[Tuple[str, Path, Any]] = []
+
+        opening_name = sanitize_filename(f"{project_name}_opening_credits")
+        units.append((
+            "opening_credits",
+            self.output_dir / f"{opening_name}.mp3",
+            lambda: self._generate_credits("opening"),
+        ))
         for chapter_num, chapter_scenes in chapters.items():
             if chapter_filter and chapter_num not in chapter_filter:
                 continue
-
             filename = sanitize_filename(f"{project_name}_ch{chapter_num:02d}")
-            existing = self.output_dir / f"{filename}.mp3"
-
+            units.append((
+                f"ch{chapter_num:02d}",
+                self.output_dir / f"{filename}.mp3",
+                lambda n=chapter_num, sc=chapter_scenes: self._generate_chapter_audio(n, sc),
+            ))
+        closing_name = sanitize_filename(f"{project_name}_closing_credits")
+        units.append((
+            "closing_credits",
+            self.output_dir / f"{closing_name}.mp3",
+            lambda: self._generate_credits("closing"),
+        ))
+
+        pending: List[Tuple[str, Any]] = []
+        for label, existing, make in units:
             if not force and existing.exists():
-                logger.info(f"  Skipping Chapter {chapter_num} (exists, use --force)")
+                logger.info(f"  Skipping {label} (exists, use --force)")
                 self._skipped_files.append(str(existing))
                 continue
+            pending.append((label, make))
+
+        self._synth_tasks = {}
+        self._synth_semaphore = None
+        owns_executor = self.assembly_executor is None
+        self._executor = self.assembly_executor or ProcessPoolExecutor(
+            max_workers=int(self.audiobook_config.get(
+                "assembly_workers", min(4, os.cpu_count() or 1)))
+        )
+        try:
+            results = await asyncio.gather(
+                *(make() for _, make in pending), return_exceptions=True,
+            )
+        finally:
+            if owns_executor:
+                self._executor.shutdown(wait=True)
+            self._executor = None
+
+        for (label, _), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to generate {label}: {result}")
+                self._errors.append(f"{label}: {result}")
+                continue
+            if isinstance(result, tuple):
+                path, compliance = result
+                compliance_results[label] = compliance
+            else:
+                path = result
+            self._generated_files.append(str(path))
 
-            try:
-                path = await self._generate_chapter_audio(chapter_num, chapter_scenes)
-                self._generated_files.append(str(path))
-
-                # Post-export compliance check
-                from pydub import AudioSegment
-                audio = AudioSegment.from_mp3(str(path))
-                compliance = validate_acx_compliance(audio)
-                compliance_results[f"ch{chapter_num:02d}"] = compliance
-
-            except Exception as e:
-                logger.error(f"Failed to generate Chapter {chapter_num}: {e}")
-                self._errors.append(f"ch{chapter_num:02d}: {e}")
-
-        # --- Closing credits ---
-        closing_name = sanitize_filename(f"{project_name}_closing_credits")
-        closing_path = self.output_dir / f"{closing_name}.mp3"
-
-        if force or not closing_path.exists():
-            try:
-                path = await self._generate_credits("closing")
-                self._generated_files.append(str(path))
-            except Exception as e:
-                logger.error(f"Failed to generate closing credits: {e}")
-                self._errors.append(f"closing_credits: {e}")
-        else:
-            self._skipped_files.append(str(closing_path))
+        logger.info(
+            f"TTS chunks: {self._chunks_synthesized} synthesized, "
+            f"{self._chunks_cached} reused from cache"
+        )
 
         # --- Manifest ---
         self._write_manifest(compliance_results)
@@ -425,6 +521,8 @@ class AudiobookEngine:
             "total_chars": self._total_chars,
             "estimated_cost_usd": round(estimate_cost_usd(self._total_chars), 2),
             "acx_compliance": compliance_results,
+            "chunks_synthesized": self._chunks_synthesized,
+            "chunks_cached": self._chunks_cached,
         }
 
     # ------------------------------------------------------------------
@@ -444,6 +542,8 @@ class AudiobookEngine:
             "files_skipped": self._skipped_files,
             "errors": self._errors,
             "total_characters_used": self._total_chars,
+            "chunks_synthesized": self._chunks_synthesized,
+            "chunks_cached": self._chunks_cached,
             "estimated_cost_usd": round(estimate_cost_usd(self._total_chars), 2),
             "acx_compliance": compliance,
         }
@@ -48,25 +48,36 @@ class TTSRateLimitError(TTSError):
 # ---------------------------------------------------------------------------
 
 _request_timestamps: List[float] = []
+_rate_limit_lock: Optional[asyncio.Lock] = None
+_rate_limit_loop: Any = None
 
 
 async def _rate_limit_wait():
-    """Token bucket rate limiter: 250 requests/minute."""
-    now = time.time()
-    window = 60  # 1 minute
-
-    # Clean old timestamps
-    global _request_timestamps
-    _request_timestamps = [ts for ts in _request_timestamps if now - ts < window]
-
-    if len(_request_timestamps) >= REQUESTS_PER_MINUTE:
-        oldest = _request_timestamps[0]
-        wait_time = window - (now - oldest) + 0.1
-        if wait_time > 0:
-            logger.warning(f"TTS rate limit: waiting {wait_time:.1f}s")
-            await asyncio.sleep(wait_time)
-
-    _request_timestamps.append(time.time())
+    """Token bucket rate limiter: 250 requests/minute.
+
+    Serialized with a lock so concurrent chunk synthesis cannot all pass
+    the check at once and burst past the limit.
+    """
+    global _request_timestamps, _rate_limit_lock, _rate_limit_loop
+    loop = asyncio.get_running_loop()
+    if _rate_limit_lock is None or _rate_limit_loop is not loop:
+        _rate_limit_lock, _rate_limit_loop = asyncio.Lock(), loop
+
+    async with _rate_limit_lock:
+        now = time.time()
+        window = 60  # 1 minute
+
+        # Clean old timestamps
+        _request_timestamps = [ts for ts in _request_timestamps if now - ts < window]
+
+        if len(_request_timestamps) >= REQUESTS_PER_MINUTE:
+            oldest = _request_timestamps[0]
+            wait_time = window - (now - oldest) + 0.1
+            if wait_time > 0:
+                logger.warning(f"TTS rate limit: waiting {wait_time:.1f}s")
+                await asyncio.sleep(wait_time)
+
+        _request_timestamps.append(time.time())
 
 
 # ---------------------------------------------------------------------------
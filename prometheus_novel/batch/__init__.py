@@ -0,0 +1,5 @@
+"""Batch — parallel multi-book generation on top of PipelineOrchestrator."""
+
+from prometheus_novel.batch.engine import BatchEngine, BatchJob, ConcurrencyLimits, ResponseCache
+
+__all__ = ["BatchEngine", "BatchJob", "ConcurrencyLimits", "ResponseCache"]
@@ -0,0 +1,468 @@
+"""BatchEngine — drives PipelineOrchestrator.run for many projects at once.
+
+Books are pulled from one shared work queue by a fixed pool of workers, so a
+worker that finishes a short book immediately starts the next one instead of
+waiting for the slowest member of a lock-step batch. All books share:
+
+  - one LLM client per model name, wrapped in a ThrottledClient that enforces
+    global and per-model concurrency limits (local Ollama servers serialize
+    requests per model anyway; API providers have their own rate ceilings)
+  - one ResponseCache for identical requests (resume/retry of a book replays
+    the same planning prompts)
+  - the pipeline's process-wide embedding cache (stages/pipeline.py)
+
+Each book resumes from its own pipeline_state.json checkpoint, and the batch
+manifest records per-book status so re-running a batch skips finished books.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Final stage of PipelineOrchestrator.STAGES — a book whose checkpoint lists it is done
+FINAL_STAGE = "output_validation"
+
+MANIFEST_NAME = "batch_manifest.json"
+
+
+# ---------------------------------------------------------------------------
+# Shared concurrency limits + response cache
+# ---------------------------------------------------------------------------
+
+class ConcurrencyLimits:
+    """Global and per-model in-flight request limits shared across books.
+
+    Per-model slots are acquired before the global slot so a request waiting
+    on a saturated model never holds a global slot another model could use.
+    """
+
+    def __init__(self, global_limit: int = 8, per_model: Optional[Dict[str, int]] = None,
+                 default_per_model: int = 2):
+        self.global_limit = max(1, int(global_limit))
+        self.per_model = dict(per_model or {})
+        self.default_per_model = max(1, int(default_per_model))
+        self._global = asyncio.Semaphore(self.global_limit)
+        self._models: Dict[str, asyncio.Semaphore] = {}
+
+    def _model_sem(self, model: str) -> asyncio.Semaphore:
+        sem = self._models.get(model)
+        if sem is None:
+            sem = asyncio.Semaphore(max(1, int(self.per_model.get(model, self.default_per_model))))
+            self._models[model] = sem
+        return sem
+
+    @asynccontextmanager
+    async def slot(self, model: str):
+        async with self._model_sem(model):
+            async with self._global:
+                yield
+
+
+class ResponseCache:
+    """Bounded LRU of LLM responses keyed by model + prompt + sampling params.
+
+    Only low-temperature requests are cached: best-of-N candidate generation
+    deliberately repeats a prompt at creative temperatures to get variety.
+    """
+
+    def __init__(self, max_entries: int = 2048, max_temperature: float = 0.3):
+        self.max_entries = max_entries
+        self.max_temperature = max_temperature
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        # key -> future of an identical request already in flight (single-flight)
+        self.inflight: Dict[str, "asyncio.Future"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str, system_prompt: Optional[str], params: Dict[str, Any]) -> str:
+        h = hashlib.sha256()
+        for part in (model, system_prompt or "", prompt,
+                     json.dumps(params, sort_keys=True, default=str)):
+            h.update(part.encode("utf-8", errors="replace"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def get(self, key: str) -> Any:
+        resp = self._entries.get(key)
+        if resp is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return resp
+
+    def put(self, key: str, response: Any) -> None:
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class ThrottledClient:
+    """Wraps an LLM client with shared limits, response cache and token stats.
+
+    Unknown attributes delegate to the wrapped client, so the pipeline's
+    ``getattr(client, "model_name")`` lookups keep working.
+    """
+
+    def __init__(self, inner: Any, limits: ConcurrencyLimits, cache: Optional[ResponseCache] = None):
+        self._inner = inner
+        self._limits = limits
+        self._cache = cache
+        self.model_name = getattr(inner, "model_name", "unknown")
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.requests = 0
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+    async def generate(self, prompt: str, system_prompt: Optional[str] = None, **kwargs):
+        key = None
+        if self._cache is not None and float(kwargs.get("temperature", 0.7)) <= self._cache.max_temperature:
+            key = ResponseCache.make_key(self.model_name, prompt, system_prompt, kwargs)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            pending = self._cache.inflight.get(key)
+            if pending is not None:
+                self._cache.hits += 1
+                return await asyncio.shield(pending)
+            self._cache.inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            async with self._limits.slot(self.model_name):
+                response = await self._inner.generate(prompt, system_prompt=system_prompt, **kwargs)
+        except BaseException as e:
+            if key is not None:
+                fut = self._cache.inflight.pop(key)
+                if isinstance(e, asyncio.CancelledError):
+                    fut.cancel()
+                elif not fut.done():
+                    fut.set_exception(e)
+                    fut.exception()  # mark retrieved when nobody was waiting
+            raise
+        self.requests += 1
+        self.input_tokens += int(getattr(response, "input_tokens", 0) or 0)
+        self.output_tokens += int(getattr(response, "output_tokens", 0) or 0)
+        if key is not None:
+            if getattr(response, "content", None):
+                self._cache.put(key, response)
+            self._cache.inflight.pop(key).set_result(response)
+        return response
+
+    async def generate_stream(self, prompt: str, system_prompt: Optional[str] = None, **kwargs):
+        async with self._limits.slot(self.model_name):
+            async for chunk in self._inner.generate_stream(prompt, system_prompt=system_prompt, **kwargs):
+                yield chunk
+
+
+# ---------------------------------------------------------------------------
+# Jobs + report
+# ---------------------------------------------------------------------------
+
+@dataclass
+class BatchJob:
+    """One book in the batch; persisted in the batch manifest."""
+
+    project_path: Path
+    status: str = "pending"  # pending | running | completed | failed
+    attempts: int = 0
+    resumed: bool = False
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    tokens: int = 0
+    cost_usd: float = 0.0
+    words: int = 0
+    error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.project_path.name
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d["project_path"] = str(self.project_path)
+        d["name"] = self.name
+        return d
+
+
+@dataclass
+class BatchReport:
+    """Aggregate throughput for a batch run."""
+
+    books_completed: int
+    books_failed: int
+    wall_seconds: float
+    total_tokens: int
+    total_cost_usd: float
+    total_words: int
+    books_per_hour: float
+    tokens_per_sec: float
+    cost_per_10k_words: Optional[float]
+    cache_hits: int
+    cache_misses: int
+    per_model_requests: Dict[str, int] = field(default_factory=dict)
+    books: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ---------------------------------------------------------------------------
+# BatchEngine
+# ---------------------------------------------------------------------------
+
+# model_defaults key -> llm_clients bucket (same routing as cmd_generate / run_generation)
+_MODEL_BUCKETS = {
+    "api_model": "gpt",
+    "critic_model": "claude",
+    "fallback_model": "gemini",
+    "structure_gate_model": "structure",
+    "draft_model": "draft",
+    "rewrite_model": "rewrite",
+}
+
+
+def _count_words(scenes: Optional[List[Any]]) -> int:
+    return sum(
+        len((s.get("content") or "").split())
+        for s in (scenes or []) if isinstance(s, dict)
+    )
+
+
+def _read_checkpoint(project_path: Path) -> Dict[str, Any]:
+    state_file = project_path / "pipeline_state.json"
+    if not state_file.exists():
+        return {}
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            return json.load(f) or {}
+    except (json.JSONDecodeError, OSError, ValueError):
+        return {}
+
+
+def _checkpoint_stages(project_path: Path) -> List[str]:
+    return list(_read_checkpoint(project_path).get("completed_stages") or [])
+
+
+class BatchEngine:
+    """Runs the full pipeline for many projects with shared limits and caches."""
+
+    def __init__(
+        self,
+        project_paths: List[Path],
+        output_dir: Path,
+        max_books: int = 4,
+        limits: Optional[ConcurrencyLimits] = None,
+        cache: Optional[ResponseCache] = None,
+        max_attempts: int = 2,
+        client_factory: Optional[Callable[[str], Any]] = None,
+        orchestrator_factory: Optional[Callable[..., Any]] = None,
+    ):
+        self.output_dir = Path(output_dir)
+        self.max_books = max(1, int(max_books))
+        self.limits = limits or ConcurrencyLimits()
+        self.cache = cache if cache is not None else ResponseCache()
+        self.max_attempts = max(1, int(max_attempts))
+        self._client_factory = client_factory
+        self._orchestrator_factory = orchestrator_factory
+        self._clients: Dict[str, ThrottledClient] = {}
+
+        previous = self._load_manifest()
+        self.jobs: List[BatchJob] = []
+        for p in project_paths:
+            p = Path(p)
+            job = BatchJob(project_path=p)
+            prior = previous.get(str(p))
+            if prior and prior.get("status") == "completed":
+                job.status = "completed"
+                job.tokens = prior.get("tokens", 0)
+                job.cost_usd = prior.get("cost_usd", 0.0)
+                job.words = prior.get("words", 0)
+            elif FINAL_STAGE in _checkpoint_stages(p):
+                job.status = "completed"
+            self.jobs.append(job)
+
+    # -- manifest ---------------------------------------------------------
+
+    def _manifest_path(self) -> Path:
+        return self.output_dir / MANIFEST_NAME
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        path = self._manifest_path()
+        if not path.exists():
+            return {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {b["project_path"]: b for b in data.get("books", []) if "project_path" in b}
+        except (json.JSONDecodeError, OSError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable batch manifest at %s", path)
+            return {}
+
+    def _save_manifest(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._manifest_path().with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"updated_at": datetime.now().isoformat(),
+                       "books": [j.to_dict() for j in self.jobs]}, f, indent=2)
+        tmp.replace(self._manifest_path())
+
+    # -- clients ----------------------------------------------------------
+
+    def _client(self, model_name: str) -> ThrottledClient:
+        """One shared (throttled, cached) client per model across all books."""
+        client = self._clients.get(model_name)
+        if client is None:
+            factory = self._client_factory
+            if factory is None:
+                from prometheus_novel.prometheus_lib.llm.clients import get_client as factory
+            client = ThrottledClient(factory(model_name), self.limits, self.cache)
+            self._clients[model_name] = client
+        return client
+
+    def _build_clients(self, config: Dict[str, Any]) -> Dict[str, ThrottledClient]:
+        md = config.get("model_defaults", {}) or {}
+        api_model = md.get("api_model", "qwen2.5:7b")
+        models = {
+            "api_model": api_model,
+            "critic_model": md.get("critic_model", api_model),
+            "fallback_model": md.get("fallback_model", api_model),
+            "structure_gate_model": md.get("structure_gate_model"),
+            "draft_model": md.get("draft_model", api_model),
+        }
+        models["rewrite_model"] = md.get("rewrite_model", models["critic_model"])
+        return {
+            _MODEL_BUCKETS[key]: self._client(model)
+            for key, model in models.items() if model
+        }
+
+    def _make_orchestrator(self, project_path: Path, llm_clients: Dict[str, Any]):
+        factory = self._orchestrator_factory
+        if factory is None:
+            from prometheus_novel.stages.pipeline import PipelineOrchestrator as factory
+        return factory(project_path, llm_client=llm_clients["gpt"], llm_clients=llm_clients)
+
+    # -- execution --------------------------------------------------------
+
+    async def _run_job(self, job: BatchJob) -> None:
+        config_file = job.project_path / "config.yaml"
+        with open(config_file, encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+
+        orchestrator = self._make_orchestrator(job.project_path, self._build_clients(config))
+        checkpoint = _read_checkpoint(job.project_path)
+        job.resumed = bool(checkpoint.get("completed_stages"))
+        # Checkpoint totals are cumulative across runs; count only this run's spend
+        prior_tokens = int(checkpoint.get("total_tokens", 0) or 0) if job.resumed else 0
+        prior_cost = float(checkpoint.get("total_cost_usd", 0.0) or 0.0) if job.resumed else 0.0
+        state = await orchestrator.run(resume=job.resumed)
+
+        job.tokens += max(0, int(getattr(state, "total_tokens", 0) or 0) - prior_tokens)
+        job.cost_usd += max(0.0, float(getattr(state, "total_cost_usd", 0.0) or 0.0) - prior_cost)
+        job.words = _count_words(getattr(state, "scenes", None))
+        completed = getattr(state, "completed_stages", None) or []
+        if FINAL_STAGE not in completed:
+            raise RuntimeError(f"pipeline stopped before {FINAL_STAGE} "
+                               f"({len(completed)} stages completed)")
+
+    async def _worker(self, queue: "asyncio.Queue[BatchJob]") -> None:
+        while True:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            job.status = "running"
+            job.attempts += 1
+            job.error = None
+            job.started_at = job.started_at or time.time()
+            self._save_manifest()
+            logger.info("Batch: starting %s (attempt %d/%d)", job.name, job.attempts, self.max_attempts)
+            try:
+                await self._run_job(job)
+                job.status = "completed"
+                logger.info("Batch: %s complete (%d words, $%.4f)", job.name, job.words, job.cost_usd)
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"[:300]
+                if job.attempts < self.max_attempts:
+                    # Back of the queue: resumes from its checkpoint once other books progress
+                    job.status = "pending"
+                    queue.put_nowait(job)
+                    logger.warning("Batch: %s failed (%s) — requeued", job.name, job.error)
+                else:
+                    job.status = "failed"
+                    logger.error("Batch: %s failed permanently: %s", job.name, job.error)
+            finally:
+                if job.status != "pending":
+                    job.finished_at = time.time()
+                self._save_manifest()
+
+    async def run(self) -> BatchReport:
+        """Run all pending books; returns (and writes) the throughput report."""
+        queue: "asyncio.Queue[BatchJob]" = asyncio.Queue()
+        for job in self.jobs:
+            if job.status != "completed":
+                job.status = "pending"
+                queue.put_nowait(job)
+
+        logger.info("Batch: %d books queued, %d already complete, %d workers",
+                    queue.qsize(), len(self.jobs) - queue.qsize(), self.max_books)
+        started = time.time()
+        workers = [asyncio.create_task(self._worker(queue))
+                   for _ in range(min(self.max_books, max(1, queue.qsize())))]
+        await asyncio.gather(*workers)
+
+        report = self.build_report(time.time() - started)
+        self._write_report(report)
+        return report
+
+    def build_report(self, wall_seconds: float) -> BatchReport:
+        done = [j for j in self.jobs if j.status == "completed" and j.finished_at]
+        failed = [j for j in self.jobs if j.status == "failed"]
+        ran = [j for j in self.jobs if j.attempts]
+        tokens = sum(j.tokens for j in ran)
+        cost = sum(j.cost_usd for j in ran)
+        words = sum(j.words for j in done)
+        wall = max(wall_seconds, 1e-9)
+        return BatchReport(
+            books_completed=len(done),
+            books_failed=len(failed),
+            wall_seconds=round(wall_seconds, 2),
+            total_tokens=tokens,
+            total_cost_usd=round(cost, 4),
+            total_words=words,
+            books_per_hour=round(len(done) * 3600.0 / wall, 3),
+            tokens_per_sec=round(tokens / wall, 2),
+            cost_per_10k_words=round(cost * 10000.0 / words, 4) if words else None,
+            cache_hits=self.cache.hits,
+            cache_misses=self.cache.misses,
+            per_model_requests={m: c.requests for m, c in self._clients.items()},
+            books=[j.to_dict() for j in ran],
+        )
+
+    def _write_report(self, report: BatchReport) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+        logger.info(
+            "Batch report: %d done, %d failed | %.2f books/h | %.1f tok/s | cost/10k words: %s -> %s",
+            report.books_completed, report.books_failed, report.books_per_hour,
+            report.tokens_per_sec,
+            f"${report.cost_per_10k_words:.4f}" if report.cost_per_10k_words is not None else "n/a",
+            path,
+        )
+        return path
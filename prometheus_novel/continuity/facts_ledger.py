@@ -9,39 +9,32 @@ Config: enhancements.facts_ledger.enabled (default True).
 
 import json
 import logging
-import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from quality.mention_index import get_default_index
+
 logger = logging.getLogger("facts_ledger")
 
-# Patterns to extract simple facts from scene content
-_LOC_PAT = re.compile(r"\b(in|at|inside|outside)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b")
-_TIME_PAT = re.compile(r"\b(morning|afternoon|evening|night|dawn|dusk|later that (?:day|night)|the next day)\b", re.IGNORECASE)
+# Prepositions that introduce a scene location ("in the Archive", "outside Hale House")
+_LOC_PREPOSITIONS = {"in", "at", "inside", "outside"}
 
 
 def _extract_location_from_content(content: str) -> Optional[str]:
     """Heuristic: first strong location mention."""
-    for m in _LOC_PAT.finditer(content[:1500]):
-        return m.group(2).strip()
-    return None
+    return get_default_index().scene(content).first_location(limit=1500, prepositions=_LOC_PREPOSITIONS)
 
 
 def _extract_time_anchor(content: str) -> Optional[str]:
     """First time-of-day or temporal phrase."""
-    m = _TIME_PAT.search(content)
-    return m.group(1).strip() if m else None
+    return get_default_index().scene(content).first_time_anchor()
 
 
 def _extract_characters_from_content(content: str, known_names: List[str]) -> List[str]:
-    """Names that appear in dialogue or narration (simple: capitalized words that match known)."""
+    """Known names mentioned as whole words anywhere in the scene."""
     if not known_names:
         return []
-    seen = set()
-    for name in known_names:
-        if name and name.lower() in content.lower():
-            seen.add(name)
-    return sorted(seen)
+    return sorted(set(get_default_index().scene(content).present(known_names)))
 
 
 def build_facts_for_scene(
@@ -0,0 +1,223 @@
+"""
+Windowed Continuity Audit — map-reduce helpers for long manuscripts.
+
+Map: the manuscript is split into overlapping chapter windows that fit the
+audit model's context. Each window is audited on its own, with a compact
+facts-ledger digest of earlier chapters standing in for their raw prose.
+
+Reduce: window results are merged deterministically into the existing
+``continuity_issues`` schema (location, type, description, suggested_fix),
+with duplicates from overlapping chapters collapsed.
+
+Pure functions only — the pipeline owns the LLM calls.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+ISSUE_KEYS = ("location", "type", "description", "suggested_fix")
+
+_LOC_PAT = re.compile(r"ch(?:apter)?\.?\s*(\d+)(?:\D{1,12}?s(?:cene)?\.?\s*(\d+))?", re.IGNORECASE)
+_SCENE_ID_PAT = re.compile(r"ch(\d+)_s(\d+)", re.IGNORECASE)
+_WORD_PAT = re.compile(r"[a-z0-9']+")
+
+# Two issues at the same location+type with this much word overlap are one issue
+DUPLICATE_JACCARD = 0.5
+
+
+def format_scene(scene: Dict[str, Any]) -> str:
+    """Render one scene the way the single-prompt audits always have."""
+    return f"Chapter {scene.get('chapter')}, Scene {scene.get('scene_number')}:\n{scene.get('content', '')}"
+
+
+def join_scenes(scenes: Sequence[Dict[str, Any]]) -> str:
+    return "\n\n---\n\n".join(format_scene(s) for s in scenes)
+
+
+# ---------------------------------------------------------------------------
+# Map: windows
+# ---------------------------------------------------------------------------
+
+def build_chapter_windows(
+    scenes: Sequence[Dict[str, Any]],
+    token_budget: int,
+    count_fn: Callable[[str], int],
+    overlap_chapters: int = 1,
+) -> List[List[Dict[str, Any]]]:
+    """Pack consecutive chapters into windows of at most ``token_budget`` tokens.
+
+    Each window after the first re-includes the last ``overlap_chapters``
+    chapters of the previous one so boundary contradictions are visible.
+    A chapter larger than the budget is split into scene groups.
+    """
+    chapters: Dict[Any, List[Dict[str, Any]]] = {}
+    for s in scenes:
+        if isinstance(s, dict):
+            chapters.setdefault(s.get("chapter"), []).append(s)
+    if not chapters:
+        return []
+
+    # Units are whole chapters, or scene groups for oversize chapters
+    units: List[tuple] = []  # (scenes, tokens)
+    sep_tokens = count_fn("\n\n---\n\n")
+    for ch_scenes in chapters.values():
+        costs = [count_fn(format_scene(s)) + sep_tokens for s in ch_scenes]
+        if sum(costs) <= token_budget:
+            units.append((ch_scenes, sum(costs)))
+            continue
+        group: List[Dict[str, Any]] = []
+        group_cost = 0
+        for s, c in zip(ch_scenes, costs):
+            if group and group_cost + c > token_budget:
+                units.append((group, group_cost))
+                group, group_cost = [], 0
+            group.append(s)
+            group_cost += c
+        if group:
+            units.append((group, group_cost))
+
+    windows: List[List[tuple]] = []
+    current: List[tuple] = []
+    current_cost = 0
+    fresh = 0  # units in current window not carried over as overlap
+    for unit in units:
+        if current and fresh and current_cost + unit[1] > token_budget:
+            windows.append(current)
+            carry = current[-overlap_chapters:] if overlap_chapters > 0 else []
+            # Drop carried units that would leave no room for new material
+            while carry and sum(u[1] for u in carry) + unit[1] > token_budget:
+                carry = carry[1:]
+            current = list(carry)
+            current_cost = sum(u[1] for u in carry)
+            fresh = 0
+        current.append(unit)
+        current_cost += unit[1]
+        fresh += 1
+    if current:
+        windows.append(current)
+
+    return [[s for unit in window for s in unit[0]] for window in windows]
+
+
+def window_label(window: Sequence[Dict[str, Any]]) -> str:
+    chapters = [s.get("chapter") for s in window if s.get("chapter") is not None]
+    if not chapters:
+        return "manuscript"
+    lo, hi = min(chapters), max(chapters)
+    return f"Chapter {lo}" if lo == hi else f"Chapters {lo}-{hi}"
+
+
+# ---------------------------------------------------------------------------
+# Map: facts digest
+# ---------------------------------------------------------------------------
+
+def _entry_line(entry: Dict[str, Any]) -> str:
+    parts = [f"Ch{entry.get('chapter')} S{entry.get('scene')}"]
+    if entry.get("location"):
+        parts.append(f"at {entry['location']}")
+    if entry.get("time_anchor"):
+        parts.append(f"time: {entry['time_anchor']}")
+    present = entry.get("characters_present") or []
+    if present:
+        parts.append("present: " + ", ".join(str(p) for p in present))
+    events = entry.get("key_events") or []
+    if events:
+        parts.append("events: " + "; ".join(str(e) for e in events))
+    return " | ".join(parts)
+
+
+def facts_digest(
+    ledger_entries: Sequence[Dict[str, Any]],
+    before_chapter: Any,
+    token_budget: int,
+    count_fn: Callable[[str], int],
+) -> str:
+    """Compact one-line-per-scene digest of facts established before a window.
+
+    When over budget the oldest lines are dropped first — recent facts
+    matter most at a window boundary.
+    """
+    if before_chapter is None:
+        return ""
+    lines = []
+    for e in ledger_entries or []:
+        ch = e.get("chapter")
+        if isinstance(ch, (int, float)) and isinstance(before_chapter, (int, float)) and ch < before_chapter:
+            lines.append(_entry_line(e))
+    if not lines:
+        return ""
+
+    kept: List[str] = []
+    used = 0
+    for line in reversed(lines):
+        cost = count_fn(line) + 1
+        if used + cost > token_budget:
+            break
+        kept.append(line)
+        used += cost
+    kept.reverse()
+    omitted = len(lines) - len(kept)
+    if omitted:
+        kept.insert(0, f"(... {omitted} earlier scenes omitted)")
+    return "\n".join(kept)
+
+
+# ---------------------------------------------------------------------------
+# Reduce
+# ---------------------------------------------------------------------------
+
+def location_sort_key(location: str) -> tuple:
+    """(chapter, scene) parsed from free-form locations; unparseable sort last."""
+    text = str(location or "")
+    m = _SCENE_ID_PAT.search(text) or _LOC_PAT.search(text)
+    if not m:
+        return (float("inf"), float("inf"))
+    return (int(m.group(1)), int(m.group(2)) if m.group(2) else 0)
+
+
+def _normalize_issue(issue: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(issue, dict):
+        return None
+    normalized = dict(issue)
+    for key in ISSUE_KEYS:
+        value = normalized.get(key)
+        normalized[key] = "" if value is None else str(value).strip()
+    if not normalized["description"]:
+        return None
+    normalized["type"] = normalized["type"].lower().replace(" ", "_")
+    return normalized
+
+
+def _words(text: str) -> set:
+    return set(_WORD_PAT.findall(text.lower()))
+
+
+def merge_issues(issue_lists: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Merge per-window issue lists into one deduplicated, ordered list.
+
+    Issues are duplicates when they share type and (chapter, scene) and
+    their descriptions overlap by at least ``DUPLICATE_JACCARD``. The
+    first-seen wording is kept, so results are stable for a given input.
+    """
+    merged: List[Dict[str, Any]] = []
+    buckets: Dict[tuple, List[tuple]] = {}
+    for issues in issue_lists:
+        for raw in issues or []:
+            issue = _normalize_issue(raw)
+            if issue is None:
+                continue
+            bucket_key = (issue["type"], location_sort_key(issue["location"]))
+            words = _words(issue["description"])
+            duplicate = False
+            for seen_words, _ in buckets.get(bucket_key, []):
+                union = words | seen_words
+                if not union or len(words & seen_words) / len(union) >= DUPLICATE_JACCARD:
+                    duplicate = True
+                    break
+            if duplicate:
+                continue
+            buckets.setdefault(bucket_key, []).append((words, issue))
+            merged.append(issue)
+
+    order = {id(issue): i for i, issue in enumerate(merged)}
+    return sorted(merged, key=lambda i: (location_sort_key(i["location"]), order[id(i)]))
@@ -6,11 +6,20 @@ for pixel-perfect, reliable text rendering on book covers.
 
 import logging
 import textwrap
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with sentence-transformers
+    np = None
+
 logger = logging.getLogger(__name__)
 
 # Directory containing bundled OFL fonts
@@ -21,35 +30,69 @@ _FONTS_DIR = Path(__file__).resolve().parent / "fonts"
 # Font loading
 # ---------------------------------------------------------------------------
 
-def get_font(font_name: str, size: int) -> ImageFont.FreeTypeFont:
-    """Load a TrueType font with fallback chain.
-
-    Search order:
-        1. covergen/fonts/{font_name}.ttf
-        2. System fonts directory
-        3. Pillow default (last resort)
-    """
+@lru_cache(maxsize=None)
+def _resolve_font_path(font_name: str) -> Optional[str]:
+    """Resolve a font name to a .ttf path (bundled, then system), once per name."""
     # 1. Bundled fonts
     bundled = _FONTS_DIR / f"{font_name}.ttf"
     if bundled.exists():
-        return ImageFont.truetype(str(bundled), size)
+        return str(bundled)
 
     # 2. System fonts (Windows)
     import platform
     if platform.system() == "Windows":
         sys_font = Path("C:/Windows/Fonts") / f"{font_name}.ttf"
         if sys_font.exists():
-            return ImageFont.truetype(str(sys_font), size)
+            return str(sys_font)
+    return None
+
+
+@lru_cache(maxsize=512)
+def get_font(font_name: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font with fallback chain (cached per (font, size)).
+
+    Search order:
+        1. covergen/fonts/{font_name}.ttf
+        2. System fonts directory
+        3. Pillow default (last resort)
+    """
+    path = _resolve_font_path(font_name)
+    if path:
+        return ImageFont.truetype(path, size)
 
     # 3. Pillow default
     logger.warning("Font '%s' not found, using Pillow default", font_name)
     return ImageFont.load_default(size)
 
 
+def _text_width(font: ImageFont.FreeTypeFont, text: str) -> int:
+    """Right edge of text's bbox, memoized on the (cached) font object."""
+    cache = getattr(font, "_covergen_widths", None)
+    if cache is None:
+        cache = {}
+        try:
+            font._covergen_widths = cache
+        except AttributeError:
+            return font.getbbox(text)[2]
+    width = cache.get(text)
+    if width is None:
+        width = font.getbbox(text)[2]
+        cache[text] = width
+    return width
+
+
 # ---------------------------------------------------------------------------
 # Color analysis
 # ---------------------------------------------------------------------------
 
+def _region_box(image: Image.Image, region: str) -> Optional[Tuple[int, int, int, int]]:
+    if region == "top":
+        return (0, 0, image.width, int(image.height * 0.35))
+    if region == "bottom":
+        return (0, int(image.height * 0.75), image.width, image.height)
+    return None
+
+
 def analyze_luminance(image: Image.Image, region: str = "full") -> float:
     """Compute average luminance (0.0 = black, 1.0 = white) of an image region.
 
@@ -60,21 +103,47 @@ def analyze_luminance(image: Image.Image, region: str = "full") -> float:
     Returns:
         Average luminance as float 0..1.
     """
-    if region == "top":
-        box = (0, 0, image.width, int(image.height * 0.35))
-    elif region == "bottom":
-        box = (0, int(image.height * 0.75), image.width, image.height)
-    else:
-        box = None
+    return analyze_tone(image, region)["luminance"]
 
+
+def analyze_tone(image: Image.Image, region: str = "full") -> Dict[str, float]:
+    """Luminance and RMS contrast (both 0..1) of an image region.
+
+    Vectorized with NumPy over the grayscale pixels; falls back to the
+    Pillow histogram when NumPy is unavailable.
+    """
+    box = _region_box(image, region)
     sample = image.crop(box) if box else image
     gray = sample.convert("L")
+    if gray.width == 0 or gray.height == 0:
+        return {"luminance": 0.5, "contrast": 0.0}
+    if np is not None:
+        pixels = np.asarray(gray, dtype=np.float32)
+        return {
+            "luminance": float(pixels.mean()) / 255.0,
+            "contrast": float(pixels.std()) / 255.0,
+        }
     histogram = gray.histogram()
     total_pixels = sum(histogram)
-    if total_pixels == 0:
-        return 0.5
-    weighted = sum(i * count for i, count in enumerate(histogram))
-    return weighted / (total_pixels * 255.0)
+    mean = sum(i * count for i, count in enumerate(histogram)) / total_pixels
+    var = sum(count * (i - mean) ** 2 for i, count in enumerate(histogram)) / total_pixels
+    return {"luminance": mean / 255.0, "contrast": var ** 0.5 / 255.0}
+
+
+def analyze_luminance_regions(image: Image.Image) -> Dict[str, float]:
+    """Top and bottom luminance from a single grayscale conversion."""
+    if np is None:
+        return {r: analyze_luminance(image, r) for r in ("top", "bottom")}
+    pixels = np.asarray(image.convert("L"), dtype=np.float32)
+    if pixels.size == 0:
+        return {"top": 0.5, "bottom": 0.5}
+    h = pixels.shape[0]
+    top = pixels[: int(h * 0.35)]
+    bottom = pixels[int(h * 0.75):]
+    return {
+        "top": float(top.mean()) / 255.0 if top.size else 0.5,
+        "bottom": float(bottom.mean()) / 255.0 if bottom.size else 0.5,
+    }
 
 
 def pick_text_color(luminance: float) -> Tuple[int, int, int]:
@@ -103,8 +172,7 @@ def _wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list:
 
     for word in words:
         test = f"{current_line} {word}".strip()
-        bbox = font.getbbox(test)
-        if bbox[2] <= max_width:
+        if _text_width(font, test) <= max_width:
             current_line = test
         else:
             if current_line:
@@ -128,13 +196,17 @@ def _render_text_block(
     stroke_color: Optional[Tuple[int, int, int]] = None,
     shadow: bool = False,
     line_spacing: float = 1.3,
+    lines: Optional[List[str]] = None,
 ) -> int:
     """Render wrapped text centered at x_center, starting at y_start.
 
+    Pass ``lines`` (e.g. from a TextLayout) to skip re-wrapping.
+
     Returns:
         y position after the last line.
     """
-    lines = _wrap_text(text, font, max_width)
+    if lines is None:
+        lines = _wrap_text(text, font, max_width)
     ascent, descent = font.getmetrics()
     line_height = int((ascent + descent) * line_spacing)
 
@@ -166,6 +238,112 @@ def _render_text_block(
     return y
 
 
+@dataclass(frozen=True)
+class TextLayout:
+    """A fitted text block: chosen font size plus its wrapped lines."""
+
+    font_name: str
+    size: int
+    lines: Tuple[str, ...]
+
+    @property
+    def font(self) -> ImageFont.FreeTypeFont:
+        return get_font(self.font_name, self.size)
+
+
+# Exact-parameter fits (repeated author/series names across a batch of titles)
+_LAYOUT_CACHE: "OrderedDict[tuple, TextLayout]" = OrderedDict()
+# Resolution-independent fits: same text in a same-shaped box at another
+# resolution (eBook vs print front) reuses the line breaks and size ratio
+_RELATIVE_LAYOUT_CACHE: "OrderedDict[tuple, Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+_LAYOUT_CACHE_MAX = 256
+# CoverEngine composes eBook and print panels in worker threads
+_LAYOUT_LOCK = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, key: tuple):
+    with _LAYOUT_LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key: tuple, value) -> None:
+    with _LAYOUT_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _LAYOUT_CACHE_MAX:
+            cache.popitem(last=False)
+
+
+def _layout_fits(
+    lines: List[str], font: ImageFont.FreeTypeFont, max_width: int, max_height: int, line_spacing: float,
+) -> bool:
+    ascent, descent = font.getmetrics()
+    line_height = int((ascent + descent) * line_spacing)
+    if line_height * len(lines) > max_height:
+        return False
+    return all(_text_width(font, line) <= max_width for line in lines)
+
+
+def fit_text_layout(
+    text: str,
+    font_name: str,
+    max_width: int,
+    max_height: int,
+    start_size: int = 200,
+    min_size: int = 24,
+    line_spacing: float = 1.3,
+) -> TextLayout:
+    """Find the largest font size (<= start_size) whose wrapped text fits the box.
+
+    Binary search over sizes; each probe is one cached font load and one
+    memoized wrap pass. Results are cached both exactly and relative to the
+    box height, so a layout fitted for the print front is rescaled for the
+    eBook (and vice versa) after a single fit check.
+    """
+    key = (text, font_name, max_width, max_height, start_size, min_size, line_spacing)
+    hit = _cache_get(_LAYOUT_CACHE, key)
+    if hit is not None:
+        return hit
+
+    rel_key = (
+        text, font_name, round(max_width / max_height, 3),
+        round(start_size / max_height, 4), round(min_size / max_height, 4), line_spacing,
+    )
+    rel = _cache_get(_RELATIVE_LAYOUT_CACHE, rel_key)
+    if rel is not None:
+        size = max(min_size, min(start_size, int(rel[0] * max_height)))
+        if _layout_fits(list(rel[1]), get_font(font_name, size), max_width, max_height, line_spacing):
+            layout = TextLayout(font_name, size, rel[1])
+            _cache_put(_LAYOUT_CACHE, key, layout)
+            return layout
+
+    def _probe(size: int) -> Optional[List[str]]:
+        font = get_font(font_name, size)
+        lines = _wrap_text(text, font, max_width)
+        return lines if _layout_fits(lines, font, max_width, max_height, line_spacing) else None
+
+    best_size, best_lines = min_size, None
+    lo, hi = min_size, max(min_size, start_size)
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        lines = _probe(mid)
+        if lines is not None:
+            best_size, best_lines = mid, lines
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    if best_lines is None:
+        best_lines = _wrap_text(text, get_font(font_name, min_size), max_width)
+
+    layout = TextLayout(font_name, best_size, tuple(best_lines))
+    _cache_put(_LAYOUT_CACHE, key, layout)
+    _cache_put(_RELATIVE_LAYOUT_CACHE, rel_key, (best_size / max_height, layout.lines))
+    return layout
+
+
 def _auto_fit_font(
     text: str,
     font_name: str,
@@ -179,15 +357,8 @@ def _auto_fit_font(
 
     Returns (font, font_size).
     """
-    for size in range(start_size, min_size - 1, -4):
-        font = get_font(font_name, size)
-        lines = _wrap_text(text, font, max_width)
-        ascent, descent = font.getmetrics()
-        line_height = int((ascent + descent) * line_spacing)
-        total_height = line_height * len(lines)
-        if total_height <= max_height:
-            return font, size
-    return get_font(font_name, min_size), min_size
+    layout = fit_text_layout(text, font_name, max_width, max_height, start_size, min_size, line_spacing)
+    return layout.font, layout.size
 
 
 # ---------------------------------------------------------------------------
@@ -224,10 +395,9 @@ def compose_front_cover(
 
     # Auto-detect text color from artwork
     if text_color is None:
-        top_lum = analyze_luminance(artwork, "top")
-        bottom_lum = analyze_luminance(artwork, "bottom")
-        title_color = pick_text_color(top_lum)
-        author_color = pick_text_color(bottom_lum)
+        lum = analyze_luminance_regions(artwork)
+        title_color = pick_text_color(lum["top"])
+        author_color = pick_text_color(lum["bottom"])
     else:
         title_color = text_color
         author_color = text_color
@@ -250,15 +420,15 @@ def compose_front_cover(
 
     # Title (large, auto-fitted)
     title_area_height = int(h * 0.22)
-    title_font, _ = _auto_fit_font(
+    title_layout = fit_text_layout(
         title.upper(), title_font_name, max_text_width, title_area_height,
         start_size=int(h * 0.12), min_size=int(h * 0.04),
     )
     y_cursor = _render_text_block(
-        draw, title.upper(), title_font, x_center, y_cursor,
+        draw, title.upper(), title_layout.font, x_center, y_cursor,
         max_text_width, title_color,
         stroke_width=stroke_width, stroke_color=stroke_fill,
-        shadow=shadow, line_spacing=1.15,
+        shadow=shadow, line_spacing=1.15, lines=list(title_layout.lines),
     )
 
     # Subtitle
@@ -274,15 +444,15 @@ def compose_front_cover(
 
     # Author name (bottom)
     author_y = int(h * 0.84)
-    author_font, _ = _auto_fit_font(
+    author_layout = fit_text_layout(
         author_name, author_font_name, max_text_width, int(h * 0.10),
         start_size=int(h * 0.05), min_size=int(h * 0.025),
     )
     _render_text_block(
-        draw, author_name, author_font, x_center, author_y,
+        draw, author_name, author_layout.font, x_center, author_y,
         max_text_width, author_color,
         stroke_width=stroke_width, stroke_color=author_stroke_fill,
-        shadow=shadow,
+        shadow=shadow, lines=list(author_layout.lines),
     )
 
     return cover.convert("RGB")
@@ -496,26 +666,28 @@ def _fill_bleed(
     front_w: int,
     panel_h: int,
 ) -> None:
-    """Fill bleed areas by mirroring edge pixels."""
+    """Fill bleed areas by mirroring edge pixels.
+
+    Each 1px edge strip is stretched to the bleed width in one resize
+    (NEAREST replicates the row/column exactly) instead of pasted per pixel.
+    """
+    if bleed <= 0:
+        return
+
     # Left bleed (mirror left edge of back cover)
-    if bleed > 0:
-        left_strip = wrap.crop((bleed, bleed, bleed + 1, bleed + panel_h))
-        for i in range(bleed):
-            wrap.paste(left_strip, (i, bleed))
-
-        # Right bleed (mirror right edge of front cover)
-        right_x = bleed + back_w + spine_w + front_w - 1
-        right_strip = wrap.crop((right_x, bleed, right_x + 1, bleed + panel_h))
-        for i in range(bleed):
-            wrap.paste(right_strip, (right_x + 1 + i, bleed))
-
-        # Top bleed (mirror top row of panels)
-        top_strip = wrap.crop((0, bleed, wrap.width, bleed + 1))
-        for i in range(bleed):
-            wrap.paste(top_strip, (0, i))
-
-        # Bottom bleed (mirror bottom row of panels)
-        bottom_y = bleed + panel_h - 1
-        bottom_strip = wrap.crop((0, bottom_y, wrap.width, bottom_y + 1))
-        for i in range(bleed):
-            wrap.paste(bottom_strip, (0, bottom_y + 1 + i))
+    left_strip = wrap.crop((bleed, bleed, bleed + 1, bleed + panel_h))
+    wrap.paste(left_strip.resize((bleed, panel_h), Image.NEAREST), (0, bleed))
+
+    # Right bleed (mirror right edge of front cover)
+    right_x = bleed + back_w + spine_w + front_w - 1
+    right_strip = wrap.crop((right_x, bleed, right_x + 1, bleed + panel_h))
+    wrap.paste(right_strip.resize((bleed, panel_h), Image.NEAREST), (right_x + 1, bleed))
+
+    # Top bleed (mirror top row of panels)
+    top_strip = wrap.crop((0, bleed, wrap.width, bleed + 1))
+    wrap.paste(top_strip.resize((wrap.width, bleed), Image.NEAREST), (0, 0))
+
+    # Bottom bleed (mirror bottom row of panels)
+    bottom_y = bleed + panel_h - 1
+    bottom_strip = wrap.crop((0, bottom_y, wrap.width, bottom_y + 1))
+    wrap.paste(bottom_strip.resize((wrap.width, bleed), Image.NEAREST), (0, bottom_y + 1))
@@ -13,9 +13,11 @@ Workflow:
     7. Export eBook JPEG + print PDF
 """
 
+import asyncio
 import io
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -96,6 +98,8 @@ class CoverEngine:
     _errors: List[str] = field(default_factory=list)
     _cost_usd: float = 0.0
     _art_prompt: str = ""
+    # (id(artwork), w, h) -> fitted/sharpened print-resolution master
+    _masters: Dict[tuple, Image.Image] = field(default_factory=dict)
 
     @classmethod
     def from_config_path(
@@ -212,7 +216,7 @@ class CoverEngine:
     # ------------------------------------------------------------------
 
     def _save_file(self, filename: str, data: Any, mode: str = "wb") -> Path:
-        """Save a file to the output directory."""
+        """Save a file to the output directory (safe to call from worker threads)."""
         self.cover_config.output_dir.mkdir(parents=True, exist_ok=True)
         path = self.cover_config.output_dir / filename
         if mode == "wb":
@@ -275,6 +279,19 @@ class CoverEngine:
         cc.synopsis_blurb = blurb
         return blurb
 
+    def _print_master(self, artwork: Image.Image, width: int, height: int) -> Image.Image:
+        """Upscale + crop + sharpen the artwork to print size once per run.
+
+        The master serves the front panel and the back-cover background, and
+        through them the full wrap and PDF.
+        """
+        key = (id(artwork), width, height)
+        master = self._masters.get(key)
+        if master is None:
+            master = fit_and_crop(artwork, width, height)
+            self._masters[key] = master
+        return master
+
     def _step_compose_ebook(self, artwork: Image.Image) -> Image.Image:
         """Step 5: Compose eBook cover (2560x1600)."""
         cc = self.cover_config
@@ -314,58 +331,72 @@ class CoverEngine:
             paper_type=cc.paper_type,
         )
 
-        # Step 6: Front cover at print resolution
-        front_art = fit_and_crop(artwork, dims.front_width_px, dims.front_height_px)
-        front = compose_front_cover(
-            artwork=front_art,
-            title=cc.title,
-            author_name=cc.author_name,
-            subtitle=cc.subtitle,
-            series_name=cc.series_name,
-            title_font_name=cc.title_font,
-            author_font_name=cc.author_font,
-            text_color=cc.title_color,
-            stroke_width=preset.get("text_stroke_width", 2),
-            shadow=preset.get("text_shadow", True),
-        )
-        buf = io.BytesIO()
-        front.save(buf, format="PNG", dpi=(300, 300))
-        self._save_file("cover_print_front.png", buf.getvalue())
+        master = self._print_master(artwork, dims.front_width_px, dims.front_height_px)
+
+        # Steps 6-8 are independent; Pillow releases the GIL for resampling,
+        # filtering and PNG encoding, so the panels render in parallel threads
+        def _front() -> Image.Image:
+            # Step 6: Front cover at print resolution
+            front = compose_front_cover(
+                artwork=master,
+                title=cc.title,
+                author_name=cc.author_name,
+                subtitle=cc.subtitle,
+                series_name=cc.series_name,
+                title_font_name=cc.title_font,
+                author_font_name=cc.author_font,
+                text_color=cc.title_color,
+                stroke_width=preset.get("text_stroke_width", 2),
+                shadow=preset.get("text_shadow", True),
+            )
+            buf = io.BytesIO()
+            front.save(buf, format="PNG", dpi=(300, 300))
+            self._save_file("cover_print_front.png", buf.getvalue())
+            return front
+
+        def _spine() -> Image.Image:
+            # Step 7: Spine
+            spine = compose_spine(
+                title=cc.title,
+                author_name=cc.author_name,
+                spine_width_px=dims.spine_width_px,
+                height_px=dims.front_height_px,
+                bg_color=preset["default_bg_color"],
+                text_color=preset["default_text_color"],
+                title_font_name=cc.title_font,
+                author_font_name=cc.author_font,
+            )
+            buf = io.BytesIO()
+            spine.save(buf, format="PNG", dpi=(300, 300))
+            self._save_file("cover_print_spine.png", buf.getvalue())
+            return spine
+
+        def _back() -> Image.Image:
+            # Step 8: Back cover (background from the shared master — already
+            # at back-panel size, so no second upscale)
+            back = compose_back_cover(
+                blurb=cc.synopsis_blurb,
+                author_bio=cc.author_bio,
+                width_px=dims.back_width_px,
+                height_px=dims.back_height_px,
+                bg_color=preset["default_bg_color"],
+                text_color=preset["default_text_color"],
+                tagline=cc.tagline,
+                body_font_name=cc.author_font,
+                artwork_bg=master,
+                safe_zone_px=dims.safe_zone_px,
+                barcode_width_px=dims.barcode_width_px,
+                barcode_height_px=dims.barcode_height_px,
+                show_barcode=cc.show_barcode,
+            )
+            buf = io.BytesIO()
+            back.save(buf, format="PNG", dpi=(300, 300))
+            self._save_file("cover_print_back.png", buf.getvalue())
+            return back
 
-        # Step 7: Spine
-        spine = compose_spine(
-            title=cc.title,
-            author_name=cc.author_name,
-            spine_width_px=dims.spine_width_px,
-            height_px=dims.front_height_px,
-            bg_color=preset["default_bg_color"],
-            text_color=preset["default_text_color"],
-            title_font_name=cc.title_font,
-            author_font_name=cc.author_font,
-        )
-        buf = io.BytesIO()
-        spine.save(buf, format="PNG", dpi=(300, 300))
-        self._save_file("cover_print_spine.png", buf.getvalue())
-
-        # Step 8: Back cover
-        back = compose_back_cover(
-            blurb=cc.synopsis_blurb,
-            author_bio=cc.author_bio,
-            width_px=dims.back_width_px,
-            height_px=dims.back_height_px,
-            bg_color=preset["default_bg_color"],
-            text_color=preset["default_text_color"],
-            tagline=cc.tagline,
-            body_font_name=cc.author_font,
-            artwork_bg=artwork,
-            safe_zone_px=dims.safe_zone_px,
-            barcode_width_px=dims.barcode_width_px,
-            barcode_height_px=dims.barcode_height_px,
-            show_barcode=cc.show_barcode,
-        )
-        buf = io.BytesIO()
-        back.save(buf, format="PNG", dpi=(300, 300))
-        self._save_file("cover_print_back.png", buf.getvalue())
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="covergen") as pool:
+            front_f, spine_f, back_f = pool.submit(_front), pool.submit(_spine), pool.submit(_back)
+            front, spine, back = front_f.result(), spine_f.result(), back_f.result()
 
         # Step 9: Assemble full wrap
         wrap = assemble_full_wrap(
@@ -451,26 +482,24 @@ class CoverEngine:
         """
         logger.info("Starting cover generation for '%s'", self.cover_config.title)
 
-        # Step 2: Art direction
-        await self._step_art_direction()
-
-        # Step 3: Generate artwork + Step blurb (parallel)
-        artwork = await self._step_generate_artwork()
-        await self._step_generate_blurb()
-
-        # Step 5: eBook cover
-        try:
-            self._step_compose_ebook(artwork)
-        except Exception as e:
-            self._errors.append(f"eBook cover failed: {e}")
-            logger.error("eBook cover composition failed: %s", e)
+        # Steps 2-3: Art direction -> artwork, with the blurb LLM call in parallel
+        artwork, _ = await asyncio.gather(
+            self._step_artwork_chain(),
+            self._step_generate_blurb(),
+        )
 
-        # Steps 6-10: Print cover
-        try:
-            self._step_compose_print(artwork)
-        except Exception as e:
-            self._errors.append(f"Print cover failed: {e}")
-            logger.error("Print cover composition failed: %s", e)
+        # Step 5 (eBook) and Steps 6-10 (print) compose off the event loop, in parallel
+        ebook_result, print_result = await asyncio.gather(
+            asyncio.to_thread(self._step_compose_ebook, artwork),
+            asyncio.to_thread(self._step_compose_print, artwork),
+            return_exceptions=True,
+        )
+        if isinstance(ebook_result, Exception):
+            self._errors.append(f"eBook cover failed: {ebook_result}")
+            logger.error("eBook cover composition failed: %s", ebook_result)
+        if isinstance(print_result, Exception):
+            self._errors.append(f"Print cover failed: {print_result}")
+            logger.error("Print cover composition failed: %s", print_result)
 
         # Report
         report = self._generate_report()
@@ -483,11 +512,15 @@ class CoverEngine:
             "output_dir": str(self.cover_config.output_dir),
         }
 
+    async def _step_artwork_chain(self) -> Image.Image:
+        """Steps 2-3: art direction prompt, then artwork from it."""
+        await self._step_art_direction()
+        return await self._step_generate_artwork()
+
     async def generate_ebook_cover(self) -> Dict[str, Any]:
         """Generate only the eBook cover."""
-        await self._step_art_direction()
-        artwork = await self._step_generate_artwork()
-        self._step_compose_ebook(artwork)
+        artwork = await self._step_artwork_chain()
+        await asyncio.to_thread(self._step_compose_ebook, artwork)
 
         report = self._generate_report()
         self._save_file("cover_report.md", report, mode="w")
@@ -500,10 +533,11 @@ class CoverEngine:
 
     async def generate_print_cover(self) -> Dict[str, Any]:
         """Generate only the print cover (front + spine + back + PDF)."""
-        await self._step_art_direction()
-        artwork = await self._step_generate_artwork()
-        await self._step_generate_blurb()
-        self._step_compose_print(artwork)
+        artwork, _ = await asyncio.gather(
+            self._step_artwork_chain(),
+            self._step_generate_blurb(),
+        )
+        await asyncio.to_thread(self._step_compose_print, artwork)
 
         report = self._generate_report()
         self._save_file("cover_report.md", report, mode="w")
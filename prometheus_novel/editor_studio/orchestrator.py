@@ -1,11 +1,12 @@
 """Editor Studio orchestrator — runs surgical refinement passes on existing manuscript."""
 
+import asyncio
 import json
 import logging
 import re
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from editor_studio.passes import (
     PASS_0_DEFLECTION,
@@ -23,8 +24,22 @@ from editor_studio.passes import (
     PASS_OPENING_VARY,
     PASS_CROSS_SCENE_TRANSITION,
     PASS_LINE_SHARPEN,
+    FUSED_HEADER,
+    FUSED_ITEM,
 )
 
+from quality.span_patch import (
+    PATCH_OUTPUT_INSTRUCTIONS,
+    PATCH_SYSTEM_PROMPT,
+    apply_patches,
+    build_patch_excerpt,
+    head_indices,
+    parse_patches,
+    tail_indices,
+)
+from stages.resources import resources
+from stages.scene_schema import dumps_json, load_state_file
+
 # Overused physical tics to replace (from weakness report / editorial_craft)
 OVERUSED_GESTURES = [
     "hand through his hair",
@@ -131,6 +146,27 @@ PASS_TEMPERATURES = {
 }
 
 
+# Passes whose fix lives in a known span: (which end of the scene, paragraphs)
+PASS_SPANS = {
+    "final_line": ("tail", 3),
+    "truncation_complete": ("tail", 3),
+    "opening_vary": ("head", 3),
+    "cross_scene_transition": ("head", 3),
+}
+
+
+def _pass_patch_indices(pass_names: List[str], content: str) -> Optional[Set[int]]:
+    """Editable paragraphs for these passes; None when any pass may touch anything."""
+    indices: Set[int] = set()
+    for name in pass_names:
+        span = PASS_SPANS.get(name)
+        if span is None:
+            return None
+        where, count = span
+        indices |= tail_indices(content, count) if where == "tail" else head_indices(content, count)
+    return indices
+
+
 async def _run_pass(
     client: Any,
     scene: Dict,
@@ -139,8 +175,17 @@ async def _run_pass(
     *,
     context: str = "",
     temperature: float = 0.4,
+    instruction: str = "Your job: make ONE targeted fix. Do not rewrite the whole scene.",
+    max_tokens: int = 4000,
+    patch: bool = False,
+    patch_indices: Optional[Set[int]] = None,
 ) -> Optional[str]:
-    """Run one pass on one scene. Returns modified content or None."""
+    """Run one pass on one scene. Returns modified content or None.
+
+    With ``patch`` the model first gets anchored paragraphs (only
+    ``patch_indices`` plus neighbours when given) and answers with span
+    patches; an unusable answer falls back to the full-scene rewrite.
+    """
     if not client:
         return None
     content = scene.get("content", "")
@@ -167,7 +212,39 @@ async def _run_pass(
             parts.append(f"Characters: {', '.join(char_names)}")
         voice_context = "\n".join(parts)
 
-    prompt = f"""You are a surgical revision editor. Your job: make ONE targeted fix. Do not rewrite the whole scene.
+    if patch and (patch_indices is None or patch_indices):
+        scope = (
+            "Only paragraphs labelled [P<n>] are editable; CONTEXT paragraphs are read-only."
+            if patch_indices is not None else
+            "Patch only the paragraphs that must change; leave the rest out of your answer."
+        )
+        patch_prompt = f"""You are a surgical revision editor. {instruction}
+
+Scene ID: {scene_id}
+POV: {pov}
+{voice_context + chr(10) if voice_context else ""}{task_block}
+
+{scope}
+
+=== SCENE (anchored paragraphs) ===
+{build_patch_excerpt(content, patch_indices)}
+
+{PATCH_OUTPUT_INSTRUCTIONS}"""
+        if context:
+            patch_prompt = f"{context}\n\n{patch_prompt}"
+        try:
+            response = await client.generate(
+                patch_prompt, max_tokens=max_tokens, temperature=temperature,
+                system_prompt=PATCH_SYSTEM_PROMPT,
+            )
+            result = apply_patches(content, parse_patches(response.content if response else ""), allowed=patch_indices)
+            if result.ok:
+                return result.content
+            logger.debug("Span patch rejected for %s (%s); full rewrite", scene_id, "; ".join(result.errors[:3]))
+        except Exception as e:
+            logger.debug("Span patch failed for %s: %s; full rewrite", scene_id, e)
+
+    prompt = f"""You are a surgical revision editor. {instruction}
 
 Scene ID: {scene_id}
 POV: {pov}
@@ -183,7 +260,7 @@ Return ONLY the revised scene text. No commentary. No "Here is the revised scene
         prompt = f"{context}\n\n{prompt}"
 
     try:
-        response = await client.generate(prompt, max_tokens=4000, temperature=temperature)
+        response = await client.generate(prompt, max_tokens=max_tokens, temperature=temperature)
         if response and response.content:
             return response.content.strip()
     except Exception as e:
@@ -191,6 +268,97 @@ Return ONLY the revised scene text. No commentary. No "Here is the revised scene
     return None
 
 
+def _fuse_task_blocks(tasks: List[Tuple[str, str]]) -> str:
+    """Combine (pass_name, task_block) pairs into one numbered task block."""
+    count = len(tasks)
+    items = [
+        FUSED_ITEM.format(number=i, count=count, pass_name=name, task=task)
+        for i, (name, task) in enumerate(tasks, 1)
+    ]
+    return "\n\n".join([FUSED_HEADER.format(count=count)] + items)
+
+
+async def _run_fused(
+    client: Any,
+    scenes_list: List[Dict],
+    pass_names: List[str],
+    select_targets: Callable[[str], Set[int]],
+    build_task: Callable[[str, Dict], Optional[str]],
+    config: Dict,
+    report: Dict[str, Any],
+    *,
+    max_concurrent: int = 4,
+    patch: bool = False,
+) -> int:
+    """Fused mode: one revision call per scene covering every pass that targets it.
+
+    Targets and task blocks are planned from the content as it stands before
+    any revision. Scenes run concurrently; per-pass attribution is kept in
+    report["passes_run"] and per-scene detail in report["fused_scenes"].
+    Returns the number of scenes modified.
+    """
+    plan: Dict[int, List[Tuple[str, str]]] = defaultdict(list)
+    processed: Dict[str, int] = {}
+    for pass_name in pass_names:
+        targets = [i for i in sorted(select_targets(pass_name)) if i < len(scenes_list)]
+        processed[pass_name] = 0
+        for idx in targets:
+            task = build_task(pass_name, scenes_list[idx])
+            if task is not None:
+                plan[idx].append((pass_name, task))
+                processed[pass_name] += 1
+
+    sem = asyncio.Semaphore(max(1, int(max_concurrent)))
+    modified_by_pass: Dict[str, int] = {p: 0 for p in pass_names}
+
+    async def _revise(idx: int) -> Dict[str, Any]:
+        scene = scenes_list[idx]
+        tasks = plan[idx]
+        names = [name for name, _ in tasks]
+        task_block = tasks[0][1] if len(tasks) == 1 else _fuse_task_blocks(tasks)
+        # Most conservative temperature among the fused passes
+        temp = min(PASS_TEMPERATURES.get(name, 0.4) for name in names)
+        instruction = (
+            "Your job: apply the listed targeted fixes. Do not rewrite the whole scene."
+            if len(tasks) > 1 else
+            "Your job: make ONE targeted fix. Do not rewrite the whole scene."
+        )
+        async with sem:
+            new_content = await _run_pass(
+                client, scene, task_block, config, temperature=temp, instruction=instruction,
+                patch=patch, patch_indices=_pass_patch_indices(names, scene.get("content", "")),
+            )
+        orig_content = scene.get("content", "")
+        accepted = bool(
+            new_content
+            and new_content != orig_content
+            and _validate_output(orig_content, new_content)
+        )
+        if accepted:
+            scene["content"] = new_content
+            for name in names:
+                modified_by_pass[name] += 1
+        elif new_content and not _validate_output(orig_content, new_content):
+            logger.debug("Fused revision rejected output for %s (length/validation)", _scene_id(scene))
+        return {"scene_id": _scene_id(scene), "passes": names, "modified": accepted}
+
+    fused_scenes = await asyncio.gather(*(_revise(i) for i in sorted(plan)))
+
+    for pass_name in pass_names:
+        if not processed[pass_name]:
+            logger.info("Pass %s: no targeted scenes", pass_name)
+        report["passes_run"].append({
+            "pass": pass_name,
+            "scenes_processed": processed[pass_name],
+            "scenes_modified": modified_by_pass[pass_name],
+        })
+    report["mode"] = "fused"
+    report["fused_scenes"] = list(fused_scenes)
+    modified = sum(1 for r in fused_scenes if r["modified"])
+    logger.info("Fused editor passes: %d revision calls, %d scenes modified", len(fused_scenes), modified)
+    return modified
+
+
 async def run_editor_studio(
     project_path: Path,
     passes_enabled: Optional[List[str]] = None,
@@ -205,6 +373,8 @@ async def run_editor_studio(
     genre: Optional[str] = None,
     skip_persist: bool = False,
     quality_triage: Optional[List[Dict]] = None,
+    mode: Optional[str] = None,
+    max_concurrent_scenes: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Run Editor Studio passes on a completed manuscript.
 
@@ -222,6 +392,11 @@ async def run_editor_studio(
         characters: Optional list (from pipeline state) for voice context in prompts.
         genre: Optional genre string (from config) for voice context in prompts.
         skip_persist: If True, do not write back to disk (caller owns state)
+        mode: "sequential" (default; each pass rewrites its scenes in turn) or
+            "fused" (all passes triggered for a scene applied in one call).
+            Falls back to config editor_studio.mode.
+        max_concurrent_scenes: Fused mode concurrency (default
+            editor_studio.max_concurrent_scenes, else 4).
 
     Returns:
         Report dict with per-pass stats and any errors.
@@ -246,8 +421,7 @@ async def run_editor_studio(
         if not state_file.exists():
             report["errors"].append("pipeline_state.json not found — run pipeline first")
             return report
-        with open(state_file, encoding="utf-8") as f:
-            state = json.load(f)
+        state = load_state_file(state_file)
         scenes = state.get("scenes", [])
 
     if not scenes:
@@ -257,9 +431,7 @@ async def run_editor_studio(
     if config is None:
         config = state.get("config", {}) or {}
         if config_file.exists():
-            import yaml
-            with open(config_file, encoding="utf-8") as f:
-                config = yaml.safe_load(f) or config
+            config = resources().yaml(config_file) or config
 
     # Load quality contract for targeting
     qc_full = quality_contract_report
@@ -344,12 +516,8 @@ async def run_editor_studio(
     # gesture_diversify: use manuscript-mined phrases when provided, else fallback
     gesture_phrases = overused_phrases if overused_phrases else OVERUSED_GESTURES
 
-    for pass_name in to_run:
-        if pass_name not in all_pass_names:
-            continue
-        pass_modified = 0
-
-        # Build list of scene indices to process per pass
+    def _select_targets(pass_name: str) -> Set[int]:
+        """Scene indices (into scenes_list) a pass applies to, from current content."""
         if pass_name == "deflection":
             target_ids = {s for s, w in warnings_by_scene.items() if any("DEFLECTION" in x for x in w)}
         elif pass_name == "continuity":
@@ -444,92 +612,122 @@ async def run_editor_studio(
                 if _scene_id(s) in target_ids
             }
 
-        if not target_indices and pass_name not in ("voice", "gesture_diversify", "line_sharpen"):
-            logger.info("Pass %s: no targeted scenes", pass_name)
-            report["passes_run"].append({"pass": pass_name, "scenes_processed": 0})
-            continue
+        return target_indices
 
-        for idx in sorted(target_indices):
-            if idx >= len(scenes_list):
+    def _build_task(pass_name: str, scene: Dict) -> Optional[str]:
+        """Task block for one pass on one scene."""
+        sid = _scene_id(scene)
+        warnings = warnings_by_scene.get(sid, [])
+        by_type = _warnings_by_type(warnings)
+
+        if pass_name == "deflection":
+            task = PASS_0_DEFLECTION
+        elif pass_name == "continuity":
+            task = PASS_1_CONTINUITY.format(warnings="\n".join(by_type.get("CONTINUITY", [])))
+        elif pass_name == "dialogue_friction":
+            task = PASS_2_DIALOGUE_FRICTION
+        elif pass_name == "stakes":
+            task = PASS_3_STAKES
+        elif pass_name == "final_line":
+            ending_type = _parse_final_line_ending(by_type)
+            task = PASS_4_FINAL_LINE.format(ending_type=ending_type)
+        elif pass_name == "voice":
+            task = PASS_5_VOICE
+        elif pass_name == "rhythm":
+            task = PASS_RHYTHM
+        elif pass_name == "tension_collapse":
+            prev_t, curr_t = _parse_tension_collapse(warnings)
+            task = PASS_TENSION_COLLAPSE.format(prev_tension=prev_t, curr_tension=curr_t)
+        elif pass_name == "causality":
+            task = PASS_CAUSALITY
+        elif pass_name == "gesture_diversify":
+            content_lower = (scene.get("content") or "").lower()
+            found = [p for p in gesture_phrases if p.lower() in content_lower]
+            phrase = found[0] if found else (gesture_phrases[0] if gesture_phrases else "hand through his hair")
+            count = content_lower.count(phrase.lower())
+            task = PASS_GESTURE_DIVERSIFY.format(phrase=phrase, count=count)
+        elif pass_name == "line_sharpen":
+            task = PASS_LINE_SHARPEN
+        elif pass_name == "truncation_complete":
+            task = PASS_TRUNCATION_COMPLETE
+        elif pass_name == "opening_vary":
+            prev_opening = opening_vary_map.get(sid.lower(), "UNKNOWN")
+            task = PASS_OPENING_VARY.format(prev_opening=prev_opening)
+        elif pass_name == "cross_scene_transition":
+            pairs = cross_scene_map.get(sid.lower(), [])
+            prev_c, curr_c = pairs[0] if pairs else ("previous scene", "this scene")
+            task = PASS_CROSS_SCENE_TRANSITION.format(prev_context=prev_c, curr_context=curr_c)
+        elif pass_name == "premium":
+            task = PASS_6_PREMIUM
+        else:
+            return None
+        return task
+
+    es_cfg = run_config.get("editor_studio", {}) or {}
+    mode = (mode or es_cfg.get("mode") or "sequential").lower()
+    use_patch = (run_config.get("span_patch", {}) or {}).get("enabled", True) is not False
+    if mode == "fused":
+        modified_count = await _run_fused(
+            llm, scenes_list, [p for p in to_run if p in all_pass_names],
+            _select_targets, _build_task, run_config, report,
+            max_concurrent=max_concurrent_scenes or es_cfg.get("max_concurrent_scenes", 4),
+            patch=use_patch,
+        )
+    else:
+        for pass_name in to_run:
+            if pass_name not in all_pass_names:
                 continue
-            scene = scenes_list[idx]
-            sid = _scene_id(scene)
-            warnings = warnings_by_scene.get(sid, [])
-            by_type = _warnings_by_type(warnings)
-
-            if pass_name == "deflection":
-                task = PASS_0_DEFLECTION
-            elif pass_name == "continuity":
-                task = PASS_1_CONTINUITY.format(warnings="\n".join(by_type.get("CONTINUITY", [])))
-            elif pass_name == "dialogue_friction":
-                task = PASS_2_DIALOGUE_FRICTION
-            elif pass_name == "stakes":
-                task = PASS_3_STAKES
-            elif pass_name == "final_line":
-                ending_type = _parse_final_line_ending(by_type)
-                task = PASS_4_FINAL_LINE.format(ending_type=ending_type)
-            elif pass_name == "voice":
-                task = PASS_5_VOICE
-            elif pass_name == "rhythm":
-                task = PASS_RHYTHM
-            elif pass_name == "tension_collapse":
-                prev_t, curr_t = _parse_tension_collapse(warnings)
-                task = PASS_TENSION_COLLAPSE.format(prev_tension=prev_t, curr_tension=curr_t)
-            elif pass_name == "causality":
-                task = PASS_CAUSALITY
-            elif pass_name == "gesture_diversify":
-                content_lower = (scene.get("content") or "").lower()
-                found = [p for p in gesture_phrases if p.lower() in content_lower]
-                phrase = found[0] if found else (gesture_phrases[0] if gesture_phrases else "hand through his hair")
-                count = content_lower.count(phrase.lower())
-                task = PASS_GESTURE_DIVERSIFY.format(phrase=phrase, count=count)
-            elif pass_name == "line_sharpen":
-                task = PASS_LINE_SHARPEN
-            elif pass_name == "truncation_complete":
-                task = PASS_TRUNCATION_COMPLETE
-            elif pass_name == "opening_vary":
-                prev_opening = opening_vary_map.get(sid.lower(), "UNKNOWN")
-                task = PASS_OPENING_VARY.format(prev_opening=prev_opening)
-            elif pass_name == "cross_scene_transition":
-                pairs = cross_scene_map.get(sid.lower(), [])
-                prev_c, curr_c = pairs[0] if pairs else ("previous scene", "this scene")
-                task = PASS_CROSS_SCENE_TRANSITION.format(prev_context=prev_c, curr_context=curr_c)
-            elif pass_name == "premium":
-                task = PASS_6_PREMIUM
-            else:
+            pass_modified = 0
+            target_indices = _select_targets(pass_name)
+
+            if not target_indices and pass_name not in ("voice", "gesture_diversify", "line_sharpen"):
+                logger.info("Pass %s: no targeted scenes", pass_name)
+                report["passes_run"].append({"pass": pass_name, "scenes_processed": 0})
                 continue
 
-            temp = PASS_TEMPERATURES.get(pass_name, 0.4)
-            new_content = await _run_pass(llm, scene, task, run_config, temperature=temp)
-            orig_content = scene.get("content", "")
-            if (
-                new_content
-                and new_content != orig_content
-                and _validate_output(orig_content, new_content)
-            ):
-                scene["content"] = new_content
-                pass_modified += 1
-                modified_count += 1
-            elif new_content and not _validate_output(orig_content, new_content):
-                logger.debug(
-                    "Pass %s rejected output for %s (length/validation)",
-                    pass_name, sid,
+            for idx in sorted(target_indices):
+                if idx >= len(scenes_list):
+                    continue
+                scene = scenes_list[idx]
+                sid = _scene_id(scene)
+                task = _build_task(pass_name, scene)
+                if task is None:
+                    continue
+
+                temp = PASS_TEMPERATURES.get(pass_name, 0.4)
+                new_content = await _run_pass(
+                    llm, scene, task, run_config, temperature=temp, patch=use_patch,
+                    patch_indices=_pass_patch_indices([pass_name], scene.get("content", "")),
                 )
+                orig_content = scene.get("content", "")
+                if (
+                    new_content
+                    and new_content != orig_content
+                    and _validate_output(orig_content, new_content)
+                ):
+                    scene["content"] = new_content
+                    pass_modified += 1
+                    modified_count += 1
+                elif new_content and not _validate_output(orig_content, new_content):
+                    logger.debug(
+                        "Pass %s rejected output for %s (length/validation)",
+                        pass_name, sid,
+                    )
 
-        report["passes_run"].append({
-            "pass": pass_name,
-            "scenes_processed": len(target_indices),
-            "scenes_modified": pass_modified,
-        })
-        logger.info("Pass %s: %d modified", pass_name, pass_modified)
+            report["passes_run"].append({
+                "pass": pass_name,
+                "scenes_processed": len(target_indices),
+                "scenes_modified": pass_modified,
+            })
+            logger.info("Pass %s: %d modified", pass_name, pass_modified)
 
     report["scenes_modified"] = modified_count
 
     # Persist back to pipeline_state and output (unless skip_persist)
     if modified_count > 0 and not skip_persist:
         state["scenes"] = scenes
-        with open(state_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+        with open(state_file, "wb") as f:
+            f.write(dumps_json(state, indent=True))
         logger.info("Saved %d scene changes to pipeline_state.json", modified_count)
 
         # Recompile manuscript to .md (match pipeline output format)
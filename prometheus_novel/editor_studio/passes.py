@@ -176,3 +176,12 @@ Perform ONLY these micro-edits (do not rewrite structure or plot):
 
 Do NOT change plot, dialogue content, character voice, or emotional beats.
 Output the FULL scene with your edits."""
+
+# Fused mode: every pass triggered for a scene is applied in one revision call
+FUSED_HEADER = """=== COMBINED REVISION: {count} fixes ===
+Apply ALL of the numbered fixes below in a single revision of the scene.
+Each fix is surgical: change only what it requires, and do not let one fix
+undo another. Where fixes touch the same passage, satisfy both."""
+
+FUSED_ITEM = """--- FIX {number} of {count} ({pass_name}) ---
+{task}"""
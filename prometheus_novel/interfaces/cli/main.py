@@ -10,7 +10,6 @@ Provides command-line access to novel generation functionality:
 
 import os
 import sys
-import asyncio
 from pathlib import Path
 from typing import Optional
 import argparse
@@ -27,23 +26,35 @@ if sys.platform == "win32":
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-# Load .env so API keys are available to LLM clients
-from dotenv import load_dotenv, find_dotenv
-load_dotenv(find_dotenv(usecwd=True))
+# Startup is kept cheap: heavy modules (pipeline, LLM clients, quality
+# modules, asyncio, PyYAML) are imported by the commands that need them, and
+# .env/logging setup only runs for commands that can reach an LLM.
+# Benchmark: python -m scripts.bench_cli_startup
+
+# Commands that never call an LLM: no .env loading, no log file
+LIGHT_COMMANDS = {"new", "compile", "ideas", "pre-polish-sample"}
 
-try:
-    import yaml
-except ImportError:
-    print("Installing PyYAML...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pyyaml"])
-    import yaml
 
-from prometheus_lib.utils.logging_config import setup_logging
-import logging
+def _init_runtime():
+    """Load .env so API keys are available to LLM clients, and configure logging."""
+    from dotenv import load_dotenv, find_dotenv
+    load_dotenv(find_dotenv(usecwd=True))
+
+    from prometheus_lib.utils.logging_config import setup_logging
+    setup_logging()
+
+
+def _yaml():
+    """Import PyYAML on first use, installing it if missing."""
+    try:
+        import yaml
+    except ImportError:
+        print("Installing PyYAML...")
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyyaml"])
+        import yaml
+    return yaml
 
-setup_logging()
-logger = logging.getLogger("writerai.cli")
 
 # ANSI colors for terminal output
 class Colors:
@@ -233,7 +244,7 @@ def cmd_new(args):
 
     config_file = project_dir / "config.yaml"
     with open(config_file, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False)
+        _yaml().dump(config, f, default_flow_style=False)
 
     print_success(f"Project created: {project_dir}")
     print_info(f"Config saved to: {config_file}")
@@ -246,6 +257,31 @@ def cmd_new(args):
     return 0
 
 
+def _print_rerun_plan(project_path: Path, stages_to_run, rewrite_scenes_indices) -> int:
+    """Print which scenes each per-scene stage would re-process (generate --what-would-rerun)."""
+    from stages.pipeline import PipelineOrchestrator, PipelineState
+
+    state = PipelineState.load(project_path)
+    if state is None or not state.scenes:
+        print_warning("No scenes in pipeline_state.json — nothing to plan.")
+        return 1
+    orchestrator = PipelineOrchestrator(project_path)
+    orchestrator.state = state
+    plan = orchestrator.incremental_plan(stages_to_run, rewrite_scenes_indices)
+
+    mode = "incremental" if plan["incremental"] else "full (incremental off)"
+    print(f"\n{Colors.CYAN}What would rerun — {plan['scenes']} scenes, {mode}{Colors.END}\n")
+    for stage, entry in plan["stages"].items():
+        if "rerun" not in entry:
+            label = "all scenes" if entry["mode"] == "full" else "-"
+            print(f"  {stage:24s} {label}")
+            continue
+        rerun = entry["rerun"]
+        shown = ", ".join(str(i) for i in rerun[:20]) + (" ..." if len(rerun) > 20 else "")
+        print(f"  {stage:24s} {len(rerun)} rerun, {entry['reuse']} reused  [{shown}]")
+    return 0
+
+
 def cmd_generate(args):
     """Generate a novel from a project config."""
     print_banner()
@@ -256,56 +292,20 @@ def cmd_generate(args):
         return 1
 
     with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = _yaml().safe_load(f)
 
     print(f"\n{Colors.HEADER}Generating Novel: {config.get('title', 'Untitled')}{Colors.END}\n")
     print_info(f"Genre: {config.get('genre', 'unknown')}")
     print_info(f"Budget: ${config.get('budget_usd', 100)}")
 
-    # Set up LLM clients (same pattern as web dashboard)
-    from prometheus_lib.llm.clients import get_client, is_ollama_model
+    # Stage names come from the class, so --list-stages and stage validation
+    # don't construct clients or load policy.
     from stages.pipeline import PipelineOrchestrator
 
-    model_defaults = config.get("model_defaults", {})
-    api_model = model_defaults.get("api_model", "qwen2.5:7b")
-    critic_model = model_defaults.get("critic_model", api_model)
-    fallback_model = model_defaults.get("fallback_model", api_model)
-    structure_gate_model = model_defaults.get("structure_gate_model")
-    draft_model = model_defaults.get("draft_model", api_model)
-    rewrite_model = model_defaults.get("rewrite_model", critic_model)
-
-    llm_clients = {}
-    default_client = get_client(api_model)
-    llm_clients["gpt"] = default_client
-    llm_clients["claude"] = get_client(critic_model)
-    llm_clients["gemini"] = get_client(fallback_model)
-    if structure_gate_model:
-        llm_clients["structure"] = get_client(structure_gate_model)
-    llm_clients["draft"] = get_client(draft_model)
-    llm_clients["rewrite"] = get_client(rewrite_model)
-
-    local_tag = "Ollama" if is_ollama_model(api_model) else "API"
-    print_info(f"Model: {api_model} ({local_tag})")
-    if critic_model != api_model:
-        print_info(f"Critic: {critic_model}")
-    if fallback_model != api_model:
-        print_info(f"Fallback: {fallback_model}")
-    if structure_gate_model:
-        print_info(f"Structure gate: {structure_gate_model}")
-    if draft_model != api_model:
-        print_info(f"Draft model: {draft_model}")
-    if rewrite_model != critic_model:
-        print_info(f"Rewrite model: {rewrite_model}")
-
     project_path = config_path.parent
-    orchestrator = PipelineOrchestrator(
-        project_path,
-        llm_client=default_client,
-        llm_clients=llm_clients
-    )
 
     # Determine stage range
-    all_stages = orchestrator.STAGES
+    all_stages = PipelineOrchestrator.STAGES
     stages_to_run = None  # None = all stages (default)
 
     if args.stage:
@@ -399,9 +399,55 @@ def cmd_generate(args):
             print_error("--rewrite-scenes must be comma-separated integers (e.g. 3,7,12)")
             return 1
 
+    # Incremental dry run: what would rerun, from checkpoint provenance (no LLM clients)
+    if getattr(args, "what_would_rerun", False):
+        return _print_rerun_plan(project_path, stages_to_run, rewrite_scenes_indices)
+
+    # Set up LLM clients (same pattern as web dashboard)
+    from prometheus_lib.llm.clients import get_client, is_ollama_model
+
+    model_defaults = config.get("model_defaults", {})
+    api_model = model_defaults.get("api_model", "qwen2.5:7b")
+    critic_model = model_defaults.get("critic_model", api_model)
+    fallback_model = model_defaults.get("fallback_model", api_model)
+    structure_gate_model = model_defaults.get("structure_gate_model")
+    draft_model = model_defaults.get("draft_model", api_model)
+    rewrite_model = model_defaults.get("rewrite_model", critic_model)
+
+    llm_clients = {}
+    default_client = get_client(api_model)
+    llm_clients["gpt"] = default_client
+    llm_clients["claude"] = get_client(critic_model)
+    llm_clients["gemini"] = get_client(fallback_model)
+    if structure_gate_model:
+        llm_clients["structure"] = get_client(structure_gate_model)
+    llm_clients["draft"] = get_client(draft_model)
+    llm_clients["rewrite"] = get_client(rewrite_model)
+
+    local_tag = "Ollama" if is_ollama_model(api_model) else "API"
+    print_info(f"Model: {api_model} ({local_tag})")
+    if critic_model != api_model:
+        print_info(f"Critic: {critic_model}")
+    if fallback_model != api_model:
+        print_info(f"Fallback: {fallback_model}")
+    if structure_gate_model:
+        print_info(f"Structure gate: {structure_gate_model}")
+    if draft_model != api_model:
+        print_info(f"Draft model: {draft_model}")
+    if rewrite_model != critic_model:
+        print_info(f"Rewrite model: {rewrite_model}")
+
+    orchestrator = PipelineOrchestrator(
+        project_path,
+        llm_client=default_client,
+        llm_clients=llm_clients
+    )
+
     # Run
     print(f"\n{Colors.CYAN}Starting pipeline...{Colors.END}\n")
 
+    import asyncio
+
     async def _run():
         return await orchestrator.run(
             stages=stages_to_run,
@@ -438,7 +484,7 @@ def cmd_compile(args):
         return 1
 
     with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = _yaml().safe_load(f)
 
     output_format = args.format or "html"
     project_dir = config_path.parent
@@ -557,12 +603,14 @@ def cmd_editor_studio(args):
     config = {}
     if config_path.exists():
         with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+            config = _yaml().safe_load(f) or {}
     from prometheus_lib.llm.clients import get_client
     defaults = config.get("model_defaults", {}) or {}
     model = defaults.get("critic_model") or defaults.get("api_model") or "gpt-4o-mini"
     print_info(f"Model: {model}")
 
+    import asyncio
+
     async def _run():
         from editor_studio.orchestrator import run_editor_studio
         client = get_client(model)
@@ -631,7 +679,7 @@ def cmd_audit(args):
     config = {}
     if config_path.exists():
         with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+            config = _yaml().safe_load(f) or {}
 
     r = run_developmental_audit(
         state.get("scenes", []),
@@ -871,6 +919,58 @@ def cmd_cover(args):
         return 1
 
 
+def cmd_batch(args):
+    """Generate many books in parallel with shared model limits and caches."""
+    print_banner()
+
+    project_paths = []
+    for p in args.projects:
+        path = Path(p)
+        if path.name == "config.yaml":
+            path = path.parent
+        if not (path / "config.yaml").exists():
+            print_error(f"No config.yaml in project: {path}")
+            return 1
+        project_paths.append(path)
+
+    per_model = {}
+    for spec in args.model_limit or []:
+        model, _, limit = spec.rpartition("=")
+        if not model or not limit.isdigit():
+            print_error(f"--model-limit must look like MODEL=N (got {spec!r})")
+            return 1
+        per_model[model] = int(limit)
+
+    import asyncio
+    from batch.engine import BatchEngine, ConcurrencyLimits
+
+    engine = BatchEngine(
+        project_paths,
+        output_dir=Path(args.output_dir),
+        max_books=args.max_books,
+        limits=ConcurrencyLimits(
+            global_limit=args.max_requests,
+            per_model=per_model,
+            default_per_model=args.per_model,
+        ),
+        max_attempts=args.max_attempts,
+    )
+    print_info(f"Batch: {len(project_paths)} projects, {args.max_books} books in flight, "
+               f"{args.max_requests} concurrent requests")
+
+    try:
+        report = asyncio.run(engine.run())
+    except KeyboardInterrupt:
+        print_warning("\nBatch interrupted. Each book keeps its own checkpoint; rerun to resume.")
+        return 1
+
+    print_success(f"Batch complete: {report.books_completed} done, {report.books_failed} failed")
+    print_info(f"Throughput: {report.books_per_hour:.2f} books/hour, {report.tokens_per_sec:.1f} tokens/sec")
+    if report.cost_per_10k_words is not None:
+        print_info(f"Cost per 10k words: ${report.cost_per_10k_words:.4f}")
+    return 0 if report.books_failed == 0 else 1
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
@@ -904,7 +1004,7 @@ def cmd_pre_polish_sample(args):
             config = {}
             if config_path_for_flat.exists():
                 with open(config_path_for_flat, encoding="utf-8") as f:
-                    config = yaml.safe_load(f) or {}
+                    config = _yaml().safe_load(f) or {}
             from quality.voice_heatmap import get_flat_scene_ids
             flat_ids = get_flat_scene_ids(scenes, config)
             if flat_ids:
@@ -957,6 +1057,8 @@ def main():
     gen_parser.add_argument("--rewrite-scenes", dest="rewrite_scenes",
                             help="Only process these scene indices (0-based, comma-separated, e.g. 3,7,12). Use with --stage for targeted fixes.")
     gen_parser.add_argument("--list-stages", dest="list_stages", action="store_true", help="List all pipeline stages and exit")
+    gen_parser.add_argument("--what-would-rerun", dest="what_would_rerun", action="store_true",
+                            help="Dry run: list the scenes each per-scene stage would re-process (incremental recompute); exit before running")
     gen_parser.add_argument("--resume", action="store_true", help="Resume from last checkpoint")
     gen_parser.add_argument("--pre-polish-sample", dest="pre_polish_sample", action="store_true",
                             help="Print scene indices for human readability gate (early, midpoint, climax); exit before running")
@@ -1057,6 +1159,22 @@ def main():
     sample_parser.add_argument("--config", "-c", required=True, help="Path to project config.yaml")
     sample_parser.add_argument("--flat", action="store_true", help="Include voice heatmap flat-scene indices")
 
+    # batch command - parallel multi-book generation
+    batch_parser = subparsers.add_parser("batch", help="Generate many projects in parallel (shared limits/caches)")
+    batch_parser.add_argument("projects", nargs="+", help="Project dirs (or their config.yaml)")
+    batch_parser.add_argument("--max-books", dest="max_books", type=int, default=4,
+                              help="Books in flight at once (default: 4)")
+    batch_parser.add_argument("--max-requests", dest="max_requests", type=int, default=8,
+                              help="Global concurrent LLM requests across all books (default: 8)")
+    batch_parser.add_argument("--per-model", dest="per_model", type=int, default=2,
+                              help="Default concurrent requests per model (default: 2)")
+    batch_parser.add_argument("--model-limit", dest="model_limit", action="append",
+                              help="Per-model override, e.g. qwen2.5:7b=1 (repeatable)")
+    batch_parser.add_argument("--max-attempts", dest="max_attempts", type=int, default=2,
+                              help="Attempts per book; failed books are requeued and resume from checkpoint")
+    batch_parser.add_argument("--output-dir", dest="output_dir", default="output/batch",
+                              help="Where to write batch_manifest.json and throughput reports")
+
     # audiobook command - generate ACX-compliant audiobook MP3s
     audio_parser = subparsers.add_parser("audiobook", help="Generate ACX-compliant audiobook MP3s")
     audio_parser.add_argument("--config", "-c", required=True, help="Path to project config.yaml")
@@ -1089,10 +1207,13 @@ def main():
         "editorial-cleanup": cmd_editorial_cleanup,
         "audit": cmd_audit,
         "audiobook": cmd_audiobook,
+        "batch": cmd_batch,
     }
 
     handler = commands.get(args.command)
     if handler:
+        if args.command not in LIGHT_COMMANDS:
+            _init_runtime()
         return handler(args)
 
     parser.print_help()
@@ -12,10 +12,9 @@ Main entry point for the web interface, providing:
 import os
 import re
 import sys
-import json
 import asyncio
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request, BackgroundTasks
@@ -34,6 +33,8 @@ from dotenv import load_dotenv, find_dotenv
 load_dotenv(find_dotenv(usecwd=True))
 
 from prometheus_lib.utils.logging_config import setup_logging
+from interfaces.web.catalog import CATALOG_DB, ProjectCatalog
+from stages.scene_schema import dumps_json
 import logging
 
 # Setup logging
@@ -44,36 +45,163 @@ logger = logging.getLogger("writerai.web")
 # WebSocket Connection Manager
 # ============================================================================
 
-class ConnectionManager:
-    """Manages WebSocket connections for real-time updates."""
+class _Subscriber:
+    """Per-connection state: topic filter, bounded send queue, sender task."""
 
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    __slots__ = ("websocket", "topics", "queue", "task", "dropped")
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        # Empty topic set = firehose (legacy clients that never subscribe)
+        self.topics: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def wants(self, topics: Set[str]) -> bool:
+        return not self.topics or not topics or bool(self.topics & topics)
+
+    def enqueue(self, payload: str) -> None:
+        """Queue a pre-serialized payload, dropping the oldest when full."""
+        while True:
+            try:
+                self.queue.put_nowait(payload)
+                return
+            except asyncio.QueueFull:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except asyncio.QueueEmpty:
+                    pass
+
+
+def _message_topics(message: Dict[str, Any]) -> Set[str]:
+    """Derive subscription topics from a message's generation_id / project."""
+    topics = set()
+    if message.get("generation_id"):
+        topics.add(f"generation:{message['generation_id']}")
+    if message.get("project"):
+        topics.add(f"project:{message['project']}")
+    return topics
+
+
+class ConnectionManager:
+    """Manages WebSocket connections for real-time updates.
+
+    Each connection gets a bounded send queue drained by its own sender
+    task, so a slow client only backs up its own queue (oldest messages
+    are dropped) instead of stalling the broadcaster. Clients may
+    subscribe to ``project:<name>`` / ``generation:<id>`` topics; clients
+    that never subscribe receive everything. Messages are serialized once
+    per broadcast and the same payload is reused for every recipient.
+    Progress events are coalesced to at most ``progress_rate_hz`` per topic.
+    """
+
+    def __init__(self, queue_size: int = 256, progress_rate_hz: float = 4.0):
+        self.queue_size = queue_size
+        self.progress_interval = 1.0 / progress_rate_hz if progress_rate_hz > 0 else 0.0
+        self._subscribers: Dict[WebSocket, _Subscriber] = {}
+        # topic -> last emit time / latest pending message / scheduled flush
+        self._progress_last: Dict[str, float] = {}
+        self._progress_pending: Dict[str, Dict[str, Any]] = {}
+        self._progress_flush: Dict[str, asyncio.TimerHandle] = {}
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self._subscribers)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+        sub = _Subscriber(websocket, self.queue_size)
+        sub.task = asyncio.create_task(self._sender(sub))
+        self._subscribers[websocket] = sub
+        logger.info(f"WebSocket connected. Total connections: {len(self._subscribers)}")
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
+        sub = self._subscribers.pop(websocket, None)
+        if sub and sub.task and sub.task is not asyncio.current_task():
+            sub.task.cancel()
+        logger.info(f"WebSocket disconnected. Total connections: {len(self._subscribers)}")
+
+    def subscribe(self, websocket: WebSocket, topic: str) -> None:
+        sub = self._subscribers.get(websocket)
+        if sub is not None:
+            sub.topics.add(topic)
+
+    def unsubscribe(self, websocket: WebSocket, topic: str) -> None:
+        sub = self._subscribers.get(websocket)
+        if sub is not None:
+            sub.topics.discard(topic)
+
+    async def _sender(self, sub: _Subscriber) -> None:
+        """Drain one connection's queue; a failed send drops the connection."""
+        try:
+            while True:
+                payload = await sub.queue.get()
+                await sub.websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(sub.websocket)
+
+    def _fan_out(self, message: Dict[str, Any]) -> int:
+        topics = _message_topics(message)
+        payload = None
+        delivered = 0
+        for sub in self._subscribers.values():
+            if not sub.wants(topics):
+                continue
+            if payload is None:
+                payload = dumps_json(message).decode("utf-8")
+            sub.enqueue(payload)
+            delivered += 1
+        return delivered
 
     async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast message to all connected clients."""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
-
-        for conn in disconnected:
-            self.disconnect(conn)
+        """Broadcast message to all clients subscribed to its topics.
+
+        Enqueues without awaiting any socket; ``generation_progress``
+        messages are coalesced per topic.
+        """
+        if message.get("type") == "generation_progress" and self.progress_interval:
+            self._coalesce_progress(message)
+            return
+        # Don't let a held-back progress update arrive after e.g. completion
+        for topic in _message_topics(message):
+            handle = self._progress_flush.get(topic)
+            if handle is not None:
+                handle.cancel()
+                self._flush_progress(topic)
+        self._fan_out(message)
+
+    def _coalesce_progress(self, message: Dict[str, Any]) -> None:
+        topic = (f"generation:{message['generation_id']}" if message.get("generation_id")
+                 else f"project:{message.get('project', '')}")
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        wait = self._progress_last.get(topic, float("-inf")) + self.progress_interval - now
+        if wait <= 0 and topic not in self._progress_flush:
+            self._progress_last[topic] = now
+            self._fan_out(message)
+            return
+        # Keep only the newest update; one flush per interval emits it
+        self._progress_pending[topic] = message
+        if topic not in self._progress_flush:
+            self._progress_flush[topic] = loop.call_later(max(wait, 0.0), self._flush_progress, topic)
+
+    def _flush_progress(self, topic: str) -> None:
+        self._progress_flush.pop(topic, None)
+        message = self._progress_pending.pop(topic, None)
+        if message is not None:
+            self._progress_last[topic] = asyncio.get_running_loop().time()
+            self._fan_out(message)
 
     async def send_personal(self, websocket: WebSocket, message: Dict[str, Any]):
         """Send message to specific client."""
+        sub = self._subscribers.get(websocket)
+        if sub is not None:
+            sub.enqueue(dumps_json(message).decode("utf-8"))
+            return
         try:
             await websocket.send_json(message)
         except Exception as e:
@@ -86,11 +214,19 @@ manager = ConnectionManager()
 # Application State
 # ============================================================================
 
+PROJECTS_DIR = PROJECT_ROOT / "data" / "projects"
+
+
 class AppState:
-    """Global application state."""
+    """Global application state.
+
+    Projects live in the SQLite catalog (interfaces.web.catalog), kept
+    current by a background scan and by the generation hooks.
+    """
 
     def __init__(self):
-        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.catalog = ProjectCatalog(
+            os.getenv("WRITERAI_CATALOG_DB") or PROJECTS_DIR / CATALOG_DB, PROJECTS_DIR)
         self.ideas: List[Dict[str, Any]] = []
         self.active_generations: Dict[str, Dict[str, Any]] = {}
         self.settings: Dict[str, Any] = {
@@ -102,28 +238,15 @@ class AppState:
         }
 
     def load_projects(self):
-        """Load existing projects from disk."""
-        import yaml
-        projects_dir = PROJECT_ROOT / "data" / "projects"
-        if projects_dir.exists():
-            for project_path in projects_dir.iterdir():
-                if project_path.is_dir():
-                    config_file = project_path / "config.yaml"
-                    if config_file.exists():
-                        # Read status from config file
-                        try:
-                            with open(config_file, 'r', encoding='utf-8') as f:
-                                config = yaml.safe_load(f) or {}
-                            status = config.get("status", "ready")
-                        except Exception:
-                            status = "ready"
-
-                        self.projects[project_path.name] = {
-                            "name": project_path.name,
-                            "path": str(project_path),
-                            "status": status
-                        }
-        logger.info(f"Loaded {len(self.projects)} projects")
+        """Index projects on disk (only those changed since the last scan are read)."""
+        self.catalog.scan()
+        logger.info(f"Loaded {self.catalog.count()} projects")
+
+    async def require_project(self, project_name: str) -> Dict[str, Any]:
+        project = await asyncio.to_thread(self.catalog.get, project_name)
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return project
 
 
 app_state = AppState()
@@ -136,8 +259,10 @@ app_state = AppState()
 async def lifespan(app: FastAPI):
     """Application startup and shutdown."""
     logger.info("Starting WriterAI Web Dashboard...")
-    app_state.load_projects()
+    await asyncio.to_thread(app_state.load_projects)
+    watcher = asyncio.create_task(app_state.catalog.watch())
     yield
+    watcher.cancel()
     logger.info("Shutting down WriterAI Web Dashboard...")
 
 # ============================================================================
@@ -181,7 +306,7 @@ async def dashboard(request: Request):
     if templates:
         return templates.TemplateResponse("dashboard.html", {
             "request": request,
-            "projects": list(app_state.projects.values()),
+            "projects": (await asyncio.to_thread(app_state.catalog.list))[0],
             "settings": app_state.settings
         })
 
@@ -227,9 +352,16 @@ async def health_check():
 
 
 @app.get("/api/v2/projects")
-async def list_projects():
-    """List all projects."""
-    return {"projects": list(app_state.projects.values())}
+async def list_projects(limit: int = 50, offset: int = 0, status: Optional[str] = None,
+                        genre: Optional[str] = None, q: Optional[str] = None, sort: str = "name"):
+    """List projects, one page at a time (filter by status/genre, search name/title)."""
+    try:
+        projects, total = await asyncio.to_thread(
+            app_state.catalog.list, status=status, genre=genre, search=q, sort=sort,
+            limit=limit, offset=offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"projects": projects, "total": total, "limit": limit, "offset": offset}
 
 
 @app.post("/api/v2/projects")
@@ -262,11 +394,7 @@ async def create_project(request: Request):
     with open(config_file, "w", encoding="utf-8") as f:
         yaml.dump(config, f)
 
-    app_state.projects[project_name] = {
-        "name": project_name,
-        "path": str(project_dir),
-        "status": "created"
-    }
+    await asyncio.to_thread(app_state.catalog.refresh, project_dir)
 
     logger.info(f"Created project: {project_name}")
     return {"status": "created", "project": config}
@@ -275,16 +403,13 @@ async def create_project(request: Request):
 @app.get("/api/v2/projects/{project_name}")
 async def get_project(project_name: str):
     """Get project details."""
-    if project_name not in app_state.projects:
-        raise HTTPException(status_code=404, detail="Project not found")
-    return app_state.projects[project_name]
+    return await app_state.require_project(project_name)
 
 
 @app.post("/api/v2/projects/{project_name}/generate")
 async def start_generation(project_name: str, background_tasks: BackgroundTasks):
     """Start novel generation for a project."""
-    if project_name not in app_state.projects:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await app_state.require_project(project_name)
 
     # Start generation in background
     generation_id = f"{project_name}_{asyncio.get_running_loop().time()}"
@@ -305,10 +430,7 @@ async def export_project(project_name: str, sample: bool = True):
     """Export project to Word document for Kindle."""
     from fastapi.responses import FileResponse
 
-    if project_name not in app_state.projects:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    project_path = Path(app_state.projects[project_name]["path"])
+    project_path = Path((await app_state.require_project(project_name))["path"])
 
     try:
         from prometheus_novel.export.docx_exporter import KDPExporter
@@ -471,11 +593,7 @@ async def create_project_from_seed(request: Request, background_tasks: Backgroun
         yaml.dump(seed_data, f, default_flow_style=False, allow_unicode=True)
 
     # Update app state
-    app_state.projects[project_name] = {
-        "name": project_name,
-        "path": str(project_dir),
-        "status": "seeded"
-    }
+    await asyncio.to_thread(app_state.catalog.refresh, project_dir)
 
     # Count what was provided vs will be generated
     provided = [k for k, v in seed_data.items() if v and v.strip()]
@@ -507,12 +625,19 @@ async def websocket_endpoint(websocket: WebSocket):
             if message_type == "ping":
                 await manager.send_personal(websocket, {"type": "pong"})
 
-            elif message_type == "subscribe":
-                # Subscribe to project updates
+            elif message_type in ("subscribe", "unsubscribe"):
+                # Narrow (or widen) updates to a project and/or generation run
                 project = data.get("project")
+                generation_id = data.get("generation_id")
+                action = manager.subscribe if message_type == "subscribe" else manager.unsubscribe
+                if project:
+                    action(websocket, f"project:{project}")
+                if generation_id:
+                    action(websocket, f"generation:{generation_id}")
                 await manager.send_personal(websocket, {
-                    "type": "subscribed",
-                    "project": project
+                    "type": f"{message_type}d",
+                    "project": project,
+                    "generation_id": generation_id,
                 })
 
             elif message_type == "request_suggestions":
@@ -551,7 +676,7 @@ async def run_generation(project_name: str, generation_id: str):
 
     try:
         # Get project path
-        project_info = app_state.projects.get(project_name)
+        project_info = await asyncio.to_thread(app_state.catalog.get, project_name)
         if not project_info:
             raise ValueError(f"Project not found: {project_name}")
 
@@ -614,6 +739,7 @@ async def run_generation(project_name: str, generation_id: str):
 
         async def on_stage_complete(stage_name, result):
             logger.info(f"Stage {stage_name} complete: {result.status.value}")
+            await asyncio.to_thread(app_state.catalog.refresh, project_path)
 
         async def on_pipeline_complete(state):
             logger.info(f"Pipeline complete! Total tokens: {state.total_tokens}, Cost: ${state.total_cost_usd:.4f}")
@@ -637,8 +763,8 @@ async def run_generation(project_name: str, generation_id: str):
         output_path = exporter.export()
         logger.info(f"Novel exported to: {output_path}")
 
-        # Update project status in memory
-        app_state.projects[project_name]["status"] = "completed"
+        # Update project status in the catalog
+        await asyncio.to_thread(app_state.catalog.refresh, project_path)
 
         app_state.active_generations[generation_id].update({
             "status": "completed",
@@ -0,0 +1,269 @@
+"""
+Project catalog for the web dashboard (SQLite).
+
+AppState.load_projects used to walk data/projects at startup and parse
+every config.yaml, then never looked again; project status lived in a dict
+that only this process updated. With hundreds of projects startup and
+listing were slow and runs started elsewhere (CLI, batch factory) never
+showed up.
+
+ProjectCatalog keeps one row per project in data/projects/catalog.db:
+config metadata (title, genre, status), the latest run_status.json
+(last stage, completed stages, tokens, cost) and scene / word counts from
+pipeline_state.json. Rows are kept current incrementally:
+
+  - scan() stats config.yaml, run_status.json and pipeline_state.json of
+    every project directory and re-reads only projects whose files changed
+    (removed directories are dropped)
+  - watch() runs scan() in a worker thread every few seconds (started by
+    the app lifespan)
+  - refresh() re-indexes one project at once; the generation hooks call it
+    when a stage completes
+
+Listing is a paginated, filterable SQL query, so the dashboard does not
+touch project files. Connections are opened per operation (WAL mode), as
+in stages.analytics.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger("writerai.web.catalog")
+
+CATALOG_DB = "catalog.db"
+WATCH_INTERVAL_SECONDS = 5.0
+MAX_PAGE_SIZE = 500
+
+# Files whose (mtime_ns, size) make up a project's change signature
+_TRACKED_FILES = ("config.yaml", "run_status.json", "pipeline_state.json")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    title TEXT,
+    genre TEXT,
+    status TEXT NOT NULL DEFAULT 'ready',
+    last_stage TEXT,
+    last_status TEXT,
+    completed_stages INTEGER NOT NULL DEFAULT 0,
+    scene_count INTEGER NOT NULL DEFAULT 0,
+    word_count INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    total_cost_usd REAL NOT NULL DEFAULT 0,
+    last_run_at TEXT,
+    indexed_at TEXT NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_status ON projects (status);
+CREATE INDEX IF NOT EXISTS idx_projects_genre ON projects (genre);
+CREATE INDEX IF NOT EXISTS idx_projects_last_run ON projects (last_run_at);
+"""
+
+_COLUMNS = ("name", "path", "title", "genre", "status", "last_stage", "last_status",
+            "completed_stages", "scene_count", "word_count", "total_tokens", "total_cost_usd",
+            "last_run_at", "indexed_at", "signature")
+
+# Sort keys accepted by list(); "-" prefix for descending
+_SORTABLE = {"name", "title", "genre", "status", "last_stage", "completed_stages", "scene_count",
+             "word_count", "total_tokens", "total_cost_usd", "last_run_at"}
+
+
+def _signature(project_dir: Path) -> str:
+    parts = []
+    for filename in _TRACKED_FILES:
+        try:
+            st = os.stat(project_dir / filename)
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def index_project(project_dir: Path) -> Dict[str, Any]:
+    """Catalog row for one project directory (missing or broken files give defaults)."""
+    project_dir = Path(project_dir)
+    signature = _signature(project_dir)
+    try:
+        with open(project_dir / "config.yaml", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    except Exception:
+        config = {}
+    if not isinstance(config, dict):
+        config = {}
+    run_status = _read_json(project_dir / "run_status.json")
+    scenes = _read_json(project_dir / "pipeline_state.json").get("scenes") or []
+    word_count = sum(len((s.get("content") or "").split()) for s in scenes if isinstance(s, dict))
+    return {
+        "name": project_dir.name,
+        "path": str(project_dir),
+        "title": config.get("title") or project_dir.name,
+        "genre": config.get("genre"),
+        "status": config.get("status") or "ready",
+        "last_stage": run_status.get("last_stage"),
+        "last_status": run_status.get("last_status"),
+        "completed_stages": len(run_status.get("completed_stages") or []),
+        "scene_count": len(scenes) or int(run_status.get("scene_count") or 0),
+        "word_count": word_count,
+        "total_tokens": int(run_status.get("total_tokens") or 0),
+        "total_cost_usd": float(run_status.get("total_cost_usd") or 0.0),
+        "last_run_at": run_status.get("timestamp"),
+        "indexed_at": datetime.now().isoformat(),
+        "signature": signature,
+    }
+
+
+def _is_project(entry: os.DirEntry) -> bool:
+    return entry.is_dir() and os.path.exists(os.path.join(entry.path, "config.yaml"))
+
+
+class ProjectCatalog:
+    """Indexed project metadata and status for the dashboard."""
+
+    def __init__(self, path, projects_root):
+        self.path = Path(path)
+        self.projects_root = Path(projects_root)
+        self._ready = False
+        self._init_lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+
+    @contextmanager
+    def connect(self):
+        """Connection committed on success, rolled back on error, always closed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            if not self._ready:
+                with self._init_lock:
+                    if not self._ready:
+                        conn.execute("PRAGMA journal_mode = WAL")
+                        conn.executescript(_SCHEMA)
+                        self._ready = True
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _upsert(self, conn: sqlite3.Connection, rows: List[Dict[str, Any]]) -> None:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO projects ({', '.join(_COLUMNS)})"
+            f" VALUES ({', '.join('?' for _ in _COLUMNS)})",
+            [tuple(row[c] for c in _COLUMNS) for row in rows])
+
+    def scan(self) -> Dict[str, int]:
+        """Bring the catalog in line with the projects directory; only changed projects are re-read."""
+        with self._scan_lock:
+            found: Dict[str, Path] = {}
+            if self.projects_root.is_dir():
+                with os.scandir(self.projects_root) as it:
+                    for entry in it:
+                        if _is_project(entry):
+                            found[entry.name] = Path(entry.path)
+            with self.connect() as conn:
+                known = dict(conn.execute("SELECT name, signature FROM projects").fetchall())
+            changed = [d for name, d in found.items() if known.get(name) != _signature(d)]
+            removed = [name for name in known if name not in found]
+            rows = [index_project(d) for d in changed]
+            with self.connect() as conn:
+                self._upsert(conn, rows)
+                conn.executemany("DELETE FROM projects WHERE name = ?", [(n,) for n in removed])
+        added = sum(1 for d in changed if d.name not in known)
+        if changed or removed:
+            logger.info("Project catalog: %d added, %d updated, %d removed",
+                        added, len(changed) - added, len(removed))
+        return {"added": added, "updated": len(changed) - added, "removed": len(removed)}
+
+    def refresh(self, project_dir) -> Optional[Dict[str, Any]]:
+        """Re-index one project now (dropped from the catalog if it no longer exists)."""
+        project_dir = Path(project_dir)
+        if not (project_dir / "config.yaml").exists():
+            with self.connect() as conn:
+                conn.execute("DELETE FROM projects WHERE name = ?", (project_dir.name,))
+            return None
+        row = index_project(project_dir)
+        with self.connect() as conn:
+            self._upsert(conn, [row])
+        return self._public(row)
+
+    async def watch(self, interval: float = WATCH_INTERVAL_SECONDS) -> None:
+        """Poll for changes until cancelled (each scan runs in a worker thread)."""
+        while True:
+            try:
+                await asyncio.to_thread(self.scan)
+            except Exception as e:
+                logger.warning(f"Project catalog scan failed: {e}")
+            await asyncio.sleep(interval)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _public(row) -> Dict[str, Any]:
+        out = dict(row)
+        out.pop("signature", None)
+        return out
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self.connect() as conn:
+            row = conn.execute("SELECT * FROM projects WHERE name = ?", (name,)).fetchone()
+        return self._public(row) if row is not None else None
+
+    def list(self, status: Optional[str] = None, genre: Optional[str] = None,
+             search: Optional[str] = None, sort: str = "name",
+             limit: int = 50, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """One page of projects and the total matching the filters.
+
+        ``search`` matches name or title (case-insensitive substring);
+        ``sort`` is a column name, "-" prefixed for descending.
+        """
+        where, params = [], []
+        if status:
+            where.append("status = ?")
+            params.append(status)
+        if genre:
+            where.append("genre = ?")
+            params.append(genre)
+        if search:
+            where.append("(name LIKE ? ESCAPE '\\' OR title LIKE ? ESCAPE '\\')")
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            params.extend([pattern, pattern])
+        column = sort.lstrip("-")
+        if column not in _SORTABLE:
+            raise ValueError(f"Cannot sort projects by {sort!r}")
+        order = f"{column} {'DESC' if sort.startswith('-') else 'ASC'}, name ASC"
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        limit = max(0, min(int(limit), MAX_PAGE_SIZE))
+        with self.connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM projects{clause}", params).fetchone()[0]
+            rows = conn.execute(f"SELECT * FROM projects{clause} ORDER BY {order} LIMIT ? OFFSET ?",
+                                [*params, limit, max(0, int(offset))]).fetchall()
+        return [self._public(r) for r in rows], total
+
+    def count(self) -> int:
+        with self.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
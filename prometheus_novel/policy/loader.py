@@ -148,8 +148,13 @@ def _safe_yaml_load(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        try:
+            from stages.resources import resources
+        except ImportError:  # imported as prometheus_novel.policy
+            with open(path, "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f)
+        else:
+            data = resources().yaml(path)
         return data if isinstance(data, dict) else None
     except Exception as exc:
         logger.warning("Failed to load %s: %s", path, exc)
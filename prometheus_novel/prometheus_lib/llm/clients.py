@@ -636,6 +636,9 @@ class OllamaClient(BaseLLMClient):
         super().__init__(model_name)
         self.client = None
         self.base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
+        # Shared per-server bookkeeping of loaded models (swap counts, keep_alive pinning)
+        from prometheus_lib.llm.residency import get_residency
+        self.residency = get_residency(self.base_url)
 
     async def _ensure_initialized(self):
         """Lazy initialization of the Ollama client (OpenAI-compatible API)."""
@@ -738,7 +741,12 @@ class OllamaClient(BaseLLMClient):
         if extra:
             create_kwargs["extra_body"] = extra
 
-        # Retry loop with exponential backoff
+        async with self.residency.use(self.model_name):
+            return await self._create_with_retries(create_kwargs, prompt, timeout_val)
+
+    async def _create_with_retries(self, create_kwargs: Dict[str, Any], prompt: str,
+                                   timeout_val: float) -> LLMResponse:
+        """Chat completion with exponential backoff; connection errors fail fast."""
         last_error = None
         delay = INITIAL_RETRY_DELAY
 
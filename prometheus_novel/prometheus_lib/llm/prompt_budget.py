@@ -0,0 +1,220 @@
+"""
+Token-budgeted prompt assembly.
+
+Large prompts (scene drafting) are a fixed instruction template plus
+variable context blocks: story state, previous scene endings, bible
+excerpts, voice constraints, avoid lists. When the whole thing does not
+fit the model's context next to the output reservation, the old path only
+clamped max_tokens, which truncated scenes and triggered retries.
+
+PromptBudget instead treats the variable sections as prioritized blocks:
+
+    budget = PromptBudget(counter, max_prompt_tokens)
+    state = budget.block("story_state", text, priority=80, compress="middle")
+    prompt = f"... {state} ..."            # block() returns a placeholder
+    prompt, report = budget.render(prompt, system_prompt=contract)
+
+render() counts the fixed part once and, if the blocks overflow what is
+left, compresses or drops the lowest-priority blocks first. Token counts
+are cached by content hash, so the constant template and repeated blocks
+are only tokenized once per process.
+
+TokenCounter uses the real tokenizer when one is available: tiktoken for
+OpenAI models, or a Hugging Face tokenizer (``tokenizers`` package) named
+in config; otherwise the calibrated chars/token heuristic from
+prometheus_lib.llm.clients.count_tokens.
+"""
+
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_CACHE_SIZE = 8192
+_token_cache: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+_hf_tokenizers: Dict[str, Any] = {}
+
+_PLACEHOLDER = "\x00PB:{}\x00"
+_PLACEHOLDER_RE = re.compile(r"\x00PB:([^\x00]+)\x00")
+
+TRIM_NOTE = "[... trimmed to fit context ...]"
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _load_hf_tokenizer(name: str):
+    """tokenizers.Tokenizer from a tokenizer.json path or hub id; None if unavailable."""
+    if name in _hf_tokenizers:
+        return _hf_tokenizers[name]
+    tok = None
+    try:
+        from tokenizers import Tokenizer
+        from pathlib import Path
+        tok = Tokenizer.from_file(name) if Path(name).exists() else Tokenizer.from_pretrained(name)
+    except Exception as e:
+        logger.warning("Tokenizer '%s' unavailable (%s); using heuristic token counts", name, e)
+    _hf_tokenizers[name] = tok
+    return tok
+
+
+class TokenCounter:
+    """Token counts for one model, cached by content hash."""
+
+    def __init__(self, model_name: str = "", tokenizer: Optional[str] = None):
+        self.model_name = model_name or ""
+        self._hf = _load_hf_tokenizer(tokenizer) if tokenizer else None
+        self.kind = f"hf:{tokenizer}" if self._hf is not None else f"model:{self.model_name.lower()}"
+
+    def _encode_len(self, text: str) -> int:
+        if self._hf is not None:
+            return len(self._hf.encode(text, add_special_tokens=False).ids)
+        from prometheus_lib.llm.clients import count_tokens
+        return count_tokens(text, self.model_name)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        key = (self.kind, _digest(text))
+        hit = _token_cache.get(key)
+        if hit is not None:
+            _token_cache.move_to_end(key)
+            return hit
+        n = self._encode_len(text)
+        self.remember(text, n, key)
+        return n
+
+    def remember(self, text: str, n: int, key: Optional[Tuple[str, str]] = None) -> None:
+        """Cache a known count (e.g. the total of an assembled prompt)."""
+        _token_cache[key or (self.kind, _digest(text))] = n
+        if len(_token_cache) > _CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+
+@dataclass
+class PromptBlock:
+    name: str
+    text: str
+    priority: int = 50          # higher survives longer
+    compress: Optional[str] = None  # "head" | "tail" | "middle" | None (drop only)
+    min_tokens: int = 40        # below this a compressed block is dropped instead
+
+
+def _fit_lines(lines: List[str], counter: TokenCounter, target: int, mode: str, sep: str = "\n") -> str:
+    """Keep whole pieces from the head, tail or both ends until ~target tokens."""
+    note = counter.count(TRIM_NOTE)
+    budget = target - note
+    if mode == "tail":
+        order = list(range(len(lines) - 1, -1, -1))
+    elif mode == "middle":
+        order = []
+        lo, hi = 0, len(lines) - 1
+        while lo <= hi:
+            order.append(lo)
+            if hi != lo:
+                order.append(hi)
+            lo, hi = lo + 1, hi - 1
+    else:
+        order = list(range(len(lines)))
+    keep = set()
+    used = 0
+    for i in order:
+        cost = counter.count(lines[i]) + 1
+        if used + cost > budget:
+            break
+        keep.add(i)
+        used += cost
+    if not keep:
+        return ""
+    out: List[str] = []
+    gap = False
+    for i, line in enumerate(lines):
+        if i in keep:
+            if gap:
+                out.append(TRIM_NOTE)
+                gap = False
+            out.append(line)
+        else:
+            gap = True
+    if gap:
+        out.append(TRIM_NOTE)
+    return sep.join(out)
+
+
+def compress_text(text: str, counter: TokenCounter, target: int, mode: str) -> str:
+    """Shrink text to about ``target`` tokens at line (else sentence, else list item) boundaries."""
+    lines = text.splitlines()
+    if len(lines) > 1:
+        return _fit_lines(lines, counter, target, mode)
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    if len(sentences) > 1:
+        return _fit_lines(sentences, counter, target, mode, sep=" ")
+    return _fit_lines(text.split(", "), counter, target, mode, sep=", ")
+
+
+class PromptBudget:
+    """Collects prioritized blocks for one prompt and fits them to a token budget."""
+
+    def __init__(self, counter: TokenCounter, max_prompt_tokens: int):
+        self.counter = counter
+        self.max_prompt_tokens = int(max_prompt_tokens)
+        self.blocks: Dict[str, PromptBlock] = {}
+
+    def block(self, name: str, text: str, priority: int = 50, compress: Optional[str] = None,
+              min_tokens: int = 40) -> str:
+        """Register a block and return its placeholder for the prompt template."""
+        self.blocks[name] = PromptBlock(name, text or "", priority, compress, min_tokens)
+        return _PLACEHOLDER.format(name)
+
+    def fit(self, available: int) -> Dict[str, Dict[str, Any]]:
+        """Decide each block's final text; lowest priority gives way first."""
+        sizes = {name: self.counter.count(b.text) for name, b in self.blocks.items()}
+        final = {name: b.text for name, b in self.blocks.items()}
+        kept = dict(sizes)
+        actions = {name: "keep" for name in self.blocks}
+        overflow = sum(kept.values()) - available
+        for b in sorted(self.blocks.values(), key=lambda b: b.priority):
+            if overflow <= 0:
+                break
+            if not kept[b.name]:
+                continue
+            target = kept[b.name] - overflow
+            if b.compress and target >= b.min_tokens:
+                final[b.name] = compress_text(b.text, self.counter, target, b.compress)
+                actions[b.name] = "compressed" if final[b.name] else "dropped"
+            else:
+                final[b.name] = ""
+                actions[b.name] = "dropped"
+            new = self.counter.count(final[b.name])
+            overflow -= kept[b.name] - new
+            kept[b.name] = new
+        return {
+            name: {"text": final[name], "tokens": sizes[name], "kept_tokens": kept[name], "action": actions[name]}
+            for name in self.blocks
+        }
+
+    def render(self, template: str, system_prompt: str = "") -> Tuple[str, Dict[str, Any]]:
+        """Substitute placeholders with fitted blocks. Returns (prompt, report)."""
+        fixed_text = _PLACEHOLDER_RE.sub("", template)
+        fixed = self.counter.count(fixed_text) + self.counter.count(system_prompt)
+        available = self.max_prompt_tokens - fixed
+        fitted = self.fit(max(0, available))
+        prompt = _PLACEHOLDER_RE.sub(lambda m: fitted.get(m.group(1), {}).get("text", ""), template)
+        total = fixed + sum(f["kept_tokens"] for f in fitted.values())
+        self.counter.remember(prompt, total - self.counter.count(system_prompt))
+        report = {
+            "budget": self.max_prompt_tokens,
+            "fixed_tokens": fixed,
+            "total_tokens": total,
+            "over_budget": total > self.max_prompt_tokens,
+            "blocks": {
+                name: {k: v for k, v in f.items() if k != "text"}
+                for name, f in fitted.items()
+            },
+        }
+        return prompt, report
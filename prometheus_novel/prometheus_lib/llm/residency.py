@@ -0,0 +1,246 @@
+"""
+Ollama model residency: keep the right weights loaded.
+
+Configs often route drafting, rewriting, critique and structure gates to
+different local models. Every switch makes the Ollama server evict one
+model and load another (10-60 s for multi-GB weights). One ModelResidency
+per server sits in front of all OllamaClient calls and:
+
+  - tracks which models are loaded (seeded from /api/ps, then kept as an
+    LRU the way the server evicts)
+  - loads a model explicitly before first use, pinned with keep_alive,
+    and times it; a load that pushes out another model is a swap
+  - pin()/unpin(): callers (the stage scheduler) mark a model as in use
+    for longer than a single request, so prefetching never evicts it
+  - prefetch(model): loads the next model as soon as nothing is using
+    the models it would evict, i.e. while the current stage wraps up
+  - warm(models): loads up to max_loaded models concurrently (canary pre-flight)
+  - report(): loads, swaps and seconds spent swapping since reset()
+
+Capacity is max_loaded_models (config, else OLLAMA_MAX_LOADED_MODELS,
+else 1). Without httpx, or with the server unreachable, explicit loads are
+skipped and Ollama's own on-demand loading applies; a load that did not
+happen is neither marked loaded nor counted in report().
+
+residency_of(client) finds the manager behind a client, including clients
+wrapped by batch.engine.ThrottledClient.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEEP_ALIVE = "30m"
+
+_managers: Dict[str, "ModelResidency"] = {}
+
+
+def native_base_url(base_url: str) -> str:
+    """Ollama's native API root from the OpenAI-compatible base URL."""
+    url = (base_url or "http://localhost:11434").rstrip("/")
+    return url[:-3] if url.endswith("/v1") else url
+
+
+def get_residency(base_url: Optional[str] = None) -> "ModelResidency":
+    """Shared manager for one Ollama server."""
+    root = native_base_url(base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"))
+    if root not in _managers:
+        _managers[root] = ModelResidency(root)
+    return _managers[root]
+
+
+def residency_of(client: Any) -> Optional["ModelResidency"]:
+    """The residency manager behind a local Ollama client, else None.
+
+    Goes by behaviour rather than isinstance(client, OllamaClient): wrappers
+    keep the real client in ``_inner``, and the client module is importable
+    as both prometheus_lib.llm.clients and
+    prometheus_novel.prometheus_lib.llm.clients (two distinct classes).
+    """
+    inner = getattr(client, "_inner", client)
+    residency = getattr(inner, "residency", None)
+    if residency is None or not inspect.iscoroutinefunction(getattr(residency, "ensure", None)):
+        return None
+    return residency
+
+
+class ModelResidency:
+    """Loaded-model bookkeeping, explicit loads and prefetch for one Ollama server."""
+
+    def __init__(self, base_url: str, max_loaded: Optional[int] = None,
+                 keep_alive: str = DEFAULT_KEEP_ALIVE):
+        self.base_url = native_base_url(base_url)
+        self.max_loaded = max(1, int(max_loaded or os.getenv("OLLAMA_MAX_LOADED_MODELS") or 1))
+        self.keep_alive = keep_alive
+        self.loaded: "OrderedDict[str, None]" = OrderedDict()  # least recently used first
+        self.busy: Dict[str, int] = {}
+        self._loading: Dict[str, "asyncio.Future"] = {}
+        self._tasks: Set["asyncio.Future"] = set()
+        self._next: Optional[str] = None
+        self._synced = False
+        self.reset()
+
+    def configure(self, max_loaded: Optional[int] = None, keep_alive: Optional[str] = None) -> None:
+        if max_loaded:
+            self.max_loaded = max(1, int(max_loaded))
+        if keep_alive:
+            self.keep_alive = str(keep_alive)
+
+    def reset(self) -> None:
+        """Start a new reporting window (one pipeline run)."""
+        self.stats: Dict[str, Any] = {"loads": 0, "swaps": 0, "swap_seconds": 0.0,
+                                      "prefetches": 0, "models": {}}
+
+    # ------------------------------------------------------------------
+    # Server calls
+    # ------------------------------------------------------------------
+
+    async def _request(self, method: str, path: str, payload: Optional[dict] = None) -> Optional[dict]:
+        """JSON request to the native API; None when httpx or the server is unavailable."""
+        try:
+            import httpx
+        except ImportError:
+            return None
+        try:
+            async with httpx.AsyncClient(timeout=httpx.Timeout(600.0, connect=2.0)) as http:
+                resp = await http.request(method, self.base_url + path, json=payload)
+                resp.raise_for_status()
+                return resp.json() if resp.content else {}
+        except Exception as e:
+            logger.debug("Ollama %s %s failed: %s", method, path, e)
+            return None
+
+    async def sync(self) -> List[str]:
+        """Refresh the loaded set from /api/ps. Returns loaded model names."""
+        self._synced = True
+        data = await self._request("GET", "/api/ps")
+        if data is not None:
+            names = [m.get("name") or m.get("model") for m in data.get("models", [])]
+            self.loaded = OrderedDict((n, None) for n in names if n)
+        return list(self.loaded)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @property
+    def active(self) -> Set[str]:
+        """Models loaded, loading or pinned (what the server holds or is about to)."""
+        return set(self.loaded) | set(self.busy) | set(self._loading)
+
+    def _evict_overflow(self) -> List[str]:
+        """Drop least recently used models beyond capacity (the newest load is last, so it stays)."""
+        evicted = []
+        while len(self.loaded) > self.max_loaded:
+            evicted.append(self.loaded.popitem(last=False)[0])
+        return evicted
+
+    async def _load(self, model: str) -> bool:
+        if not self._synced:
+            await self.sync()
+        if model in self.loaded:
+            self.loaded.move_to_end(model)
+            return True
+        start = time.monotonic()
+        ok = await self._request("POST", "/api/generate",
+                                 {"model": model, "keep_alive": self.keep_alive}) is not None
+        elapsed = time.monotonic() - start
+        if not ok:
+            return False  # nothing loaded; Ollama loads on demand
+        # Evictions are decided once the load lands: concurrent loads each
+        # see the models that finished before them, never a stale free slot.
+        self.loaded[model] = None
+        self.loaded.move_to_end(model)
+        evicted = self._evict_overflow()
+        per_model = self.stats["models"].setdefault(model, {"loads": 0, "seconds": 0.0})
+        per_model["loads"] += 1
+        per_model["seconds"] = round(per_model["seconds"] + elapsed, 3)
+        self.stats["loads"] += 1
+        if evicted:
+            self.stats["swaps"] += 1
+            self.stats["swap_seconds"] = round(self.stats["swap_seconds"] + elapsed, 3)
+            logger.info("Ollama swap: %s -> %s (%.1fs)", ", ".join(evicted), model, elapsed)
+        return True
+
+    async def ensure(self, model: str) -> bool:
+        """Make ``model`` resident (shared with any load already in flight)."""
+        if model in self.loaded:
+            self.loaded.move_to_end(model)
+            return True
+        task = self._loading.get(model)
+        if task is None:
+            task = self._loading[model] = asyncio.ensure_future(self._load(model))
+            task.add_done_callback(lambda _t: self._loading.pop(model, None))
+        return await asyncio.shield(task)
+
+    def pin(self, model: Optional[str]) -> None:
+        """Mark ``model`` in use; prefetch will not evict it."""
+        if model:
+            self.busy[model] = self.busy.get(model, 0) + 1
+
+    def unpin(self, model: Optional[str]) -> None:
+        if not model or model not in self.busy:
+            return
+        self.busy[model] -= 1
+        if self.busy[model] <= 0:
+            del self.busy[model]
+            self._maybe_prefetch()
+
+    @asynccontextmanager
+    async def use(self, model: str):
+        """Hold ``model`` resident for one request."""
+        self.pin(model)
+        try:
+            await self.ensure(model)
+            yield
+        finally:
+            self.unpin(model)
+
+    def prefetch(self, model: Optional[str]) -> None:
+        """Load ``model`` next, as soon as that evicts nothing in use."""
+        if not model or model in self.loaded or model in self._loading:
+            return
+        self._next = model
+        self._maybe_prefetch()
+
+    def _maybe_prefetch(self) -> None:
+        model = self._next
+        if not model:
+            return
+        if model in self.loaded or model in self._loading:
+            self._next = None
+            return
+        if len((set(self.busy) | set(self._loading)) | {model}) > self.max_loaded:
+            return  # retried from unpin() once the current work drains
+        self._next = None
+        self.stats["prefetches"] += 1
+        task = asyncio.ensure_future(self.ensure(model))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def warm(self, models: Iterable[str]) -> Dict[str, bool]:
+        """Load up to max_loaded of ``models`` concurrently. Returns {model: loaded_ok}.
+
+        Models past capacity are left out (False): loading them would only
+        evict ones warmed a moment earlier.
+        """
+        wanted = [m for m in dict.fromkeys(models) if m]
+        names = wanted[:self.max_loaded]
+        results = await asyncio.gather(*(self.ensure(m) for m in names), return_exceptions=True)
+        warmed = {m: r is True for m, r in zip(names, results)}
+        return {m: warmed.get(m, False) for m in wanted}
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "max_loaded_models": self.max_loaded,
+            "keep_alive": self.keep_alive,
+            "loaded": list(self.loaded),
+        }
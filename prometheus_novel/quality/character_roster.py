@@ -8,6 +8,8 @@ import logging
 import re
 from typing import Any, Dict, List, Set, Tuple
 
+from quality.mention_index import get_default_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,35 +41,83 @@ def _extract_roster(outline: List[Dict], characters: List[Dict], config: Dict) -
     return roster
 
 
+_PREFIX_VERBS = frozenset({
+    "said", "whispered", "asked", "replied", "murmured", "exclaimed", "called",
+    "added", "continued", "began", "offered", "warned", "joked", "teased",
+})
+_SUFFIX_VERBS = ("said", "whispered", "asked", "replied", "murmured", "exclaimed")
+_ACTION_VERBS = ("said", "whispered", "asked", "walked", "turned", "looked", "smiled",
+                 "nodded", "reached", "grabbed", "pressed", "touched")
+_CAP_NAME = re.compile(r"[A-Z][a-z]{2,}")
+_WS = re.compile(r"\s+")
+# Skip common false positives
+_SKIP = {"the", "i", "a", "he", "she", "they", "it", "we", "you", "my", "me",
+         "chapter", "scene", "am", "is", "are", "was", "were", "be", "been",
+         "have", "has", "had", "do", "does", "did", "will", "would", "could",
+         "should", "may", "might", "must", "can", "said", "asked", "told"}
+
+
+def _after_closing_quote(text: str, start: int) -> bool:
+    """True when text[:start] ends with a closed quotation followed by whitespace."""
+    q = len(text[:start].rstrip())
+    if q == start or q == 0 or text[q - 1] not in '"\u201d':
+        return False
+    q -= 1
+    # Opening quote: nearest '"' before the close, or any '\u201c' after it
+    r = max(text.rfind('"', 0, q), text.rfind("\u201d", 0, q))
+    if r >= 0 and text[r] == '"':
+        return True
+    return text.rfind("\u201c", r + 1, q) >= 0
+
+
 def _count_dialogue_lines(text: str, name: str) -> int:
     """Count dialogue lines attributed to this character."""
     # Patterns: "Name said/said Name", '"...' after Name
-    name_esc = re.escape(name)
-    # "Name said" or "Name whispered" etc.
-    prefix = len(re.findall(rf"\b{name_esc}\s+(?:said|whispered|asked|replied|murmured|exclaimed|called|added|continued|began|offered|warned|joked|teased)\b", text, re.IGNORECASE))
-    # '"..." Name said' (dialogue before attribution)
-    suffix = len(re.findall(rf'["\u201c][^"\u201d]*["\u201d]\s+{name_esc}\s+(?:said|whispered|asked|replied|murmured|exclaimed)', text, re.IGNORECASE))
+    mentions = get_default_index().scene(text)
+    prefix = suffix = 0
+    for first, end in mentions.find_tokens(name):
+        if end >= len(mentions.spans) or not _WS.fullmatch(mentions.gap_before(end)):
+            continue
+        verb = mentions.token(end).lower()
+        # "Name said" or "Name whispered" etc.
+        if verb in _PREFIX_VERBS:
+            prefix += 1
+        # '"..." Name said' (dialogue before attribution)
+        if verb.startswith(_SUFFIX_VERBS) and _after_closing_quote(text, mentions.spans[first][0]):
+            suffix += 1
     return prefix + suffix
 
 
 def _extract_named_characters_in_scene(text: str) -> Dict[str, int]:
     """Extract named characters (capitalized multi-char words) with approximate significance."""
-    # Skip common false positives
-    skip = {"the", "i", "a", "he", "she", "they", "it", "we", "you", "my", "me",
-            "chapter", "scene", "am", "is", "are", "was", "were", "be", "been",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "must", "can", "said", "asked", "told"}
+    mentions = get_default_index().scene(text)
+    return dict(mentions.memo("roster_candidates", lambda: _scan_named_characters(mentions)))
+
+
+def _scan_named_characters(mentions) -> Dict[str, int]:
+    text = mentions.text
+    n_tokens = len(mentions.spans)
+    is_name = [bool(_CAP_NAME.fullmatch(mentions.token(i))) for i in range(n_tokens)]
+    ws_before = [bool(_WS.fullmatch(mentions.gap_before(i))) if i else False for i in range(n_tokens)]
     candidates: Dict[str, int] = {}
     # Multi-word names: "Sofia Chen", "Marco Vitale" — use first name for roster
-    for m in re.finditer(r"\b([A-Z][a-z]{2,})\s+([A-Z][a-z]{2,})\b", text):
-        first, _ = m.group(1), m.group(2)
-        if first.lower() not in skip:
-            candidates[first.lower()] = candidates.get(first.lower(), 0) + 1
+    i = 0
+    while i + 1 < n_tokens:
+        if is_name[i] and is_name[i + 1] and ws_before[i + 1]:
+            first = mentions.token(i).lower()
+            if first not in _SKIP:
+                candidates[first] = candidates.get(first, 0) + 1
+            i += 2
+        else:
+            i += 1
     # Single capitalized names (less reliable, but catch "Elena")
-    for m in re.finditer(r"(?<=[.!?\s])([A-Z][a-z]{2,})(?=\s+(?:said|whispered|asked|walked|turned|looked|smiled|nodded|reached|grabbed|pressed|touched))", text):
-        n = m.group(1).lower()
-        if n not in skip:
-            candidates[n] = candidates.get(n, 0) + 2  # Weight by likely significance
+    for i in range(n_tokens - 1):
+        start = mentions.spans[i][0]
+        if (is_name[i] and start > 0 and (text[start - 1] in ".!?" or text[start - 1].isspace())
+                and ws_before[i + 1] and mentions.token(i + 1).startswith(_ACTION_VERBS)):
+            n = mentions.token(i).lower()
+            if n not in _SKIP:
+                candidates[n] = candidates.get(n, 0) + 2  # Weight by likely significance
     return candidates
 
 
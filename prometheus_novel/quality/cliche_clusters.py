@@ -13,7 +13,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-import yaml
+from stages.resources import resources
 
 if TYPE_CHECKING:
     from quality.ceiling import CeilingTracker
@@ -28,8 +28,7 @@ def load_cluster_config(config_path: Path) -> Dict[str, Any]:
     if not config_path.exists():
         logger.warning("Cliche cluster config not found: %s", config_path)
         return {"clusters": {}}
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {"clusters": {}}
+    return resources().yaml(config_path) or {"clusters": {}}
 
 
 def _compile_patterns(cluster_def: Dict[str, Any]) -> List[Tuple[re.Pattern, List[str]]]:
@@ -8,13 +8,20 @@ Usage:
     cs = ContinuityState.from_outline(outline, config, characters)
     block = cs.build_context_block("ch08_s01", pov="Elena Vance", prev_tail="...")
     result = cs.validate_content("ch08_s01", scene_text, pov="Elena Vance")
+    cs.timing_stats()  # compile/validate counters
+
+All validation patterns are compiled once in from_outline (see compile()),
+so validate_content is one scan per matcher over the scene text.
 """
 from __future__ import annotations
 
 import logging
 import re
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
+
+from quality.mention_index import get_default_index
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +47,46 @@ _UNDERWATER_BANNED = [
 ]
 
 
+# Memory/flashback exemption phrases: a dead character mentioned near one of
+# these is remembered, not present
+_MEMORY_CONTEXT = (
+    "remembered", "memory", "memorial", "photo", "photograph",
+    "thinking about", "thought of", "used to", "once told",
+    "had said", "before the", "back when",
+)
+
+# Verbs that put a named character physically in the scene
+_ACTIVE_VERBS = (
+    r'said|says|walked|walks|stood|stands|looked|looks|turned|turns|'
+    r'stepped|steps|grabbed|grabs|smiled|smiles|laughed|laughs|moved|moves|'
+    r'leaned|leans|sat|sits|nods|nodded|shrugs|shrugged|points|pointed|'
+    r'whispers|whispered|enters|entered|exits|exited|reaches|reached|'
+    r'pushes|pushed|pulls|pulled|holds|held|approaches|approached|'
+    r'follows|followed|speaks|spoke|asks|asked|replies|replied|adds|added|'
+    r'touches|touched|stares|stared|backs|backed|races|raced|stumbles|stumbled|'
+    r'collapses|collapsed|gasps|gasped|growls|growled'
+)
+
+# Characters of context checked on each side of a dead-name mention
+_MEMORY_WINDOW = 80
+
+
+def _alternation(patterns: List[str]) -> str:
+    return "|".join(f"(?:{p})" for p in patterns)
+
+
+@dataclass
+class _CompiledMatchers:
+    """Per-run automata built once from the state's names, bans and gates."""
+
+    key: tuple
+    dead_active: Optional[Pattern]         # (?P<name>...)\s+(?:verbs)
+    dead_by_first: Dict[str, List[str]]    # lowercased first name -> full names
+    setting_ban: Optional[Pattern]
+    design_forbidden: Optional[Pattern]
+    info_gates: List[Optional[Pattern]]    # one matcher per gate, aligned with ContinuityState.info_gates
+
+
 @dataclass
 class InfoGate:
     """A fact that should not appear before a specific scene."""
@@ -78,6 +125,14 @@ class ContinuityState:
     character_locations: Dict[str, str] = field(default_factory=dict)  # name -> last_known_location
     location_scene_map: Dict[str, str] = field(default_factory=dict)  # name -> scene_id where set
 
+    # Validation timing counters (see timing_stats)
+    stats: Dict[str, float] = field(default_factory=lambda: {
+        "compile_calls": 0, "compile_ms": 0.0, "validate_calls": 0, "validate_ms": 0.0,
+    })
+
+    _compiled: Optional[_CompiledMatchers] = field(default=None, repr=False, compare=False)
+    _scene_pos: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
     @classmethod
     def from_outline(
         cls,
@@ -261,14 +316,92 @@ class ContinuityState:
                 r"\bmilky\s+white\s+eye\b",
             ])
 
+        cs.compile()
         return cs
 
+    # ------------------------------------------------------------------
+    # Precompiled matchers
+    # ------------------------------------------------------------------
+
+    def _matcher_key(self) -> tuple:
+        dead_names = tuple(sorted({
+            name for events in self.scene_events.values()
+            for name in events.get("deaths", []) if name and name != "unnamed"
+        }))
+        return (
+            dead_names,
+            tuple(self.setting_bans),
+            tuple(self.design_forbidden),
+            tuple(tuple(g.trigger_phrases) for g in self.info_gates),
+        )
+
+    def compile(self) -> None:
+        """Build the validation automata once for this run.
+
+        - one dead-name + active-verb matcher covering every character who dies
+        - one setting-ban matcher and one design-fidelity matcher
+        - one matcher per info gate (its trigger phrases as one alternation)
+
+        validate_content recompiles automatically if names, bans or gates change.
+        """
+        t0 = time.perf_counter()
+        key = self._matcher_key()
+        dead_names, bans, forbidden, gate_triggers = key
+
+        dead_by_first: Dict[str, List[str]] = {}
+        for name in dead_names:
+            dead_by_first.setdefault(name.split()[0].lower(), []).append(name)
+        dead_active = None
+        if dead_by_first:
+            names_alt = "|".join(re.escape(n) for n in sorted(dead_by_first, key=len, reverse=True))
+            dead_active = re.compile(rf"(?P<name>{names_alt})\s+(?:{_ACTIVE_VERBS})", re.IGNORECASE)
+
+        setting_ban = None
+        if bans:
+            setting_ban = re.compile(
+                "|".join(re.escape(b.lower()) for b in sorted(bans, key=len, reverse=True)),
+                re.IGNORECASE,
+            )
+
+        design = re.compile(_alternation(list(forbidden)), re.IGNORECASE) if forbidden else None
+
+        # Gates stay separate: triggers share the antagonist's name, so in a single
+        # alternation an open gate matching first would hide a closed one.
+        gates = [re.compile(_alternation(list(triggers)), re.IGNORECASE) if triggers else None
+                 for triggers in gate_triggers]
+
+        self._compiled = _CompiledMatchers(
+            key=key,
+            dead_active=dead_active,
+            dead_by_first=dead_by_first,
+            setting_ban=setting_ban,
+            design_forbidden=design,
+            info_gates=gates,
+        )
+        self._scene_pos = {sid: i for i, sid in enumerate(self.scene_order)}
+        self.stats["compile_calls"] += 1
+        self.stats["compile_ms"] += (time.perf_counter() - t0) * 1000
+
+    def _matchers(self) -> _CompiledMatchers:
+        if self._compiled is None or self._compiled.key != self._matcher_key():
+            self.compile()
+        return self._compiled
+
+    def timing_stats(self) -> Dict[str, Any]:
+        """Compile/validate counters, plus mean validation time per scene."""
+        calls = self.stats["validate_calls"]
+        return {
+            **self.stats,
+            "compile_ms": round(self.stats["compile_ms"], 3),
+            "validate_ms": round(self.stats["validate_ms"], 3),
+            "validate_mean_ms": round(self.stats["validate_ms"] / calls, 3) if calls else 0.0,
+        }
+
     def _scene_index(self, scene_id: str) -> int:
         """Get ordinal position of a scene in the story."""
-        try:
-            return self.scene_order.index(scene_id)
-        except ValueError:
-            return -1
+        if len(self._scene_pos) != len(self.scene_order):
+            self._scene_pos = {sid: i for i, sid in enumerate(self.scene_order)}
+        return self._scene_pos.get(scene_id, -1)
 
     def get_alive_at(self, scene_id: str) -> Set[str]:
         """Return set of characters alive at the start of a given scene."""
@@ -380,64 +513,50 @@ class ContinuityState:
         pov: str = "",
         character_names: Set[str] = None,
     ) -> dict:
-        """Post-draft content validation. Returns {ok, errors, retry_notes}."""
+        """Post-draft content validation. Returns {ok, errors, retry_notes}.
+
+        Uses the automata from compile(): one pass per matcher over the scene.
+        """
+        t0 = time.perf_counter()
+        try:
+            return self._validate_content(scene_id, text)
+        finally:
+            self.stats["validate_calls"] += 1
+            self.stats["validate_ms"] += (time.perf_counter() - t0) * 1000
+
+    def _validate_content(self, scene_id: str, text: str) -> dict:
         errors = []
         retry_notes = []
 
         if not text or not text.strip():
             return {"ok": False, "errors": ["Empty scene"], "retry_notes": ["Write a complete scene."]}
 
-        text_lower = text.lower()
+        matchers = self._matchers()
 
         # 1. Dead character appearing as physically present
         dead = self.get_dead_at(scene_id)
-        if dead:
-            # Memory/flashback exemption words
-            memory_ctx = {"remembered", "memory", "memorial", "photo", "photograph",
-                          "thinking about", "thought of", "used to", "once told",
-                          "had said", "before the", "back when"}
+        if dead and matchers.dead_active is not None:
+            active: Set[str] = set()
+            for m in matchers.dead_active.finditer(text):
+                first = m.group("name").lower()
+                candidates = [n for n in matchers.dead_by_first.get(first, []) if n in dead and n not in active]
+                if not candidates:
+                    continue
+                window = text[max(0, m.start() - _MEMORY_WINDOW):m.start() + len(first) + _MEMORY_WINDOW].lower()
+                if not any(ctx in window for ctx in _MEMORY_CONTEXT):
+                    active.update(candidates)
             for name, died_in in dead.items():
-                first_name = name.split()[0]
-                if first_name.lower() in text_lower:
-                    # Check if ALL mentions are in memory context
-                    # Find all mention positions
-                    positions = [m.start() for m in re.finditer(
-                        re.escape(first_name), text, re.IGNORECASE
-                    )]
-                    active_mentions = 0
-                    for pos in positions:
-                        # Check 80 chars before the mention for memory context
-                        window = text[max(0, pos - 80):pos + len(first_name) + 80].lower()
-                        if not any(ctx in window for ctx in memory_ctx):
-                            # Check for active-presence verbs near the mention
-                            active_verbs = (
-                                r'said|says|walked|walks|stood|stands|looked|looks|turned|turns|'
-                                r'stepped|steps|grabbed|grabs|smiled|smiles|laughed|laughs|moved|moves|'
-                                r'leaned|leans|sat|sits|nods|nodded|shrugs|shrugged|points|pointed|'
-                                r'whispers|whispered|enters|entered|exits|exited|reaches|reached|'
-                                r'pushes|pushed|pulls|pulled|holds|held|approaches|approached|'
-                                r'follows|followed|speaks|spoke|asks|asked|replies|replied|adds|added|'
-                                r'touches|touched|stares|stared|backs|backed|races|raced|stumbles|stumbled|'
-                                r'collapses|collapsed|gasps|gasped|growls|growled'
-                            )
-                            if re.search(
-                                rf'{re.escape(first_name.lower())}\s+(?:{active_verbs})',
-                                window
-                            ):
-                                active_mentions += 1
-                    if active_mentions >= 1:
-                        errors.append(f"Dead character '{name}' (died {died_in}) appears as physically present.")
-                        retry_notes.append(
-                            f"Remove {name} from active scene. {name} died in {died_in}. "
-                            f"They may only appear in memory/dialogue about the past."
-                        )
+                if name in active:
+                    errors.append(f"Dead character '{name}' (died {died_in}) appears as physically present.")
+                    retry_notes.append(
+                        f"Remove {name} from active scene. {name} died in {died_in}. "
+                        f"They may only appear in memory/dialogue about the past."
+                    )
 
         # 2. Setting violations (banned keywords)
-        if self.setting_bans:
-            hits = []
-            for ban in self.setting_bans:
-                if ban.lower() in text_lower:
-                    hits.append(ban)
+        if matchers.setting_ban is not None:
+            found = {m.group(0).lower() for m in matchers.setting_ban.finditer(text)}
+            hits = [ban for ban in self.setting_bans if ban.lower() in found]
             if hits:
                 errors.append(f"Setting violation — impossible references: {', '.join(hits)}")
                 rule_summary = "; ".join(self.hard_rules[:2]) if self.hard_rules else "underwater"
@@ -448,37 +567,33 @@ class ContinuityState:
                 )
 
         # 2b. Design fidelity: forbid clone/double/doppelgänger and config.avoid elements
-        if self.design_forbidden:
-            text_lower = text.lower()
-            for pat in self.design_forbidden:
-                if re.search(pat, text, re.IGNORECASE):
-                    errors.append(
-                        "Design drift: Scene introduces plot elements forbidden by design "
-                        "(e.g. clone, double, doppelgänger, or config.avoid). "
-                        "Stay within the outlined antagonist and premise."
-                    )
-                    retry_notes.append(
-                        "Remove clone/double/doppelgänger or other invented plot elements. "
-                        "The antagonist and premise are fixed in config. "
-                        "Do not invent duplicate characters, AI body-doubles, or supernatural twists."
-                    )
-                    break  # One hit is enough
+        if matchers.design_forbidden is not None and matchers.design_forbidden.search(text):
+            errors.append(
+                "Design drift: Scene introduces plot elements forbidden by design "
+                "(e.g. clone, double, doppelgänger, or config.avoid). "
+                "Stay within the outlined antagonist and premise."
+            )
+            retry_notes.append(
+                "Remove clone/double/doppelgänger or other invented plot elements. "
+                "The antagonist and premise are fixed in config. "
+                "Do not invent duplicate characters, AI body-doubles, or supernatural twists."
+            )
 
         # 3. Info leak detection (knowledge gating)
-        target_idx = self._scene_index(scene_id)
-        for gate in self.info_gates:
-            reveal_idx = self._scene_index(gate.reveal_at)
-            if reveal_idx < 0 or target_idx >= reveal_idx:
-                continue  # Already revealed, no gate needed
-            for phrase_pat in gate.trigger_phrases:
-                if re.search(phrase_pat, text, re.IGNORECASE):
-                    errors.append(f"Info leak: '{gate.fact}' referenced before reveal in {gate.reveal_at}")
-                    retry_notes.append(
-                        f"Remove any implication that {gate.fact}. "
-                        f"This is not revealed until {gate.reveal_at}. "
-                        f"Keep suspicion ambiguous; do not name or confirm the antagonist."
-                    )
-                    break  # One hit per gate is enough
+        if any(matchers.info_gates):
+            target_idx = self._scene_index(scene_id)
+            for gate, pattern in zip(self.info_gates, matchers.info_gates):
+                reveal_idx = self._scene_index(gate.reveal_at)
+                if pattern is None or reveal_idx < 0 or target_idx >= reveal_idx:
+                    continue  # no triggers, or already revealed for this scene
+                if not pattern.search(text):
+                    continue
+                errors.append(f"Info leak: '{gate.fact}' referenced before reveal in {gate.reveal_at}")
+                retry_notes.append(
+                    f"Remove any implication that {gate.fact}. "
+                    f"This is not revealed until {gate.reveal_at}. "
+                    f"Keep suspicion ambiguous; do not name or confirm the antagonist."
+                )
 
         # 4. Completion check (mid-sentence already checked by format validator,
         #    but we add a stronger check here)
@@ -513,9 +628,8 @@ class ContinuityState:
     )
 
     # Location extraction: "in the [Location]", "at the [Location]", etc.
-    _LOCATION_EXTRACT = re.compile(
-        r'\b(?:in|at|inside|on|aboard|within)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})',
-    )
+    # (matched once per scene text by the shared mention index)
+    _LOCATION_PREPOSITIONS = frozenset({"in", "at", "inside", "on", "aboard", "within"})
 
     def update_character_location(self, scene_id: str, char_name: str, location: str) -> None:
         """Update a character's last known location."""
@@ -550,12 +664,15 @@ class ContinuityState:
             return {"pass": True, "issues": []}
 
         # Extract current scene location from first 500 chars
-        first_500 = text[:500]
-        loc_match = self._LOCATION_EXTRACT.search(first_500)
-        current_location = loc_match.group(1).strip() if loc_match else ""
+        mentions = get_default_index().scene(text)
+        current_location = mentions.first_location(
+            limit=500, prepositions=self._LOCATION_PREPOSITIONS, max_words=4,
+        ) or ""
 
         # Check for transition verbs in first 500 chars
-        has_transition = bool(self._TRANSITION_VERBS.search(first_500))
+        has_transition = mentions.memo(
+            "opening_transition", lambda: bool(self._TRANSITION_VERBS.search(text[:500])),
+        )
 
         for char in participants:
             prev = self.get_character_location(char)
@@ -13,6 +13,8 @@ import logging
 import re
 from typing import Any, Dict, List, Tuple
 
+from quality.mention_index import get_default_index
+
 logger = logging.getLogger("entity_tracker")
 
 # Patterns to extract entity-relationship pairs
@@ -53,6 +55,16 @@ _PRONOUN_REL_NAME = re.compile(
     r"\s*,?\s*\b([A-Z][a-z]{2,})\b",
 )
 
+# Role words as the mention index tokenizes them ("ex-wife" -> "ex", "wife");
+# a scene without any of these cannot match the patterns above.
+_ROLE_TOKENS = frozenset({
+    "brother", "sister", "mother", "father", "son", "daughter", "husband", "wife",
+    "aunt", "uncle", "cousin", "grandmother", "grandfather",
+    "partner", "fiancé", "fiancée", "fiance", "fiancee",
+    "boyfriend", "girlfriend", "friend", "lover", "mentor", "boss",
+    "stepmother", "stepfather", "stepbrother", "stepsister",
+})
+
 
 def _normalize_role(role: str) -> str:
     """Normalize a relationship role for comparison."""
@@ -71,45 +83,35 @@ def extract_entity_pairs(
     """Extract entity-relationship pairs from a scene text.
 
     Returns list of dicts: {owner, role, name, scene_id, pattern}.
+    Matches are cached per scene content in the shared mention index.
     """
+    mentions = get_default_index().scene(text)
+    matches = mentions.memo("entity_pairs", lambda: _scan_entity_pairs(mentions))
+    return [
+        {"owner": owner, "role": role, "name": name, "scene_id": scene_id, "pattern": pattern}
+        for owner, role, name, pattern in matches
+    ]
+
+
+def _scan_entity_pairs(mentions) -> List[Tuple[str, str, str, str]]:
+    if _ROLE_TOKENS.isdisjoint(mentions.words):
+        return []
+    text = mentions.text
     pairs = []
 
     # Pattern A: "Marco's brother Luca"
     for m in _POSSESSIVE_REL.finditer(text):
-        owner = m.group(1)
-        role = m.group(2)
         name = m.group(3)  # May be None if no name follows
-        pairs.append({
-            "owner": owner,
-            "role": _normalize_role(role),
-            "name": name if name else "",
-            "scene_id": scene_id,
-            "pattern": "possessive",
-        })
-
-    # Pattern B: "Luca, his brother" — here Luca IS the relationship
+        pairs.append((m.group(1), _normalize_role(m.group(2)), name if name else "", "possessive"))
+
+    # Pattern B: "Luca, his brother" — here Luca IS the relationship;
+    # owner is the pronoun referent (unknown without context)
     for m in _APPOSITIVE_REL.finditer(text):
-        name = m.group(1)
-        role = m.group(2)
-        pairs.append({
-            "owner": "",  # Owner is the pronoun referent (unknown without context)
-            "role": _normalize_role(role),
-            "name": name,
-            "scene_id": scene_id,
-            "pattern": "appositive",
-        })
+        pairs.append(("", _normalize_role(m.group(2)), m.group(1), "appositive"))
 
     # Pattern C: "her brother Luca"
     for m in _PRONOUN_REL_NAME.finditer(text):
-        role = m.group(1)
-        name = m.group(2)
-        pairs.append({
-            "owner": "",  # Owner is the pronoun referent
-            "role": _normalize_role(role),
-            "name": name,
-            "scene_id": scene_id,
-            "pattern": "pronoun_rel",
-        })
+        pairs.append(("", _normalize_role(m.group(1)), m.group(2), "pronoun_rel"))
 
     return pairs
 
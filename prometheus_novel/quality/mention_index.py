@@ -0,0 +1,188 @@
+"""Shared manuscript mention index — one tokenization pass per scene content.
+
+Character-name, location and time-anchor lookups used to rescan the full
+scene text once per name in several places (facts ledger, roster gate,
+entity tracker, location continuity). The index tokenizes each distinct
+scene text once, keyed by content hash, and answers those queries from
+token positions, so checks cost O(mentions) instead of O(names x text).
+
+Tokenization is roster-agnostic: any name, alias or multi-word name can be
+queried against the same entry, and edited scenes simply hash to a new
+entry (unchanged scenes are never rescanned).
+
+Usage:
+    idx = get_default_index()
+    m = idx.scene(text)
+    m.contains("Elena Vance"); m.find("Silas"); m.first_location(limit=500)
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Letters/digits only: "Marco's" -> "marco", "s"; "O'Brien" -> "o", "brien"
+_TOKEN_PAT = re.compile(r"[^\W_]+")
+
+# Location after a preposition: "in the Control Room", "aboard Meridian"
+_LOCATION_PAT = re.compile(
+    r"\b(in|at|inside|outside|on|aboard|within)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
+)
+
+# Time-of-day or temporal phrase
+_TIME_PAT = re.compile(
+    r"\b(morning|afternoon|evening|night|dawn|dusk|later that (?:day|night)|the next day)\b",
+    re.IGNORECASE,
+)
+
+# Separators allowed between the words of a multi-word name
+_NAME_GAP = re.compile(r"[\s'’\-.]{1,3}")
+
+DEFAULT_MAX_ENTRIES = 2048
+
+
+def content_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SceneMentions:
+    """Token positions and derived mentions for one scene text."""
+
+    __slots__ = ("text", "spans", "words", "_memo")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.spans: List[Tuple[int, int]] = []
+        self.words: Dict[str, List[int]] = {}  # lowercased token -> token indices
+        for i, m in enumerate(_TOKEN_PAT.finditer(text)):
+            self.spans.append((m.start(), m.end()))
+            self.words.setdefault(m.group(0).lower(), []).append(i)
+        self._memo: Dict[str, Any] = {}
+
+    # -- tokens -----------------------------------------------------------
+
+    def token(self, i: int) -> str:
+        start, end = self.spans[i]
+        return self.text[start:end]
+
+    def gap_before(self, i: int) -> str:
+        """Text between token i-1 and token i."""
+        prev_end = self.spans[i - 1][1] if i > 0 else 0
+        return self.text[prev_end:self.spans[i][0]]
+
+    # -- names ------------------------------------------------------------
+
+    def find_tokens(self, name: str) -> List[Tuple[int, int]]:
+        """(first_token, past_last_token) index ranges of whole-word matches of name."""
+        parts = [p.lower() for p in _TOKEN_PAT.findall(name or "")]
+        if not parts:
+            return []
+        hits = []
+        for i in self.words.get(parts[0], []):
+            end = i + len(parts)
+            if end > len(self.spans):
+                continue
+            if all(
+                self.token(i + k).lower() == parts[k] and _NAME_GAP.fullmatch(self.gap_before(i + k))
+                for k in range(1, len(parts))
+            ):
+                hits.append((i, end))
+        return hits
+
+    def find(self, name: str) -> List[int]:
+        """Character offsets of whole-word, case-insensitive matches of name."""
+        return [self.spans[i][0] for i, _ in self.find_tokens(name)]
+
+    def contains(self, name: str) -> bool:
+        return bool(self.find(name))
+
+    def count(self, name: str) -> int:
+        return len(self.find(name))
+
+    def present(self, names: Iterable[str]) -> List[str]:
+        """Subset of names mentioned in the scene (input order kept)."""
+        return [n for n in names if n and self.contains(n)]
+
+    # -- locations / time -------------------------------------------------
+
+    def locations(self) -> List[Tuple[int, str, int, int]]:
+        """All (match_start, preposition, name_start, name_end) location mentions."""
+        return self.memo("locations", lambda: [
+            (m.start(), m.group(1), m.start(2), m.end(2)) for m in _LOCATION_PAT.finditer(self.text)
+        ])
+
+    def first_location(
+        self,
+        limit: Optional[int] = None,
+        prepositions: Optional[Set[str]] = None,
+        max_words: Optional[int] = None,
+    ) -> Optional[str]:
+        """First location named within the first ``limit`` characters."""
+        for start, prep, name_start, name_end in self.locations():
+            if limit is not None and name_start >= limit:
+                break
+            if prepositions is not None and prep not in prepositions:
+                continue
+            end = name_end if limit is None else min(name_end, limit)
+            words = re.findall(r"[A-Z][a-z]+", self.text[name_start:end])
+            if not words:
+                continue
+            if max_words:
+                words = words[:max_words]
+            return " ".join(words)
+        return None
+
+    def time_anchors(self) -> List[Tuple[int, str]]:
+        return self.memo("time_anchors", lambda: [
+            (m.start(), m.group(1)) for m in _TIME_PAT.finditer(self.text)
+        ])
+
+    def first_time_anchor(self) -> Optional[str]:
+        anchors = self.time_anchors()
+        return anchors[0][1].strip() if anchors else None
+
+    # -- derived results --------------------------------------------------
+
+    def memo(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Cache any derived per-scene result alongside the tokens."""
+        if key not in self._memo:
+            self._memo[key] = fn()
+        return self._memo[key]
+
+
+class MentionIndex:
+    """LRU of SceneMentions keyed by scene content hash."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, SceneMentions]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def scene(self, text: str) -> SceneMentions:
+        key = content_hash(text or "")
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = SceneMentions(text or "")
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_default_index = MentionIndex()
+
+
+def get_default_index() -> MentionIndex:
+    """Process-wide index shared by the quality/continuity consumers."""
+    return _default_index
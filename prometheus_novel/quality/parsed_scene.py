@@ -0,0 +1,227 @@
+"""
+ParsedScene — one memoized parse of a scene's text for the quality modules.
+
+quality_contract, tension_density, voice_heatmap, quiet_killers,
+quality_meters and the pipeline's word counter each re-split the same
+scene into paragraphs, sentences, dialogue spans and words with their own
+regexes, several times per stage. parse_scene(text) returns a shared
+ParsedScene instead:
+
+  - looked up by content (an LRU of the most recent texts), so unchanged
+    scenes are parsed once across stages and modules
+  - every view is computed lazily on first access
+  - __slots__ and array('I') offsets keep each parse small
+
+Views keep the exact splitting rules the modules used before (a paragraph
+is a stripped, non-empty "\\n\\n" block; a sentence is a stripped,
+non-empty segment between runs of .!?; words are whitespace tokens), so
+switching a module to ParsedScene does not change its output.
+"""
+
+import re
+from array import array
+from collections import OrderedDict
+from itertools import chain
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+PARSE_CACHE_SIZE = 512
+
+_SENTENCE_END = re.compile(r"[.!?]+")
+_TOKEN = re.compile(r"\S+")
+_DIALOGUE_RE = re.compile(r'"[^"]*"')
+_SMART_DIALOGUE_RE = re.compile(r'\u201c[^\u201d]*\u201d')
+# "dialogue" ... <speaker> said (quality_meters voice attribution)
+_ATTRIBUTED_QUOTE_RE = re.compile(
+    r'[\u201c"]([^\u201d"]{10,})[\u201d"][^\u201d"]*?(?:(\w+)\s+(?:said|whispered|murmured|replied|asked|'
+    r'snapped|muttered|called|yelled|answered|demanded|insisted|admitted|suggested|offered|growled|'
+    r'hissed|breathed))',
+    re.IGNORECASE,
+)
+# count_words_accurate: markdown headers, scene breaks, formatting characters
+_MD_HEADER = re.compile(r'^#+\s+.*$', re.MULTILINE)
+_SCENE_BREAK = re.compile(r'[⁂\*]{3,}')
+_MD_FORMAT = re.compile(r'[\*_\[\]`#]')
+
+_cache: "OrderedDict[str, ParsedScene]" = OrderedDict()
+
+
+class ParsedScene:
+    """Lazily computed structural views of one scene text."""
+
+    __slots__ = ("text", "_blocks", "_paragraphs", "_sentence_bounds", "_sentence_words",
+                 "_word_count", "_token_bounds", "_dialogue_spans", "_dialogue", "_quotes",
+                 "_accurate_words", "_labels")
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self._blocks: Optional[Tuple[str, ...]] = None
+        self._paragraphs: Optional[Tuple[str, ...]] = None
+        self._sentence_bounds: Optional[array] = None
+        self._sentence_words: Optional[array] = None
+        self._word_count: Optional[int] = None
+        self._token_bounds: Optional[array] = None
+        self._dialogue_spans: Optional[array] = None
+        self._dialogue: Optional[Tuple[str, str]] = None
+        self._quotes: Optional[Tuple[Tuple[int, str, str], ...]] = None
+        self._accurate_words: Optional[int] = None
+        self._labels: Optional[Dict[tuple, Tuple[str, ...]]] = None
+
+    # ------------------------------------------------------------------
+    # Paragraphs
+    # ------------------------------------------------------------------
+
+    @property
+    def blocks(self) -> Tuple[str, ...]:
+        """Raw "\\n\\n"-separated blocks (unstripped, empties kept)."""
+        if self._blocks is None:
+            self._blocks = tuple(self.text.split("\n\n"))
+        return self._blocks
+
+    @property
+    def paragraphs(self) -> Tuple[str, ...]:
+        """Stripped, non-empty paragraphs."""
+        if self._paragraphs is None:
+            self._paragraphs = tuple(p for p in (b.strip() for b in self.blocks) if p)
+        return self._paragraphs
+
+    def labels(self, classifier: Callable[[str], str], blocks: bool = False) -> Tuple[str, ...]:
+        """classifier(paragraph) for every paragraph (or raw block), memoized per classifier."""
+        if self._labels is None:
+            self._labels = {}
+        key = (classifier, blocks)
+        found = self._labels.get(key)
+        if found is None:
+            found = self._labels[key] = tuple(classifier(p) for p in
+                                              (self.blocks if blocks else self.paragraphs))
+        return found
+
+    # ------------------------------------------------------------------
+    # Sentences
+    # ------------------------------------------------------------------
+
+    def _split_sentences(self) -> None:
+        text = self.text
+        bounds, words = array("I"), array("I")
+        start = 0
+        for m in chain(_SENTENCE_END.finditer(text), (None,)):
+            segment = text[start:m.start()] if m else text[start:]
+            stripped = segment.strip()
+            if stripped:
+                lead = start + len(segment) - len(segment.lstrip())
+                bounds.extend((lead, lead + len(stripped)))
+                words.append(len(stripped.split()))
+            if m:
+                start = m.end()
+        self._sentence_bounds, self._sentence_words = bounds, words
+
+    @property
+    def sentence_bounds(self) -> array:
+        """Flat [start, end, start, end, ...] offsets of the stripped sentences."""
+        if self._sentence_bounds is None:
+            self._split_sentences()
+        return self._sentence_bounds
+
+    @property
+    def sentence_lengths(self) -> array:
+        """Word count of each sentence."""
+        if self._sentence_words is None:
+            self._split_sentences()
+        return self._sentence_words
+
+    def sentences(self) -> Iterator[str]:
+        bounds = self.sentence_bounds
+        for i in range(0, len(bounds), 2):
+            yield self.text[bounds[i]:bounds[i + 1]]
+
+    # ------------------------------------------------------------------
+    # Words
+    # ------------------------------------------------------------------
+
+    @property
+    def word_count(self) -> int:
+        """Whitespace-separated tokens (len(text.split()))."""
+        if self._word_count is None:
+            self._word_count = (len(self._token_bounds) // 2 if self._token_bounds is not None
+                                else len(self.text.split()))
+        return self._word_count
+
+    @property
+    def token_bounds(self) -> array:
+        """Flat [start, end, ...] offsets of whitespace-separated tokens."""
+        if self._token_bounds is None:
+            bounds = array("I")
+            for m in _TOKEN.finditer(self.text):
+                bounds.extend(m.span())
+            self._token_bounds = bounds
+        return self._token_bounds
+
+    @property
+    def accurate_word_count(self) -> int:
+        """Word count excluding markdown headers, scene breaks and formatting."""
+        if self._accurate_words is None:
+            text = self.text
+            if text:
+                text = _MD_HEADER.sub('', text)
+                text = _SCENE_BREAK.sub('', text)
+                text = _MD_FORMAT.sub('', text)
+            self._accurate_words = len(text.split())
+        return self._accurate_words
+
+    # ------------------------------------------------------------------
+    # Dialogue
+    # ------------------------------------------------------------------
+
+    @property
+    def dialogue_spans(self) -> array:
+        """Flat [start, end, ...] offsets of quoted spans: straight quotes, then curly."""
+        if self._dialogue_spans is None:
+            spans = array("I")
+            for rx in (_DIALOGUE_RE, _SMART_DIALOGUE_RE):
+                for m in rx.finditer(self.text):
+                    spans.extend(m.span())
+            self._dialogue_spans = spans
+        return self._dialogue_spans
+
+    @property
+    def dialogue_text(self) -> str:
+        """All quoted spans (straight quotes first, then curly), space-joined."""
+        return self._split_dialogue()[0]
+
+    @property
+    def narration_text(self) -> str:
+        """The text with quoted spans removed."""
+        return self._split_dialogue()[1]
+
+    def _split_dialogue(self) -> Tuple[str, str]:
+        if self._dialogue is None:
+            text, spans = self.text, self.dialogue_spans
+            dialogue = " ".join(text[spans[i]:spans[i + 1]] for i in range(0, len(spans), 2))
+            # straight-quote spans are removed first; curly spans are matched on what remains
+            narration = _SMART_DIALOGUE_RE.sub("", _DIALOGUE_RE.sub("", text))
+            self._dialogue = (dialogue, narration)
+        return self._dialogue
+
+    @property
+    def attributed_quotes(self) -> Tuple[Tuple[int, str, str], ...]:
+        """(offset, quoted text, lower-cased speaker word) for quotes followed by a speech verb."""
+        if self._quotes is None:
+            self._quotes = tuple((m.start(), m.group(1), m.group(2).lower())
+                                 for m in _ATTRIBUTED_QUOTE_RE.finditer(self.text))
+        return self._quotes
+
+
+def parse_scene(text: Optional[str]) -> ParsedScene:
+    """Shared ParsedScene for ``text`` (LRU by content, PARSE_CACHE_SIZE entries)."""
+    text = text or ""
+    parsed = _cache.get(text)
+    if parsed is None:
+        parsed = _cache[text] = ParsedScene(text)
+        if len(_cache) > PARSE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(text)
+    return parsed
+
+
+def clear_cache() -> None:
+    _cache.clear()
@@ -16,6 +16,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from stages.resources import resources
+
 logger = logging.getLogger(__name__)
 
 # English stopwords (lightweight, no nltk dependency)
@@ -271,8 +273,7 @@ def load_phrase_config(
     all_paths = [auto_path, manual_path] + (supplemental_paths or [])
     for path in all_paths:
         if path and Path(path).exists():
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = resources().yaml(path) or {}
             for entry in data.get("phrases", []):
                 phrases[entry["phrase"]] = entry
 
@@ -286,7 +287,5 @@ def load_miner_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
         "ignore_regex": [],
     }
     if config_path and config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        defaults.update(data)
+        defaults.update(resources().yaml(config_path) or {})
     return defaults
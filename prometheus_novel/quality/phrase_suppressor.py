@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
+from stages.resources import resources
+
 if TYPE_CHECKING:
     from quality.ceiling import CeilingTracker
 
@@ -127,16 +129,13 @@ def load_replacement_banks(*paths: Union[Path, str]) -> Dict[str, List[str]]:
     Format: { banks: { "phrase": ["replacement1", ...], ... } }
     Project override: <project>/phrase_replacement_banks.yaml
     """
-    import yaml
-
     bank: Dict[str, List[str]] = {}
     for p in paths:
         path = Path(p) if not isinstance(p, Path) else p
         if not path.exists():
             continue
         try:
-            with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = resources().yaml(path, copy=False) or {}
             raw = data.get("banks") or data
             if isinstance(raw, dict):
                 for k, v in raw.items():
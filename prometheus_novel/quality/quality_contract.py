@@ -15,6 +15,8 @@ import re
 import logging
 from typing import Dict, List, Optional, Tuple
 
+from quality.parsed_scene import parse_scene
+
 logger = logging.getLogger("quality_contract")
 
 # Connectors that MUST reference prior beat when starting a paragraph
@@ -197,12 +199,17 @@ def _check_causality(paragraphs: List[str]) -> List[str]:
     return warnings
 
 
-def _check_deflection(paragraphs: List[str], tension_level: int) -> List[str]:
-    """For tension>=6, flag 2+ consecutive reflective (INTERNAL+DESCRIPTION) paragraphs."""
+def _check_deflection(paragraphs: List[str], tension_level: int,
+                      tags: Optional[List[str]] = None) -> List[str]:
+    """For tension>=6, flag 2+ consecutive reflective (INTERNAL+DESCRIPTION) paragraphs.
+
+    ``tags`` are precomputed _tag_paragraph_type labels of the non-empty paragraphs.
+    """
     if tension_level < 6:
         return []
 
-    tags = [_tag_paragraph_type(p) for p in paragraphs if p.strip()]
+    if tags is None:
+        tags = [_tag_paragraph_type(p) for p in paragraphs if p.strip()]
     if len(tags) < 3:
         return []
 
@@ -293,10 +300,7 @@ def _classify_opening_move(text: str) -> str:
 def _check_rhythm_variance(content: str) -> Tuple[bool, bool, List[str]]:
     """Check for very short (<=6), long (>=25), and flatline (N consecutive in 12-18 band)."""
     warnings = []
-    sentences = re.split(r"[.!?]+", content)
-    sentences = [s.strip() for s in sentences if s.strip()]
-
-    lengths = [len(s.split()) for s in sentences]
+    lengths = parse_scene(content).sentence_lengths
     if not lengths:
         return False, False, []
 
@@ -384,14 +388,16 @@ def run_quality_contract(
         sc = int(scene.get("scene_number") or scene.get("scene", 0))
         tension_level = _get_tension_level(scene, outline)
 
-        paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
+        parsed = parse_scene(content)
+        paragraphs = list(parsed.paragraphs)
         all_warnings: List[str] = []
 
         # Causality
         all_warnings.extend(_check_causality(paragraphs))
 
         # Deflection
-        all_warnings.extend(_check_deflection(paragraphs, tension_level))
+        all_warnings.extend(_check_deflection(paragraphs, tension_level,
+                                              parsed.labels(_tag_paragraph_type)))
 
         # Anchor categories
         _, anchor_warnings = _check_anchor_categories(content)
@@ -26,6 +26,8 @@ import random
 import logging
 from typing import Dict, List, Optional, Tuple
 
+from quality.parsed_scene import parse_scene
+
 logger = logging.getLogger("quiet_killers")
 
 # === CONTINUITY TRIPWIRES ===
@@ -950,7 +952,8 @@ def apply_final_line_rewrite(content: str, scene_mode: str = "default") -> str:
     dialogue line from within the final 3 paragraphs. Falls back to mode-aware
     template bank.
     """
-    paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
+    parsed = parse_scene(content)
+    paragraphs = list(parsed.paragraphs)
     if len(paragraphs) < 2:
         return content
     last = paragraphs[-1]
@@ -1134,11 +1137,12 @@ def apply_deflection_grounding(
     if tension_level < 6:
         return text
 
-    paragraphs = text.split("\n\n")
+    parsed = parse_scene(text)
+    paragraphs = list(parsed.blocks)
     if len(paragraphs) < 3:
         return text
 
-    classifications = [_classify_paragraph(p) for p in paragraphs]
+    classifications = parsed.labels(_classify_paragraph, blocks=True)
     edits = 0
     insert_idx = 0
 
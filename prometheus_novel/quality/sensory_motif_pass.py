@@ -10,7 +10,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
+from stages.resources import resources
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +26,7 @@ def _load_motif_config(config_path: Path) -> Dict[str, Dict[str, Any]]:
     """Load sensory motifs config. Returns motif_name -> {pattern, max_per_5k, swap_candidates}."""
     if not config_path.exists():
         return {}
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    data = resources().yaml(config_path) or {}
     return data.get("motifs", {})
 
 
@@ -0,0 +1,243 @@
+"""Span-level patch protocol for surgical rewrites.
+
+Surgical stages (chapter hooks, final de-AI, continuity fixes, structure
+repairs, Editor Studio passes) used to resend and regenerate the entire
+scene even when the fix touched two paragraphs. With this protocol the
+model sees anchored paragraphs ([P1], [P2], ...) and returns only JSON
+replacement patches for the ones it changes:
+
+    {"patches": [{"anchor": "P7", "text": "replacement paragraph"}]}
+
+A deterministic applier validates every patch and splices it into the
+original text byte-for-byte around the replaced paragraphs. Any invalid
+patch rejects the whole set so the caller can fall back to a full rewrite.
+
+Pure functions only — callers own the LLM calls.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Paragraph boundary: one or more blank lines (matches content.split("\n\n"))
+_PARA_BREAK = re.compile(r"\n\n+")
+_ANCHOR_PAT = re.compile(r"^\s*\[?P(\d+)\]?\s*$", re.IGNORECASE)
+# Labels that must never leak into prose
+_LEAK_PAT = re.compile(r"\[(?:P\d+|FIX THIS|KEEP VERBATIM|CONTEXT[^\]]*)\]", re.IGNORECASE)
+
+PATCH_SYSTEM_PROMPT = (
+    "You are a surgical line editor. You change only what the task requires "
+    "and answer with JSON replacement patches, never with the full scene."
+)
+
+PATCH_OUTPUT_INSTRUCTIONS = """=== OUTPUT FORMAT (PATCHES) ===
+Return ONLY a JSON object, no commentary:
+{"patches": [{"anchor": "P<n>", "text": "<full replacement paragraph>"}]}
+- One entry per paragraph you change; omit paragraphs you leave untouched.
+- "text" replaces the WHOLE paragraph. It may contain blank lines to split it.
+- Do not include anchor labels like [P3] inside "text"."""
+
+
+def paragraph_spans(content: str) -> List[Tuple[int, int]]:
+    """(start, end) offsets of each non-blank paragraph in content."""
+    spans = []
+    pos = 0
+    for m in _PARA_BREAK.finditer(content):
+        if content[pos:m.start()].strip():
+            spans.append((pos, m.start()))
+        pos = m.end()
+    if content[pos:].strip():
+        spans.append((pos, len(content)))
+    return spans
+
+
+def split_paragraphs(content: str) -> List[str]:
+    return [content[s:e] for s, e in paragraph_spans(content)]
+
+
+def anchor_for(index: int) -> str:
+    """Anchor label for a 0-based paragraph index."""
+    return f"P{index + 1}"
+
+
+def select_repair_paragraphs(paragraphs: Sequence[str], patch_targets: Iterable[str]) -> Set[int]:
+    """Map semantic patch_targets to paragraph indices.
+
+      "opening paragraphs"  → first 2 paragraphs
+      "middle section"      → paragraphs between opening and closing
+      "final beat"          → last 2 paragraphs
+      "dialogue exchanges"  → paragraphs containing quoted speech
+      "emotional arc"       → middle 50% of paragraphs
+      "consequence/stakes"  → middle 50% of paragraphs
+    Returns an empty set (repair everything) for scenes under 4 paragraphs
+    or when more than 70% of paragraphs would be targeted.
+    """
+    n = len(paragraphs)
+    if n < 4:
+        return set()
+
+    fix_indices: Set[int] = set()
+    targets_lower = " ".join(patch_targets).lower()
+
+    if "opening" in targets_lower or "goal statement" in targets_lower:
+        fix_indices.update(range(min(2, n)))
+    if "obstacle" in targets_lower or "tactic" in targets_lower or "middle" in targets_lower:
+        fix_indices.update(range(2, max(2, n - 2)))
+    if "final" in targets_lower or "closing" in targets_lower:
+        fix_indices.update(range(max(0, n - 2), n))
+    if "dialogue" in targets_lower:
+        for i, p in enumerate(paragraphs):
+            if '"' in p or '“' in p:  # straight or smart quotes
+                fix_indices.add(i)
+    if "emotional" in targets_lower or "consequence" in targets_lower or "stakes" in targets_lower:
+        quarter = max(1, n // 4)
+        fix_indices.update(range(quarter, n - quarter))
+
+    if len(fix_indices) > n * 0.7:
+        return set()
+    return fix_indices
+
+
+def build_patch_excerpt(
+    content: str,
+    fix_indices: Optional[Iterable[int]] = None,
+    context: int = 1,
+) -> str:
+    """Anchored scene excerpt for a patch prompt.
+
+    With ``fix_indices`` only those paragraphs (marked editable) plus
+    ``context`` neighbours on each side (marked read-only) are included.
+    Without them every paragraph is included and editable.
+    """
+    paragraphs = split_paragraphs(content)
+    if fix_indices is None:
+        return "\n\n".join(f"[{anchor_for(i)}]\n{p}" for i, p in enumerate(paragraphs))
+
+    fix = {i for i in fix_indices if 0 <= i < len(paragraphs)}
+    shown: Set[int] = set()
+    for i in fix:
+        shown.update(range(max(0, i - context), min(len(paragraphs), i + context + 1)))
+
+    blocks = []
+    prev = -1
+    for i in sorted(shown):
+        if i > prev + 1:
+            blocks.append(f"[... {i - prev - 1} paragraph(s) omitted ...]")
+        label = anchor_for(i) if i in fix else f"CONTEXT {anchor_for(i)} — read only, do not patch"
+        blocks.append(f"[{label}]\n{paragraphs[i]}")
+        prev = i
+    if prev < len(paragraphs) - 1:
+        blocks.append(f"[... {len(paragraphs) - prev - 1} paragraph(s) omitted ...]")
+    return "\n\n".join(blocks)
+
+
+def parse_patches(text: str) -> Optional[List[Dict[str, Any]]]:
+    """Extract the patch list from a model response; None if unparseable."""
+    if not text:
+        return None
+    cleaned = re.sub(r"^```(?:json)?\s*|\s*```$", "", text.strip(), flags=re.IGNORECASE)
+    data: Any = None
+    try:
+        data = json.loads(cleaned)
+    except (json.JSONDecodeError, ValueError):
+        start, end = cleaned.find("{"), cleaned.rfind("}")
+        if start >= 0 and end > start:
+            try:
+                data = json.loads(cleaned[start:end + 1])
+            except (json.JSONDecodeError, ValueError):
+                return None
+    if isinstance(data, dict):
+        data = data.get("patches")
+    if not isinstance(data, list):
+        return None
+    return [p for p in data if isinstance(p, dict)]
+
+
+@dataclass
+class PatchResult:
+    ok: bool
+    content: str
+    applied: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+
+def apply_patches(
+    content: str,
+    patches: Optional[Sequence[Dict[str, Any]]],
+    allowed: Optional[Iterable[int]] = None,
+    *,
+    max_growth: float = 2.5,
+    min_retention: float = 0.3,
+) -> PatchResult:
+    """Validate patches and splice them into content.
+
+    All-or-nothing: any invalid patch (unknown or disallowed anchor,
+    duplicate, empty or leaked-label text, runaway or collapsed length)
+    returns ``ok=False`` with the original content. An empty patch list is
+    also a failure — the caller asked for a fix.
+    """
+    if not patches:
+        return PatchResult(False, content, errors=["no patches returned"])
+
+    spans = paragraph_spans(content)
+    allowed_set = set(allowed) if allowed is not None else None
+    replacements: Dict[int, str] = {}
+    errors: List[str] = []
+
+    for patch in patches:
+        m = _ANCHOR_PAT.match(str(patch.get("anchor", "")))
+        if not m:
+            errors.append(f"bad anchor {patch.get('anchor')!r}")
+            continue
+        idx = int(m.group(1)) - 1
+        label = anchor_for(idx)
+        if not 0 <= idx < len(spans):
+            errors.append(f"{label}: no such paragraph")
+            continue
+        if allowed_set is not None and idx not in allowed_set:
+            errors.append(f"{label}: not an editable paragraph")
+            continue
+        if idx in replacements:
+            errors.append(f"{label}: duplicate patch")
+            continue
+        text = patch.get("text")
+        if not isinstance(text, str) or not text.strip():
+            errors.append(f"{label}: empty replacement")
+            continue
+        if _LEAK_PAT.search(text):
+            errors.append(f"{label}: replacement contains anchor/marker labels")
+            continue
+        start, end = spans[idx]
+        orig_words = len(content[start:end].split())
+        new_words = len(text.split())
+        if new_words > orig_words * max_growth + 20:
+            errors.append(f"{label}: replacement grew {orig_words}->{new_words} words")
+            continue
+        if orig_words >= 10 and new_words < orig_words * min_retention:
+            errors.append(f"{label}: replacement shrank {orig_words}->{new_words} words")
+            continue
+        replacements[idx] = text.strip()
+
+    if errors:
+        return PatchResult(False, content, errors=errors)
+
+    pieces = []
+    pos = 0
+    for idx in sorted(replacements):
+        start, end = spans[idx]
+        pieces.append(content[pos:start])
+        pieces.append(replacements[idx])
+        pos = end
+    pieces.append(content[pos:])
+    return PatchResult(True, "".join(pieces), applied=[anchor_for(i) for i in sorted(replacements)])
+
+
+def tail_indices(content: str, count: int) -> Set[int]:
+    n = len(paragraph_spans(content))
+    return set(range(max(0, n - count), n))
+
+
+def head_indices(content: str, count: int) -> Set[int]:
+    n = len(paragraph_spans(content))
+    return set(range(min(count, n)))
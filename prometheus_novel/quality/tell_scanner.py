@@ -0,0 +1,77 @@
+"""
+Compiled phrase scanner for AI-tell pattern lists.
+
+count_ai_tells used to rebuild its matchers on every call: lower-casing
+each pattern, escaping and rewriting placeholder patterns ("[X]",
+"[emotion]") into a fresh regex string, then going through the re cache.
+PhraseScanner does that once per pattern list:
+
+  - literals are stored lower-cased and counted with str.count
+  - placeholder patterns ([x] / [emotion] / [character] -> \\w+) are
+    compiled once and counted with findall
+
+A combined single-regex pass (one alternation, or zero-width lookahead
+starts fed into a trie) was measured slower on scene-sized text: CPython's
+str.count and prefix-optimised compiled patterns run in C, while one big
+alternation is tried branch by branch at every position.
+
+Counts are identical to the old loop: case-insensitive substring matching,
+non-overlapping per pattern, overlapping across patterns. Callers that
+rescan the same text memoize on a content hash (see count_ai_tells).
+"""
+
+import re
+from typing import Dict, Sequence, Tuple
+
+_PLACEHOLDERS = (r"\[x\]", r"\[emotion\]", r"\[character\]")
+
+_scanners: Dict[Tuple[str, ...], "PhraseScanner"] = {}
+
+
+def _placeholder_regex(pattern_lower: str) -> str:
+    rx = re.escape(pattern_lower)
+    for placeholder in _PLACEHOLDERS:
+        rx = rx.replace(placeholder, r"\w+")
+    return rx
+
+
+class PhraseScanner:
+    """Counts of a fixed list of phrase patterns in a text."""
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        self._literals = []
+        self._regexes = []
+        for pattern in self.patterns:
+            low = pattern.lower()
+            if not low:
+                continue
+            if "[" in low:
+                self._regexes.append((pattern, re.compile(_placeholder_regex(low))))
+            else:
+                self._literals.append((pattern, low))
+
+    def scan(self, text: str) -> Dict[str, int]:
+        """{pattern: count} for patterns found, in pattern order."""
+        if not text:
+            return {}
+        low = text.lower()
+        found = {}
+        for pattern, literal in self._literals:
+            count = low.count(literal)
+            if count:
+                found[pattern] = count
+        for pattern, rx in self._regexes:
+            count = len(rx.findall(low))
+            if count:
+                found[pattern] = count
+        return {p: found[p] for p in self.patterns if p in found}
+
+
+def get_scanner(patterns: Sequence[str]) -> PhraseScanner:
+    """Compiled scanner for a pattern list (built once per distinct list)."""
+    key = tuple(patterns)
+    scanner = _scanners.get(key)
+    if scanner is None:
+        scanner = _scanners[key] = PhraseScanner(key)
+    return scanner
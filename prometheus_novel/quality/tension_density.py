@@ -21,6 +21,8 @@ import re
 import logging
 from typing import Dict, List, Optional, Tuple
 
+from quality.parsed_scene import parse_scene
+
 logger = logging.getLogger("tension_density")
 
 
@@ -264,17 +266,10 @@ def _score_emotional_turn(text: str, dialogue: str, narration: str) -> Tuple[boo
 
 # ── Text Splitting Utilities ──────────────────────────────────────────────
 
-_DIALOGUE_RE = re.compile(r'"[^"]*"')
-_SMART_DIALOGUE_RE = re.compile(r'\u201c[^\u201d]*\u201d')
-
-
 def _split_dialogue_narration(text: str) -> Tuple[str, str]:
-    """Split text into dialogue and narration components."""
-    dialogue_parts = _DIALOGUE_RE.findall(text) + _SMART_DIALOGUE_RE.findall(text)
-    dialogue = " ".join(dialogue_parts)
-    narration = _DIALOGUE_RE.sub("", text)
-    narration = _SMART_DIALOGUE_RE.sub("", narration)
-    return dialogue, narration
+    """Split text into dialogue and narration components (shared ParsedScene)."""
+    parsed = parse_scene(text)
+    return parsed.dialogue_text, parsed.narration_text
 
 
 # ── Main Scoring Function ────────────────────────────────────────────────
@@ -294,7 +289,7 @@ def score_tension_density(
     Returns:
         Dict with score, per-dimension results, verdict, and recommendation.
     """
-    if not content or len(content.split()) < 50:
+    if not content or parse_scene(content).word_count < 50:
         return {
             "scene_id": scene_id,
             "tension_score": 0,
@@ -10,6 +10,8 @@ Config: enhancements.voice_heatmap.enabled
 import re
 from typing import Dict, List, Optional, Any
 
+from quality.parsed_scene import parse_scene
+
 # Weak verbs that signal passive/flat prose
 _WEAK_VERBS = re.compile(
     r"\b(was|were|is|are|be|been|being|has|have|had|get|gets|got|"
@@ -43,8 +45,8 @@ def compute_scene_metrics(content: str) -> Dict[str, float]:
     if not content or len(content.strip()) < 50:
         return {}
 
-    words = content.split()
-    word_count = len(words)
+    parsed = parse_scene(content)
+    word_count = parsed.word_count
     if word_count < 20:
         return {}
 
@@ -53,8 +55,8 @@ def compute_scene_metrics(content: str) -> Dict[str, float]:
     weak_count = len(_WEAK_VERBS.findall(content))
     abstract_count = len(_ABSTRACT_NOUNS.findall(content))
 
-    sentences = [s.strip() for s in re.split(r"[.!?]+", content) if s.strip() and len(s.strip()) > 5]
-    lengths = [len(s.split()) for s in sentences]
+    bounds = parsed.sentence_bounds
+    lengths = [n for i, n in enumerate(parsed.sentence_lengths) if bounds[2 * i + 1] - bounds[2 * i] > 5]
     variance = 0.0
     if len(lengths) >= 5:
         mean_l = sum(lengths) / len(lengths)
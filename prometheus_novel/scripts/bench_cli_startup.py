@@ -0,0 +1,150 @@
+"""CLI startup benchmark — cold and warm start time per subcommand.
+
+Usage:
+    python -m scripts.bench_cli_startup [--runs 5] [--budget-ms 200] [--json out.json]
+
+Each command runs as a fresh `python -m interfaces.cli.main ...` process
+against a throwaway project (no LLM calls, nothing written to data/).
+
+  cold: first start with an empty bytecode cache (every module compiled)
+  warm: median of --runs starts reusing that cache (day-to-day startup)
+
+The warm run is repeated under -X importtime to list the slowest imports,
+so a regression points at the module that caused it. Exits 1 when a
+budgeted (non-generation) command's warm start exceeds --budget-ms.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+if sys.platform == "win32":
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    if hasattr(sys.stderr, "reconfigure"):
+        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def build_commands(project: Path) -> List[Tuple[str, List[str], bool]]:
+    """(label, argv, budgeted) for each benchmarked command."""
+    config = str(project / "config.yaml")
+    return [
+        ("help", ["--help"], True),
+        ("ideas", ["ideas", "--list"], True),
+        ("compile", ["compile", "-c", config, "--format", "markdown"], True),
+        ("pre-polish-sample", ["pre-polish-sample", "-c", config], True),
+        ("audit", ["audit", "-p", str(project), "--skip-llm"], True),
+        ("editor-studio", ["editor-studio", "-p", str(project), "--dry-run"], True),
+        # Imports the pipeline module (no clients, no policy)
+        ("generate --list-stages", ["generate", "-c", config, "--list-stages"], False),
+    ]
+
+
+def make_project(root: Path) -> Path:
+    project = root / "bench-project"
+    project.mkdir()
+    (project / "config.yaml").write_text(
+        "project_name: bench-project\ntitle: Bench\ngenre: literary\nsynopsis: Startup benchmark.\n",
+        encoding="utf-8",
+    )
+    scenes = [
+        {"chapter": 1, "scene_number": i, "scene_id": f"ch01_s0{i}", "content": "She waited by the door."}
+        for i in range(1, 4)
+    ]
+    (project / "pipeline_state.json").write_text(
+        json.dumps({"scenes": scenes, "master_outline": [], "characters": []}), encoding="utf-8"
+    )
+    return project
+
+
+def parse_importtime(stderr: str, limit: int = 5) -> List[Dict[str, int]]:
+    """Slowest imports (cumulative microseconds) from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header row
+        rows.append({"module": parts[2].strip(), "self_us": int(parts[0]), "cumulative_us": int(parts[1])})
+    rows.sort(key=lambda r: r["cumulative_us"], reverse=True)
+    return rows[:limit]
+
+
+def _run(argv: List[str], env: Dict[str, str], importtime: bool = False) -> Tuple[float, subprocess.CompletedProcess]:
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-m", "interfaces.cli.main"] + argv
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    return (time.perf_counter() - start) * 1000, proc
+
+
+def bench(runs: int = 5) -> Dict[str, Dict]:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="writerai-bench-") as tmp:
+        tmp_path = Path(tmp)
+        project = make_project(tmp_path)
+        for label, argv, budgeted in build_commands(project):
+            env = dict(os.environ)
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+            # Private bytecode cache per command: the first run is truly cold
+            env["PYTHONPYCACHEPREFIX"] = str(tmp_path / "pycache" / label.replace(" ", "_"))
+            cold_ms, proc = _run(argv, env)
+            warm = [_run(argv, env)[0] for _ in range(max(1, runs))]
+            _, traced = _run(argv, env, importtime=True)
+            results[label] = {
+                "argv": argv,
+                "budgeted": budgeted,
+                "returncode": proc.returncode,
+                "cold_ms": round(cold_ms, 1),
+                "warm_ms": round(statistics.median(warm), 1),
+                "warm_min_ms": round(min(warm), 1),
+                "slowest_imports": parse_importtime(traced.stderr),
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WriterAI CLI startup per subcommand")
+    parser.add_argument("--runs", type=int, default=5, help="Warm runs per command (median reported)")
+    parser.add_argument("--budget-ms", type=float, default=200.0, help="Warm-start budget for non-generation commands")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = bench(args.runs)
+
+    over_budget = []
+    print(f"{'command':<26}{'cold ms':>10}{'warm ms':>10}  slowest import")
+    for label, r in results.items():
+        top = r["slowest_imports"][0] if r["slowest_imports"] else {"module": "-", "cumulative_us": 0}
+        flag = ""
+        if r["returncode"] != 0:
+            flag = f"  [exit {r['returncode']}]"
+        elif r["budgeted"] and r["warm_ms"] > args.budget_ms:
+            flag = "  [OVER BUDGET]"
+            over_budget.append(label)
+        print(f"{label:<26}{r['cold_ms']:>10.0f}{r['warm_ms']:>10.0f}  "
+              f"{top['module']} ({top['cumulative_us'] / 1000:.0f} ms){flag}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(
+            {"budget_ms": args.budget_ms, "python": sys.version.split()[0], "commands": results}, indent=2,
+        ), encoding="utf-8")
+        print(f"\nSaved: {args.json}")
+
+    if over_budget:
+        print(f"\nOver {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
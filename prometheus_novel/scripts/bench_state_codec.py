@@ -0,0 +1,89 @@
+"""State schema / codec benchmark — validation cost and (de)serialization speed.
+
+Usage:
+    python -m scripts.bench_state_codec [path/to/pipeline_state.json] [--runs 20]
+
+Without a path the largest data/projects/*/pipeline_state.json is used.
+
+  validate: validate_state() over the checkpoint (what load_state_file
+            adds on top of decoding)
+  speed:    checkpoint encode (indent=2) and decode with stdlib json vs
+            stages.scene_schema (orjson when installed), plus MessagePack
+            when msgpack is installed
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from stages import scene_schema  # noqa: E402
+from stages.scene_schema import dumps_json, loads_json, validate_state  # noqa: E402
+
+
+def _timed(fn: Callable[[], Any], runs: int) -> float:
+    """Median milliseconds over ``runs`` calls."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="State schema validation and codec benchmark")
+    parser.add_argument("state_file", nargs="?", default=None)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.state_file:
+        path = Path(args.state_file)
+    else:
+        candidates = sorted((PROJECT_ROOT / "data" / "projects").glob("*/pipeline_state.json"),
+                            key=lambda p: p.stat().st_size)
+        if not candidates:
+            print("No pipeline_state.json found; pass a path", file=sys.stderr)
+            return 1
+        path = candidates[-1]
+
+    raw = path.read_bytes()
+    state: Dict[str, Any] = json.loads(raw)
+    scenes = [s for s in state.get("scenes") or [] if isinstance(s, dict)]
+    if not scenes:
+        print(f"{path}: no scenes", file=sys.stderr)
+        return 1
+
+    print(f"{path} ({len(raw) / 1024:.0f} KB, {len(scenes)} scenes)")
+    _, issues = validate_state(state)
+    print("\nvalidate_state: %.2f ms (median of %d), %d issue(s)" % (
+        _timed(lambda: validate_state(state), args.runs), args.runs, len(issues)))
+
+    text = json.dumps(state, indent=2)
+    rows = [
+        ("encode  json.dumps(indent=2)", lambda: json.dumps(state, indent=2)),
+        ("encode  dumps_json(indent=True)", lambda: dumps_json(state, indent=True)),
+        ("decode  json.loads", lambda: json.loads(text)),
+        ("decode  loads_json", lambda: loads_json(raw)),
+    ]
+    if scene_schema.msgpack is not None:
+        packed = scene_schema.dumps_msgpack(state)
+        rows += [
+            ("encode  dumps_msgpack", lambda: scene_schema.dumps_msgpack(state)),
+            ("decode  loads_msgpack", lambda: scene_schema.loads_msgpack(packed)),
+        ]
+    print("\nCodec (median of %d, orjson %s, msgpack %s)" % (
+        args.runs, "on" if scene_schema.orjson else "off", "on" if scene_schema.msgpack else "off"))
+    for label, fn in rows:
+        print("  %-34s %8.2f ms" % (label, _timed(fn, args.runs)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
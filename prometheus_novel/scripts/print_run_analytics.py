@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Import JSONL run histories into the analytics store and query it.
+
+Usage:
+  python -m prometheus_novel.scripts.print_run_analytics import
+  python -m prometheus_novel.scripts.print_run_analytics delta burning-vows
+  python -m prometheus_novel.scripts.print_run_analytics trend scenes_with_preamble --last 5
+  python -m prometheus_novel.scripts.print_run_analytics incidents
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stages.analytics import ANALYTICS_DB, AnalyticsStore  # noqa: E402
+
+
+def main():
+    base = Path(__file__).resolve().parent.parent / "data" / "projects"
+    parser = argparse.ArgumentParser(description="Run analytics (SQLite) across projects")
+    parser.add_argument("--projects", default=str(base), help="Projects directory (default: data/projects)")
+    parser.add_argument("--db", default=None, help="Database path (default: <projects>/analytics.db)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("import", help="Import artifact_metrics_history / incidents / morgue JSONL files")
+    p_delta = sub.add_parser("delta", help="Latest run vs the one before it")
+    p_delta.add_argument("project")
+    p_trend = sub.add_parser("trend", help="One metric across runs and projects")
+    p_trend.add_argument("metric")
+    p_trend.add_argument("--project", action="append", default=None)
+    p_trend.add_argument("--last", type=int, default=None, help="Most recent N runs per project")
+    p_inc = sub.add_parser("incidents", help="Incident counts by project, stage and category")
+    p_inc.add_argument("project", nargs="?", default=None)
+    args = parser.parse_args()
+
+    projects = Path(args.projects)
+    store = AnalyticsStore(Path(args.db) if args.db else projects / ANALYTICS_DB)
+
+    if args.command == "import":
+        if not projects.is_dir():
+            print(f"Projects directory not found: {projects}", file=sys.stderr)
+            sys.exit(1)
+        for name, counts in store.import_projects(projects).items():
+            print("  %-30s runs=%d incidents=%d morgue=%d" % (
+                name, counts["runs"], counts["incidents"], counts["morgue"]))
+        print("Store:", store.path)
+    elif args.command == "delta":
+        runs = store.runs(args.project, limit=2)
+        if len(runs) < 2:
+            print(f"Need two runs of {args.project} (found {len(runs)})", file=sys.stderr)
+            sys.exit(1)
+        print("\nRun:", runs[0]["run_nonce"], runs[0]["timestamp"])
+        print("Compare:", runs[1]["run_nonce"], runs[1]["timestamp"])
+        delta = store.run_delta(args.project, runs[0]["run_nonce"])
+        rows = sorted(delta.items(), key=lambda kv: (abs(kv[1]["change"]), kv[0]), reverse=True)
+        print("\nMetric changes (largest first):")
+        for metric, d in rows:
+            print("  %-50s %10s -> %-10s d %+g" % (metric, d["previous"], d["current"], d["change"]))
+    elif args.command == "trend":
+        for r in store.trend(args.metric, args.project, args.last):
+            print("  %-30s %-10s %-26s %g" % (r["project"], r["run_nonce"], r["timestamp"], r["value"]))
+    elif args.command == "incidents":
+        for r in store.incident_counts(args.project):
+            print("  %-30s %-28s %-20s %d" % (r["project"], r["stage"], r["category"], r["count"]))
+
+
+if __name__ == "__main__":
+    main()
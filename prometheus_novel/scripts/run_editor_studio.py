@@ -20,6 +20,7 @@ Usage:
     python -m scripts.run_editor_studio data/projects/burning-vows-30k
     python -m scripts.run_editor_studio data/projects/burning-vows-30k --passes continuity,dialogue_friction
     python -m scripts.run_editor_studio data/projects/burning-vows-30k --dry-run
+    python -m scripts.run_editor_studio data/projects/burning-vows-30k --fused
 """
 
 import argparse
@@ -58,6 +59,11 @@ def main():
         default=None,
         help="Comma-separated passes (default: all). Options: continuity,dialogue_friction,stakes,final_line,voice,premium",
     )
+    parser.add_argument(
+        "--fused",
+        action="store_true",
+        help="Apply every pass triggered for a scene in one revision call (scenes run concurrently)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -111,6 +117,7 @@ def main():
             project_path,
             passes_enabled=passes_enabled,
             client=client,
+            mode="fused" if args.fused else None,
         )
         return report
 
@@ -79,13 +79,13 @@ def main():
 
     if not args.dry_run and report["scenes_modified"] > 0:
         # Backup then persist
-        backup = project_path / "pipeline_state.json.pre_editorial_cleanup"
-        import shutil
         import yaml
-        shutil.copy2(state_file, backup)
+        from stages.snapshots import SnapshotStore
+        snap = SnapshotStore.for_project(project_path).snapshot_file(
+            state_file, "pre_editorial_cleanup", keep=5)
         with open(state_file, "w", encoding="utf-8") as f:
             json.dump(state_data, f, indent=2, ensure_ascii=False)
-        print(f"[INFO] State persisted; backup at {backup.name}")
+        print(f"[INFO] State persisted; backup is snapshot {snap['id']} (scripts/state_snapshots.py)")
         # Recompile .md and .docx
         output_dir = project_path / "output"
         output_dir.mkdir(parents=True, exist_ok=True)
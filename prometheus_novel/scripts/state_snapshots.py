@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Manage a project's pipeline state snapshots (stages.snapshots).
+
+Usage:
+  python -m prometheus_novel.scripts.state_snapshots list data/projects/burning-vows
+  python -m prometheus_novel.scripts.state_snapshots snapshot data/projects/burning-vows manual
+  python -m prometheus_novel.scripts.state_snapshots diff data/projects/burning-vows pre_targeted_refinement manual
+  python -m prometheus_novel.scripts.state_snapshots restore data/projects/burning-vows pre_editorial_cleanup
+  python -m prometheus_novel.scripts.state_snapshots import-legacy data/projects/burning-vows --remove
+  python -m prometheus_novel.scripts.state_snapshots gc data/projects/burning-vows
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stages.snapshots import STATE_FILE, SnapshotStore  # noqa: E402
+
+# Full-copy backups written before the snapshot store existed
+LEGACY_PATTERNS = ("pipeline_state.json.pre_*", "pipeline_state_*.json")
+
+
+def _mb(n: int) -> str:
+    return "%.1f MB" % (n / (1024 * 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deduplicated pipeline state snapshots")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for cmd, help_text in (("list", "Snapshots, oldest first, and disk usage"),
+                           ("gc", "Remove blobs no snapshot references")):
+        sub.add_parser(cmd, help=help_text).add_argument("project")
+    p_snap = sub.add_parser("snapshot", help="Snapshot the current pipeline_state.json")
+    p_snap.add_argument("project")
+    p_snap.add_argument("name")
+    p_snap.add_argument("--keep", type=int, default=None, help="Keep only the newest N of this name")
+    p_diff = sub.add_parser("diff", help="Scene changes between two snapshots (id or name)")
+    p_diff.add_argument("project")
+    p_diff.add_argument("old")
+    p_diff.add_argument("new")
+    p_restore = sub.add_parser("restore", help="Write a snapshot back to pipeline_state.json")
+    p_restore.add_argument("project")
+    p_restore.add_argument("ref")
+    p_restore.add_argument("--no-backup", action="store_true",
+                           help="Don't snapshot the current state before restoring")
+    p_import = sub.add_parser("import-legacy", help="Move full-copy backups into the store")
+    p_import.add_argument("project")
+    p_import.add_argument("--remove", action="store_true", help="Delete the copies once imported")
+    args = parser.parse_args()
+
+    project = Path(args.project)
+    if not project.is_dir():
+        print(f"Project not found: {project}", file=sys.stderr)
+        sys.exit(1)
+    store = SnapshotStore.for_project(project)
+    state_file = project / STATE_FILE
+
+    try:
+        if args.command == "list":
+            for m in store.list():
+                print("  %-48s %4d scenes  %s" % (m["id"], len(m["scenes"]), m.get("label", "")))
+            usage = store.disk_usage()
+            print("\n%d snapshots, %d objects: %s stored for %s of state" % (
+                usage["snapshots"], usage["objects"], _mb(usage["stored_bytes"]), _mb(usage["raw_bytes"])))
+        elif args.command == "snapshot":
+            m = store.snapshot_file(state_file, args.name, keep=args.keep)
+            print("Snapshot", m["id"], "(%s new)" % _mb(m["written_bytes"]))
+        elif args.command == "diff":
+            d = store.diff(args.old, args.new)
+            print(f"{d['old']} -> {d['new']}")
+            for kind in ("added", "removed", "changed"):
+                print(f"  {kind:8s} {len(d[kind]):4d}  {', '.join(d[kind][:20])}")
+            print(f"  unchanged {d['unchanged']}; non-scene state {'changed' if d['state_changed'] else 'unchanged'}")
+        elif args.command == "restore":
+            if not args.no_backup and state_file.exists():
+                print("Current state saved as", store.snapshot_file(state_file, "pre_restore")["id"])
+            print("Restored", store.restore(args.ref, state_file)["id"])
+        elif args.command == "import-legacy":
+            copies = sorted({p for pattern in LEGACY_PATTERNS for p in project.glob(pattern)})
+            for path in copies:
+                name = path.name.replace("pipeline_state", "").replace(".json", "").strip("._") or "legacy"
+                m = store.snapshot_file(path, name, label=path.name)
+                print("  %-45s -> %s" % (path.name, m["id"]))
+                if args.remove:
+                    path.unlink()
+            if not copies:
+                print("No legacy backups found")
+        elif args.command == "gc":
+            r = store.gc()
+            print("Removed %d objects (%s)" % (r["removed_objects"], _mb(r["freed_bytes"])))
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""
+Run analytics store (SQLite).
+
+Per-project history used to live only in append-only JSONL files
+(artifact_metrics_history.jsonl, incidents.jsonl, cleanup_morgue.jsonl).
+Comparing runs meant re-reading and parsing every line, and nothing could
+be queried across projects. One AnalyticsStore database (by default
+data/projects/analytics.db, next to the project directories) holds:
+
+  runs           one row per pipeline run (project, run_nonce, metrics JSON)
+  run_metrics    numeric metric leaves of each run, flattened ("per_stage.
+                 scene_drafting.failed"), indexed by metric for trends
+  stage_results  status / duration / tokens per stage per run
+  scene_metrics  per-scene word count, chapter, POV per run
+  incidents      incident log entries
+  morgue         cleanup morgue entries
+
+Writes are batched: a run and all its child rows go in one transaction,
+telemetry batches arrive from the JSONL writer thread (stages.telemetry)
+and are inserted with executemany. Incidents and morgue rows carry a
+digest of their content and of how many identical entries of the same run
+came before them in the source, so re-importing a JSONL file the pipeline
+already mirrored adds nothing while a failure genuinely logged twice keeps
+both rows. The JSONL files are still written as the audit trail.
+
+Connections are opened per operation (WAL mode), so the store is safe to
+use from the telemetry writer thread and from concurrent runs.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from stages.telemetry import INCIDENT_FILE, MORGUE_FILE
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_DB = "analytics.db"
+HISTORY_FILE = "artifact_metrics_history.jsonl"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    run_nonce TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    config_fingerprint TEXT,
+    metrics TEXT,
+    budget TEXT,
+    UNIQUE (project, run_nonce)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_project_time ON runs (project, timestamp);
+
+CREATE TABLE IF NOT EXISTS run_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, metric)
+);
+CREATE INDEX IF NOT EXISTS idx_run_metrics_metric ON run_metrics (metric, run_id);
+
+CREATE TABLE IF NOT EXISTS stage_results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    stage TEXT NOT NULL,
+    status TEXT,
+    duration_seconds REAL,
+    tokens_used INTEGER,
+    cost_usd REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_stage_results_run ON stage_results (run_id);
+CREATE INDEX IF NOT EXISTS idx_stage_results_stage ON stage_results (stage, status);
+
+CREATE TABLE IF NOT EXISTS scene_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    scene_id TEXT NOT NULL,
+    chapter INTEGER,
+    scene_number INTEGER,
+    pov TEXT,
+    word_count INTEGER,
+    PRIMARY KEY (run_id, scene_id)
+);
+
+CREATE TABLE IF NOT EXISTS incidents (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    run_nonce TEXT NOT NULL DEFAULT '',
+    timestamp TEXT,
+    stage TEXT,
+    category TEXT,
+    severity TEXT,
+    failure_type TEXT,
+    detail TEXT,
+    scene_count_before INTEGER,
+    scene_count_after INTEGER,
+    digest TEXT NOT NULL,
+    UNIQUE (project, digest)
+);
+CREATE INDEX IF NOT EXISTS idx_incidents_run ON incidents (project, run_nonce);
+CREATE INDEX IF NOT EXISTS idx_incidents_stage ON incidents (stage, category);
+
+CREATE TABLE IF NOT EXISTS morgue (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    run_nonce TEXT NOT NULL DEFAULT '',
+    scene_id TEXT,
+    trigger_pattern TEXT,
+    phase TEXT,
+    anchor_check TEXT,
+    deleted_text TEXT,
+    digest TEXT NOT NULL,
+    UNIQUE (project, digest)
+);
+CREATE INDEX IF NOT EXISTS idx_morgue_run ON morgue (project, run_nonce);
+CREATE INDEX IF NOT EXISTS idx_morgue_pattern ON morgue (trigger_pattern);
+"""
+
+_INCIDENT_COLUMNS = ("timestamp", "stage", "category", "severity", "failure_type", "detail",
+                     "scene_count_before", "scene_count_after")
+_MORGUE_COLUMNS = ("scene_id", "trigger_pattern", "phase", "anchor_check", "deleted_text")
+
+
+def default_db_path(project_path) -> Path:
+    """Shared database next to the project directories (data/projects/analytics.db)."""
+    return Path(project_path).resolve().parent / ANALYTICS_DB
+
+
+def flatten_metrics(data: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """Numeric leaves of a nested dict keyed by dotted path (bools skipped)."""
+    out: Dict[str, float] = {}
+    for key, value in (data or {}).items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            out.update(flatten_metrics(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            out[name] = float(value)
+    return out
+
+
+def _digest(entry: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(entry, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """Parsed JSON objects from a JSONL file; unparseable lines are skipped."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                entries.append(entry)
+    return entries
+
+
+class AnalyticsStore:
+    """Indexed run history for any number of projects in one SQLite file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._ready = False
+        self._init_lock = threading.Lock()
+
+    @contextmanager
+    def connect(self):
+        """Connection committed on success, rolled back on error, always closed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA foreign_keys = ON")
+            if not self._ready:
+                with self._init_lock:
+                    if not self._ready:
+                        conn.execute("PRAGMA journal_mode = WAL")
+                        conn.executescript(_SCHEMA)
+                        self._ready = True
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record_run(self, project: str, run_nonce: str, timestamp: str,
+                   metrics: Dict[str, Any], budget: Optional[Dict[str, Any]] = None,
+                   config_fingerprint: Optional[Dict[str, Any]] = None,
+                   stage_results: Iterable[Dict[str, Any]] = (),
+                   scenes: Iterable[Dict[str, Any]] = (),
+                   replace: bool = True) -> Optional[int]:
+        """Store one run with its metrics, stage results and scenes in one transaction.
+
+        With replace=False an existing (project, run_nonce) row is left
+        untouched and None is returned (import mode).
+        """
+        flat = flatten_metrics(metrics)
+        flat.update(flatten_metrics(budget or {}, "budget."))
+        with self.connect() as conn:
+            row = conn.execute("SELECT id FROM runs WHERE project = ? AND run_nonce = ?",
+                               (project, run_nonce)).fetchone()
+            if row is not None and not replace:
+                return None
+            values = (timestamp, json.dumps(config_fingerprint or {}, default=str),
+                      json.dumps(metrics or {}, default=str), json.dumps(budget or {}, default=str))
+            if row is None:
+                run_id = conn.execute(
+                    "INSERT INTO runs (project, run_nonce, timestamp, config_fingerprint, metrics, budget)"
+                    " VALUES (?, ?, ?, ?, ?, ?)", (project, run_nonce, *values)).lastrowid
+            else:
+                run_id = row["id"]
+                conn.execute("UPDATE runs SET timestamp = ?, config_fingerprint = ?, metrics = ?,"
+                             " budget = ? WHERE id = ?", (*values, run_id))
+                for table in ("run_metrics", "stage_results", "scene_metrics"):
+                    conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+            conn.executemany("INSERT INTO run_metrics (run_id, metric, value) VALUES (?, ?, ?)",
+                             [(run_id, k, v) for k, v in flat.items()])
+            conn.executemany(
+                "INSERT INTO stage_results (run_id, stage, status, duration_seconds, tokens_used,"
+                " cost_usd, error) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, r.get("stage_name") or r.get("stage"), r.get("status"),
+                  r.get("duration_seconds", 0.0), r.get("tokens_used", 0), r.get("cost_usd", 0.0),
+                  r.get("error")) for r in stage_results])
+            scene_rows = {}
+            for s in scenes:
+                if not isinstance(s, dict):
+                    continue
+                scene_id = s.get("scene_id") or f"ch{s.get('chapter')}_s{s.get('scene_number')}"
+                scene_rows[scene_id] = (run_id, scene_id, s.get("chapter"), s.get("scene_number"),
+                                        s.get("pov"), len((s.get("content") or "").split()))
+            conn.executemany(
+                "INSERT INTO scene_metrics (run_id, scene_id, chapter, scene_number, pov, word_count)"
+                " VALUES (?, ?, ?, ?, ?, ?)", list(scene_rows.values()))
+        return run_id
+
+    def _add_entries(self, table: str, columns: Sequence[str], project: str,
+                     entries: Iterable[Dict[str, Any]], run_nonce: str,
+                     seen: Optional[Counter]) -> int:
+        seen = Counter() if seen is None else seen
+        rows = []
+        for e in entries:
+            if not isinstance(e, dict):
+                continue
+            nonce = e.get("run_nonce") or run_nonce
+            digest = _digest({**e, "run_nonce": nonce} if nonce else e)
+            n = seen[(nonce, digest)]
+            seen[(nonce, digest)] += 1
+            rows.append((project, nonce, *(e.get(c) for c in columns),
+                         f"{digest}:{n}" if n else digest))
+        if not rows:
+            return 0
+        names = ", ".join(("project", "run_nonce", *columns, "digest"))
+        marks = ", ".join("?" * (len(columns) + 3))
+        with self.connect() as conn:
+            before = conn.total_changes
+            conn.executemany(f"INSERT OR IGNORE INTO {table} ({names}) VALUES ({marks})", rows)
+            return conn.total_changes - before
+
+    def add_incidents(self, project: str, entries: Iterable[Dict[str, Any]], run_nonce: str = "",
+                      seen: Optional[Counter] = None) -> int:
+        """Insert incident entries, skipping ones already stored. Returns rows added.
+
+        ``entries`` are one source read in order: the nth identical entry
+        of a run is a separate row, and the same source added again adds
+        nothing. Pass the same ``seen`` Counter to continue a source across
+        calls (batches of one log, a rotated file and its successor).
+        """
+        return self._add_entries("incidents", _INCIDENT_COLUMNS, project, entries, run_nonce, seen)
+
+    def add_morgue(self, project: str, entries: Iterable[Dict[str, Any]], run_nonce: str = "",
+                   seen: Optional[Counter] = None) -> int:
+        """Insert cleanup morgue entries, skipping ones already stored (see add_incidents)."""
+        return self._add_entries("morgue", _MORGUE_COLUMNS, project, entries, run_nonce, seen)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _run_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        run = dict(row)
+        for key in ("config_fingerprint", "metrics", "budget"):
+            run[key] = json.loads(run[key]) if run.get(key) else {}
+        return run
+
+    def runs(self, project: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Runs of a project, newest first."""
+        sql = "SELECT * FROM runs WHERE project = ? ORDER BY timestamp DESC, id DESC"
+        params: tuple = (project,)
+        if limit:
+            sql += " LIMIT ?"
+            params += (int(limit),)
+        with self.connect() as conn:
+            return [self._run_dict(r) for r in conn.execute(sql, params)]
+
+    def previous_run(self, project: str, run_nonce: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Latest run of a project other than ``run_nonce`` (and older than it, if stored)."""
+        with self.connect() as conn:
+            current = None
+            if run_nonce:
+                current = conn.execute("SELECT timestamp, id FROM runs WHERE project = ? AND run_nonce = ?",
+                                       (project, run_nonce)).fetchone()
+            if current is not None:
+                row = conn.execute(
+                    "SELECT * FROM runs WHERE project = ? AND (timestamp < ? OR (timestamp = ? AND id < ?))"
+                    " ORDER BY timestamp DESC, id DESC LIMIT 1",
+                    (project, current["timestamp"], current["timestamp"], current["id"])).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT * FROM runs WHERE project = ? AND run_nonce != ?"
+                    " ORDER BY timestamp DESC, id DESC LIMIT 1", (project, run_nonce or "")).fetchone()
+        return self._run_dict(row) if row is not None else None
+
+    def run_delta(self, project: str, run_nonce: Optional[str] = None,
+                  metrics: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Changed metrics of a run (default: latest) vs the run before it.
+
+        Returns {metric: {"previous", "current", "change"}} for metrics whose
+        value differs; a metric missing on one side counts as 0.
+        """
+        if run_nonce is None:
+            latest = self.runs(project, limit=1)
+            if not latest:
+                return {}
+            run_nonce = latest[0]["run_nonce"]
+        prev = self.previous_run(project, run_nonce)
+        if prev is None:
+            return {}
+        with self.connect() as conn:
+            values = {}
+            for nonce in (prev["run_nonce"], run_nonce):
+                rows = conn.execute(
+                    "SELECT m.metric, m.value FROM run_metrics m JOIN runs r ON r.id = m.run_id"
+                    " WHERE r.project = ? AND r.run_nonce = ?", (project, nonce))
+                values[nonce] = {r["metric"]: r["value"] for r in rows}
+        before, after = values[prev["run_nonce"]], values[run_nonce]
+        keys = metrics or sorted(set(before) | set(after))
+        delta = {}
+        for key in keys:
+            p, c = before.get(key, 0.0), after.get(key, 0.0)
+            if p != c:
+                delta[key] = {"previous": p, "current": c, "change": round(c - p, 6)}
+        return delta
+
+    def trend(self, metric: str, projects: Optional[Sequence[str]] = None,
+              last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """One metric across runs (and projects), oldest first.
+
+        ``last`` keeps only the most recent N runs of each project.
+        """
+        sql = ("SELECT r.project, r.run_nonce, r.timestamp, m.value FROM run_metrics m"
+               " JOIN runs r ON r.id = m.run_id WHERE m.metric = ?")
+        params: list = [metric]
+        if projects:
+            sql += f" AND r.project IN ({', '.join('?' * len(projects))})"
+            params.extend(projects)
+        sql += " ORDER BY r.project, r.timestamp, r.id"
+        with self.connect() as conn:
+            rows = [dict(r) for r in conn.execute(sql, params)]
+        if last:
+            by_project: Dict[str, List[Dict[str, Any]]] = {}
+            for r in rows:
+                by_project.setdefault(r["project"], []).append(r)
+            rows = [r for runs in by_project.values() for r in runs[-int(last):]]
+        return rows
+
+    def stage_stats(self, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Per project and stage: runs, failures, mean duration and tokens."""
+        sql = ("SELECT r.project, s.stage, COUNT(*) AS runs,"
+               " SUM(CASE WHEN s.status = 'failed' THEN 1 ELSE 0 END) AS failed,"
+               " AVG(s.duration_seconds) AS mean_seconds, AVG(s.tokens_used) AS mean_tokens"
+               " FROM stage_results s JOIN runs r ON r.id = s.run_id")
+        params: tuple = ()
+        if stage:
+            sql += " WHERE s.stage = ?"
+            params = (stage,)
+        sql += " GROUP BY r.project, s.stage ORDER BY r.project, s.stage"
+        with self.connect() as conn:
+            return [dict(r) for r in conn.execute(sql, params)]
+
+    def incident_counts(self, project: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Incident counts by project, stage and category, most frequent first."""
+        sql = "SELECT project, stage, category, COUNT(*) AS count FROM incidents"
+        params: tuple = ()
+        if project:
+            sql += " WHERE project = ?"
+            params = (project,)
+        sql += " GROUP BY project, stage, category ORDER BY count DESC, project, stage"
+        with self.connect() as conn:
+            return [dict(r) for r in conn.execute(sql, params)]
+
+    # ------------------------------------------------------------------
+    # JSONL import
+    # ------------------------------------------------------------------
+
+    def import_project(self, project_path) -> Dict[str, int]:
+        """Import a project's existing JSONL histories. Safe to repeat.
+
+        Runs already stored (same run_nonce) are kept as they are;
+        incident and morgue lines already stored are skipped (see
+        add_incidents). Rotated ``.jsonl.old`` files are read before the
+        live ones, as one source.
+        """
+        root = Path(project_path)
+        project = root.name
+        counts = {"runs": 0, "incidents": 0, "morgue": 0}
+
+        history = root / HISTORY_FILE
+        if history.exists():
+            for entry in _read_jsonl(history):
+                nonce = entry.get("run_nonce")
+                if not nonce:
+                    continue
+                if self.record_run(project, nonce, entry.get("timestamp") or "",
+                                   entry.get("metrics") or {}, entry.get("budget"),
+                                   entry.get("config_fingerprint"), replace=False) is not None:
+                    counts["runs"] += 1
+
+        for key, name, add in (("incidents", INCIDENT_FILE, self.add_incidents),
+                               ("morgue", MORGUE_FILE, self.add_morgue)):
+            seen: Counter = Counter()
+            for path in (root / (name + ".old"), root / name):
+                if path.exists():
+                    counts[key] += add(project, _read_jsonl(path), seen=seen)
+        return counts
+
+    def import_projects(self, projects_root) -> Dict[str, Dict[str, int]]:
+        """import_project() for every project directory under ``projects_root``."""
+        results = {}
+        for path in sorted(Path(projects_root).iterdir()):
+            if path.is_dir() and any((path / n).exists() for n in
+                                     (HISTORY_FILE, INCIDENT_FILE, MORGUE_FILE)):
+                results[path.name] = self.import_project(path)
+        return results
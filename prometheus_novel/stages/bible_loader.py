@@ -37,6 +37,7 @@ class ReferenceBible:
         self._characters: Dict[str, str] = {}  # lowercase first name -> full entry
         self._character_donots: Dict[str, List[str]] = {}  # lowercase first name -> DO NOT items
         self._scene_outlines: Dict[str, str] = {}  # "ch01_s01" -> outline text
+        self._memo: Dict[tuple, str] = {}  # per-scene lookups, repeated across stages
         self._loaded = False
 
         if self.path.exists():
@@ -178,6 +179,12 @@ class ReferenceBible:
         """
         if not self._characters:
             return ""
+        key = ("character_rules", tuple(character_names))
+        if key not in self._memo:
+            self._memo[key] = self._character_rules(character_names)
+        return self._memo[key]
+
+    def _character_rules(self, character_names: List[str]) -> str:
 
         parts = []
         matched = set()
@@ -264,6 +271,12 @@ class ReferenceBible:
         This tells the LLM exactly what should happen in this scene,
         including key beats, character locations, and ending type.
         """
+        memo_key = ("scene_outline", chapter, scene)
+        if memo_key not in self._memo:
+            self._memo[memo_key] = self._scene_outline(chapter, scene)
+        return self._memo[memo_key]
+
+    def _scene_outline(self, chapter: int, scene: int) -> str:
         key = f"ch{chapter:02d}_s{scene:02d}"
         outline = self._scene_outlines.get(key, "")
         if not outline:
@@ -15,32 +15,45 @@ Validation: final_deai, quality_audit, output_validation
 
 import asyncio
 import logging
+import math
 import os
 import random
 import re
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Callable, Tuple, Awaitable, Set, Iterable
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import secrets
 import yaml
 from datetime import datetime
-from stages.quality_meters import run_all_meters
-from quality.quality_contract import run_quality_contract
-from quality.phrase_miner import mine_hot_phrases, write_auto_yaml, load_phrase_config, load_miner_config
-from quality.phrase_suppressor import suppress_phrases
-from quality.dialogue_trimmer import process_scenes as trim_dialogue_scenes
-from quality.emotion_diversifier import process_scenes as diversify_emotion_scenes
-from quality.cliche_clusters import detect_clusters, repair_clusters, load_cluster_config
-from quality.delta_report import compute_pass_delta, build_delta_report
-from editor_studio.orchestrator import run_editor_studio
-from quality.ceiling import CeilingRules, CeilingTracker
-from quality.policy import load_policy as _load_quality_policy_legacy, is_pass_enabled
-from policy import load_policy as load_central_policy, Policy
+# Heavy modules (central policy/pydantic, quality meters, deterministic polish
+# passes, Editor Studio, LLM clients) are imported inside the stages that use
+# them so importing the pipeline — CLI startup, --list-stages — stays cheap.
 from prometheus_lib.utils.error_handling import CreditsExhaustedError
-from prometheus_lib.llm.clients import count_tokens, get_context_limit
-from quality.loop_guard import check_replacement_loops
+from stages.provenance import ProvenanceLedger, content_hash, fingerprint, scene_hashes, scene_keys
+from stages.resources import ResourceRegistry, resources, use_resources
+from stages.scene_schema import dumps_json, load_state_file
+from stages.stage_graph import ALL, BARRIER, StageIO, StageTimeline, schedule_report, stage_dependencies
+from stages.telemetry import (
+    INCIDENT_FILE,
+    MORGUE_FILE,
+    MORGUE_MAX_BYTES,
+    append_jsonl,
+    current_telemetry,
+    run_telemetry,
+)
+from quality.parsed_scene import parse_scene
+from quality.span_patch import (
+    PATCH_OUTPUT_INSTRUCTIONS, PATCH_SYSTEM_PROMPT, apply_patches, build_patch_excerpt,
+    head_indices, parse_patches, select_repair_paragraphs, split_paragraphs, tail_indices,
+)
+from quality.tell_scanner import get_scanner
+
+if TYPE_CHECKING:
+    from policy import Policy
 
 logger = logging.getLogger(__name__)
 
@@ -231,20 +244,10 @@ ROMANCE_TROPES = {
 # WORD COUNTING UTILITIES
 # ============================================================================
 def count_words_accurate(text: str) -> int:
-    """Accurately count words, excluding markdown and formatting."""
+    """Accurately count words, excluding markdown and formatting (shared ParsedScene)."""
     if not text:
         return 0
-    # Remove markdown headers
-    text = re.sub(r'^#+\s+.*$', '', text, flags=re.MULTILINE)
-    # Remove scene breaks
-    text = re.sub(r'[⁂\*]{3,}', '', text)
-    # Remove markdown formatting
-    text = re.sub(r'[\*_\[\]`#]', '', text)
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Split and count non-empty words
-    words = [w for w in text.split() if w.strip()]
-    return len(words)
+    return parse_scene(text).accurate_word_count
 
 
 def validate_scene_length(scene: Dict, target_words: int, tolerance: float = 0.8) -> Dict:
@@ -265,35 +268,34 @@ def validate_scene_length(scene: Dict, target_words: int, tolerance: float = 0.8
     }
 
 
-def count_ai_tells(text: str) -> Dict:
-    """Count AI tell patterns in text."""
-    text_lower = text.lower()
-    counts = {}
-    total = 0
-
-    for pattern in AI_TELL_PATTERNS:
-        p_lower = pattern.lower()
-        if '[' in p_lower:
-            # Convert placeholder patterns to regex (e.g. "[X]" → r'\w+')
-            rx = re.escape(p_lower)
-            rx = rx.replace(r'\[x\]', r'\w+').replace(r'\[emotion\]', r'\w+').replace(r'\[character\]', r'\w+')
-            count = len(re.findall(rx, text_lower))
-        else:
-            count = text_lower.count(p_lower)
-        if count > 0:
-            counts[pattern] = count
-            total += count
+# count_ai_tells results by content hash (scenes are rescanned by audit, validation, reports)
+_AI_TELL_CACHE: "OrderedDict[str, Dict]" = OrderedDict()
+_AI_TELL_CACHE_SIZE = 4096
 
-    word_count = count_words_accurate(text)
-    ratio = total / (word_count / 1000) if word_count > 0 else 0
 
-    return {
-        "total_tells": total,
-        "tells_per_1000_words": round(ratio, 2),
-        "patterns_found": counts,
-        "word_count": word_count,
-        "acceptable": ratio < 2.0  # Less than 2 per 1000 words is acceptable
-    }
+def count_ai_tells(text: str) -> Dict:
+    """Count AI tell patterns in text (memoized per content hash)."""
+    text = text or ""
+    key = content_hash(text)
+    result = _AI_TELL_CACHE.get(key)
+    if result is None:
+        counts = get_scanner(AI_TELL_PATTERNS).scan(text)
+        total = sum(counts.values())
+        word_count = count_words_accurate(text)
+        ratio = total / (word_count / 1000) if word_count > 0 else 0
+        result = {
+            "total_tells": total,
+            "tells_per_1000_words": round(ratio, 2),
+            "patterns_found": counts,
+            "word_count": word_count,
+            "acceptable": ratio < 2.0  # Less than 2 per 1000 words is acceptable
+        }
+        _AI_TELL_CACHE[key] = result
+        if len(_AI_TELL_CACHE) > _AI_TELL_CACHE_SIZE:
+            _AI_TELL_CACHE.popitem(last=False)
+    else:
+        _AI_TELL_CACHE.move_to_end(key)
+    return {**result, "patterns_found": dict(result["patterns_found"])}
 
 
 # ============================================================================
@@ -798,37 +800,35 @@ def _validate_yaml_config(data: Dict[str, Any], config_name: str,
     return data
 
 
-_cached_cleanup_config: Optional[Dict[str, Any]] = None
+def _validated_cleanup_config(config_path: Path) -> Dict[str, Any]:
+    data = resources().yaml(config_path) or {}
+    config = _validate_yaml_config(
+        data, "cleanup_patterns.yaml",
+        expected_keys={"inline_truncate_markers", "inline_preamble_markers",
+                       "regex_patterns", "disabled_builtins", "inline"},
+        regex_keys={"regex_patterns"}
+    )
+    logger.info("Loaded cleanup_patterns.yaml")
+    return config
 
 
 def _load_cleanup_config() -> Dict[str, Any]:
     """Load optional cleanup patterns from configs/cleanup_patterns.yaml.
 
-    Cached after first load to avoid repeated file I/O during scene processing.
+    The validated config is cached in the resource registry and reloaded
+    when the file changes. Callers must not mutate it.
     """
-    global _cached_cleanup_config
-    if _cached_cleanup_config is not None:
-        return _cached_cleanup_config
     try:
         config_path = Path(__file__).resolve().parent.parent / "configs" / "cleanup_patterns.yaml"
-        if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-            _cached_cleanup_config = _validate_yaml_config(
-                data, "cleanup_patterns.yaml",
-                expected_keys={"inline_truncate_markers", "inline_preamble_markers",
-                               "regex_patterns", "disabled_builtins", "inline"},
-                regex_keys={"regex_patterns"}
-            )
-            logger.info("Loaded cleanup_patterns.yaml (cached for session — restart to pick up edits)")
-            return _cached_cleanup_config
+        return resources().get("cleanup_config", config_path, _validated_cleanup_config, default={})
     except Exception as e:
         logger.warning(f"Failed to load cleanup_patterns.yaml: {e}")
-    _cached_cleanup_config = {}
-    return _cached_cleanup_config
+    return {}
 
 
-# Cleanup morgue: log every "smart deletion" for auditability
+# Cleanup morgue: log every "smart deletion" for auditability.
+# During PipelineOrchestrator.run() entries go to that run's telemetry sink
+# (stages.telemetry); this buffer only collects entries logged outside a run.
 _cleanup_morgue: List[Dict[str, Any]] = []
 
 
@@ -836,36 +836,35 @@ def _log_to_morgue(scene_id: str, deleted_text: str, trigger_pattern: str,
                    phase: str = "", anchor_check: str = ""):
     """Log a deletion to the cleanup morgue for post-run audit."""
     if deleted_text and len(deleted_text.strip()) > 5:
-        _cleanup_morgue.append({
+        entry = {
             "scene_id": scene_id,
             "deleted_text": deleted_text.strip()[:200],
             "trigger_pattern": trigger_pattern,
             "phase": phase,
             "anchor_check": anchor_check,
-        })
+        }
+        telemetry = current_telemetry()
+        if telemetry is not None:
+            telemetry.morgue.put(entry)
+        else:
+            _cleanup_morgue.append(entry)
 
 
 def _flush_morgue(project_path):
-    """Write morgue entries to JSONL file and clear buffer."""
+    """Write morgue entries to JSONL file and clear buffer.
+
+    Inside a run the background writer owns the file; this only wakes it.
+    """
     global _cleanup_morgue
+    telemetry = current_telemetry()
+    if telemetry is not None:
+        telemetry.morgue.kick()
+        return
     if not _cleanup_morgue or not project_path:
         return
     try:
-        morgue_path = Path(project_path) / "cleanup_morgue.jsonl"
-        # Morgue size limit: rotate if file exceeds 5MB
-        _MORGUE_MAX_BYTES = 5 * 1024 * 1024
-        if morgue_path.exists() and morgue_path.stat().st_size > _MORGUE_MAX_BYTES:
-            rotated = morgue_path.with_suffix(".jsonl.old")
-            try:
-                if rotated.exists():
-                    rotated.unlink()
-                morgue_path.rename(rotated)
-                logger.info(f"Cleanup morgue rotated (>{_MORGUE_MAX_BYTES // (1024*1024)}MB)")
-            except Exception as rot_e:
-                logger.warning(f"Morgue rotation failed: {rot_e}")
-        with open(morgue_path, "a", encoding="utf-8") as f:
-            for entry in _cleanup_morgue:
-                f.write(json.dumps(entry) + "\n")
+        morgue_path = Path(project_path) / MORGUE_FILE
+        append_jsonl(morgue_path, _cleanup_morgue, MORGUE_MAX_BYTES)
         logger.info(f"Cleanup morgue: {len(_cleanup_morgue)} deletions logged to {morgue_path}")
     except Exception as e:
         logger.warning(f"Failed to write cleanup morgue: {e}")
@@ -873,6 +872,7 @@ def _flush_morgue(project_path):
 
 
 # Incident log: structured records for rollbacks and defense events
+# (run-scoped like the morgue; this buffer is the outside-a-run fallback)
 _incident_buffer: List[Dict[str, Any]] = []
 
 
@@ -901,7 +901,7 @@ def _log_incident(stage: str, category: str, detail: str, severity: str = "error
     """Log an incident for post-run analysis (rollbacks, circuit breaker trips, etc.)."""
     if not failure_type:
         failure_type = _classify_failure(detail)
-    _incident_buffer.append({
+    entry = {
         "timestamp": datetime.now().isoformat(),
         "stage": stage,
         "category": category,
@@ -910,19 +910,32 @@ def _log_incident(stage: str, category: str, detail: str, severity: str = "error
         "detail": detail,
         "scene_count_before": scene_count_before,
         "scene_count_after": scene_count_after,
-    })
+    }
+    telemetry = current_telemetry()
+    if telemetry is not None:
+        telemetry.incidents.put(entry)
+    else:
+        _incident_buffer.append(entry)
+
+
+def _incident_count() -> int:
+    """Incidents logged so far in the current run (or the fallback buffer)."""
+    telemetry = current_telemetry()
+    return telemetry.incidents.count if telemetry is not None else len(_incident_buffer)
 
 
 def _flush_incidents(project_path):
-    """Write incident buffer to incidents.jsonl and clear."""
+    """Write incident buffer to incidents.jsonl and clear (inside a run: wake the writer)."""
     global _incident_buffer
+    telemetry = current_telemetry()
+    if telemetry is not None:
+        telemetry.incidents.kick()
+        return
     if not _incident_buffer or not project_path:
         return
     try:
-        incident_path = Path(project_path) / "incidents.jsonl"
-        with open(incident_path, "a", encoding="utf-8") as f:
-            for entry in _incident_buffer:
-                f.write(json.dumps(entry) + "\n")
+        incident_path = Path(project_path) / INCIDENT_FILE
+        append_jsonl(incident_path, _incident_buffer)
         logger.info(f"Incidents: {len(_incident_buffer)} events logged to {incident_path}")
     except Exception as e:
         logger.warning(f"Failed to write incidents: {e}")
@@ -2076,6 +2089,12 @@ def _detect_duplicate_content(text: str, similarity_threshold: float = 0.6) -> s
 
 _cached_st_model = None  # Module-level cache for SentenceTransformer (lazy-loaded)
 
+# Process-wide embedding cache (text sha256 -> tensor). Shared by every
+# orchestrator in the process, so batch runs (batch/engine.py) reuse
+# embeddings of identical synopsis/scene snippets across books and retries.
+_EMBEDDING_CACHE_MAX = 4096
+_embedding_cache: "OrderedDict[str, Any]" = OrderedDict()
+
 
 def _get_st_model():
     """Get or lazily load the SentenceTransformer model (cached across calls)."""
@@ -2087,6 +2106,24 @@ def _get_st_model():
     return _cached_st_model
 
 
+def _encode_cached(texts: List[str]) -> list:
+    """Encode texts with the shared model, reusing cached embeddings."""
+    import hashlib
+    keys = [hashlib.sha256(t.encode("utf-8", errors="replace")).hexdigest() for t in texts]
+    missing = [i for i, k in enumerate(keys) if k not in _embedding_cache]
+    if missing:
+        encoded = _get_st_model().encode([texts[i] for i in missing], convert_to_tensor=True)
+        for i, emb in zip(missing, encoded):
+            _embedding_cache[keys[i]] = emb
+    out = []
+    for k in keys:
+        _embedding_cache.move_to_end(k)
+        out.append(_embedding_cache[k])
+    while len(_embedding_cache) > _EMBEDDING_CACHE_MAX:
+        _embedding_cache.popitem(last=False)
+    return out
+
+
 def _semantic_similarity_check(text_a: str, text_b: str) -> float:
     """Compute semantic similarity between two text segments using word overlap + TF-IDF weighting.
 
@@ -2097,8 +2134,7 @@ def _semantic_similarity_check(text_a: str, text_b: str) -> float:
     if len(text_a) > 200 and len(text_b) > 200:
         try:
             from sentence_transformers import util
-            model = _get_st_model()
-            embeddings = model.encode([text_a[:1000], text_b[:1000]], convert_to_tensor=True)
+            embeddings = _encode_cached([text_a[:1000], text_b[:1000]])
             sim = float(util.cos_sim(embeddings[0], embeddings[1])[0][0])
             return sim
         except (ImportError, Exception):
@@ -3385,6 +3421,9 @@ class PipelineState:
     # Outline diversity report (from validate_outline_diversity)
     outline_diversity_report: Optional[Dict[str, Any]] = None
 
+    # Per-scene, per-stage provenance for incremental recompute (stages/provenance.py)
+    scene_provenance: Dict[str, Any] = field(default_factory=dict)
+
     def calculate_targets(self):
         """Calculate word count targets based on target_length and genre."""
         length_map = {
@@ -3438,7 +3477,7 @@ class PipelineState:
         """Save state to disk with checkpoint data for reliable resume.
 
         Uses atomic write (temp file + os.replace) to prevent corruption
-        from mid-write crashes. A crash during json.dump() only corrupts
+        from mid-write crashes. A crash while encoding or writing only corrupts
         the .tmp file; the previous checkpoint survives intact.
         """
         state_file = self.project_path / "pipeline_state.json"
@@ -3467,6 +3506,7 @@ class PipelineState:
             "artifact_metrics": self.artifact_metrics,
             "quality_meter_report": self.quality_meter_report,
             "outline_diversity_report": self.outline_diversity_report,
+            "scene_provenance": self.scene_provenance,
             "_quality_iterations": getattr(self, '_quality_iterations', 0),
             "_prev_audit_snapshot": getattr(self, '_prev_audit_snapshot', None),
             "_continuity_fixed_indices": getattr(self, '_continuity_fixed_indices', []),
@@ -3482,10 +3522,10 @@ class PipelineState:
             ]
         }
         # Atomic write: dump to temp file, then replace original.
-        # If json.dump fails (e.g. disk full), clean up the partial tmp file.
+        # If encoding or the write fails (e.g. disk full), clean up the partial tmp file.
         try:
-            with open(tmp_file, "w", encoding="utf-8") as f:
-                json.dump(state_dict, f, indent=2)
+            with open(tmp_file, "wb") as f:
+                f.write(dumps_json(state_dict, indent=True))
             os.replace(str(tmp_file), str(state_file))
         except Exception:
             try:
@@ -3503,9 +3543,8 @@ class PipelineState:
             return None
 
         try:
-            with open(state_file, encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, ValueError) as e:
+            data = load_state_file(state_file)
+        except ValueError as e:
             logger.error(f"Failed to parse pipeline state JSON: {e}")
             return None
 
@@ -3551,6 +3590,7 @@ class PipelineState:
             }),
             quality_meter_report=data.get("quality_meter_report"),
             outline_diversity_report=data.get("outline_diversity_report"),
+            scene_provenance=data.get("scene_provenance") or {},
         )
         state._quality_iterations = data.get("_quality_iterations", 0)
         state._prev_audit_snapshot = data.get("_prev_audit_snapshot")
@@ -3688,16 +3728,78 @@ class PipelineOrchestrator:
         "output_validation": 0.2
     }
 
-    # Define which stages can run in parallel (they share no dependencies)
-    # Each group runs concurrently; groups run sequentially
-    # IMPORTANT: Group members MUST be adjacent in STAGES list
-    PARALLEL_GROUPS = {
-        # After high_concept: both only need high_concept, no cross-dependency
-        "planning_parallel_1": ["world_building", "beat_sheet"],
-        # After group 1: emotional_arch needs beat_sheet, characters needs world_bible
-        "planning_parallel_2": ["emotional_architecture", "character_profiles"],
+    # State fields each stage reads/writes — the scheduler derives the stage
+    # DAG from these plus STAGES order (see stages/stage_graph.py). Stages
+    # that only share reads run concurrently. Undeclared stages are barriers.
+    # config, token/cost totals, artifact_metrics and stage_results are
+    # accumulators and not declared.
+    STAGE_IO = {
+        "high_concept": StageIO.of(
+            writes=["high_concept", "high_concept_candidates", "high_concept_fingerprint"]),
+        "world_building": StageIO.of(reads=["high_concept"], writes=["world_bible"]),
+        # world_bible is optional context here ("Not yet created"); beat_sheet
+        # runs alongside world_building by design
+        "beat_sheet": StageIO.of(reads=["high_concept", "high_concept_fingerprint"], writes=["beat_sheet"]),
+        # emotional_arc is not read by later stages, so this runs off the critical path
+        "emotional_architecture": StageIO.of(reads=["high_concept", "beat_sheet"], writes=["emotional_arc"]),
+        "character_profiles": StageIO.of(
+            reads=["high_concept", "world_bible"], writes=["characters", "voice_profiles"]),
+        "motif_embedding": StageIO.of(reads=["high_concept", "beat_sheet", "characters"], writes=["motif_map"]),
+        "master_outline": StageIO.of(
+            reads=["high_concept", "high_concept_fingerprint", "beat_sheet", "characters", "motif_map"],
+            writes=["master_outline", "master_outline_raw", "outline_json_report",
+                    "outline_diversity_report", "conflict_maturity_report"]),
+        "trope_integration": StageIO.of(writes=["master_outline"]),
+        "scene_drafting": StageIO.of(
+            reads=["master_outline", "master_outline_raw", "beat_sheet", "characters", "world_bible",
+                   "high_concept_fingerprint", "motif_map", "voice_profiles"],
+            writes=["scenes", "tension_density_report"]),
+        "roster_gate": StageIO.of(reads=["scenes", "master_outline", "characters"], writes=["roster_violations"]),
+        "scene_expansion": StageIO.of(reads=["master_outline", "characters"], writes=["scenes"]),
+        "structure_gate": StageIO.of(reads=["master_outline", "characters"], writes=["scenes"]),
+        "continuity_audit": StageIO.of(
+            reads=["scenes", "master_outline", "characters", "world_bible"], writes=["continuity_issues"]),
+        "continuity_fix": StageIO.of(
+            reads=["continuity_issues", "characters", "world_bible"],
+            writes=["scenes", "_continuity_fixed_indices"]),
+        "continuity_recheck": StageIO.of(
+            reads=["_continuity_fixed_indices", "characters", "world_bible"], writes=["scenes"]),
+        "self_refinement": StageIO.of(reads=["characters"], writes=["scenes"]),
+        "voice_human_pass": StageIO.of(reads=["master_outline", "characters"], writes=["scenes"]),
+        "continuity_audit_2": StageIO.of(
+            reads=["scenes", "characters", "world_bible"], writes=["continuity_issues_2"]),
+        "continuity_fix_2": StageIO.of(reads=["continuity_issues_2", "characters"], writes=["scenes"]),
+        "pov_enforcer": StageIO.of(reads=["characters"], writes=["scenes"]),
+        "dialogue_polish": StageIO.of(reads=["characters"], writes=["scenes"]),
+        "prose_polish": StageIO.of(reads=["characters"], writes=["scenes"]),
+        "chapter_hooks": StageIO.of(reads=["characters"], writes=["scenes"]),
+        "final_deai": StageIO.of(reads=["characters"], writes=["scenes"]),
+        "quality_polish": StageIO.of(writes=["scenes", "quality_polish_report"]),
+        "quality_meters": StageIO.of(
+            reads=["scenes", "master_outline", "characters", "motif_map", "voice_profiles",
+                   "quality_polish_report"],
+            writes=["quality_meter_report", "quality_contract_report", "quality_triage"]),
+        "targeted_refinement": StageIO.of(
+            reads=["quality_meter_report", "quality_contract_report", "quality_triage", "characters"],
+            writes=["scenes", "targeted_refinement_report"]),
+        # Applies fixes to scenes unless fixes_enabled is false (see _stage_io)
+        "developmental_audit": StageIO.of(
+            reads=["master_outline", "characters"], writes=["scenes", "developmental_audit_report"]),
+        # Iteration re-runs scene-writing stages from the run loop
+        "quality_audit": StageIO.of(writes=["scenes", "_quality_iterations", "_prev_audit_snapshot"]),
+        # Final report reads everything, including completed_stages
+        "output_validation": BARRIER,
     }
 
+    # Per-scene stages that skip scenes whose provenance is clean when
+    # incremental recompute is on (see _scene_is_clean). Cross-scene stages
+    # (gates, audits, quality_polish, meters) always run over everything.
+    INCREMENTAL_STAGES = ("scene_drafting", "scene_expansion", "voice_human_pass", "chapter_hooks", "final_deai")
+
+    # Bump a stage's version when its prompts or logic change, so incremental
+    # runs redo scenes it processed under the old version. Unlisted = 1.
+    STAGE_VERSIONS: Dict[str, int] = {}
+
     def get_temperature_for_stage(self, stage_name: str) -> float:
         """Get appropriate temperature for a stage.
 
@@ -3729,6 +3831,13 @@ class PipelineOrchestrator:
         self.llm_client = llm_client  # Default/fallback client
         self.llm_clients = llm_clients or {}  # {"gpt": client, "claude": client, "gemini": client}
         self.state: Optional[PipelineState] = None
+        # Incremental recompute bookkeeping (see _provenance_begin)
+        self._provenance_cfg: Optional[str] = None
+        self._provenance_ctx: Dict[str, tuple] = {}
+        self._incremental_skips: Dict[str, Set[str]] = {}
+        self._incremental_suspended = False
+        self._token_counters: Dict[str, Any] = {}  # model -> TokenCounter (see _token_counter)
+        self._analytics: Optional[Any] = None  # AnalyticsStore (see _analytics_store)
         self.callbacks: Dict[str, List[Callable]] = {
             "on_stage_start": [],
             "on_stage_complete": [],
@@ -3749,7 +3858,12 @@ class PipelineOrchestrator:
         ] + CREATIVE_STOP_SEQUENCES[1:]  # Keep backup sequences, replace primary
 
         # Centralized policy: single source of truth for cleanup/validation/lexicon/quality/export
-        self.policy: Policy = load_central_policy(project_path=project_path)
+        # Parsed bible/YAML artifacts, shared by every stage of this orchestrator's runs
+        self.resources = ResourceRegistry()
+
+        from policy import load_policy as load_central_policy
+        with use_resources(self.resources):
+            self.policy: "Policy" = load_central_policy(project_path=project_path)
         logger.info("Policy loaded (version %s)", self.policy.policy_version)
 
         # Defense mode: observe (log only), protect (default), aggressive (stricter)
@@ -3761,7 +3875,11 @@ class PipelineOrchestrator:
             "rewritten_scenes": 0,     # total scenes rewritten in feedback loops
             "defense_tokens": 0,       # tokens spent on retries + feedback rewrites
             "generation_tokens": 0,    # tokens spent on primary generation
+            "hedged_generations": 0,   # generations that raced several candidates
+            "hedge_cancelled": 0,      # hedged candidates cancelled once another passed
         }
+        # Span-patch outcomes per stage: {"patch", "full", "fallback"} counts
+        self._span_patch_stats: Dict[str, Dict[str, int]] = {}
 
     # Default defense thresholds — overridable via config.yaml defense.thresholds
     _DEFAULT_DEFENSE_THRESHOLDS = {
@@ -3898,12 +4016,143 @@ class PipelineOrchestrator:
                 value = clamped
         return value
 
-    def _should_process_scene(self, idx: int) -> bool:
-        """When rewrite_scenes_indices is set, only process those indices; else process all."""
+    def _should_process_scene(self, idx: int, stage: Optional[str] = None) -> bool:
+        """When rewrite_scenes_indices is set, only process those indices; else process all.
+
+        With a stage name, scenes whose provenance is clean for that stage
+        are skipped too (incremental recompute).
+        """
         rwi = getattr(self, "_rewrite_scenes_indices", None)
-        if rwi is None:
-            return True
-        return idx in rwi
+        if rwi is not None and idx not in rwi:
+            return False
+        return stage is None or not self._scene_is_clean(stage, idx)
+
+    # ------------------------------------------------------------------
+    # Incremental recompute (per-scene provenance)
+    # ------------------------------------------------------------------
+
+    def _incremental_enabled(self) -> bool:
+        """incremental.enabled in config; unset means on only for --rewrite-scenes runs."""
+        if self._incremental_suspended or not self.state:
+            return False
+        enabled = ((self.state.config or {}).get("incremental") or {}).get("enabled")
+        if enabled is None:
+            return getattr(self, "_rewrite_scenes_indices", None) is not None
+        return bool(enabled)
+
+    def _provenance_order(self) -> List[str]:
+        """Full stage order (legacy polish stages included) for downstream invalidation."""
+        order = list(self.STAGES)
+        order.insert(order.index("voice_human_pass"), "self_refinement")
+        order[order.index("chapter_hooks"):order.index("chapter_hooks")] = ["dialogue_polish", "prose_polish"]
+        return order
+
+    def _provenance(self) -> ProvenanceLedger:
+        return ProvenanceLedger(self.state.scene_provenance, self._provenance_order())
+
+    def _provenance_inputs(self, stage_name: str) -> tuple:
+        """(version, config hash, non-scene input hash) recorded with each scene."""
+        cfg = getattr(self, "_provenance_cfg", None)
+        if cfg is None:
+            fp = self._build_config_fingerprint()
+            fp.pop("clients", None)  # connected clients aren't known to --what-would-rerun
+            cfg = self._provenance_cfg = fingerprint(fp)
+        # Declared reads that live in the checkpoint; scenes are hashed per scene
+        persisted = PipelineState.__dataclass_fields__
+        fields = sorted(f for f in self._stage_io(stage_name).reads if f in persisted and f != "scenes")
+        deps = fingerprint({f: getattr(self.state, f, None) for f in fields})
+        return self.STAGE_VERSIONS.get(stage_name, 1), cfg, deps
+
+    def _scene_is_clean(self, stage_name: str, idx: int) -> bool:
+        """True when an incremental run can keep scene idx as-is for this stage.
+
+        Scenes named by --rewrite-scenes are always dirty: the user asked for
+        them to be redone even if the ledger says their inputs are unchanged
+        (incremental_plan counts them as forced the same way).
+        """
+        if stage_name not in self.INCREMENTAL_STAGES or not self._incremental_enabled():
+            return False
+        rwi = getattr(self, "_rewrite_scenes_indices", None)
+        if rwi is not None and idx in rwi:
+            return False
+        scenes = self.state.scenes or []
+        if not 0 <= idx < len(scenes) or not isinstance(scenes[idx], dict):
+            return False
+        key = scene_keys(scenes)[idx]
+        inputs = self._provenance_ctx.get(stage_name) or self._provenance_inputs(stage_name)
+        current = content_hash(scenes[idx].get("content"))
+        if not self._provenance().is_clean(key, stage_name, current, *inputs):
+            return False
+        self._incremental_skips.setdefault(stage_name, set()).add(key)
+        return True
+
+    def _provenance_begin(self, stage_name: str) -> Optional[Dict[str, str]]:
+        """Snapshot scene hashes before a scene-touching stage runs."""
+        if not self.state or not ({"scenes", ALL} & self._stage_io(stage_name).fields):
+            return None
+        before = scene_hashes(self.state.scenes or [])
+        untracked = self._provenance().sync(before)
+        if untracked:
+            logger.info("Provenance: %d scene(s) changed outside tracked stages; treating as dirty", len(untracked))
+        self._provenance_ctx[stage_name] = self._provenance_inputs(stage_name)
+        self._incremental_skips[stage_name] = set()
+        return before
+
+    def _provenance_commit(self, stage_name: str, before: Optional[Dict[str, str]]) -> None:
+        """Record which scenes this stage processed and invalidate downstream records for changed ones."""
+        if before is None:
+            return
+        after = scene_hashes(self.state.scenes or [])
+        skipped = self._incremental_skips.pop(stage_name, set())
+        inputs = self._provenance_ctx.pop(stage_name)
+        changed = self._provenance().record(stage_name, before, after, *inputs, skipped=skipped)
+        if skipped:
+            logger.info(
+                "%s: reused %d/%d unchanged scene(s), %d changed (incremental)",
+                stage_name, len(skipped), len(after), changed,
+            )
+
+    def incremental_plan(self, stages: Optional[List[str]] = None,
+                         rewrite_scenes_indices: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Dry run: which scenes each per-scene stage would re-process. Needs a loaded state.
+
+        Scenes listed in rewrite_scenes_indices count as dirty from the first
+        stage, and per-scene stages never touch any others.
+        """
+        self._rewrite_scenes_indices = rewrite_scenes_indices
+        stages = list(stages or self.STAGES)
+        scenes = self.state.scenes or []
+        keys = scene_keys(scenes)
+        hashes = scene_hashes(scenes)
+        rwi = set(rewrite_scenes_indices or [])
+        forced = [keys[i] for i in sorted(rwi) if i < len(keys)]
+        expected = {s: self._provenance_inputs(s) for s in stages if s in self.INCREMENTAL_STAGES}
+        plan = self._provenance().plan(stages, hashes, expected, forced=forced)
+
+        index = {key: i for i, key in enumerate(keys)}
+        report: Dict[str, Any] = {
+            "scenes": len(scenes),
+            "incremental": self._incremental_enabled(),
+            "rewrite_scenes": sorted(rwi) if rewrite_scenes_indices is not None else None,
+            "stages": {},
+        }
+        for stage in stages:
+            if stage not in plan:
+                touches = {"scenes", ALL} & self._stage_io(stage).fields
+                report["stages"][stage] = {"mode": "full" if touches else "no_scenes"}
+                continue
+            rerun = [index[k] for k in plan[stage]]
+            gated = rewrite_scenes_indices is not None
+            if not report["incremental"]:
+                rerun = list(range(len(scenes)))
+            if gated:
+                rerun = [i for i in rerun if i in rwi]
+            report["stages"][stage] = {
+                "mode": "incremental" if report["incremental"] else ("rewrite_scenes" if gated else "full"),
+                "rerun": rerun,
+                "reuse": len(scenes) - len(rerun),
+            }
+        return report
 
     def _write_run_status(self, last_stage: str, result=None):
         """Write run_status.json at phase boundaries for monitoring."""
@@ -3919,7 +4168,7 @@ class PipelineOrchestrator:
                 "total_tokens": self.state.total_tokens,
                 "total_cost_usd": round(self.state.total_cost_usd, 4),
                 "scene_count": len(self.state.scenes) if self.state.scenes else 0,
-                "incidents": len(_incident_buffer),
+                "incidents": _incident_count(),
                 "budget": {
                     "defense_tokens": self._budget_tracker.get("defense_tokens", 0),
                     "generation_tokens": self._budget_tracker.get("generation_tokens", 0),
@@ -4036,15 +4285,32 @@ class PipelineOrchestrator:
             "watching rain. Output ONLY the two sentences, nothing else."
         )
         # Try each unique client
+        targets = []
         clients_tested = set()
         for stage_name in ["scene_drafting", "self_refinement", "final_deai"]:
             try:
                 client = self.get_client_for_stage(stage_name)
-                client_id = id(client)
-                if client_id in clients_tested:
-                    continue
-                clients_tested.add(client_id)
-
+            except Exception as e:
+                logger.warning(f"CANARY CHECK: model for {stage_name} unavailable: {e}")
+                _log_incident(stage_name, "canary_failure", str(e)[:200], severity="warning")
+                continue
+            if id(client) not in clients_tested:
+                clients_tested.add(id(client))
+                targets.append((stage_name, client))
+
+        # Load every configured local model at once instead of one per check
+        residency = self._residency()
+        if residency:
+            from prometheus_lib.llm.residency import residency_of
+            models = [c.model_name for c in [self.llm_client, *self.llm_clients.values()]
+                      if residency_of(c) is not None]
+            started = time.monotonic()
+            warmed = await residency.warm(models)
+            logger.info("Canary warm-up: %d/%d local models loaded in %.1fs",
+                        sum(warmed.values()), len(warmed), time.monotonic() - started)
+
+        async def check(stage_name, client):
+            try:
                 response = await client.generate(
                     canary_prompt,
                     max_tokens=200,
@@ -4085,6 +4351,55 @@ class PipelineOrchestrator:
                 _log_incident(stage_name, "canary_failure",
                               str(e)[:200], severity="warning")
 
+        await asyncio.gather(*(check(stage_name, client) for stage_name, client in targets))
+
+    def _residency(self):
+        """Shared Ollama ModelResidency when any configured client is local, else None.
+
+        Config: ollama_residency: {enabled, max_loaded_models, keep_alive}.
+        """
+        cfg = ((self.state.config if self.state else None) or {}).get("ollama_residency", {}) or {}
+        if cfg.get("enabled", True) is False:
+            return None
+        from prometheus_lib.llm.residency import residency_of
+        local = [r for r in map(residency_of, [self.llm_client, *self.llm_clients.values()]) if r is not None]
+        if not local:
+            return None
+        residency = local[0]
+        residency.configure(cfg.get("max_loaded_models"), cfg.get("keep_alive"))
+        return residency
+
+    def _stage_model(self, stage_name: str) -> Optional[str]:
+        """Local Ollama model a stage runs on (None for API models)."""
+        from prometheus_lib.llm.residency import residency_of
+        client = self.get_client_for_stage(stage_name)
+        return client.model_name if residency_of(client) is not None else None
+
+    @staticmethod
+    def _model_affinity(ready: List[str], running: Iterable[str], models: Dict[str, Optional[str]],
+                        residency) -> List[str]:
+        """Ready stages in launch order, grouped by resident Ollama model.
+
+        Stages on a model that is running or loaded go first (list order is
+        kept within each group). A stage that would need more models in use
+        than the server holds waits for the running ones to finish.
+        """
+        active = {models[s] for s in running if models.get(s)}
+
+        def cold(name):
+            model = models.get(name)
+            return bool(model) and model not in active and model not in residency.active
+
+        order = []
+        for name in sorted(ready, key=cold):
+            model = models.get(name)
+            if model and model not in active:
+                if active and len(active) >= residency.max_loaded:
+                    continue
+                active.add(model)
+            order.append(name)
+        return order
+
     def get_client_for_stage(self, stage_name: str):
         """Get the appropriate LLM client for a given stage.
 
@@ -4200,10 +4515,27 @@ class PipelineOrchestrator:
 
     async def run(self, stages: Optional[List[str]] = None, resume: bool = False,
                   rewrite_scenes_indices: Optional[List[int]] = None):
-        """Run the pipeline with quality-driven iteration and checkpoint resume."""
+        """Run the pipeline with quality-driven iteration and checkpoint resume.
+
+        Morgue and incident records of this run go to its own telemetry
+        sinks (stages.telemetry), written in the background and drained
+        before returning. Bible and YAML loads go through self.resources
+        (stages.resources).
+        """
+        with use_resources(self.resources):
+            async with run_telemetry(self.project_path, self._run_nonce):
+                return await self._run_pipeline(stages, resume, rewrite_scenes_indices)
+
+    async def _run_pipeline(self, stages: Optional[List[str]], resume: bool,
+                            rewrite_scenes_indices: Optional[List[int]]):
         self._rewrite_scenes_indices = rewrite_scenes_indices
         await self.initialize(resume=resume)
 
+        telemetry = current_telemetry()
+        store = self._analytics_store()
+        if telemetry is not None and store is not None:
+            telemetry.attach_store(store)
+
         # Write resolved config for reproducibility (env + project merged)
         try:
             from configs.config_resolver import resolve_and_write
@@ -4284,220 +4616,333 @@ class PipelineOrchestrator:
         else:
             start_index = 0
 
-        # Build reverse lookup: stage_name -> parallel group
-        parallel_lookup = {}
-        for group_name, group_stages in self.PARALLEL_GROUPS.items():
-            for s in group_stages:
-                parallel_lookup[s] = group_stages
-
         # Reset budget tracker for this run
         self._budget_tracker = {
             "retries_per_stage": {},
             "rewritten_scenes": 0,
             "defense_tokens": 0,
             "generation_tokens": 0,
+            "hedged_generations": 0,
+            "hedge_cancelled": 0,
         }
+        self._span_patch_stats = {}
+        self._provenance_cfg = None
+        if self._incremental_enabled() and self.state.scenes:
+            plan = self.incremental_plan(stages_to_run, rewrite_scenes_indices)
+            for name, entry in plan["stages"].items():
+                if "rerun" in entry:
+                    logger.info("Incremental: %s will process %d/%d scene(s)",
+                                name, len(entry["rerun"]), plan["scenes"])
 
         # Pre-flight canary scene check
         await self._canary_scene_check()
 
-        # Circuit breaker: halt after N consecutive stage failures + snapshot restores
-        CIRCUIT_BREAKER_THRESHOLD = int(self._get_threshold("circuit_breaker_threshold"))
-        consecutive_failures = 0
-
         try:
-            i = start_index
-            while i < len(stages_to_run):
-                stage_name = stages_to_run[i]
-
-                # Skip stages already completed (safety check for parallel group overlap)
-                # Exception: when user explicitly requested a single stage (--stage X), always run it
-                if len(stages_to_run) > 1 and stage_name in self.state.completed_stages:
-                    i += 1
-                    continue
+            await self._run_stage_graph(stages_to_run, start_index)
 
-                # Check if this stage is part of a parallel group
-                parallel_group = parallel_lookup.get(stage_name)
-                if parallel_group and all(s in stages_to_run[i:] for s in parallel_group):
-                    # Find all group members that start at consecutive positions
-                    group_members = [s for s in parallel_group if s in stages_to_run[i:] and s not in self.state.completed_stages]
-
-                    if len(group_members) > 1:
-                        logger.info(f"Running {len(group_members)} stages in parallel: {group_members}")
-                        for s in group_members:
-                            await self._emit("on_stage_start", s, i)
-
-                        # Run in parallel
-                        results = await asyncio.gather(
-                            *[self._run_stage(s) for s in group_members],
-                            return_exceptions=True
-                        )
-
-                        # Process results
-                        failed = False
-                        for s, result in zip(group_members, results):
-                            if isinstance(result, Exception):
-                                result = StageResult(stage_name=s, status=StageStatus.FAILED, error=str(result))
-                                failed = True
+        finally:
+            output_dir = self.state.project_path / "output" if getattr(self.state, "project_path", None) else None
+            if output_dir and getattr(self.state, "outline_json_report", None):
+                from configs.config_resolver import update_resolved_outline_meta
+                update_resolved_outline_meta(output_dir, self.state.outline_json_report)
 
-                            self.state.stage_results.append(result)
-                            self.state.total_tokens += result.tokens_used
-                            self.state.total_cost_usd += result.cost_usd
+        await self._emit("on_pipeline_complete", self.state)
+        return self.state
 
-                            if result.status == StageStatus.COMPLETED:
-                                if s not in self.state.completed_stages:
-                                    self.state.completed_stages.append(s)
+    # Fields stages edit in place: a checkpoint taken while a stage writing
+    # one is still running could persist a half-applied edit.
+    _IN_PLACE_FIELDS = frozenset({"scenes", "master_outline", ALL})
+
+    def _stage_io(self, stage_name: str) -> StageIO:
+        """Declared reads/writes for a stage, narrowed by config that disables its writes."""
+        io = self.STAGE_IO.get(stage_name, BARRIER)
+        if stage_name == "developmental_audit":
+            da_cfg = (self.state.config or {}).get("enhancements", {}).get("developmental_audit", {}) or {}
+            if da_cfg.get("enabled") is False:
+                return StageIO()
+            if not da_cfg.get("fixes_enabled", True) or da_cfg.get("dry_run", False):
+                return StageIO(io.reads | {"scenes"}, io.writes - {"scenes"})
+        return io
+
+    async def _run_stage_graph(self, stages_to_run: List[str], start_index: int) -> None:
+        """Run stages as a DAG: every stage whose inputs are ready starts at once.
+
+        Dependencies come from STAGE_IO and the order of stages_to_run; with
+        max_concurrent=1 (or enhancements.stage_scheduler.enabled: false)
+        stages run exactly in list order. A failed stage doesn't block its
+        dependents (same as sequential runs); the circuit breaker, cost kill
+        switch, credit exhaustion and unexpected errors stop new launches
+        while stages already in flight finish and are recorded.
+
+        With local Ollama models (see _residency), ready stages on the model
+        already loaded launch first, stages are held back rather than run
+        two more models than the server can keep loaded, and the next model is
+        prefetched once the current one is no longer needed. Swap counts go
+        in the schedule report.
+
+        Config: enhancements.stage_scheduler.max_concurrent (default 4).
+        Writes output/stage_schedule.json with the critical path.
+        """
+        sched_cfg = (self.state.config or {}).get("enhancements", {}).get("stage_scheduler", {}) or {}
+        if sched_cfg.get("enabled", True) is False:
+            max_concurrent = 1
+        else:
+            max_concurrent = max(1, int(sched_cfg.get("max_concurrent", 4)))
 
-                            await self._emit("on_stage_complete", s, result)
+        index_of: Dict[str, int] = {}
+        pending: List[str] = []
+        for i, name in enumerate(stages_to_run):
+            index_of.setdefault(name, i)
+            if i < start_index or name in pending:
+                continue
+            # Skip stages already completed (resume).
+            # Exception: when user explicitly requested a single stage (--stage X), always run it
+            if len(stages_to_run) > 1 and name in self.state.completed_stages:
+                continue
+            pending.append(name)
+
+        io = {name: self._stage_io(name) for name in pending}
+        deps = stage_dependencies(pending, io)
+        residency = self._residency()
+        models: Dict[str, Optional[str]] = {}
+        if residency:
+            residency.reset()
+            models = {name: self._stage_model(name) for name in pending}
+        if max_concurrent > 1:
+            concurrent = [n for n in pending if not deps[n] and pending.index(n) > 0]
+            logger.info("Stage scheduler: %d stages, up to %d concurrent", len(pending), max_concurrent)
+            if concurrent:
+                logger.debug("Stages with no pending dependencies: %s", concurrent)
 
-                        self.state.current_stage = i + len(group_members)
-                        self.state.save()
+        # Circuit breaker: halt after N consecutive stage failures + snapshot restores
+        breaker = {"failures": 0, "threshold": int(self._get_threshold("circuit_breaker_threshold"))}
+        timeline = StageTimeline()
+        running: Dict["asyncio.Future", str] = {}
+        finished: Set[str] = set()
+        stop = False
+        save_deferred = False
 
-                        # Cost kill switch: abort if budget exceeded
-                        if self._check_cost_kill_switch():
+        try:
+            while pending or running:
+                if not stop:
+                    ready = [name for name in pending if deps[name] <= finished]
+                    if residency:
+                        ready = self._model_affinity(ready, running.values(), models, residency)
+                    for name in ready:
+                        if len(running) >= max_concurrent:
                             break
+                        pending.remove(name)
+                        self.state.current_stage = index_of[name]
+                        await self._emit("on_stage_start", name, index_of[name])
+                        timeline.start(name)
+                        if residency:
+                            residency.pin(models.get(name))
+                        running[asyncio.ensure_future(self._run_stage(name))] = name
+                    if residency:
+                        self._prefetch_next_model(pending, models, residency)
+                if not running:
+                    break
 
-                        if failed:
-                            break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: index_of[running[t]]):
+                    stage_name = running.pop(task)
+                    finished.add(stage_name)
+                    if residency:
+                        residency.unpin(models.get(stage_name))
+                    checkpoint = not any(io[s].writes & self._IN_PLACE_FIELDS for s in running.values())
+                    try:
+                        result = task.result()
+                        timeline.finish(stage_name, result.status.value)
+                        if not checkpoint:
+                            save_deferred = True
+                        if await self._after_stage(stage_name, result, breaker, checkpoint=checkpoint):
+                            stop = True
+
+                    except CreditsExhaustedError as cee:
+                        timeline.finish(stage_name, "paused")
+                        logger.critical(
+                            "CREDITS_EXHAUSTED: %s provider out of credits during stage '%s'. "
+                            "Pipeline paused. Refill credits and rerun with --resume.",
+                            cee.provider, stage_name,
+                        )
+                        self.state.save()
+                        self._write_pause_reason(stage_name, cee)
+                        self._write_run_status(stage_name)
+                        _log_incident(stage_name, "credits_exhausted", str(cee)[:200], severity="critical")
+                        stop = True
 
-                        # Skip past all group members
-                        i += len(group_members)
-                        continue
+                    except Exception as e:
+                        if stage_name not in timeline.status:
+                            timeline.finish(stage_name, "failed")
+                        logger.error(f"Stage {stage_name} failed: {e}")
+                        result = StageResult(
+                            stage_name=stage_name,
+                            status=StageStatus.FAILED,
+                            error=str(e)
+                        )
+                        self.state.stage_results.append(result)
+                        await self._emit("on_stage_error", stage_name, str(e))
+                        stop = True
 
-                # Sequential execution for non-parallel stages
-                self.state.current_stage = i
-                await self._emit("on_stage_start", stage_name, i)
+            if save_deferred:
+                self.state.save()
+        finally:
+            for task, name in running.items():
+                task.cancel()
+                if residency:
+                    residency.unpin(models.get(name))
+            if timeline.spans:
+                report = schedule_report(timeline, deps, max_concurrent)
+                if residency:
+                    report["model_residency"] = residency.report()
+                self._write_stage_schedule(report)
 
-                try:
-                    result = await self._run_stage(stage_name)
-                    self.state.stage_results.append(result)
-                    self.state.total_tokens += result.tokens_used
-                    self.state.total_cost_usd += result.cost_usd
+    @staticmethod
+    def _prefetch_next_model(pending: List[str], models: Dict[str, Optional[str]], residency) -> None:
+        """Queue the next stage's model unless pending work still needs a resident one."""
+        resident = residency.active
+        upcoming = next((models[n] for n in pending if models.get(n) and models[n] not in resident), None)
+        if not upcoming:
+            return
+        if len(resident) >= residency.max_loaded and any(models.get(n) in resident for n in pending):
+            return  # loading now would evict a model later stages still use
+        residency.prefetch(upcoming)
 
-                    # Track completed stages for checkpoint resume
-                    if result.status == StageStatus.COMPLETED:
-                        if stage_name not in self.state.completed_stages:
-                            self.state.completed_stages.append(stage_name)
-                        consecutive_failures = 0  # Reset circuit breaker on success
+    async def _after_stage(self, stage_name: str, result: StageResult, breaker: Dict[str, int],
+                           checkpoint: bool = True) -> bool:
+        """Record a finished stage: totals, checkpoint, review gate, circuit breaker.
 
-                    self.state.save()
-                    self._write_run_status(stage_name, result)
+        Returns True when the pipeline must stop launching stages.
+        """
+        self.state.stage_results.append(result)
+        self.state.total_tokens += result.tokens_used
+        self.state.total_cost_usd += result.cost_usd
 
-                    await self._emit("on_stage_complete", stage_name, result)
+        # Track completed stages for checkpoint resume
+        if result.status == StageStatus.COMPLETED:
+            if stage_name not in self.state.completed_stages:
+                self.state.completed_stages.append(stage_name)
+            breaker["failures"] = 0  # Reset circuit breaker on success
 
-                    # Cost kill switch: abort if budget exceeded
-                    if self._check_cost_kill_switch():
-                        break
+        if checkpoint:
+            self.state.save()
+        self._write_run_status(stage_name, result)
 
-                    # Human-in-the-loop: pause for review if stage is in gates
-                    review_gates = (self.state.config or {}).get("enhancements", {}).get("human_review_gates") or []
-                    if result.status == StageStatus.COMPLETED and stage_name in review_gates:
-                        self._display_review_summary(stage_name)
-                        output_dir = self.state.project_path / "output" if getattr(self.state, "project_path", None) else None
-                        if output_dir:
-                            output_dir.mkdir(parents=True, exist_ok=True)
-                            review_file = output_dir / "review_requested.json"
-                            with open(review_file, "w", encoding="utf-8") as f:
-                                json.dump({"stage": stage_name, "status": "awaiting_review"}, f, indent=2)
-                        try:
-                            input("\nPress Enter to APPROVE and continue, or Ctrl+C to abort... ")
-                        except (EOFError, KeyboardInterrupt):
-                            logger.warning("Human review: user aborted pipeline at %s.", stage_name)
-                            self.state.save()
-                            break
+        await self._emit("on_stage_complete", stage_name, result)
 
-                    if result.status == StageStatus.FAILED:
-                        consecutive_failures += 1
-                        await self._emit("on_stage_error", stage_name, result.error)
+        # Cost kill switch: abort if budget exceeded
+        if self._check_cost_kill_switch():
+            return True
 
-                        # Circuit breaker: halt pipeline after N consecutive failures
-                        if consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD:
-                            failed_stages = [
-                                r.stage_name for r in self.state.stage_results[-CIRCUIT_BREAKER_THRESHOLD:]
-                                if r.status == StageStatus.FAILED
-                            ]
-                            logger.error(
-                                f"CIRCUIT BREAKER: {consecutive_failures} consecutive stage failures "
-                                f"({', '.join(failed_stages)}). Halting pipeline. "
-                                f"Diagnostic: check model availability, config validity, and scene state."
-                            )
-                            _log_incident(
-                                ",".join(failed_stages), "circuit_breaker_trip",
-                                f"{consecutive_failures} consecutive failures",
-                                severity="critical"
-                            )
-                            break  # Only break on circuit breaker trip
-                        else:
-                            logger.warning(
-                                f"Stage {stage_name} failed ({consecutive_failures}/{CIRCUIT_BREAKER_THRESHOLD} "
-                                f"consecutive failures). Continuing pipeline."
-                            )
-                            i += 1
-                            continue
+        # Human-in-the-loop: pause for review if stage is in gates
+        review_gates = (self.state.config or {}).get("enhancements", {}).get("human_review_gates") or []
+        if result.status == StageStatus.COMPLETED and stage_name in review_gates:
+            self._display_review_summary(stage_name)
+            output_dir = self.state.project_path / "output" if getattr(self.state, "project_path", None) else None
+            if output_dir:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                review_file = output_dir / "review_requested.json"
+                with open(review_file, "w", encoding="utf-8") as f:
+                    json.dump({"stage": stage_name, "status": "awaiting_review"}, f, indent=2)
+            try:
+                input("\nPress Enter to APPROVE and continue, or Ctrl+C to abort... ")
+            except (EOFError, KeyboardInterrupt):
+                logger.warning("Human review: user aborted pipeline at %s.", stage_name)
+                self.state.save()
+                return True
 
-                    # Handle iteration if quality_audit indicates it's needed
-                    if stage_name == "quality_audit" and result.output:
-                        audit_output = result.output
-                        if audit_output.get("needs_iteration") and audit_output.get("stages_to_rerun"):
-                            stages_to_rerun = audit_output["stages_to_rerun"]
-                            logger.info(f"Quality audit triggered iteration. Re-running: {stages_to_rerun}")
-
-                            # Re-run the problematic stages
-                            for rerun_stage in stages_to_rerun:
-                                logger.info(f"  Re-running stage: {rerun_stage}")
-                                await self._emit("on_stage_start", f"{rerun_stage}_iteration", -1)
-
-                                rerun_result = await self._run_stage(rerun_stage)
-                                self.state.stage_results.append(rerun_result)
-                                self.state.total_tokens += rerun_result.tokens_used
-                                self.state.total_cost_usd += rerun_result.cost_usd
-
-                                await self._emit("on_stage_complete", f"{rerun_stage}_iteration", rerun_result)
-
-                            # Re-run full polish chain after destructive/expansion fixes
-                            if "voice_human_pass" in stages_to_rerun or "scene_expansion" in stages_to_rerun:
-                                logger.info("  Re-running polish chain: dialogue, prose, hooks, final_deai")
-                                for polish_stage in ["dialogue_polish", "prose_polish", "chapter_hooks", "final_deai"]:
-                                    p_result = await self._run_stage(polish_stage)
-                                    self.state.stage_results.append(p_result)
-                                    self.state.total_tokens += p_result.tokens_used
-                                    self.state.total_cost_usd += p_result.cost_usd
-
-                            self.state.save()
-
-                except CreditsExhaustedError as cee:
-                    logger.critical(
-                        "CREDITS_EXHAUSTED: %s provider out of credits during stage '%s'. "
-                        "Pipeline paused. Refill credits and rerun with --resume.",
-                        cee.provider, stage_name,
-                    )
-                    self.state.save()
-                    self._write_pause_reason(stage_name, cee)
-                    self._write_run_status(stage_name)
-                    _log_incident(stage_name, "credits_exhausted", str(cee)[:200], severity="critical")
-                    break
+        if result.status == StageStatus.FAILED:
+            breaker["failures"] += 1
+            await self._emit("on_stage_error", stage_name, result.error)
 
-                except Exception as e:
-                    logger.error(f"Stage {stage_name} failed: {e}")
-                    result = StageResult(
-                        stage_name=stage_name,
-                        status=StageStatus.FAILED,
-                        error=str(e)
-                    )
-                    self.state.stage_results.append(result)
-                    await self._emit("on_stage_error", stage_name, str(e))
-                    break
+            # Circuit breaker: halt pipeline after N consecutive failures
+            threshold = breaker["threshold"]
+            if breaker["failures"] >= threshold:
+                failed_stages = [
+                    r.stage_name for r in self.state.stage_results[-threshold:]
+                    if r.status == StageStatus.FAILED
+                ]
+                logger.error(
+                    f"CIRCUIT BREAKER: {breaker['failures']} consecutive stage failures "
+                    f"({', '.join(failed_stages)}). Halting pipeline. "
+                    f"Diagnostic: check model availability, config validity, and scene state."
+                )
+                _log_incident(
+                    ",".join(failed_stages), "circuit_breaker_trip",
+                    f"{breaker['failures']} consecutive failures",
+                    severity="critical"
+                )
+                return True  # Only stop on circuit breaker trip
+            logger.warning(
+                f"Stage {stage_name} failed ({breaker['failures']}/{threshold} "
+                f"consecutive failures). Continuing pipeline."
+            )
+            return False
 
-                i += 1
+        # Handle iteration if quality_audit indicates it's needed
+        if stage_name == "quality_audit" and result.output:
+            await self._run_quality_iteration(result.output)
+        return False
 
+    async def _run_quality_iteration(self, audit_output: Dict[str, Any]) -> None:
+        """Re-run the stages quality_audit flagged, then the polish chain if needed."""
+        if not (audit_output.get("needs_iteration") and audit_output.get("stages_to_rerun")):
+            return
+        stages_to_rerun = audit_output["stages_to_rerun"]
+        logger.info(f"Quality audit triggered iteration. Re-running: {stages_to_rerun}")
+        # Iteration exists to redo scenes, so clean provenance must not skip them
+        self._incremental_suspended = True
+        try:
+            # Re-run the problematic stages
+            for rerun_stage in stages_to_rerun:
+                logger.info(f"  Re-running stage: {rerun_stage}")
+                await self._emit("on_stage_start", f"{rerun_stage}_iteration", -1)
+
+                rerun_result = await self._run_stage(rerun_stage)
+                self.state.stage_results.append(rerun_result)
+                self.state.total_tokens += rerun_result.tokens_used
+                self.state.total_cost_usd += rerun_result.cost_usd
+
+                await self._emit("on_stage_complete", f"{rerun_stage}_iteration", rerun_result)
+
+            # Re-run full polish chain after destructive/expansion fixes
+            if "voice_human_pass" in stages_to_rerun or "scene_expansion" in stages_to_rerun:
+                logger.info("  Re-running polish chain: dialogue, prose, hooks, final_deai")
+                for polish_stage in ["dialogue_polish", "prose_polish", "chapter_hooks", "final_deai"]:
+                    p_result = await self._run_stage(polish_stage)
+                    self.state.stage_results.append(p_result)
+                    self.state.total_tokens += p_result.tokens_used
+                    self.state.total_cost_usd += p_result.cost_usd
         finally:
-            output_dir = self.state.project_path / "output" if getattr(self.state, "project_path", None) else None
-            if output_dir and getattr(self.state, "outline_json_report", None):
-                from configs.config_resolver import update_resolved_outline_meta
-                update_resolved_outline_meta(output_dir, self.state.outline_json_report)
+            self._incremental_suspended = False
 
-        await self._emit("on_pipeline_complete", self.state)
-        return self.state
+        self.state.save()
+
+    def _write_stage_schedule(self, report: Dict[str, Any]) -> None:
+        """Log the critical path and write output/stage_schedule.json."""
+        self._stage_schedule = report
+        path = " -> ".join(step["stage"] for step in report["critical_path"])
+        logger.info(
+            "Stage schedule: %.1fs wall for %.1fs of stage time (x%.2f, max %d concurrent). Critical path: %s",
+            report["wall_seconds"], report["stage_seconds"], report["parallelism"],
+            report["max_concurrent"], path or "-",
+        )
+        residency = report.get("model_residency")
+        if residency:
+            logger.info(
+                "Ollama residency: %d loads, %d swaps, %.1fs swapping (max %d loaded)",
+                residency["loads"], residency["swaps"], residency["swap_seconds"],
+                residency["max_loaded_models"],
+            )
+        if not self.state or not getattr(self.state, "project_path", None):
+            return
+        try:
+            output_dir = Path(self.state.project_path) / "output"
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with open(output_dir / "stage_schedule.json", "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except Exception as e:
+            logger.debug(f"Failed to write stage_schedule.json: {e}")
 
     async def _run_stage(self, stage_name: str) -> StageResult:
         """Run a single pipeline stage with transaction safety.
@@ -4551,6 +4996,8 @@ class PipelineOrchestrator:
                 error=f"Unknown stage: {stage_name}"
             )
 
+        provenance_before = self._provenance_begin(stage_name)
+
         # Transaction safety: snapshot scenes before prose stages
         scenes_snapshot = None
         if stage_name in PROSE_STAGES and self.state.scenes:
@@ -4755,6 +5202,7 @@ class PipelineOrchestrator:
 
             # Log artifact metrics for this stage
             self._log_artifact_summary(stage_name)
+            self._provenance_commit(stage_name, provenance_before)
 
             return StageResult(
                 stage_name=stage_name,
@@ -5538,9 +5986,14 @@ Return a JSON object with character names as keys. No commentary."""
     async def _stage_master_outline(self) -> tuple:
         """Create master outline with scene-by-scene breakdown.
 
-        Uses batched generation (5 chapters per batch) to avoid token limits
+        Uses batched generation (3 chapters per batch) to avoid token limits
         with smaller models. Each batch gets full story context plus a summary
         of previously generated chapters for continuity.
+
+        Skeleton mode (master_outline.mode = "skeleton", or "auto" for books of
+        skeleton_min_chapters+ chapters): one cheap call fixes act placement,
+        purpose and POV per chapter, then all batches expand concurrently from
+        that skeleton and scene-name collisions are resolved once at the end.
         """
         config = self.state.config
         story_context = self._build_story_context()
@@ -5572,36 +6025,18 @@ Return a JSON object with character names as keys. No commentary."""
             indent=1
         )
 
-        for batch_start in range(1, self.state.target_chapters + 1, BATCH_SIZE):
-            batch_end = min(batch_start + BATCH_SIZE - 1, self.state.target_chapters)
-
-            # Summary of previous chapters for continuity
-            prev_summary = ""
-            if all_chapters:
-                prev_lines = []
-                for ch in all_chapters:
-                    if not isinstance(ch, dict):
-                        continue
-                    ch_num = ch.get("chapter", "?")
-                    ch_title = ch.get("chapter_title", "")
-                    scene_summaries = []
-                    for sc in ch.get("scenes", []):
-                        if isinstance(sc, dict):
-                            scene_summaries.append(f"  - {sc.get('scene_name', 'Scene')}: {sc.get('purpose', '')}")
-                    prev_lines.append(f"Ch {ch_num} \"{ch_title}\":\n" + "\n".join(scene_summaries))
-                prev_summary = "PREVIOUSLY OUTLINED CHAPTERS:\n" + "\n".join(prev_lines)
-
-            # Collect used scene names for dedup guard
-            used_scene_names = []
-            for ch in all_chapters:
-                if not isinstance(ch, dict):
-                    continue
-                for sc in ch.get("scenes", []):
-                    if isinstance(sc, dict):
-                        sn = sc.get("scene_name", "")
-                        if sn:
-                            used_scene_names.append(sn)
-
+        async def _generate_batch(
+            batch_start: int,
+            batch_end: int,
+            prev_summary: str,
+            used_scene_names: List[str],
+            detect_collisions: bool = True,
+        ) -> tuple:
+            """Generate, retry/repair and normalize one outline batch.
+
+            Returns (validated chapter dicts, tokens used).
+            """
+            batch_tokens = 0
             dedup_guard = ""
             if used_scene_names:
                 names_list = "\n".join(f"  - {n}" for n in used_scene_names)
@@ -5722,6 +6157,8 @@ Respond with a JSON object containing a "chapters" array of {batch_end - batch_s
                 response = await client.generate(prompt, max_tokens=retry_max,
                                                   json_mode=True, temperature=retry_temp,
                                                   timeout=600)
+                if response:
+                    batch_tokens += response.input_tokens + response.output_tokens
                 raw_text = response.content if response else ""
                 batch = extract_json_robust(raw_text, expect_array=True)
 
@@ -5870,18 +6307,106 @@ Respond with a JSON object containing a "chapters" array of {batch_end - batch_s
                     ]
 
             # Post-gen collision detector: fix duplicate/near-duplicate scene names
-            if validated_batch:
+            # (skeleton mode defers this to one pass over the merged outline)
+            if validated_batch and detect_collisions:
                 collisions = self._detect_scene_name_collisions(validated_batch, used_scene_names)
                 if collisions:
                     logger.warning(f"Scene name collisions: {len(collisions)} duplicates in batch {batch_start}-{batch_end}")
                     regen_tokens = await self._regenerate_colliding_scene_names(
                         client, validated_batch, collisions, used_scene_names
                     )
-                    total_tokens += regen_tokens
+                    batch_tokens += regen_tokens
 
-            all_chapters.extend(validated_batch)
-            total_tokens += response.input_tokens + response.output_tokens
-            logger.info(f"Outlined chapters {batch_start}-{batch_end}: {len(all_chapters)} total chapters so far")
+            return validated_batch, batch_tokens
+
+        outline_cfg = config.get("master_outline", {}) or {}
+        outline_mode = outline_cfg.get("mode", "auto")
+        use_skeleton = outline_mode == "skeleton" or (
+            outline_mode == "auto"
+            and self.state.target_chapters >= int(outline_cfg.get("skeleton_min_chapters", 12))
+        )
+        skeleton = None
+        if use_skeleton:
+            skeleton, skeleton_tokens = await self._generate_outline_skeleton(
+                client, story_context, chars_brief, protagonist, is_dual_pov,
+            )
+            total_tokens += skeleton_tokens
+            if not skeleton:
+                logger.warning("Outline skeleton unusable, falling back to sequential batches")
+
+        if skeleton:
+            # Phase 2: expand every batch concurrently against the fixed skeleton
+            batch_ranges = [
+                (start, min(start + BATCH_SIZE - 1, self.state.target_chapters))
+                for start in range(1, self.state.target_chapters + 1, BATCH_SIZE)
+            ]
+            batch_semaphore = asyncio.Semaphore(max(1, int(outline_cfg.get("max_concurrent_batches", 4))))
+
+            async def _expand(start: int, end: int) -> tuple:
+                async with batch_semaphore:
+                    return await _generate_batch(
+                        start, end, self._build_skeleton_context_block(skeleton, start, end),
+                        [], detect_collisions=False,
+                    )
+
+            results = await asyncio.gather(*(_expand(start, end) for start, end in batch_ranges))
+            for chapters, batch_tokens in results:
+                all_chapters.extend(chapters)
+                total_tokens += batch_tokens
+            if self.state.outline_json_report:
+                self.state.outline_json_report["batches"].sort(
+                    key=lambda b: int(str(b.get("batch_range", "0")).split("-")[0])
+                )
+                self.state.outline_json_report["skeleton_chapters"] = len(skeleton)
+
+            # Scene-name collisions checked once over the merged outline
+            collisions = self._detect_scene_name_collisions(all_chapters, [])
+            if collisions:
+                logger.warning(f"Scene name collisions: {len(collisions)} duplicates across merged outline")
+                total_tokens += await self._regenerate_colliding_scene_names(
+                    client, all_chapters, collisions, []
+                )
+            logger.info(
+                f"Outlined {len(all_chapters)} chapters from skeleton "
+                f"in {len(batch_ranges)} parallel batches"
+            )
+        else:
+            for batch_start in range(1, self.state.target_chapters + 1, BATCH_SIZE):
+                batch_end = min(batch_start + BATCH_SIZE - 1, self.state.target_chapters)
+
+                # Summary of previous chapters for continuity
+                prev_summary = ""
+                if all_chapters:
+                    prev_lines = []
+                    for ch in all_chapters:
+                        if not isinstance(ch, dict):
+                            continue
+                        ch_num = ch.get("chapter", "?")
+                        ch_title = ch.get("chapter_title", "")
+                        scene_summaries = []
+                        for sc in ch.get("scenes", []):
+                            if isinstance(sc, dict):
+                                scene_summaries.append(f"  - {sc.get('scene_name', 'Scene')}: {sc.get('purpose', '')}")
+                        prev_lines.append(f"Ch {ch_num} \"{ch_title}\":\n" + "\n".join(scene_summaries))
+                    prev_summary = "PREVIOUSLY OUTLINED CHAPTERS:\n" + "\n".join(prev_lines)
+
+                # Collect used scene names for dedup guard
+                used_scene_names = []
+                for ch in all_chapters:
+                    if not isinstance(ch, dict):
+                        continue
+                    for sc in ch.get("scenes", []):
+                        if isinstance(sc, dict):
+                            sn = sc.get("scene_name", "")
+                            if sn:
+                                used_scene_names.append(sn)
+
+                validated_batch, batch_tokens = await _generate_batch(
+                    batch_start, batch_end, prev_summary, used_scene_names,
+                )
+                all_chapters.extend(validated_batch)
+                total_tokens += batch_tokens
+                logger.info(f"Outlined chapters {batch_start}-{batch_end}: {len(all_chapters)} total chapters so far")
 
         # Chapter completeness check: detect and backfill any missing chapters
         produced_nums = {ch.get("chapter", 0) for ch in all_chapters if isinstance(ch, dict)}
@@ -6889,6 +7414,118 @@ Return JSON with:
         protag, secondary = self._get_dual_pov_characters()
         return protag if chapter_num % 2 == 1 else secondary
 
+    async def _generate_outline_skeleton(
+        self,
+        client,
+        story_context: str,
+        chars_brief: str,
+        protagonist: str,
+        is_dual_pov: bool,
+    ) -> tuple:
+        """Phase 1 of skeleton-first outlining: one chapter-level plan.
+
+        Returns (skeleton, tokens). skeleton is a chapter-ordered list of
+        {chapter, act, purpose, pov, key_events}, or None if the response
+        covered too few chapters to be trusted.
+        """
+        config = self.state.config
+        n = self.state.target_chapters
+        act1_end = max(1, n // 4)
+        act2_end = n * 3 // 4
+
+        def act_for(ch: int) -> int:
+            return 1 if ch <= act1_end else (2 if ch <= act2_end else 3)
+
+        pov_block = self._build_pov_prompt_block(1, n) if is_dual_pov else "POV: " + protagonist
+        prompt = f"""Plan the CHAPTER-LEVEL SKELETON of a {n}-chapter novel. Do NOT write scenes yet.
+
+{story_context}
+
+HIGH CONCEPT: {self.state.high_concept}
+
+BEAT SHEET:
+{json.dumps(self.state.beat_sheet, indent=2)}
+
+CHARACTERS (brief):
+{chars_brief}
+
+=== MANDATORY PLOT POINTS ===
+{config.get('key_plot_points', 'None specified')}
+Place every plot point in a chapter: ACT 1 = chapters 1-{act1_end}, ACT 2 = chapters {act1_end + 1}-{act2_end}, ACT 3 = chapters {act2_end + 1}-{n}.
+The inciting incident belongs in Chapter 1 or 2.
+
+{pov_block}
+
+For EVERY chapter 1-{n} give: chapter, act (1-3), purpose (one sentence: what changes in this chapter),
+pov, key_events (1-3 short phrases). No two chapters may share a purpose.
+
+Respond with a JSON object: {{"chapters": [{{"chapter": 1, "act": 1, "purpose": "...", "pov": "...", "key_events": ["..."]}}]}}"""
+
+        response = await client.generate(
+            prompt,
+            max_tokens=self.get_max_tokens_for_stage("master_outline_skeleton", min(4096, 400 + 80 * n)),
+            json_mode=True, temperature=0.4, timeout=600,
+        )
+        tokens = (response.input_tokens + response.output_tokens) if response else 0
+        parsed = extract_json_robust(response.content if response else "", expect_array=True)
+        if isinstance(parsed, dict):
+            parsed = parsed.get("chapters") or parsed.get("skeleton") or []
+        if not isinstance(parsed, list):
+            return None, tokens
+
+        by_chapter: Dict[int, Dict[str, Any]] = {}
+        for entry in parsed:
+            if not isinstance(entry, dict) or "raw" in entry:
+                continue
+            try:
+                ch = int(entry.get("chapter"))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= ch <= n and ch not in by_chapter:
+                by_chapter[ch] = entry
+
+        if len(by_chapter) < max(1, int(n * 0.8)):
+            logger.warning(f"Outline skeleton covered {len(by_chapter)}/{n} chapters")
+            return None, tokens
+
+        skeleton = []
+        for ch in range(1, n + 1):
+            entry = by_chapter.get(ch, {})
+            events = entry.get("key_events") or []
+            skeleton.append({
+                "chapter": ch,
+                "act": entry.get("act") or act_for(ch),
+                "purpose": str(entry.get("purpose", "")).strip(),
+                "pov": self._expected_pov_for_chapter(ch) if is_dual_pov else (entry.get("pov") or protagonist),
+                "key_events": [str(e) for e in events] if isinstance(events, list) else [str(events)],
+            })
+        logger.info(f"Outline skeleton: {len(by_chapter)}/{n} chapters planned")
+        return skeleton, tokens
+
+    def _build_skeleton_context_block(self, skeleton: List[Dict[str, Any]], batch_start: int, batch_end: int) -> str:
+        """Skeleton + neighbour context for one batch (replaces PREVIOUSLY OUTLINED)."""
+        def line(entry: Dict[str, Any]) -> str:
+            events = "; ".join(entry.get("key_events") or [])
+            text = f"Ch {entry['chapter']} [Act {entry.get('act')}, POV {entry.get('pov')}]: {entry.get('purpose', '')}"
+            return f"{text} | events: {events}" if events else text
+
+        by_chapter = {e["chapter"]: e for e in skeleton}
+        lines = ["=== BOOK SKELETON (fixed — expand your chapters, do not re-plan the book) ==="]
+        lines.extend(line(e) for e in skeleton)
+        lines.append("")
+        lines.append(f"=== YOUR CHAPTERS ({batch_start}-{batch_end}) ===")
+        lines.extend(line(by_chapter[ch]) for ch in range(batch_start, batch_end + 1) if ch in by_chapter)
+        if batch_start - 1 in by_chapter:
+            lines.append(f"Preceded by -> {line(by_chapter[batch_start - 1])}")
+        if batch_end + 1 in by_chapter:
+            lines.append(f"Followed by -> {line(by_chapter[batch_end + 1])}")
+        lines.append(
+            "Deliver exactly the purpose and events above for your chapters and hand off cleanly "
+            "to the neighbours. Other chapters are being outlined in parallel, so make every "
+            "scene_name specific to this chapter's purpose."
+        )
+        return "\n".join(lines)
+
     def _build_pov_prompt_block(self, batch_start: int, batch_end: int) -> str:
         """Build explicit POV assignment block for master_outline prompt.
 
@@ -7746,8 +8383,13 @@ RULES:
         }
 
     def _record_artifact_metrics(self, stage_name: str, scene_meta: dict,
-                                  validation: dict, is_retry: bool = False):
-        """Record artifact detection metrics for diagnostics."""
+                                  validation: dict, is_retry: bool = False,
+                                  hedge_discarded: bool = False):
+        """Record artifact detection metrics for diagnostics.
+
+        hedge_discarded: a losing hedged candidate; only the discard counters
+        move, so scene totals and per-stage failure rates stay per generation.
+        """
         metrics = self.state.artifact_metrics
 
         # Ensure keys exist (may be missing after state reset or checkpoint load)
@@ -7759,16 +8401,21 @@ RULES:
         metrics.setdefault("scenes_retried", 0)
         metrics.setdefault("per_stage", {})
 
-        metrics["total_scenes_generated"] += 1
-
         if stage_name not in metrics["per_stage"]:
             metrics["per_stage"][stage_name] = {
                 "scenes": 0, "preamble": 0, "truncation": 0,
                 "alternate": 0, "analysis": 0, "pov_drift": 0,
-                "too_short": 0, "prompt_leak": 0, "mid_sentence_cutoff": 0, "scene_collapse": 0, "retried": 0
+                "too_short": 0, "prompt_leak": 0, "mid_sentence_cutoff": 0, "scene_collapse": 0, "retried": 0,
+                "failed": 0,
             }
 
         sm = metrics["per_stage"][stage_name]
+        if hedge_discarded:
+            sm["hedge_discarded"] = sm.get("hedge_discarded", 0) + 1
+            metrics["hedge_candidates_discarded"] = metrics.get("hedge_candidates_discarded", 0) + 1
+            return
+
+        metrics["total_scenes_generated"] += 1
         sm["scenes"] += 1
 
         issues = validation.get("issues", {})
@@ -7799,6 +8446,8 @@ RULES:
         if issues.get("language_drift"):
             sm["language_drift"] = sm.get("language_drift", 0) + 1
             metrics["scenes_with_language_drift"] = metrics.get("scenes_with_language_drift", 0) + 1
+        if not validation.get("pass", True):
+            sm["failed"] = sm.get("failed", 0) + 1
         if is_retry:
             sm["retried"] += 1
             metrics["scenes_retried"] += 1
@@ -7875,6 +8524,8 @@ RULES:
                 "defense_cost_ratio": defense_ratio,
                 "retries_per_stage": dict(self._budget_tracker.get("retries_per_stage", {})),
                 "rewritten_scenes": self._budget_tracker.get("rewritten_scenes", 0),
+                "hedged_generations": self._budget_tracker.get("hedged_generations", 0),
+                "hedge_cancelled": self._budget_tracker.get("hedge_cancelled", 0),
             },
         }
         try:
@@ -7884,23 +8535,76 @@ RULES:
         except Exception as e:
             logger.warning(f"Failed to persist artifact metrics: {e}")
 
-    def _compute_metrics_delta(self) -> Optional[Dict[str, Any]]:
-        """Compare current run metrics against the previous run.
+        store = self._analytics_store()
+        if store is not None:
+            try:
+                store.record_run(
+                    self.state.project_path.name, self._run_nonce, entry["timestamp"],
+                    entry["metrics"], entry["budget"], entry["config_fingerprint"],
+                    stage_results=[{
+                        "stage_name": r.stage_name, "status": r.status.value,
+                        "duration_seconds": r.duration_seconds, "tokens_used": r.tokens_used,
+                        "cost_usd": r.cost_usd, "error": r.error,
+                    } for r in self.state.stage_results],
+                    scenes=self.state.scenes or [],
+                )
+            except Exception as e:
+                logger.warning(f"Failed to record run in analytics store: {e}")
 
-        Returns a delta dict showing improvement/regression per metric,
-        or None if no prior run exists.
+    def _analytics_store(self):
+        """Shared AnalyticsStore for run history, or None when disabled.
+
+        Config: analytics: {enabled (default true), db_path}. db_path is
+        relative to the project; default is analytics.db next to it. The
+        first time a project is seen its existing JSONL histories are imported.
         """
-        history_path = self.state.project_path / "artifact_metrics_history.jsonl"
+        cfg = ((self.state.config if self.state else None) or {}).get("analytics", {}) or {}
+        if cfg.get("enabled", True) is False:
+            return None
+        if self._analytics is None:
+            from stages.analytics import AnalyticsStore, default_db_path
+            db_path = cfg.get("db_path")
+            path = self.project_path / db_path if db_path else default_db_path(self.project_path)
+            try:
+                store = AnalyticsStore(path)
+                if not store.runs(self.project_path.name, limit=1):
+                    imported = store.import_project(self.project_path)
+                    if any(imported.values()):
+                        logger.info(f"Analytics store: imported JSONL history {imported}")
+            except Exception as e:
+                logger.warning(f"Analytics store unavailable ({path}): {e}")
+                return None
+            self._analytics = store
+        return self._analytics
+
+    def _previous_run_metrics(self) -> Optional[Dict[str, Any]]:
+        """Artifact metrics of the run before this one (analytics store, else JSONL history)."""
+        store = self._analytics_store()
+        if store is not None:
+            try:
+                prev = store.previous_run(self.state.project_path.name, self._run_nonce)
+                return prev["metrics"] if prev else None
+            except Exception as e:
+                logger.warning(f"Analytics store query failed, reading JSONL history: {e}")
+        history_path = self.state.project_path / "artifact_metrics_history.jsonl"
         if not history_path.exists():
             return None
+        lines = history_path.read_text(encoding="utf-8").strip().split("\n")
+        # Need at least 2 entries (previous + current)
+        if len(lines) < 2:
+            return None
+        return json.loads(lines[-2])["metrics"]
 
+    def _compute_metrics_delta(self) -> Optional[Dict[str, Any]]:
+        """Compare current run metrics against the previous run.
+
+        Returns a delta dict showing improvement/regression per metric,
+        or None if no prior run exists.
+        """
         try:
-            lines = history_path.read_text(encoding="utf-8").strip().split("\n")
-            # Need at least 2 entries (previous + current)
-            if len(lines) < 2:
+            prev = self._previous_run_metrics()
+            if prev is None:
                 return None
-
-            prev = json.loads(lines[-2])["metrics"]
             curr = self.state.artifact_metrics
 
             delta = {}
@@ -7947,6 +8651,228 @@ RULES:
             logger.warning(f"Failed to compute metrics delta: {e}")
             return None
 
+    def _token_counter(self, client):
+        """Cached TokenCounter for the client's model (model_defaults.tokenizer = optional HF tokenizer)."""
+        from prometheus_lib.llm.prompt_budget import TokenCounter
+        model_name = getattr(client, 'model_name', getattr(client, 'model', '')) or ''
+        tokenizer = ((self.state.config or {}).get('model_defaults', {}) or {}).get('tokenizer')
+        key = f"{model_name}|{tokenizer or ''}"
+        counter = self._token_counters.get(key)
+        if counter is None:
+            counter = self._token_counters[key] = TokenCounter(model_name, tokenizer)
+        return counter
+
+    def _prompt_budget(self, client, max_tokens: int):
+        """PromptBudget sized to the model's context minus the output reservation.
+
+        Config (all optional):
+            prompt_budget:
+              enabled: true
+              max_prompt_tokens: 12000        # global override
+              per_model: {"qwen2.5:14b": 9000} # per-model override
+        """
+        from prometheus_lib.llm.clients import get_context_limit
+        from prometheus_lib.llm.prompt_budget import PromptBudget
+        config = self.state.config or {}
+        cfg = config.get('prompt_budget', {}) or {}
+        model_name = getattr(client, 'model_name', getattr(client, 'model', '')) or ''
+        if not cfg.get('enabled', True):
+            limit = 10 ** 9
+        elif model_name in (cfg.get('per_model') or {}):
+            limit = int(cfg['per_model'][model_name])
+        elif cfg.get('max_prompt_tokens'):
+            limit = int(cfg['max_prompt_tokens'])
+        else:
+            config_limit = config.get('model_defaults', {}).get('model_context_limit')
+            limit = get_context_limit(model_name, config_limit) - int(max_tokens) - 256
+        return PromptBudget(self._token_counter(client), max(1000, limit))
+
+    def _check_generation(self, stage_name: str, response, scene_meta: dict,
+                          continuity_state=None, record: bool = True) -> dict:
+        """Critic gate for one raw generation: truncation warning, validation, metrics, length guard.
+
+        record=False skips _record_artifact_metrics (hedged candidates are
+        recorded once the kept one is known).
+        """
+        # Truncation detection: warn if response hit max_tokens limit
+        if response.finish_reason == "length":
+            logger.warning(
+                "TRUNCATION DETECTED in %s (scene %s): finish_reason='length'. "
+                "Response may be incomplete (%d output tokens). Consider raising max_tokens.",
+                stage_name, scene_meta.get("scene_id", "?"), response.output_tokens,
+            )
+
+        # Run critic gate on raw output
+        validation = self._validate_scene_output(response.content, scene_meta, continuity_state)
+        if record:
+            self._record_artifact_metrics(stage_name, scene_meta or {}, validation)
+
+        # Output length guard: catch silent scene collapse (rewrite shrinks >15%)
+        orig_wc = scene_meta.get("original_word_count") if scene_meta else None
+        if orig_wc is not None and orig_wc > 0:
+            min_retention = self._get_threshold("rewrite_min_length_ratio")
+            new_wc = validation.get("word_count", 0)
+            if new_wc < min_retention * orig_wc:
+                validation["issues"]["scene_collapse"] = {
+                    "original": orig_wc,
+                    "rewritten": new_wc,
+                    "retention": round(new_wc / orig_wc, 2),
+                }
+                validation["pass"] = False
+                logger.warning(
+                    "Output length guard: %s scene collapsed %.0f%% (orig=%d, new=%d). Retry.",
+                    stage_name, (1 - new_wc / orig_wc) * 100, orig_wc, new_wc,
+                )
+        return validation
+
+    @staticmethod
+    def _score_output(val: dict, content: str) -> float:
+        """Rank a generation by its critic-gate issues: hard penalties for artifacts, bonus for length."""
+        score = 0
+        issues = val.get("issues", {})
+        # Hard penalties (artifacts that ruin the output)
+        score -= 100 * len({"preamble", "truncation_marker", "alternate_version",
+                             "analysis_commentary", "prompt_leak", "mid_sentence_cutoff", "phrase_loop", "scene_collapse"} & set(issues.keys()))
+        # Content correctness penalties (continuity errors)
+        score -= 80 * len({"dead_character_present", "setting_violation", "info_leak", "design_drift", "avoid_violation"} & set(issues.keys()))
+        # Craft penalties (pronoun, tense, phantom characters, tics, echoing)
+        if issues.get("pov_pronoun_confusion"):
+            score -= 50
+        if issues.get("tense_violation"):
+            score -= 40
+        if issues.get("phantom_character"):
+            score -= 30
+        if issues.get("physical_tic_repetition"):
+            score -= 25
+        if issues.get("tense_leak"):
+            score -= 30
+        if issues.get("echoing_text"):
+            score -= 35
+        if issues.get("location_continuity"):
+            score -= 25
+        if issues.get("phrase_cap_exceeded"):
+            score -= 30
+        # Soft penalties
+        if issues.get("too_short"):
+            score -= 30
+        if issues.get("pov_drift"):
+            score -= 20
+        if issues.get("emotional_summary_ending"):
+            score -= 15
+        # Quality bonuses
+        wc = val.get("word_count", 0)
+        if wc >= 200:
+            score += min(wc / 50, 20)  # Up to +20 for good length
+        return score
+
+    def _hedge_width(self, stage_name: str) -> int:
+        """How many candidates to generate at once for this stage (1 = no hedging).
+
+        Uses the stage's recorded critic-gate failure rate
+        (artifact_metrics["per_stage"]): enough candidates that all of them
+        failing is unlikely (rate**n <= target_residual), within
+        max_candidates. Hedging stops while defense spend is over
+        budget_max_defense_ratio.
+
+        Config: enhancements.hedged_generation.{enabled (false), min_samples (4),
+        min_failure_rate (0.3), target_residual (0.1), max_candidates (3),
+        temperature_spread (0.15)}.
+        """
+        cfg = (self.state.config or {}).get("enhancements", {}).get("hedged_generation", {}) or {}
+        if not cfg.get("enabled", False):
+            return 1
+        sm = (self.state.artifact_metrics or {}).get("per_stage", {}).get(stage_name) or {}
+        attempts = sm.get("scenes", 0)
+        if attempts < int(cfg.get("min_samples", 4)):
+            return 1
+        rate = sm.get("failed", 0) / attempts
+        if rate < float(cfg.get("min_failure_rate", 0.3)):
+            return 1
+        gen_tok = self._budget_tracker.get("generation_tokens", 0)
+        def_tok = self._budget_tracker.get("defense_tokens", 0)
+        if gen_tok + def_tok > 0 and def_tok / (gen_tok + def_tok) >= self._get_threshold("budget_max_defense_ratio"):
+            return 1
+        max_candidates = max(1, int(cfg.get("max_candidates", 3)))
+        if rate >= 1.0:
+            return max_candidates
+        target = float(cfg.get("target_residual", 0.1))
+        return max(2, min(max_candidates, math.ceil(math.log(target) / math.log(rate))))
+
+    async def _hedged_generate(self, client, prompt: str, stage_name: str, scene_meta: dict,
+                               continuity_state, width: int, kwargs: dict) -> tuple:
+        """Generate ``width`` candidates concurrently; the first clean one wins.
+
+        Candidates after the first use temperatures spread around the stage's.
+        When a candidate passes the critic gate the rest are cancelled;
+        otherwise the best by _score_output is kept. Only the kept candidate
+        is recorded in artifact_metrics as a generation; the others count as
+        hedge_discarded. Tokens of the kept candidate count as generation,
+        the others as defense spend. A cancelled candidate is charged its
+        estimated prompt tokens (providers bill the request once sent); any
+        output it produced before cancellation is not reported and is left out.
+        Returns (response, validation, tokens).
+        """
+        cfg = (self.state.config or {}).get("enhancements", {}).get("hedged_generation", {}) or {}
+        spread = float(cfg.get("temperature_spread", 0.15))
+        base_temp = float(kwargs.get("temperature", 0.7))
+        offsets = [0.0, spread, -spread, 2 * spread, -2 * spread]
+        tasks = {}
+        for i in range(width):
+            cand_kwargs = dict(kwargs)
+            if i:
+                cand_kwargs["temperature"] = round(min(1.5, max(0.1, base_temp + offsets[i % len(offsets)])), 2)
+            tasks[asyncio.ensure_future(client.generate(prompt, **cand_kwargs))] = i
+
+        finished = []  # (index, response, validation)
+        errors = []
+        winner = None
+        pending = set(tasks)
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.get):
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        errors.append(e)
+                        logger.warning("Hedged %s candidate #%d failed: %s", stage_name, tasks[task], e)
+                        continue
+                    validation = self._check_generation(stage_name, response, scene_meta,
+                                                        continuity_state, record=False)
+                    finished.append((tasks[task], response, validation))
+                    if winner is None and validation["pass"]:
+                        winner = finished[-1]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        if not finished:
+            raise errors[0]
+
+        if winner is None:
+            winner = max(finished, key=lambda f: (self._score_output(f[2], f[1].content), -f[0]))
+        tokens = 0
+        for index, response, validation in finished:
+            used = response.input_tokens + response.output_tokens
+            tokens += used
+            kept = index == winner[0]
+            self._budget_tracker["generation_tokens" if kept else "defense_tokens"] += used
+            self._record_artifact_metrics(stage_name, scene_meta or {}, validation, hedge_discarded=not kept)
+        if pending:
+            counter = self._token_counter(client)
+            prompt_tokens = counter.count(prompt) + counter.count(str(kwargs.get("system_prompt", "")))
+            tokens += prompt_tokens * len(pending)
+            self._budget_tracker["defense_tokens"] += prompt_tokens * len(pending)
+            self._budget_tracker["hedge_cancelled"] = self._budget_tracker.get("hedge_cancelled", 0) + len(pending)
+        self._budget_tracker["hedged_generations"] = self._budget_tracker.get("hedged_generations", 0) + 1
+        logger.info(
+            "Hedged %s (scene %s): %d candidates, %d finished, %d cancelled; kept #%d (%s)",
+            stage_name, (scene_meta or {}).get("scene_id", "?"), width, len(finished), len(pending),
+            winner[0], "clean" if winner[2]["pass"] else "best score",
+        )
+        return winner[1], winner[2], tokens
+
     async def _generate_prose(self, client, prompt: str, stage_name: str,
                                scene_meta: dict = None,
                                continuity_state=None, **kwargs) -> tuple:
@@ -7968,12 +8894,14 @@ RULES:
         kwargs.setdefault('stop', self._stop_sequences)
 
         # Context window pre-flight: clamp max_tokens if prompt + output would exceed limit
+        # (last resort: budgeted prompts are already fitted; counts are cached per content hash)
+        from prometheus_lib.llm.clients import get_context_limit
         max_tok = kwargs.get('max_tokens', 4096)
         model_name = getattr(client, 'model_name', getattr(client, 'model', '')) or ''
         config_limit = (self.state.config or {}).get('model_defaults', {}).get('model_context_limit')
         ctx_limit = get_context_limit(model_name, config_limit)
-        prompt_text = prompt + "\n" + str(kwargs.get('system_prompt', ''))
-        prompt_tokens = count_tokens(prompt_text, model_name)
+        counter = self._token_counter(client)
+        prompt_tokens = counter.count(prompt) + counter.count(str(kwargs.get('system_prompt', '')))
         if prompt_tokens + max_tok > ctx_limit:
             clamped = max(500, ctx_limit - prompt_tokens - 100)
             logger.warning(
@@ -7982,39 +8910,16 @@ RULES:
             )
             kwargs['max_tokens'] = clamped
 
-        # Generate
-        response = await client.generate(prompt, **kwargs)
-        total_tokens = response.input_tokens + response.output_tokens
-        self._budget_tracker["generation_tokens"] += response.input_tokens + response.output_tokens
-
-        # Truncation detection: warn if response hit max_tokens limit
-        if response.finish_reason == "length":
-            logger.warning(
-                "TRUNCATION DETECTED in %s (scene %s): finish_reason='length'. "
-                "Response may be incomplete (%d output tokens). Consider raising max_tokens.",
-                stage_name, scene_meta.get("scene_id", "?"), response.output_tokens,
-            )
-
-        # Run critic gate on raw output
-        validation = self._validate_scene_output(response.content, scene_meta, continuity_state)
-        self._record_artifact_metrics(stage_name, scene_meta or {}, validation)
-
-        # Output length guard: catch silent scene collapse (rewrite shrinks >15%)
-        orig_wc = scene_meta.get("original_word_count") if scene_meta else None
-        if orig_wc is not None and orig_wc > 0:
-            min_retention = self._get_threshold("rewrite_min_length_ratio")
-            new_wc = validation.get("word_count", 0)
-            if new_wc < min_retention * orig_wc:
-                validation["issues"]["scene_collapse"] = {
-                    "original": orig_wc,
-                    "rewritten": new_wc,
-                    "retention": round(new_wc / orig_wc, 2),
-                }
-                validation["pass"] = False
-                logger.warning(
-                    "Output length guard: %s scene collapsed %.0f%% (orig=%d, new=%d). Retry.",
-                    stage_name, (1 - new_wc / orig_wc) * 100, orig_wc, new_wc,
-                )
+        # Generate (hedged: several candidates at once for failure-prone stages)
+        width = self._hedge_width(stage_name)
+        if width > 1:
+            response, validation, total_tokens = await self._hedged_generate(
+                client, prompt, stage_name, scene_meta, continuity_state, width, kwargs)
+        else:
+            response = await client.generate(prompt, **kwargs)
+            total_tokens = response.input_tokens + response.output_tokens
+            self._budget_tracker["generation_tokens"] += response.input_tokens + response.output_tokens
+            validation = self._check_generation(stage_name, response, scene_meta, continuity_state)
 
         # If critic gate fails on fixable issues, retry once with issue-specific feedback
         fixable_issues = {"preamble", "truncation_marker", "alternate_version", "analysis_commentary", "prompt_leak", "language_drift", "pov_pronoun_confusion", "mid_sentence_cutoff", "phrase_loop", "scene_collapse", "dead_character_present", "setting_violation", "info_leak", "design_drift", "avoid_violation", "tense_violation", "phantom_character", "physical_tic_repetition", "tense_leak", "echoing_text", "location_continuity", "phrase_cap_exceeded"}
@@ -8059,46 +8964,8 @@ RULES:
             self._record_artifact_metrics(stage_name, scene_meta or {}, validation2, is_retry=True)
 
             # Score both outputs: hard penalties for artifacts, soft bonuses for quality
-            def _score_output(val, content):
-                score = 0
-                issues = val.get("issues", {})
-                # Hard penalties (artifacts that ruin the output)
-                score -= 100 * len({"preamble", "truncation_marker", "alternate_version",
-                                     "analysis_commentary", "prompt_leak", "mid_sentence_cutoff", "phrase_loop", "scene_collapse"} & set(issues.keys()))
-                # Content correctness penalties (continuity errors)
-                score -= 80 * len({"dead_character_present", "setting_violation", "info_leak", "design_drift", "avoid_violation"} & set(issues.keys()))
-                # Craft penalties (pronoun, tense, phantom characters, tics, echoing)
-                if issues.get("pov_pronoun_confusion"):
-                    score -= 50
-                if issues.get("tense_violation"):
-                    score -= 40
-                if issues.get("phantom_character"):
-                    score -= 30
-                if issues.get("physical_tic_repetition"):
-                    score -= 25
-                if issues.get("tense_leak"):
-                    score -= 30
-                if issues.get("echoing_text"):
-                    score -= 35
-                if issues.get("location_continuity"):
-                    score -= 25
-                if issues.get("phrase_cap_exceeded"):
-                    score -= 30
-                # Soft penalties
-                if issues.get("too_short"):
-                    score -= 30
-                if issues.get("pov_drift"):
-                    score -= 20
-                if issues.get("emotional_summary_ending"):
-                    score -= 15
-                # Quality bonuses
-                wc = val.get("word_count", 0)
-                if wc >= 200:
-                    score += min(wc / 50, 20)  # Up to +20 for good length
-                return score
-
-            score1 = _score_output(validation, response.content)
-            score2 = _score_output(validation2, response2.content)
+            score1 = self._score_output(validation, response.content)
+            score2 = self._score_output(validation2, response2.content)
             if score2 > score1:
                 response = response2
         elif not validation["pass"] and detected & fixable_issues and not budget_allows_retry:
@@ -9324,6 +10191,7 @@ In crisis, {pov_char} should sound like {pov_char}, not like Generic Anxious Nar
         """Draft all scenes with rolling context, POV, and full config awareness."""
         scenes = []
         total_tokens = 0
+        budget_trims = []  # per-scene PromptBudget reports where blocks were trimmed
         client = self.get_client_for_stage("scene_drafting")
         config = self.state.config
 
@@ -9447,8 +10315,7 @@ In crisis, {pov_char} should sound like {pov_char}, not like Generic Anxious Nar
             configs_dir = Path(__file__).resolve().parent.parent / "configs"
             auto_yaml_path = configs_dir / "hot_phrases.auto.yaml"
             if auto_yaml_path.exists():
-                with open(auto_yaml_path, "r", encoding="utf-8") as _hf:
-                    _hp_data = yaml.safe_load(_hf) or {}
+                _hp_data = self.resources.yaml(auto_yaml_path, copy=False) or {}
                 _hp_limit = 15
                 if self.policy and hasattr(self.policy, "quality_polish"):
                     qm = getattr(self.policy.quality_polish, "quality_meters", None)
@@ -9468,10 +10335,9 @@ In crisis, {pov_char} should sound like {pov_char}, not like Generic Anxious Nar
         _bible_cfg = config.get("reference_bible", {})
         if _bible_cfg.get("enabled"):
             try:
-                from stages.bible_loader import ReferenceBible
                 _bible_path = self.project_path / config.get("reference_bible_path", "reference_bible.md")
                 if _bible_path.exists():
-                    _bible = ReferenceBible(_bible_path)
+                    _bible = self.resources.bible(_bible_path)
                     logger.info("Reference bible loaded for scene_drafting: %s", _bible_path.name)
                 else:
                     logger.warning("Reference bible path not found: %s", _bible_path)
@@ -9510,7 +10376,7 @@ In crisis, {pov_char} should sound like {pov_char}, not like Generic Anxious Nar
                 pov_char = scene_info.get("pov", "protagonist")
 
                 # Rewrite-scenes gate: skip regeneration for non-targeted scenes
-                if not self._should_process_scene(_global_scene_idx):
+                if not self._should_process_scene(_global_scene_idx, "scene_drafting"):
                     if _global_scene_idx < len(_existing_scenes):
                         scenes.append(_existing_scenes[_global_scene_idx])
                     continue
@@ -9778,6 +10644,31 @@ Hook in the first 100 words.
                 except ImportError:
                     genre_block = ""
 
+                # Calculate max tokens based on target words (1 token ≈ 1.2-1.4 words)
+                # Use 2.5x multiplier for buffer and comprehensive scenes.
+                # Config stage_max_tokens.scene_drafting overrides (e.g. paid models).
+                computed = max(int(self.state.words_per_scene * 2.5), 2500)
+                max_tokens = self.get_max_tokens_for_stage("scene_drafting", computed)
+                temp = self.get_temperature_for_stage("scene_drafting")
+
+                # Token budget: variable context goes in as prioritized blocks so an
+                # oversized prompt loses low-value context instead of output tokens.
+                budget = self._prompt_budget(client, max_tokens)
+                reference_bible_block = budget.block("reference_bible", reference_bible_block, 50, "head")
+                style_ref_block = budget.block("style_reference", style_ref_block, 20)
+                _style_avoid_lines = budget.block("avoid_list", _style_avoid_lines, 40, "head")
+                chapter_openings_block = budget.block("chapter_openings", chapter_openings_block, 35, "head")
+                _bible_scene_text = budget.block("bible_excerpt", _bible_scene_block, 55, "head")
+                _voice_block = budget.block("voice_constraints", self._format_voice_constraints(), 60, "head")
+                _story_state_block = budget.block(
+                    "story_state", self._build_story_state(scenes, chapter_num, scene_num), 80, "middle")
+                _continuity_text = budget.block(
+                    "continuity_state",
+                    self._build_continuity_block(_continuity_state, stable_id, pov_char, scenes, outcome),
+                    85, "head")
+                _previous_block = budget.block("previous_scene_ending", previous_context, 90, "tail")
+                _used_details_block = budget.block("used_details", self._get_used_details_tracker(scenes), 30, "head")
+
                 prompt = f"""Write Chapter {chapter_num}, Scene {scene_num}: "{scene_name}"
 POSITION: Scene {scene_position + 1} of {total_scenes_in_chapter} in this chapter.
 YOU ARE {pov_char.upper()}. You are writing AS {pov_char}, in first person. "I" = {pov_char}.
@@ -9987,19 +10878,19 @@ TENSION LEVEL: {tension_level}/10
 
 {f"=== CULTURAL AUTHENTICITY ==={chr(10)}{cultural_notes}" if cultural_notes else ""}
 
-{_bible_scene_block}
+{_bible_scene_text}
 
-{self._format_voice_constraints()}
+{_voice_block}
 
 === STORY STATE (what has happened so far — READ THIS CAREFULLY) ===
-{self._build_story_state(scenes, chapter_num, scene_num)}
+{_story_state_block}
 
-{self._build_continuity_block(_continuity_state, stable_id, pov_char, scenes, outcome)}
+{_continuity_text}
 
 === CONTINUITY (previous scene endings — continue from here) ===
-{previous_context}
+{_previous_block}
 
-{self._get_used_details_tracker(scenes)}
+{_used_details_block}
 
 === TARGET LENGTH ===
 Approximately {self.state.words_per_scene} words.
@@ -10026,6 +10917,16 @@ Begin DIRECTLY with narrative—no preamble, no title, no scene heading.
 
 Write the complete scene as {pov_char} ("I"):"""
 
+                prompt, budget_report = budget.render(prompt, system_prompt=self._format_contract)
+                _trimmed = {n: b["action"] for n, b in budget_report["blocks"].items() if b["action"] != "keep"}
+                if _trimmed:
+                    logger.info(
+                        "Prompt budget %s: %d/%d tokens after fitting (%s)",
+                        stable_id, budget_report["total_tokens"], budget_report["budget"],
+                        ", ".join(f"{n} {a}" for n, a in _trimmed.items()),
+                    )
+                    budget_trims.append({"scene_id": stable_id, **budget_report})
+
                 # Context safety: validate the inline-assembled prompt for
                 # credential leaks, injection attempts, and template placeholders.
                 # Scene drafting builds context inline (not via _build_scene_context),
@@ -10033,12 +10934,6 @@ Write the complete scene as {pov_char} ("I"):"""
                 self._validate_context_schema(prompt, len(scenes))
 
                 if client:
-                    # Calculate max tokens based on target words (1 token ≈ 1.2-1.4 words)
-                    # Use 2.5x multiplier for buffer and comprehensive scenes.
-                    # Config stage_max_tokens.scene_drafting overrides (e.g. paid models).
-                    computed = max(int(self.state.words_per_scene * 2.5), 2500)
-                    max_tokens = self.get_max_tokens_for_stage("scene_drafting", computed)
-                    temp = self.get_temperature_for_stage("scene_drafting")
                     content, tokens = await self._generate_prose(
                         client, prompt, "scene_drafting",
                         scene_meta={"chapter": chapter_num, "scene": scene_num, "scene_id": stable_id, "pov": pov_char},
@@ -10102,6 +10997,9 @@ Write the complete scene as {pov_char} ("I"):"""
 
         self.state.scenes = scenes
 
+        if _continuity_state is not None:
+            logger.info("ContinuityState validation timing: %s", _continuity_state.timing_stats())
+
         # Canonical facts ledger (lite) — per-scene continuity log
         try:
             from continuity.facts_ledger import build_facts_ledger, write_facts_ledger
@@ -10194,6 +11092,16 @@ Write the complete scene as {pov_char} ("I"):"""
         except Exception as e:
             logger.debug("Tension density check failed (non-blocking): %s", e)
 
+        # --- Prompt budget report (only when context had to give way) ---
+        if budget_trims:
+            logger.info("Prompt budget: trimmed context for %d/%d scenes", len(budget_trims), len(scenes))
+            proj = getattr(self.state, "project_path", None)
+            if proj and Path(proj).exists():
+                out_dir = Path(proj) / "output"
+                out_dir.mkdir(parents=True, exist_ok=True)
+                with open(out_dir / "prompt_budget.json", "w", encoding="utf-8") as f:
+                    json.dump({"scenes": budget_trims}, f, indent=2)
+
         return scenes, total_tokens
 
     # ========================================================================
@@ -10899,7 +11807,7 @@ Return the paragraph with exactly one *italic thought* added:"""
             if not isinstance(scene, dict):
                 expanded_scenes.append(scene)
                 continue
-            if not self._should_process_scene(idx):
+            if not self._should_process_scene(idx, "scene_expansion"):
                 expanded_scenes.append(scene)
                 continue
             validation = validate_scene_length(scene, target_words)
@@ -11011,6 +11919,8 @@ Output the COMPLETE expanded scene. Keep all existing content, add depth:"""
             total_tokens += exp_tokens
 
         self.state.scenes = expanded_scenes
+        if _continuity_state is not None:
+            logger.info("ContinuityState validation timing: %s", _continuity_state.timing_stats())
 
         return {
             "scenes_expanded": scenes_expanded,
@@ -11107,30 +12017,9 @@ Output the COMPLETE expanded scene. Keep all existing content, add depth:"""
         Falls back to full-scene repair if >70% of paragraphs are targeted.
         """
         paragraphs = [p for p in content.split("\n\n") if p.strip()]
-        n = len(paragraphs)
-        if n < 4:
-            # Scene too short for span targeting — repair everything
-            return content
-
-        fix_indices: set = set()
-        targets_lower = " ".join(patch_targets).lower()
-
-        if "opening" in targets_lower or "goal statement" in targets_lower:
-            fix_indices.update(range(min(2, n)))
-        if "obstacle" in targets_lower or "tactic" in targets_lower or "middle" in targets_lower:
-            fix_indices.update(range(2, max(2, n - 2)))
-        if "final" in targets_lower or "closing" in targets_lower:
-            fix_indices.update(range(max(0, n - 2), n))
-        if "dialogue" in targets_lower:
-            for i, p in enumerate(paragraphs):
-                if '"' in p or '\u201c' in p:  # straight or smart quotes
-                    fix_indices.add(i)
-        if "emotional" in targets_lower or "consequence" in targets_lower or "stakes" in targets_lower:
-            quarter = max(1, n // 4)
-            fix_indices.update(range(quarter, n - quarter))
-
-        # Fallback: if too many paragraphs are targeted, don't bother with markers
-        if len(fix_indices) > n * 0.7:
+        fix_indices = select_repair_paragraphs(paragraphs, patch_targets)
+        if not fix_indices:
+            # Scene too short for span targeting, or too many paragraphs targeted
             return content
 
         marked = []
@@ -11139,16 +12028,93 @@ Output the COMPLETE expanded scene. Keep all existing content, add depth:"""
             marked.append(f"{tag}\n{p}")
         return "\n\n".join(marked)
 
-    def _build_structure_repair_prompt(
-        self, content: str, meta: dict, scores: Dict[str, int],
-        repair_info: Dict[str, Any], target_words: int,
-    ) -> str:
-        """Build a targeted repair prompt with explicit success criteria.
+    # Output-affecting artifacts that make a patched scene unusable
+    _PATCH_REJECT_ISSUES = {"preamble", "prompt_leak", "analysis_commentary", "alternate_version", "truncation_marker"}
 
-        Uses span-targeted patching: paragraphs are marked [KEEP VERBATIM]
-        or [FIX THIS] so the model knows exactly what to touch. Preserves
-        80%+ wording and proves compliance via success criteria.
+    async def _patch_rewrite(
+        self,
+        stage_name: str,
+        client,
+        content: str,
+        task: str,
+        full_rewrite: Callable[[], Awaitable[Tuple[str, int]]],
+        *,
+        fix_indices: Optional[Set[int]] = None,
+        pov: str = "",
+        max_tokens: int = 3000,
+        temperature: float = 0.4,
+        budget_key: str = "generation_tokens",
+    ) -> Tuple[str, int, str]:
+        """Surgical rewrite via span patches, falling back to ``full_rewrite()``.
+
+        The model sees only the editable paragraphs (``fix_indices``) plus
+        ``span_patch.context_paragraphs`` neighbours — or, with
+        ``fix_indices=None``, the whole anchored scene — and returns JSON
+        replacement patches. An empty ``fix_indices`` means nothing can be
+        targeted, so the full rewrite runs directly.
+
+        Returns (content, tokens, mode) with mode "patch" or "full".
         """
+        cfg = (self.state.config or {}).get("span_patch", {}) or {}
+        stats = self._span_patch_stats.setdefault(stage_name, {"patch": 0, "full": 0, "fallback": 0})
+        if cfg.get("enabled", True) is False or not client or (fix_indices is not None and not fix_indices):
+            new_content, tokens = await full_rewrite()
+            stats["full"] += 1
+            return new_content, tokens, "full"
+
+        paragraphs = split_paragraphs(content)
+        context = int(cfg.get("context_paragraphs", 1))
+        excerpt = build_patch_excerpt(content, fix_indices, context=context)
+        scope = (
+            "Only paragraphs labelled [P<n>] are editable; CONTEXT paragraphs are read-only."
+            if fix_indices is not None else
+            "Patch only the paragraphs that must change; leave the rest out of your answer."
+        )
+        prompt = f"""{task}
+
+{scope}
+
+=== SCENE (anchored paragraphs) ===
+{excerpt}
+
+{PATCH_OUTPUT_INSTRUCTIONS}"""
+
+        if fix_indices is not None:
+            editable_words = sum(len(paragraphs[i].split()) for i in fix_indices if i < len(paragraphs))
+            max_tokens = min(max_tokens, int(editable_words * 4) + 300)
+
+        tokens = 0
+        reason = ""
+        try:
+            response = await client.generate(
+                prompt, max_tokens=max_tokens, temperature=temperature,
+                system_prompt=PATCH_SYSTEM_PROMPT,
+            )
+            tokens = (response.input_tokens or 0) + (response.output_tokens or 0)
+            self._budget_tracker[budget_key] += tokens
+            result = apply_patches(content, parse_patches(response.content), allowed=fix_indices)
+            if result.ok:
+                issues = self._validate_scene_output(result.content, {"pov": pov}).get("issues", {})
+                rejected = self._PATCH_REJECT_ISSUES & set(issues)
+                if not rejected:
+                    stats["patch"] += 1
+                    logger.debug("%s: span patch applied to %s", stage_name, ", ".join(result.applied))
+                    return self._postprocess(result.content, pov_character=pov), tokens, "patch"
+                reason = "artifacts: " + ", ".join(sorted(rejected))
+            else:
+                reason = "; ".join(result.errors[:3])
+        except Exception as e:
+            reason = f"patch call failed: {e}"
+
+        logger.info("%s: span patch rejected (%s), falling back to full rewrite", stage_name, reason)
+        stats["fallback"] += 1
+        new_content, full_tokens = await full_rewrite()
+        stats["full"] += 1
+        return new_content, tokens + full_tokens, "full"
+
+    @staticmethod
+    def _structure_repair_sections(scores: Dict[str, int], repair_info: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Scorecard, directive and success-criteria blocks for repair prompts."""
         cats = list(scores.keys()) if scores else list(STRUCTURE_CATEGORIES)
         weak_cats = [c for c in cats if scores.get(c, 0) < 3]
         score_lines = "\n".join(
@@ -11161,6 +12127,42 @@ Output the COMPLETE expanded scene. Keep all existing content, add depth:"""
         criteria_lines = "\n".join(
             f"  * {c}" for c in repair_info["success_criteria"]
         )
+        return score_lines, directive_lines, criteria_lines
+
+    def _build_structure_patch_task(
+        self, meta: dict, scores: Dict[str, int], repair_info: Dict[str, Any],
+    ) -> str:
+        """Task block for span-patch structure repair (scene text supplied separately)."""
+        score_lines, directive_lines, criteria_lines = self._structure_repair_sections(scores, repair_info)
+        return f"""Fix structural weaknesses in this scene by rewriting ONLY the editable paragraphs.
+
+NON-NEGOTIABLES:
+- Preserve first-person POV and the existing character names and facts.
+- Keep each replacement close to the original paragraph's length.
+
+SCENE META (truth you must satisfy):
+{json.dumps(meta, ensure_ascii=False)}
+
+SCORECARD:
+{score_lines}
+
+REPAIR DIRECTIVES:
+{directive_lines}
+
+SUCCESS CRITERIA (must be detectable on re-read):
+{criteria_lines}"""
+
+    def _build_structure_repair_prompt(
+        self, content: str, meta: dict, scores: Dict[str, int],
+        repair_info: Dict[str, Any], target_words: int,
+    ) -> str:
+        """Build a targeted repair prompt with explicit success criteria.
+
+        Uses span-targeted patching: paragraphs are marked [KEEP VERBATIM]
+        or [FIX THIS] so the model knows exactly what to touch. Preserves
+        80%+ wording and proves compliance via success criteria.
+        """
+        score_lines, directive_lines, criteria_lines = self._structure_repair_sections(scores, repair_info)
         patch_lines = ", ".join(repair_info["patch_targets"]) if repair_info["patch_targets"] else "any"
 
         # Annotate scene with paragraph-level repair markers
@@ -11476,14 +12478,25 @@ JSON:"""
                     content, meta, scores, repair_info, target_words,
                 )
 
-                try:
-                    repaired_content, tokens = await self._generate_prose(
+                async def _full_repair(repair_prompt=repair_prompt, chapter=chapter, scene_num=scene_num, scene=scene):
+                    return await self._generate_prose(
                         repair_client, repair_prompt, "structure_gate",
                         scene_meta={"chapter": chapter, "scene": scene_num, "pov": scene.get("pov", "")},
                         system_prompt=STRUCTURE_REPAIR_SYSTEM_PROMPT,
                         max_tokens=int(target_words * 2.2),
                         temperature=0.45,
                     )
+
+                try:
+                    repaired_content, tokens, _mode = await self._patch_rewrite(
+                        "structure_gate", repair_client, content,
+                        self._build_structure_patch_task(meta, scores, repair_info),
+                        _full_repair,
+                        fix_indices=select_repair_paragraphs(split_paragraphs(content), repair_info["patch_targets"]),
+                        pov=scene.get("pov", ""),
+                        max_tokens=int(target_words * 2.2),
+                        temperature=0.45,
+                    )
                     total_tokens += tokens
 
                     # Verify repair didn't produce garbage (basic length check)
@@ -11631,25 +12644,148 @@ Output ONLY the revised scene—no notes, no commentary, no checklist:"""
         self.state.scenes = refined_scenes
         return refined_scenes, total_tokens
 
+    async def _windowed_continuity_audit(
+        self,
+        stage_name: str,
+        client,
+        scenes: List[Dict[str, Any]],
+        build_prompt: Callable[[str, str, Optional[str]], str],
+        max_tokens: int,
+        temperature: float,
+    ) -> tuple:
+        """Map-reduce continuity audit sized to the audit model's context.
+
+        When the whole manuscript fits, this is one call and its report is
+        returned as parsed (only missing "issues"/"passed" are filled in).
+        Otherwise scenes are split into overlapping chapter windows, each
+        audited concurrently with a facts-ledger digest of earlier chapters,
+        and the issues are merged deterministically. If any window fails,
+        its chapters went unaudited, so the report does not pass.
+
+        Args:
+            build_prompt: (manuscript, facts_digest, window_label) -> prompt.
+                window_label is None for a single-window audit.
+
+        Config (``continuity_audit``): mode ("auto" | "single"),
+        overlap_chapters (default 1), max_concurrent_windows (default 4).
+
+        Returns:
+            (report, tokens) where report has "issues", "passed", "windows"
+            (plus "windows_failed" when some windows raised).
+        """
+        from continuity.windowed_audit import (
+            build_chapter_windows, facts_digest, join_scenes, merge_issues, window_label,
+        )
+        from prometheus_lib.llm.clients import count_tokens, get_context_limit
+
+        audit_cfg = (self.state.config or {}).get("continuity_audit", {}) or {}
+        model_name = getattr(client, 'model_name', getattr(client, 'model', '')) or ''
+        config_limit = (self.state.config or {}).get('model_defaults', {}).get('model_context_limit')
+        ctx_limit = get_context_limit(model_name, config_limit)
+
+        def count(text: str) -> int:
+            return count_tokens(text, model_name)
+
+        scenes = [s for s in scenes if isinstance(s, dict)]
+        digest_budget = ctx_limit // 8
+        overhead = count(build_prompt("", "", "Chapters 0-0")) + max_tokens + 256
+        manuscript_budget = max(1000, ctx_limit - overhead - digest_budget)
+
+        if audit_cfg.get("mode", "auto") == "single":
+            windows = [scenes] if scenes else []
+        else:
+            windows = build_chapter_windows(
+                scenes, manuscript_budget, count,
+                overlap_chapters=int(audit_cfg.get("overlap_chapters", 1)),
+            )
+        if not windows:
+            return {"issues": [], "passed": True, "windows": 0}, 0
+
+        windowed = len(windows) > 1
+        ledger_entries: List[Dict[str, Any]] = []
+        if windowed:
+            from continuity.facts_ledger import build_facts_ledger
+            ledger = build_facts_ledger(
+                self.state.scenes or [],
+                characters=self.state.characters or [],
+                config=self.state.config,
+            )
+            ledger_entries = ledger.get("entries", [])
+            logger.info(
+                f"{stage_name}: manuscript exceeds {ctx_limit} token context, "
+                f"auditing {len(windows)} overlapping windows"
+            )
+
+        semaphore = asyncio.Semaphore(max(1, int(audit_cfg.get("max_concurrent_windows", 4))))
+
+        async def _audit_window(window: List[Dict[str, Any]]) -> tuple:
+            label = window_label(window) if windowed else None
+            digest = ""
+            if windowed:
+                first_chapter = min(
+                    (s.get("chapter") for s in window if isinstance(s.get("chapter"), (int, float))),
+                    default=None,
+                )
+                digest = facts_digest(ledger_entries, first_chapter, digest_budget, count)
+            prompt = build_prompt(join_scenes(window), digest, label)
+            async with semaphore:
+                response = await client.generate(
+                    prompt, max_tokens=max_tokens, temperature=temperature, json_mode=True,
+                )
+            tokens = (response.input_tokens + response.output_tokens) if response else 0
+            try:
+                report = extract_json_robust(response.content if response else None, expect_array=False)
+            except Exception as e:
+                logger.warning(f"{stage_name}: JSON parse failed for {label or 'manuscript'}: {e}")
+                report = {}
+            return (report if isinstance(report, dict) else {}), tokens
+
+        results = await asyncio.gather(*(_audit_window(w) for w in windows), return_exceptions=True)
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if len(failures) == len(results):
+            raise failures[0]
+        for window, result in zip(windows, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"{stage_name}: {window_label(window)} not audited: {result}")
+
+        reports = [r[0] for r in results if not isinstance(r, BaseException)]
+        total_tokens = sum(r[1] for r in results if not isinstance(r, BaseException))
+
+        if not windowed:
+            report = dict(reports[0])
+            if "issues" not in report:
+                report["issues"] = []
+            if "passed" not in report:
+                report["passed"] = len(report["issues"]) == 0
+            report["windows"] = 1
+            return report, total_tokens
+
+        issues = merge_issues([r.get("issues", []) for r in reports])
+        merged_report = {
+            "issues": issues,
+            "passed": not issues and not failures,
+            "windows": len(windows),
+        }
+        if failures:
+            merged_report["windows_failed"] = len(failures)
+        return merged_report, total_tokens
+
     async def _stage_continuity_audit(self) -> tuple:
-        """Audit for continuity issues using Gemini's long context."""
-        client = self.get_client_for_stage("continuity_audit")
+        """Audit for continuity issues using Gemini's long context.
 
-        # Compile all scenes for continuity check
-        all_content = "\n\n---\n\n".join([
-            f"Chapter {s.get('chapter')}, Scene {s.get('scene_number')}:\n{s.get('content', '')}"
-            for s in (self.state.scenes or [])
-        ])
+        Long manuscripts on small-context models are audited in windows
+        (see _windowed_continuity_audit).
+        """
+        client = self.get_client_for_stage("continuity_audit")
 
         # --- Reference Bible: thread tracking + truth file for continuity audit ---
         _ca_bible_block = ""
         _ca_bible_cfg = self.state.config.get("reference_bible", {})
         if _ca_bible_cfg.get("enabled"):
             try:
-                from stages.bible_loader import ReferenceBible
                 _ca_bible_path = self.project_path / self.state.config.get("reference_bible_path", "reference_bible.md")
                 if _ca_bible_path.exists():
-                    _ca_bible = ReferenceBible(_ca_bible_path)
+                    _ca_bible = self.resources.bible(_ca_bible_path)
                     if _ca_bible.loaded:
                         _ca_parts = []
                         _threads = _ca_bible.get_thread_tracking()
@@ -11665,20 +12801,32 @@ Output ONLY the revised scene—no notes, no commentary, no checklist:"""
             except Exception as e:
                 logger.debug("Reference bible load failed for continuity_audit (non-blocking): %s", e)
 
-        prompt = f"""You are a continuity editor. Analyze this complete manuscript for consistency issues.
+        _ca_world_json = json.dumps(self.state.world_bible, indent=2) if self.state.world_bible else 'Not available'
+        _ca_chars_json = json.dumps(self.state.characters, indent=2) if self.state.characters else 'Not available'
+
+        def _audit_prompt(manuscript: str, digest: str, label: Optional[str]) -> str:
+            if label is None:
+                scope = "Analyze this complete manuscript for consistency issues."
+                body = f"FULL MANUSCRIPT:\n{manuscript}"
+            else:
+                scope = (f"Analyze this manuscript excerpt ({label}) for consistency issues. "
+                         "Earlier chapters are summarized as a facts digest; report issues "
+                         "only for scenes in the excerpt.")
+                body = (f"FACTS ESTABLISHED EARLIER:\n{digest or 'None (start of book)'}\n\n"
+                        f"MANUSCRIPT EXCERPT ({label}):\n{manuscript}")
+            return f"""You are a continuity editor. {scope}
 
 WORLD RULES:
-{json.dumps(self.state.world_bible, indent=2) if self.state.world_bible else 'Not available'}
+{_ca_world_json}
 
 CHARACTERS:
-{json.dumps(self.state.characters, indent=2) if self.state.characters else 'Not available'}
+{_ca_chars_json}
 
 EXPECTED POV: First person ("I") throughout the entire manuscript.
 
 {_ca_bible_block}
 
-FULL MANUSCRIPT:
-{all_content}
+{body}
 
 Find and report:
 1. POV BREAKS: Any sentence that switches to third person (e.g., "Lena felt",
@@ -11765,24 +12913,17 @@ Respond in JSON format with "issues" array and "passed" boolean."""
             logger.debug("Causal completeness check failed (non-blocking): %s", e)
 
         if client:
-            response = await client.generate(prompt, max_tokens=4000, temperature=0.2, json_mode=True)
-            try:
-                audit_report = extract_json_robust(response.content if response else None, expect_array=False)
-            except Exception as e:
-                logger.warning(f"Continuity audit JSON parse failed: {e}")
-                audit_report = {"issues": [], "passed": True}
-            # Ensure expected keys exist
-            if "issues" not in audit_report:
-                audit_report["issues"] = []
-            if "passed" not in audit_report:
-                audit_report["passed"] = len(audit_report.get("issues", [])) == 0
+            audit_report, tokens = await self._windowed_continuity_audit(
+                "continuity_audit", client, self.state.scenes or [], _audit_prompt,
+                max_tokens=4000, temperature=0.2,
+            )
 
             # Merge roster violations with LLM audit issues (roster first — high priority)
             llm_issues = audit_report.get("issues", [])
             self.state.continuity_issues = roster_issues + llm_issues
             logger.info(f"Continuity audit found {len(self.state.continuity_issues)} issues")
 
-            return audit_report, response.input_tokens + response.output_tokens
+            return audit_report, tokens
 
         # Mock response (no client)
         audit_report = {
@@ -11793,6 +12934,18 @@ Respond in JSON format with "issues" array and "passed" boolean."""
         self.state.continuity_issues = roster_issues
         return audit_report, 50
 
+    @staticmethod
+    def _continuity_patch_task(issue_type: str, issue_desc: str, suggested_fix: str, reference: str = "") -> str:
+        """Task block for span-patch continuity fixes."""
+        return f"""Fix a continuity issue in this scene.
+
+ISSUE TYPE: {issue_type}
+ISSUE DESCRIPTION: {issue_desc}
+SUGGESTED FIX: {suggested_fix}
+{reference}
+Change only the paragraphs needed to fix the issue. Maintain the same tone and style.
+Minimal change only — do not restructure."""
+
     async def _stage_continuity_fix(self) -> tuple:
         """Fix continuity issues found in audit using Claude's nuanced understanding."""
         client = self.get_client_for_stage("continuity_fix")
@@ -11848,10 +13001,21 @@ Only change what's necessary to fix the issue.
 FIXED SCENE:"""
 
                     if client:
-                        content, tokens = await self._generate_prose(
-                            client, prompt, "continuity_fix",
-                            scene_meta={"chapter": scene.get("chapter"), "scene": scene.get("scene_number"), "pov": scene.get("pov", "")},
-                            max_tokens=2500, temperature=0.7)
+                        async def _full_fix(prompt=prompt, scene=scene):
+                            return await self._generate_prose(
+                                client, prompt, "continuity_fix",
+                                scene_meta={"chapter": scene.get("chapter"), "scene": scene.get("scene_number"), "pov": scene.get("pov", "")},
+                                max_tokens=2500, temperature=0.7)
+
+                        # Issue text does not pin paragraphs: the model picks anchors
+                        content, tokens, _mode = await self._patch_rewrite(
+                            "continuity_fix", client, scene.get("content", ""),
+                            self._continuity_patch_task(
+                                issue_type, issue_desc, suggested_fix,
+                                f"\nWORLD RULES (for reference):\n{_world_bible_json}\n\nCHARACTERS (for reference):\n{_characters_json}\n",
+                            ),
+                            _full_fix, pov=scene.get("pov", ""), max_tokens=2500, temperature=0.7,
+                        )
                         fixed_scenes[i] = {
                             **scene,
                             "content": content,
@@ -11888,6 +13052,9 @@ FIXED SCENE:"""
             logger.warning("continuity_recheck: no audit client available, skipping")
             return {"skipped": True, "reason": "no_client"}, 0
 
+        _world_json = json.dumps(self.state.world_bible, indent=2) if self.state.world_bible else 'Not available'
+        _chars_json = json.dumps(self.state.characters, indent=2) if self.state.characters else 'Not available'
+
         total_tokens = 0
         max_loops = 2
         recheck_report = {"loops": [], "total_fixes": 0}
@@ -11897,30 +13064,29 @@ FIXED SCENE:"""
             if not remaining_indices:
                 break
 
-            # --- RE-AUDIT: Build targeted manuscript excerpt for only the fixed scenes ---
-            targeted_content = "\n\n---\n\n".join([
-                f"Chapter {self.state.scenes[i].get('chapter')}, "
-                f"Scene {self.state.scenes[i].get('scene_number')}:\n"
-                f"{self.state.scenes[i].get('content', '')}"
-                for i in remaining_indices
+            # --- RE-AUDIT: only the fixed scenes (windowed if they exceed context) ---
+            targeted_scenes = [
+                self.state.scenes[i] for i in remaining_indices
                 if i < len(self.state.scenes) and isinstance(self.state.scenes[i], dict)
-            ])
+            ]
 
-            if not targeted_content.strip():
+            if not any(str(s.get('content', '')).strip() for s in targeted_scenes):
                 break
 
-            audit_prompt = f"""You are a continuity editor. Check ONLY these scenes for issues introduced by recent edits.
+            def audit_prompt(manuscript: str, digest: str, label: Optional[str]) -> str:
+                earlier = (f"FACTS ESTABLISHED EARLIER:\n{digest}\n\n" if digest else "")
+                return f"""You are a continuity editor. Check ONLY these scenes for issues introduced by recent edits.
 
 WORLD RULES:
-{json.dumps(self.state.world_bible, indent=2) if self.state.world_bible else 'Not available'}
+{_world_json}
 
 CHARACTERS:
-{json.dumps(self.state.characters, indent=2) if self.state.characters else 'Not available'}
+{_chars_json}
 
 EXPECTED POV: First person ("I") throughout.
 
-SCENES TO VERIFY (these were recently rewritten):
-{targeted_content}
+{earlier}SCENES TO VERIFY (these were recently rewritten):
+{manuscript}
 
 Check for:
 1. POV breaks introduced by the rewrite
@@ -11935,13 +13101,12 @@ If all scenes are clean, return {{"issues": [], "passed": true}}.
 Respond in JSON with "issues" array and "passed" boolean."""
 
             try:
-                response = await audit_client.generate(
-                    audit_prompt, max_tokens=2000,
+                audit_result, audit_tokens = await self._windowed_continuity_audit(
+                    "continuity_recheck", audit_client, targeted_scenes, audit_prompt,
+                    max_tokens=2000,
                     temperature=self.get_temperature_for_stage("continuity_recheck"),
-                    json_mode=True,
                 )
-                total_tokens += response.input_tokens + response.output_tokens
-                audit_result = extract_json_robust(response.content, expect_array=False)
+                total_tokens += audit_tokens
             except Exception as e:
                 logger.warning(f"continuity_recheck: audit parse failed on loop {loop_num}: {e}")
                 audit_result = {"issues": [], "passed": True}
@@ -11995,12 +13160,19 @@ Minimal change only — do not restructure.
 
 FIXED SCENE:"""
 
-                        try:
-                            content, tokens = await self._generate_prose(
+                        async def _full_refix(fix_prompt=fix_prompt, scene=scene):
+                            return await self._generate_prose(
                                 fix_client, fix_prompt, "continuity_recheck",
                                 scene_meta={"chapter": scene.get("chapter"), "scene": scene.get("scene_number"), "pov": scene.get("pov", "")},
                                 max_tokens=2500, temperature=0.5,
                             )
+
+                        try:
+                            content, tokens, _mode = await self._patch_rewrite(
+                                "continuity_recheck", fix_client, scene.get("content", ""),
+                                self._continuity_patch_task(issue_type, issue_desc, suggested_fix),
+                                _full_refix, pov=scene.get("pov", ""), max_tokens=2500, temperature=0.5,
+                            )
                             total_tokens += tokens
                             self.state.scenes[idx] = {
                                 **scene,
@@ -12051,10 +13223,9 @@ FIXED SCENE:"""
         _vhp_bible_cfg = config.get("reference_bible", {})
         if _vhp_bible_cfg.get("enabled"):
             try:
-                from stages.bible_loader import ReferenceBible
                 _vhp_bible_path = self.project_path / config.get("reference_bible_path", "reference_bible.md")
                 if _vhp_bible_path.exists():
-                    _vhp_bible = ReferenceBible(_vhp_bible_path)
+                    _vhp_bible = self.resources.bible(_vhp_bible_path)
                     logger.info("Reference bible loaded for voice_human_pass: %s", _vhp_bible_path.name)
             except Exception as e:
                 logger.debug("Reference bible load failed for voice_human_pass (non-blocking): %s", e)
@@ -12172,7 +13343,7 @@ FIXED SCENE:"""
             if not isinstance(scene, dict):
                 enhanced_scenes.append(scene)
                 continue
-            if not self._should_process_scene(idx):
+            if not self._should_process_scene(idx, "voice_human_pass"):
                 enhanced_scenes.append(scene)
                 continue
             pov = scene.get("pov", "protagonist")
@@ -12455,22 +13626,25 @@ Output the revised scene:"""
         """
         client = self.get_client_for_stage("continuity_audit_2")
 
-        all_content = "\n\n---\n\n".join([
-            f"Chapter {s.get('chapter')}, Scene {s.get('scene_number')}:\n{s.get('content', '')}"
-            for s in (self.state.scenes or []) if isinstance(s, dict)
-        ])
+        _world_json = json.dumps(self.state.world_bible, indent=2) if self.state.world_bible else 'Not available'
+        _chars_json = json.dumps(self.state.characters, indent=2) if self.state.characters else 'Not available'
 
-        prompt = f"""You are a continuity checker. The manuscript just went through a voice revision pass.
+        def _audit_prompt(manuscript: str, digest: str, label: Optional[str]) -> str:
+            if label is None:
+                body = f"MANUSCRIPT:\n{manuscript}"
+            else:
+                body = (f"FACTS ESTABLISHED EARLIER:\n{digest or 'None (start of book)'}\n\n"
+                        f"MANUSCRIPT EXCERPT ({label}) — report issues only for these scenes:\n{manuscript}")
+            return f"""You are a continuity checker. The manuscript just went through a voice revision pass.
 Check ONLY for factual consistency issues that may have been introduced.
 
 WORLD RULES:
-{json.dumps(self.state.world_bible, indent=2) if self.state.world_bible else 'Not available'}
+{_world_json}
 
 CHARACTERS:
-{json.dumps(self.state.characters, indent=2) if self.state.characters else 'Not available'}
+{_chars_json}
 
-MANUSCRIPT:
-{all_content}
+{body}
 
 CHECK ONLY:
 1. Character names spelled correctly and consistently
@@ -12488,19 +13662,14 @@ For each issue: location, type, description, suggested_fix.
 Respond in JSON: {{"issues": [...], "passed": true/false}}"""
 
         if client:
-            response = await client.generate(prompt, max_tokens=2000, temperature=0.2, json_mode=True)
-            try:
-                audit_report = extract_json_robust(response.content, expect_array=False)
-            except Exception:
-                audit_report = {"issues": [], "passed": True}
-            if "issues" not in audit_report:
-                audit_report["issues"] = []
-            if "passed" not in audit_report:
-                audit_report["passed"] = len(audit_report.get("issues", [])) == 0
+            audit_report, tokens = await self._windowed_continuity_audit(
+                "continuity_audit_2", client, self.state.scenes or [], _audit_prompt,
+                max_tokens=2000, temperature=0.2,
+            )
 
             self.state.continuity_issues_2 = audit_report.get("issues", [])
             logger.info(f"Continuity audit #2: {len(self.state.continuity_issues_2)} issues")
-            return audit_report, response.input_tokens + response.output_tokens
+            return audit_report, tokens
 
         self.state.continuity_issues_2 = []
         return {"issues": [], "passed": True}, 50
@@ -12910,7 +14079,7 @@ Respond in JSON format:
                     global_idx += 1
                     continue
 
-                if not self._should_process_scene(global_idx):
+                if not self._should_process_scene(global_idx, "chapter_hooks"):
                     hooked_scenes.append(scene)
                     global_idx += 1
                     continue
@@ -12918,10 +14087,11 @@ Respond in JSON format:
                 is_chapter_start = (i == 0)
                 is_chapter_end = (i == len(chapter_scenes) - 1)
 
-                if is_chapter_end and client:
-                    prompt = f"""Rewrite this scene so it ends with a powerful hook. Output ONLY the full scene text — no commentary, no notes, no labels.
-
-RULES:
+                if (is_chapter_end or is_chapter_start) and client:
+                    content = scene.get("content", "")
+                    if is_chapter_end:
+                        where, verb = "ending", "ends with a powerful hook"
+                        rules = f"""RULES:
 - Modify ONLY the last 2-3 paragraphs for the hook
 - Keep ALL other content word-for-word identical
 - Do NOT change facts (names, locations, objects, timeline)
@@ -12929,50 +14099,45 @@ RULES:
 - FIRST PERSON POV ("I") throughout — never third person
 - Hook types for this genre: {hook_types}
 {hook_warning}
-{hook_guidance}
-
-<scene>
-{scene.get('content', '')}
-</scene>
-
-Output the complete scene with only the ending paragraphs rewritten:"""
-
-                    max_tok = self.get_max_tokens_for_stage("chapter_hooks", 3000)
-                    orig_wc = count_words_accurate(scene.get("content", ""))
-                    content, tokens = await self._generate_prose(
-                        client, prompt, "chapter_hooks",
-                        scene_meta={"chapter": scene.get("chapter"), "scene": scene.get("scene_number"), "pov": scene.get("pov", ""), "original_word_count": orig_wc},
-                        max_tokens=max_tok, temperature=0.75)
-                    hooked_scenes.append({
-                        **scene,
-                        "content": content,
-                        "hook_enhanced": True
-                    })
-                    total_tokens += tokens
-
-                elif is_chapter_start and client:
-                    prompt = f"""Rewrite this scene so it opens with an immediate hook. Output ONLY the full scene text — no commentary, no notes, no labels.
-
-RULES:
+{hook_guidance}"""
+                        fix_indices = tail_indices(content, 3)
+                    else:
+                        where, verb = "opening", "opens with an immediate hook"
+                        rules = """RULES:
 - Modify ONLY the first 2-3 paragraphs for the hook
 - Keep ALL other content word-for-word identical
 - Do NOT change facts (names, locations, objects, timeline)
 - No AI tells
 - FIRST PERSON POV ("I") throughout — never third person
-- Hook types: in medias res, striking sensory image, provocative thought, immediate conflict, disorientation
+- Hook types: in medias res, striking sensory image, provocative thought, immediate conflict, disorientation"""
+                        fix_indices = head_indices(content, 3)
+
+                    prompt = f"""Rewrite this scene so it {verb}. Output ONLY the full scene text — no commentary, no notes, no labels.
+
+{rules}
 
 <scene>
-{scene.get('content', '')}
+{content}
 </scene>
 
-Output the complete scene with only the opening paragraphs rewritten:"""
+Output the complete scene with only the {where} paragraphs rewritten:"""
 
                     max_tok = self.get_max_tokens_for_stage("chapter_hooks", 3000)
-                    orig_wc = count_words_accurate(scene.get("content", ""))
-                    content, tokens = await self._generate_prose(
-                        client, prompt, "chapter_hooks",
-                        scene_meta={"chapter": scene.get("chapter"), "scene": scene.get("scene_number"), "pov": scene.get("pov", ""), "original_word_count": orig_wc},
-                        max_tokens=max_tok, temperature=0.75)
+                    orig_wc = count_words_accurate(content)
+
+                    async def _full_hook(prompt=prompt, scene=scene, max_tok=max_tok, orig_wc=orig_wc):
+                        return await self._generate_prose(
+                            client, prompt, "chapter_hooks",
+                            scene_meta={"chapter": scene.get("chapter"), "scene": scene.get("scene_number"), "pov": scene.get("pov", ""), "original_word_count": orig_wc},
+                            max_tokens=max_tok, temperature=0.75)
+
+                    content, tokens, _mode = await self._patch_rewrite(
+                        "chapter_hooks", client, content,
+                        f"Revise the {where} paragraphs of this scene so it {verb}.\n\n{rules}",
+                        _full_hook,
+                        fix_indices=fix_indices if len(split_paragraphs(content)) > len(fix_indices) else set(),
+                        pov=scene.get("pov", ""), max_tokens=max_tok, temperature=0.75,
+                    )
                     hooked_scenes.append({
                         **scene,
                         "content": content,
@@ -13179,8 +14344,7 @@ POLISHED SCENE:"""
         yaml_path = Path(__file__).parent.parent / "configs" / "surgical_replacements.yaml"
         if yaml_path.exists():
             try:
-                with open(yaml_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                data = self.resources.yaml(yaml_path, copy=False) or {}
                 # Validate: all categories should be dicts with string keys/values
                 if not isinstance(data, dict):
                     logger.warning("surgical_replacements.yaml: expected dict, using defaults")
@@ -13205,6 +14369,47 @@ POLISHED SCENE:"""
                 logger.warning(f"Failed to load surgical_replacements.yaml: {e}")
         return dict(self._DEFAULT_SURGICAL_REPLACEMENTS)
 
+    async def _deai_rewrite(self, client, text: str, tells: Dict, pov: str) -> Tuple[str, int]:
+        """Surgical AI-tell rewrite of ``text``: span patches on the paragraphs
+        that contain tells, falling back to a full-text rewrite."""
+        problem_patterns = list(tells["patterns_found"].keys())[:5]
+        rules = f"""PATTERNS TO FIX: {problem_patterns}
+
+RULES:
+- Only change sentences containing the patterns above
+- Keep meaning, just remove the AI tell
+- Preserve surrounding sentences EXACTLY"""
+
+        async def _full():
+            prompt = f"""SURGICAL edit. Fix ONLY sentences containing these AI tell patterns.
+Do NOT change anything else.
+
+{rules}
+
+TEXT:
+{text}
+
+OUTPUT the text with only problematic sentences fixed:"""
+            response = await client.generate(
+                prompt, max_tokens=3000,
+                system_prompt=self._format_contract,
+                stop=self._stop_sequences)
+            _tok = ((response.input_tokens or 0) + (response.output_tokens or 0)) if response else 0
+            self._budget_tracker["defense_tokens"] += _tok
+            return self._postprocess(response.content, pov_character=pov), _tok
+
+        tell_paragraphs = {
+            i for i, p in enumerate(split_paragraphs(text))
+            if count_ai_tells(p)["total_tells"] > 0
+        }
+        new_text, tokens, _mode = await self._patch_rewrite(
+            "final_deai", client, text,
+            f"SURGICAL edit. Fix ONLY sentences containing these AI tell patterns.\nDo NOT change anything else.\n\n{rules}",
+            _full, fix_indices=tell_paragraphs, pov=pov, max_tokens=3000,
+            temperature=0.4, budget_key="defense_tokens",
+        )
+        return new_text, tokens
+
     async def _stage_final_deai(self) -> tuple:
         """Final surgical pass to remove any AI tells that slipped through.
 
@@ -13246,6 +14451,9 @@ POLISHED SCENE:"""
             if not isinstance(scene, dict):
                 cleaned_scenes.append(scene)
                 continue
+            if not self._should_process_scene(idx, "final_deai"):
+                cleaned_scenes.append(scene)
+                continue
 
             content = scene.get("content", "")
             scene_fixes = 0
@@ -13282,30 +14490,8 @@ POLISHED SCENE:"""
                 # LLM pass on middle only if needed
                 remaining_tells = count_ai_tells(middle)
                 if remaining_tells["total_tells"] > 0 and client:
-                    problem_patterns = list(remaining_tells["patterns_found"].keys())[:5]
-                    prompt = f"""SURGICAL edit. Fix ONLY sentences containing these AI tell patterns.
-Do NOT change anything else.
-
-PATTERNS TO FIX: {problem_patterns}
-
-RULES:
-- Only change sentences containing the patterns above
-- Keep meaning, just remove the AI tell
-- Preserve surrounding sentences EXACTLY
-
-TEXT:
-{middle}
-
-OUTPUT the text with only problematic sentences fixed:"""
-
-                    response = await client.generate(
-                        prompt, max_tokens=3000,
-                        system_prompt=self._format_contract,
-                        stop=self._stop_sequences)
-                    rewritten_middle = self._postprocess(response.content, pov_character=scene.get("pov", ""))
-                    _tok = ((response.input_tokens or 0) + (response.output_tokens or 0)) if response else 0
+                    rewritten_middle, _tok = await self._deai_rewrite(client, middle, remaining_tells, scene.get("pov", ""))
                     total_tokens += _tok
-                    self._budget_tracker["defense_tokens"] += _tok
 
                     # Per-paragraph word count guard: reject if any paragraph
                     # lost >50% of its words (LLM rewrote too aggressively)
@@ -13347,30 +14533,8 @@ OUTPUT the text with only problematic sentences fixed:"""
 
                 remaining_tells = count_ai_tells(content)
                 if remaining_tells["total_tells"] > 0 and client:
-                    problem_patterns = list(remaining_tells["patterns_found"].keys())[:5]
-                    prompt = f"""SURGICAL edit. Fix ONLY sentences containing these AI tell patterns.
-Do NOT change anything else.
-
-PATTERNS TO FIX: {problem_patterns}
-
-RULES:
-- Only change sentences containing the patterns above
-- Keep meaning, just remove the AI tell
-- Preserve surrounding sentences EXACTLY
-
-TEXT:
-{content}
-
-OUTPUT the text with only problematic sentences fixed:"""
-
-                    response = await client.generate(
-                        prompt, max_tokens=3000,
-                        system_prompt=self._format_contract,
-                        stop=self._stop_sequences)
-                    content = self._postprocess(response.content, pov_character=scene.get("pov", ""))
-                    _tok = ((response.input_tokens or 0) + (response.output_tokens or 0)) if response else 0
+                    content, _tok = await self._deai_rewrite(client, content, remaining_tells, scene.get("pov", ""))
                     total_tokens += _tok
-                    self._budget_tracker["defense_tokens"] += _tok
                     scene_fixes += remaining_tells["total_tells"]
 
             if scene_fixes > 0:
@@ -13441,6 +14605,16 @@ OUTPUT the text with only problematic sentences fixed:"""
         if not scenes_list:
             return {"skipped": "no scenes"}, 0
 
+        from quality.phrase_miner import mine_hot_phrases, write_auto_yaml, load_phrase_config, load_miner_config
+        from quality.phrase_suppressor import suppress_phrases
+        from quality.dialogue_trimmer import process_scenes as trim_dialogue_scenes
+        from quality.emotion_diversifier import process_scenes as diversify_emotion_scenes
+        from quality.cliche_clusters import detect_clusters, repair_clusters, load_cluster_config
+        from quality.delta_report import compute_pass_delta, build_delta_report
+        from quality.ceiling import CeilingRules, CeilingTracker
+        from quality.policy import is_pass_enabled
+        from quality.loop_guard import check_replacement_loops
+
         texts = [s.get("content", "") for s in scenes_list]
         original_texts = list(texts)  # Snapshot for delta report
         project_path = Path(self.state.config.get("_project_path", ""))
@@ -13848,6 +15022,9 @@ OUTPUT the text with only problematic sentences fixed:"""
 
     async def _stage_quality_meters(self) -> tuple:
         """Run deterministic quality meters (no LLM needed). Non-blocking."""
+        from stages.quality_meters import run_all_meters
+        from quality.quality_contract import run_quality_contract
+
         scenes = [s for s in (self.state.scenes or []) if isinstance(s, dict)]
         outline = self.state.master_outline or []
         characters = self.state.characters or []
@@ -14065,13 +15242,13 @@ OUTPUT the text with only problematic sentences fixed:"""
 
         # Backup state before 85+ LLM calls — single bad rewrite can cascade
         if tr_cfg.get("backup_before", True):
-            import shutil
+            from stages.snapshots import SnapshotStore
             state_file = Path(project_path) / "pipeline_state.json"
             if state_file.exists():
-                backup_path = state_file.with_suffix(".json.pre_targeted_refinement")
                 try:
-                    shutil.copy2(state_file, backup_path)
-                    logger.info("targeted_refinement: backed up state to %s", backup_path.name)
+                    snap = SnapshotStore.for_project(project_path).snapshot_file(
+                        state_file, "pre_targeted_refinement", keep=tr_cfg.get("backup_keep", 5))
+                    logger.info("targeted_refinement: backed up state to snapshot %s", snap["id"])
                 except Exception as e:
                     logger.warning("targeted_refinement: backup failed (continuing): %s", e)
 
@@ -14111,6 +15288,7 @@ OUTPUT the text with only problematic sentences fixed:"""
 
         qc_report = getattr(self.state, "quality_contract_report", None) or {"contracts": contracts}
         triage_data = getattr(self.state, "quality_triage", None) or []
+        from editor_studio.orchestrator import run_editor_studio
         report = await run_editor_studio(
             project_path,
             passes_enabled=passes_enabled,
@@ -14124,6 +15302,8 @@ OUTPUT the text with only problematic sentences fixed:"""
             genre=self.state.config.get("genre", ""),
             skip_persist=True,
             quality_triage=triage_data,
+            mode=tr_cfg.get("mode"),
+            max_concurrent_scenes=tr_cfg.get("max_concurrent_scenes"),
         )
 
         if report.get("errors"):
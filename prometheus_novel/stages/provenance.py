@@ -0,0 +1,145 @@
+"""
+Per-scene, per-stage provenance for incremental recompute.
+
+The checkpoint keeps a small ledger (PipelineState.scene_provenance):
+
+    {scene_key: {"head": <content hash after the last tracked stage>,
+                 "stages": {stage: {"in": hash, "v": version, "cfg": hash, "deps": hash}}}}
+
+A stage's record for a scene says "this stage already processed the scene
+with these inputs". Records are dropped when the inputs can no longer be
+trusted:
+
+  - a stage changes the scene's content  -> records of every later stage go
+  - the content changed outside a tracked stage (head mismatch, e.g. a hand
+    edit between runs)                    -> all records for the scene go
+
+A scene is clean for a stage when its record exists and the stage version,
+config fingerprint and non-scene input fingerprint all still match. Clean
+scenes keep their current content; that content already contains the
+stage's earlier output.
+
+Pure functions and a thin ledger wrapper; the orchestrator owns hashing of
+its own state and decides which stages may skip scenes.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+
+def content_hash(text: Optional[str]) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()[:16]
+
+
+def fingerprint(value: Any) -> str:
+    """Stable hash of a JSON-like value (same before and after a checkpoint round-trip)."""
+    try:
+        blob = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+    except (TypeError, ValueError):
+        blob = repr(value)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def scene_keys(scenes: Sequence[Any]) -> List[str]:
+    """Stable per-scene keys: scene_id, else chNN_sNN, else position. Duplicates get #index."""
+    keys: List[str] = []
+    seen: Set[str] = set()
+    for idx, scene in enumerate(scenes):
+        key = f"idx{idx}"
+        if isinstance(scene, dict):
+            key = scene.get("scene_id") or ""
+            if not key:
+                try:
+                    key = f"ch{int(scene.get('chapter')):02d}_s{int(scene.get('scene_number')):02d}"
+                except (TypeError, ValueError):
+                    key = f"idx{idx}"
+        if key in seen:
+            key = f"{key}#{idx}"
+        seen.add(key)
+        keys.append(key)
+    return keys
+
+
+def scene_hashes(scenes: Sequence[Any]) -> Dict[str, str]:
+    """{scene_key: content hash} for the current scene list."""
+    return {
+        key: content_hash(scene.get("content") if isinstance(scene, dict) else str(scene))
+        for key, scene in zip(scene_keys(scenes), scenes)
+    }
+
+
+class ProvenanceLedger:
+    """View over the checkpointed ledger dict; mutates it in place."""
+
+    def __init__(self, data: Dict[str, Any], order: Sequence[str]):
+        self.data = data
+        self.order = list(order)
+
+    def _later(self, stage: str) -> List[str]:
+        if stage not in self.order:
+            return []
+        return self.order[self.order.index(stage) + 1:]
+
+    def sync(self, hashes: Mapping[str, str]) -> List[str]:
+        """Forget scenes changed outside tracked stages. Returns their keys."""
+        touched = []
+        for key, h in hashes.items():
+            entry = self.data.get(key)
+            if entry is not None and entry.get("head") != h:
+                entry["stages"] = {}
+                entry["head"] = h
+                touched.append(key)
+        return touched
+
+    def is_clean(self, key: str, stage: str, current: str, version: Any, cfg: str, deps: str) -> bool:
+        entry = self.data.get(key)
+        if not entry or entry.get("head") != current:
+            return False
+        rec = entry.get("stages", {}).get(stage)
+        return bool(rec) and rec.get("v") == version and rec.get("cfg") == cfg and rec.get("deps") == deps
+
+    def record(self, stage: str, before: Mapping[str, str], after: Mapping[str, str],
+               version: Any, cfg: str, deps: str, skipped: Iterable[str] = ()) -> int:
+        """Record a completed stage. Returns how many scenes it changed."""
+        skipped = set(skipped)
+        changed = 0
+        for key in list(self.data):
+            if key not in after:
+                del self.data[key]
+        for key, h in after.items():
+            entry = self.data.setdefault(key, {"head": h, "stages": {}})
+            if key in skipped:
+                continue
+            h_in = before.get(key, "")
+            if h != h_in:
+                changed += 1
+                for later in self._later(stage):
+                    entry["stages"].pop(later, None)
+            entry["stages"][stage] = {"in": h_in, "v": version, "cfg": cfg, "deps": deps}
+            entry["head"] = h
+        return changed
+
+    def plan(self, stages: Sequence[str], hashes: Mapping[str, str], expected: Mapping[str, tuple],
+             forced: Iterable[str] = ()) -> Dict[str, List[str]]:
+        """Scenes each stage in ``expected`` would re-process, in run order.
+
+        ``expected`` maps stage -> (version, cfg, deps). A scene that is
+        dirty for one stage is assumed dirty for every later one (the stage
+        may change it). ``forced`` scenes are dirty from the start.
+        """
+        dirty: Set[str] = set(forced)
+        for key, h in hashes.items():
+            entry = self.data.get(key)
+            if not entry or entry.get("head") != h:
+                dirty.add(key)
+        plan: Dict[str, List[str]] = {}
+        for stage in stages:
+            if stage not in expected:
+                continue
+            version, cfg, deps = expected[stage]
+            for key, h in hashes.items():
+                if key not in dirty and not self.is_clean(key, stage, h, version, cfg, deps):
+                    dirty.add(key)
+            plan[stage] = [key for key in hashes if key in dirty]
+        return plan
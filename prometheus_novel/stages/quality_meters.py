@@ -15,6 +15,8 @@ import logging
 from collections import Counter, defaultdict
 from typing import Dict, List, Optional, Tuple
 
+from quality.parsed_scene import parse_scene
+
 logger = logging.getLogger("quality_meters")
 
 
@@ -318,13 +320,7 @@ def _extract_dialogue_by_character(
 
         # Find dialogue + attribution patterns
         # Pattern: "dialogue" followed by attribution
-        for match in re.finditer(
-            r'[\u201c"]([^\u201d"]{10,})[\u201d"][^\u201d"]*?(?:(\w+)\s+(?:said|whispered|murmured|replied|asked|snapped|muttered|called|yelled|answered|demanded|insisted|admitted|suggested|offered|growled|hissed|breathed))',
-            content, re.IGNORECASE
-        ):
-            dialogue_text = match.group(1)
-            speaker_ref = match.group(2).lower()
-
+        for match_start, dialogue_text, speaker_ref in parse_scene(content).attributed_quotes:
             # Determine speaker
             if speaker_ref == "i":
                 # First person = POV character
@@ -336,7 +332,6 @@ def _extract_dialogue_by_character(
                 dialogue_by_char[char_names[speaker_ref]].append(dialogue_text)
             elif speaker_ref in ("she", "he", "they"):
                 # Resolve pronoun by scanning preceding context for character names
-                match_start = match.start()
                 lookback = content[max(0, match_start - 300):match_start].lower()
                 best_char = None
                 best_pos = -1
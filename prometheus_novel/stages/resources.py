@@ -0,0 +1,141 @@
+"""
+Run-scoped registry of file-backed resources (reference bible, YAML configs).
+
+The reference bible and the YAML configs were loaded wherever they were
+needed: scene_drafting, continuity_audit and voice_human_pass each parsed
+reference_bible.md again, the quality passes re-read cliche_clusters.yaml,
+the phrase banks and the hot-phrase files on every call, and
+cleanup_patterns.yaml sat in a module global that never noticed edits.
+
+ResourceRegistry loads each artifact once and keeps the parsed form,
+keyed by kind and path:
+
+  - every lookup stats the file; an unchanged (mtime_ns, size) is a hit
+  - a changed stat re-hashes the bytes and only different content is
+    parsed again (a touch, or a rewrite with the same content, stays cached)
+  - a missing file is remembered as missing until it appears
+
+PipelineOrchestrator publishes its registry with use_resources() for the
+duration of run() (and while loading the policy), so stage code, the
+quality modules, the policy loader and Editor Studio all share it through
+resources(). Outside a run resources() is one process-wide registry, so
+one-off callers still get caching and invalidation.
+
+Parsed YAML is handed out as a deep copy unless the caller passes
+copy=False and only reads it. Loaders that fail are not cached: the error
+goes to the caller, as with the direct reads this replaces.
+"""
+
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import yaml
+
+_MISSING = object()
+
+_current: ContextVar[Optional["ResourceRegistry"]] = ContextVar("prometheus_run_resources", default=None)
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_yaml(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+class _Entry:
+    __slots__ = ("signature", "digest", "value")
+
+    def __init__(self, signature, digest, value):
+        self.signature = signature
+        self.digest = digest
+        self.value = value
+
+
+class ResourceRegistry:
+    """Parsed file artifacts, reloaded only when the file content changes."""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, kind: str, path: Union[Path, str], loader: Callable[[Path], Any],
+            default: Any = None) -> Any:
+        """loader(path), parsed once per content of ``path``; ``default`` if it is missing."""
+        key = (kind, os.path.abspath(path))
+        with self._lock:
+            signature = _signature(key[1])
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self.hits += 1
+                return default if signature is None else entry.value
+            if signature is None:
+                self._entries[key] = _Entry(None, None, None)
+                return default
+            digest = hashlib.sha1(Path(key[1]).read_bytes()).hexdigest()
+            if entry is not None and entry.digest == digest:
+                entry.signature = signature
+                self.hits += 1
+                return entry.value
+            value = loader(Path(path))
+            self._entries[key] = _Entry(signature, digest, value)
+            self.loads += 1
+            return value
+
+    def yaml(self, path: Union[Path, str], default: Any = None, copy: bool = True) -> Any:
+        """yaml.safe_load of ``path`` (None for an empty file); ``default`` if it is missing."""
+        data = self.get("yaml", path, _load_yaml, default=_MISSING)
+        if data is _MISSING:
+            return default
+        return deepcopy(data) if copy else data
+
+    def bible(self, path: Union[Path, str]):
+        """Shared ReferenceBible for ``path`` (None if it is missing). Treat as read-only."""
+        from stages.bible_loader import ReferenceBible
+        return self.get("reference_bible", path, ReferenceBible)
+
+    def invalidate(self, path: Union[Path, str, None] = None) -> None:
+        """Drop cached entries for ``path`` (every kind), or everything."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            target = os.path.abspath(path)
+            for key in [k for k in self._entries if k[1] == target]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "loads": self.loads}
+
+
+_process_registry = ResourceRegistry()
+
+
+def resources() -> ResourceRegistry:
+    """The current run's registry, or the process-wide one outside a run."""
+    registry = _current.get()
+    return _process_registry if registry is None else registry
+
+
+@contextmanager
+def use_resources(registry: ResourceRegistry):
+    """Publish ``registry`` to the current task (and tasks it creates)."""
+    token = _current.set(registry)
+    try:
+        yield registry
+    finally:
+        _current.reset(token)
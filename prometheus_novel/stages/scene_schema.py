@@ -0,0 +1,211 @@
+"""
+Scene / Chapter schema validation and fast state (de)serialization.
+
+Scenes travel through the pipeline as plain dicts (state.scenes), read
+with isinstance(s, dict) filters and .get() chains, and checkpoints were
+written with json.dump(indent=2). This module checks them where state
+enters the process and speeds up the encode/decode around it:
+
+  - SCENE_FIELDS / CHAPTER_FIELDS give the types of the fields every
+    drafted scene / outline chapter carries. check_scene() and
+    check_chapter() coerce what can be coerced safely (numeric strings for
+    chapter / scene_number, numbers for pov, ...) and report the rest;
+    validate_state() applies them to a whole checkpoint and keeps plain
+    dicts and key order. Other keys (stage flags such as "refined",
+    structure-repair history) are left alone.
+  - dumps_json / loads_json use orjson when it is installed and fall back
+    to the stdlib json module; dumps_msgpack / loads_msgpack need the
+    optional msgpack package.
+
+Checkpoint load, Editor Studio's state load and the dashboard's WebSocket
+payloads go through this module. scripts/bench_state_codec.py measures
+codec speed.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional: MessagePack encoding
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+SCENE_FIELDS: Dict[str, type] = {
+    "scene_id": str,
+    "chapter": int,
+    "scene_number": int,
+    "pov": str,
+    "location": str,
+    "content": str,
+    "spice_level": int,
+    "tension_level": int,
+    "scene_function": str,
+    "scene_profile": dict,
+}
+SCENE_REQUIRED = ("chapter", "scene_number")
+
+CHAPTER_FIELDS: Dict[str, type] = {
+    "chapter": int,
+    "chapter_title": str,
+    "scenes": list,
+}
+CHAPTER_REQUIRED = ("chapter",)
+
+
+class SchemaError(ValueError):
+    """A scene or chapter that cannot be coerced to the schema (strict mode)."""
+
+
+def _coerce(value: Any, expected: type) -> Any:
+    """``value`` as ``expected``; raises TypeError/ValueError when that is not a safe conversion."""
+    if expected is int:
+        if isinstance(value, bool):
+            raise TypeError("bool is not an int field")
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+            return int(value.strip())
+    elif expected is str and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise TypeError(f"expected {expected.__name__}, got {type(value).__name__}")
+
+
+def _check(data: Dict[str, Any], fields: Dict[str, type], required: Tuple[str, ...],
+           strict: bool, where: str) -> Tuple[Dict[str, Any], List[str]]:
+    """``data`` with field types coerced (a copy, same key order, if anything changed) and the issues found.
+
+    Missing required fields and values that cannot be coerced are reported
+    and left as they are, or raise SchemaError when ``strict``.
+    """
+    errors: List[str] = []
+    coerced: List[str] = []
+    fixed = data
+    for key in required:
+        if fixed.get(key) is None:
+            errors.append(f"{where}: missing {key}")
+    for key, expected in fields.items():
+        value = fixed.get(key)
+        if value is None or (isinstance(value, expected) and not
+                             (expected is int and isinstance(value, bool))):
+            continue
+        try:
+            if fixed is data:
+                fixed = dict(data)
+            fixed[key] = _coerce(value, expected)
+            coerced.append(f"{where}: coerced {key} {value!r} -> {fixed[key]!r}")
+        except (TypeError, ValueError) as e:
+            errors.append(f"{where}: invalid {key} ({e})")
+    if strict and errors:
+        raise SchemaError("; ".join(errors))
+    return fixed, errors + coerced
+
+
+def check_scene(data: Dict[str, Any], strict: bool = False,
+                where: str = "scene") -> Tuple[Dict[str, Any], List[str]]:
+    """One state.scenes entry checked against SCENE_FIELDS; see _check."""
+    return _check(data, SCENE_FIELDS, SCENE_REQUIRED, strict, where)
+
+
+def check_chapter(data: Dict[str, Any], strict: bool = False,
+                  where: str = "chapter") -> Tuple[Dict[str, Any], List[str]]:
+    """One master_outline chapter checked against CHAPTER_FIELDS; see _check."""
+    return _check(data, CHAPTER_FIELDS, CHAPTER_REQUIRED, strict, where)
+
+
+def validate_state(data: Dict[str, Any], strict: bool = False) -> Tuple[Dict[str, Any], List[str]]:
+    """Checkpoint dict with scenes and outline chapters coerced to the schema, plus issues.
+
+    Non-dict entries are kept (stage code skips them) and reported.
+    """
+    issues: List[str] = []
+    data = dict(data)
+    for key, check in (("scenes", check_scene), ("master_outline", check_chapter)):
+        entries = data.get(key)
+        if not isinstance(entries, list):
+            continue
+        checked = []
+        for idx, entry in enumerate(entries):
+            if isinstance(entry, dict):
+                entry, found = check(entry, strict=strict, where=f"{key}[{idx}]")
+                issues.extend(found)
+            else:
+                issues.append(f"{key}[{idx}]: not an object ({type(entry).__name__})")
+                if strict:
+                    raise SchemaError(issues[-1])
+            checked.append(entry)
+        data[key] = checked
+    return data, issues
+
+
+# ----------------------------------------------------------------------
+# Codecs
+# ----------------------------------------------------------------------
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(value: Any, indent: bool = False) -> bytes:
+    """UTF-8 JSON (2-space indent when ``indent``); sets and tuples encode as arrays."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(value, default=_default, option=option)
+        except TypeError:
+            pass  # integers beyond 64 bits, lone surrogates: the stdlib encoder handles those
+    text = json.dumps(value, default=_default, ensure_ascii=False, indent=2 if indent else None)
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates (e.g. a truncated emoji in model output) only survive as \u escapes
+        return json.dumps(value, default=_default, ensure_ascii=True,
+                          indent=2 if indent else None).encode("ascii")
+
+
+def loads_json(data) -> Any:
+    """Parse JSON from bytes or str (ValueError on malformed input).
+
+    orjson rejects some input the stdlib accepts and wrote into older
+    checkpoints (lone surrogate escapes such as "\\ud83d", NaN), so its
+    failures are retried with the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_msgpack(value: Any) -> bytes:
+    if msgpack is None:
+        raise RuntimeError("MessagePack encoding needs the msgpack package (pip install msgpack)")
+    return msgpack.packb(value, default=_default, use_bin_type=True)
+
+
+def loads_msgpack(data: bytes) -> Any:
+    if msgpack is None:
+        raise RuntimeError("MessagePack decoding needs the msgpack package (pip install msgpack)")
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def load_state_file(path, strict: bool = False) -> Dict[str, Any]:
+    """Read and validate a pipeline_state.json; schema issues are logged."""
+    with open(path, "rb") as f:
+        data = loads_json(f.read())
+    if not isinstance(data, dict):
+        raise SchemaError(f"{path}: top level is not an object")
+    data, issues = validate_state(data, strict=strict)
+    if issues:
+        logger.warning("%s: %d schema issue(s), first: %s", path, len(issues), issues[0])
+    return data
@@ -0,0 +1,240 @@
+"""
+Content-addressed snapshot store for pipeline state backups.
+
+Backups used to be full copies of pipeline_state.json next to it
+(pipeline_state.json.pre_targeted_refinement, .pre_editorial_cleanup):
+an uncompressed manuscript per copy, although most scenes are identical
+between backups. SnapshotStore keeps them under <project>/.snapshots:
+
+  objects/ab/cdef...   zlib-compressed blobs named by the SHA-256 of their
+                       uncompressed bytes; each scene is one blob and the
+                       rest of the state (outline, bible, reports) another
+  manifests/<id>.json  a snapshot: name, label, creation time, the state
+                       blob and the ordered list of scene blobs
+
+A snapshot only writes blobs the store does not have yet, so taking one
+costs about one serialisation pass plus the changed scenes; restoring
+reassembles the state and writes it atomically. diff() compares two
+snapshots scene by scene (keys from stages.provenance.scene_keys) without
+decompressing unchanged scenes. Deleting or pruning manifests leaves
+unreferenced blobs behind until gc().
+
+Snapshot ids are "<timestamp>-<name>"; every call that takes a snapshot
+reference also accepts a bare name, meaning the latest snapshot of that
+name.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from stages.provenance import scene_keys
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = ".snapshots"
+STATE_FILE = "pipeline_state.json"
+COMPRESSION_LEVEL = 6
+
+# Placeholder kept in the state blob so restore puts "scenes" back in its original key position
+_SCENES_SLOT = "__snapshot_scenes__"
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class SnapshotStore:
+    """Deduplicated, compressed snapshots of one project's pipeline state."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.manifests = self.root / "manifests"
+
+    @classmethod
+    def for_project(cls, project_path) -> "SnapshotStore":
+        return cls(Path(project_path) / SNAPSHOT_DIR)
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+    def _put(self, data: bytes) -> Tuple[str, int]:
+        """Store a blob once; returns (digest, bytes written)."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        packed = zlib.compress(data, COMPRESSION_LEVEL)
+        _atomic_write(path, packed)
+        return digest, len(packed)
+
+    def _get(self, digest: str) -> Any:
+        with open(self._object_path(digest), "rb") as f:
+            return json.loads(zlib.decompress(f.read()).decode("utf-8"))
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self, state: Dict[str, Any], name: str, label: str = "",
+                 keep: Optional[int] = None) -> Dict[str, Any]:
+        """Store ``state`` as a new snapshot called ``name``; returns its manifest.
+
+        With ``keep``, older snapshots of the same name beyond the newest
+        ``keep`` are pruned and their unreferenced blobs collected.
+        """
+        scenes = state.get("scenes") or []
+        base = _encode({k: (_SCENES_SLOT if k == "scenes" else v) for k, v in state.items()})
+        base_digest, written = self._put(base)
+        scene_digests = []
+        raw_bytes = len(base)
+        for scene in scenes:
+            data = _encode(scene)
+            raw_bytes += len(data)
+            digest, n = self._put(data)
+            scene_digests.append(digest)
+            written += n
+        created = datetime.now()
+        manifest = {
+            "id": f"{created.strftime('%Y%m%d-%H%M%S-%f')}-{name}",
+            "name": name,
+            "label": label,
+            "created": created.isoformat(),
+            "state": base_digest,
+            "scenes": scene_digests,
+            "scene_keys": scene_keys(scenes),
+            "raw_bytes": raw_bytes,
+            "written_bytes": written,
+        }
+        self.manifests.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.manifests / f"{manifest['id']}.json",
+                      json.dumps(manifest, indent=2).encode("utf-8"))
+        logger.info("Snapshot %s: %d scenes, %d new bytes stored", manifest["id"], len(scenes), written)
+        if keep is not None:
+            self.prune(name, keep)
+        return manifest
+
+    def snapshot_file(self, state_file, name: str, label: str = "",
+                      keep: Optional[int] = None) -> Dict[str, Any]:
+        """Snapshot a pipeline_state.json on disk."""
+        with open(state_file, encoding="utf-8") as f:
+            state = json.load(f)
+        return self.snapshot(state, name, label or Path(state_file).name, keep=keep)
+
+    def list(self, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Manifests, oldest first (optionally only those called ``name``)."""
+        if not self.manifests.is_dir():
+            return []
+        found = []
+        for path in self.manifests.glob("*.json"):
+            try:
+                manifest = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if name is None or manifest.get("name") == name:
+                found.append(manifest)
+        return sorted(found, key=lambda m: m["id"])
+
+    def manifest(self, ref: str) -> Dict[str, Any]:
+        """Manifest by id, or the latest snapshot named ``ref``."""
+        path = self.manifests / f"{ref}.json"
+        if path.exists():
+            return json.loads(path.read_text(encoding="utf-8"))
+        named = self.list(ref)
+        if not named:
+            raise KeyError(f"No snapshot {ref!r} in {self.root}")
+        return named[-1]
+
+    def load(self, ref: str) -> Dict[str, Any]:
+        """The state dict stored in a snapshot."""
+        manifest = self.manifest(ref)
+        state = self._get(manifest["state"])
+        scenes = [self._get(d) for d in manifest["scenes"]]
+        if "scenes" in state:
+            state["scenes"] = scenes
+        return state
+
+    def restore(self, ref: str, state_file) -> Dict[str, Any]:
+        """Write a snapshot back to ``state_file`` (atomic); returns its manifest."""
+        manifest = self.manifest(ref)
+        state = self.load(manifest["id"])
+        _atomic_write(Path(state_file), json.dumps(state, indent=2).encode("utf-8"))
+        logger.info("Restored snapshot %s to %s", manifest["id"], state_file)
+        return manifest
+
+    def diff(self, old_ref: str, new_ref: str) -> Dict[str, Any]:
+        """Scene-level changes between two snapshots (by scene key)."""
+        old, new = self.manifest(old_ref), self.manifest(new_ref)
+        old_scenes = dict(zip(old["scene_keys"], old["scenes"]))
+        new_scenes = dict(zip(new["scene_keys"], new["scenes"]))
+        return {
+            "old": old["id"],
+            "new": new["id"],
+            "added": [k for k in new["scene_keys"] if k not in old_scenes],
+            "removed": [k for k in old["scene_keys"] if k not in new_scenes],
+            "changed": [k for k in new["scene_keys"]
+                        if k in old_scenes and old_scenes[k] != new_scenes[k]],
+            "unchanged": sum(1 for k, d in new_scenes.items() if old_scenes.get(k) == d),
+            "state_changed": old["state"] != new["state"],
+        }
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+
+    def delete(self, ref: str) -> None:
+        manifest = self.manifest(ref)
+        (self.manifests / f"{manifest['id']}.json").unlink()
+
+    def prune(self, name: str, keep: int) -> int:
+        """Delete all but the newest ``keep`` snapshots of ``name``, then gc(); returns the count deleted."""
+        stale = self.list(name)[:-keep] if keep > 0 else self.list(name)
+        for manifest in stale:
+            (self.manifests / f"{manifest['id']}.json").unlink()
+        if stale:
+            self.gc()
+        return len(stale)
+
+    def gc(self) -> Dict[str, int]:
+        """Remove blobs no manifest references."""
+        live = set()
+        for manifest in self.list():
+            live.add(manifest["state"])
+            live.update(manifest["scenes"])
+        removed = freed = 0
+        if self.objects.is_dir():
+            for path in self.objects.glob("*/*"):
+                if path.parent.name + path.name not in live:
+                    freed += path.stat().st_size
+                    path.unlink()
+                    removed += 1
+        return {"removed_objects": removed, "freed_bytes": freed}
+
+    def disk_usage(self) -> Dict[str, int]:
+        """Blob count and bytes on disk, plus the uncompressed size of all snapshots."""
+        sizes = [p.stat().st_size for p in self.objects.glob("*/*")] if self.objects.is_dir() else []
+        manifests = self.list()
+        return {
+            "snapshots": len(manifests),
+            "objects": len(sizes),
+            "stored_bytes": sum(sizes),
+            "raw_bytes": sum(m.get("raw_bytes", 0) for m in manifests),
+        }
@@ -0,0 +1,162 @@
+"""
+Stage dependency graph and critical-path report for the pipeline scheduler.
+
+Each stage declares the PipelineState fields it reads and writes
+(PipelineOrchestrator.STAGE_IO). Dependencies follow from the stage order
+plus those declarations — for an earlier stage A and later stage B, B waits
+for A when:
+
+  - B reads a field A writes              (read-after-write)
+  - B writes a field A reads              (write-after-read: A must see the old value)
+  - both write the same field             (write-after-write: keep STAGES order)
+
+Anything not declared, or declared with ALL, is a full barrier. Stages that
+only share reads run concurrently.
+
+Accumulators every stage touches (token/cost totals, artifact_metrics,
+stage_results) are deliberately left out of the declarations; the run loop
+merges them after each stage.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Wildcard: reads/writes every field (barrier)
+ALL = "*"
+
+
+@dataclass(frozen=True)
+class StageIO:
+    """Declared state fields a stage reads and writes."""
+    reads: FrozenSet[str] = frozenset()
+    writes: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def of(cls, reads: Iterable[str] = (), writes: Iterable[str] = ()) -> "StageIO":
+        return cls(frozenset(reads), frozenset(writes))
+
+    @property
+    def fields(self) -> FrozenSet[str]:
+        return self.reads | self.writes
+
+
+BARRIER = StageIO.of(reads=[ALL], writes=[ALL])
+
+
+def _overlap(a: FrozenSet[str], b: FrozenSet[str]) -> bool:
+    if not a or not b:
+        return False
+    return ALL in a or ALL in b or not a.isdisjoint(b)
+
+
+def conflicts(earlier: StageIO, later: StageIO) -> bool:
+    """True when ``later`` must wait for ``earlier``."""
+    return (
+        _overlap(earlier.writes, later.reads)
+        or _overlap(earlier.reads, later.writes)
+        or _overlap(earlier.writes, later.writes)
+    )
+
+
+def stage_dependencies(order: List[str], io: Mapping[str, StageIO]) -> Dict[str, Set[str]]:
+    """Map each stage in ``order`` to the earlier stages it must wait for.
+
+    Only direct conflicts are listed; transitive ordering follows from them.
+    Stages missing from ``io`` are barriers.
+    """
+    deps: Dict[str, Set[str]] = {}
+    for i, name in enumerate(order):
+        mine = io.get(name, BARRIER)
+        deps[name] = {prev for prev in order[:i] if conflicts(io.get(prev, BARRIER), mine)}
+    return deps
+
+
+@dataclass
+class StageTimeline:
+    """Start/end offsets (seconds from run start) for scheduled stages."""
+    started_at: float = field(default_factory=time.monotonic)
+    spans: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    status: Dict[str, str] = field(default_factory=dict)
+    _open: Dict[str, float] = field(default_factory=dict)
+
+    def start(self, name: str) -> None:
+        self._open[name] = time.monotonic() - self.started_at
+
+    def finish(self, name: str, status: str = "completed") -> None:
+        start = self._open.pop(name, 0.0)
+        self.spans[name] = (start, time.monotonic() - self.started_at)
+        self.status[name] = status
+
+
+def critical_path(
+    spans: Mapping[str, Tuple[float, float]],
+    deps: Mapping[str, Set[str]],
+    slack: float = 0.05,
+) -> List[Dict[str, object]]:
+    """Chain of stages that bounds wall time, in run order.
+
+    Walks back from the last stage to finish. At each step the predecessor
+    is the dependency that finished last ("dependency"). If the stage started
+    well after all its dependencies, it was waiting for a scheduler slot, and
+    the stage whose finish freed that slot is used instead ("slot").
+    """
+    if not spans:
+        return []
+    current: Optional[str] = max(spans, key=lambda s: spans[s][1])
+    chain: List[Dict[str, object]] = []
+    seen: Set[str] = set()
+    while current is not None and current not in seen:
+        seen.add(current)
+        start, end = spans[current]
+        timed_deps = [d for d in deps.get(current, ()) if d in spans]
+        dep = max(timed_deps, key=lambda d: spans[d][1]) if timed_deps else None
+        via = "start"
+        prev = None
+        if dep is not None and start - spans[dep][1] <= slack:
+            prev, via = dep, "dependency"
+        else:
+            freed = [s for s in spans if s != current and s not in seen and 0 <= start - spans[s][1] <= slack]
+            if freed:
+                prev, via = max(freed, key=lambda s: spans[s][1]), "slot"
+            elif dep is not None:
+                prev, via = dep, "dependency"
+        chain.append({
+            "stage": current,
+            "start": round(start, 3),
+            "duration": round(end - start, 3),
+            "via": via if prev else "start",
+        })
+        current = prev
+    chain.reverse()
+    return chain
+
+
+def schedule_report(
+    timeline: StageTimeline,
+    deps: Mapping[str, Set[str]],
+    max_concurrent: int,
+) -> Dict[str, object]:
+    """Wall time vs summed stage time, per-stage spans and the critical path."""
+    spans = timeline.spans
+    wall = max((end for _, end in spans.values()), default=0.0)
+    stage_total = sum(end - start for start, end in spans.values())
+    path = critical_path(spans, deps)
+    return {
+        "max_concurrent": max_concurrent,
+        "wall_seconds": round(wall, 3),
+        "stage_seconds": round(stage_total, 3),
+        "parallelism": round(stage_total / wall, 2) if wall > 0 else 1.0,
+        "critical_path_seconds": round(sum(step["duration"] for step in path), 3),
+        "critical_path": path,
+        "stages": {
+            name: {
+                "start": round(start, 3),
+                "end": round(end, 3),
+                "duration": round(end - start, 3),
+                "status": timeline.status.get(name, "completed"),
+                "depends_on": sorted(d for d in deps.get(name, ()) if d in spans),
+            }
+            for name, (start, end) in sorted(spans.items(), key=lambda kv: kv[1][0])
+        },
+    }
@@ -0,0 +1,209 @@
+"""
+Run-scoped telemetry sinks (cleanup morgue, incident log).
+
+The morgue and incident log used to be module-level lists flushed at
+output validation. Two pipelines in one process (the web server) shared
+them, so entries landed in the wrong project's JSONL, and the flush was a
+blocking write on the event loop.
+
+Each PipelineOrchestrator.run() now opens a RunTelemetry through
+run_telemetry(project_path); it is published in a ContextVar, so stage
+tasks spawned by that run (they copy the context) log into it and a
+concurrent run sees its own. Each JsonlSink is a bounded in-memory queue
+drained by a background task that appends batches in a worker thread and
+handles size-based rotation. Closing the run drains everything.
+
+Records are stamped with the run nonce. Once the run's AnalyticsStore is
+known, attach_store() mirrors every written batch into its incidents and
+morgue tables (stages.analytics).
+
+Outside a run (tests, one-off helpers) current_telemetry() is None and
+callers keep their synchronous fallback.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MORGUE_FILE = "cleanup_morgue.jsonl"
+INCIDENT_FILE = "incidents.jsonl"
+MORGUE_MAX_BYTES = 5 * 1024 * 1024
+
+_current: ContextVar[Optional["RunTelemetry"]] = ContextVar("prometheus_run_telemetry", default=None)
+
+
+def append_jsonl(path: Path, entries: List[Dict[str, Any]], max_bytes: Optional[int] = None) -> None:
+    """Append entries as JSON lines, rotating to <name>.old first when over max_bytes."""
+    if max_bytes and path.exists() and path.stat().st_size > max_bytes:
+        rotated = path.with_suffix(path.suffix + ".old")
+        try:
+            if rotated.exists():
+                rotated.unlink()
+            path.rename(rotated)
+            logger.info(f"{path.name} rotated (>{max_bytes // (1024 * 1024)}MB)")
+        except Exception as e:
+            logger.warning(f"{path.name} rotation failed: {e}")
+    with open(path, "a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+class JsonlSink:
+    """Bounded queue of JSON records appended to one file by a background writer."""
+
+    def __init__(self, path: Path, max_bytes: Optional[int] = None, max_queue: int = 10000,
+                 batch_size: int = 256, flush_interval: float = 1.0,
+                 defaults: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.defaults = defaults or {}
+        self.mirror: Optional[Callable[[List[Dict[str, Any]]], Any]] = None  # also gets each written batch
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: "deque[Dict[str, Any]]" = deque(maxlen=max_queue)
+        self.count = 0      # records accepted
+        self.written = 0
+        self.dropped = 0    # oldest records pushed out of a full queue
+        self._task: Optional["asyncio.Task"] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing = False
+        self._write_lock = threading.Lock()
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        """Queue a record without blocking (safe from sync code and worker threads)."""
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        if self.defaults:
+            entry = {**self.defaults, **entry}
+        self.queue.append(entry)
+        self.count += 1
+        if len(self.queue) >= self.batch_size:
+            self.kick()
+
+    def kick(self) -> None:
+        """Wake the writer now instead of at the next interval."""
+        if self._wake is None or self._loop is None or self._loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wake.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _take(self) -> List[Dict[str, Any]]:
+        batch = []
+        while self.queue and len(batch) < self.batch_size:
+            batch.append(self.queue.popleft())
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        with self._write_lock:
+            try:
+                append_jsonl(self.path, batch, self.max_bytes)
+                self.written += len(batch)
+            except Exception as e:
+                logger.warning(f"Failed to write {self.path.name}: {e}")
+            if self.mirror is not None:
+                try:
+                    self.mirror(batch)
+                except Exception as e:
+                    logger.warning(f"Failed to mirror {self.path.name} batch: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            while self.queue:
+                await asyncio.to_thread(self._write, self._take())
+            if self._closing:
+                return
+
+    def start(self) -> None:
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Drain the queue and stop the writer."""
+        self._closing = True
+        if self._task is not None:
+            self._wake.set()
+            try:
+                await self._task
+            except Exception as e:
+                logger.warning(f"Telemetry writer for {self.path.name} failed: {e}")
+            self._task = None
+        self.flush_sync()
+        if self.dropped:
+            logger.warning(f"{self.path.name}: {self.dropped} records dropped (queue full)")
+
+    def flush_sync(self) -> None:
+        """Write whatever is queued, blocking (no writer task / shutdown)."""
+        while self.queue:
+            self._write(self._take())
+
+
+class RunTelemetry:
+    """Morgue and incident sinks for one pipeline run."""
+
+    def __init__(self, project_path, run_nonce: str = "", **sink_options):
+        root = Path(project_path)
+        self.project = root.name
+        self.run_nonce = run_nonce
+        defaults = {"run_nonce": run_nonce} if run_nonce else None
+        self.morgue = JsonlSink(root / MORGUE_FILE, max_bytes=MORGUE_MAX_BYTES,
+                                defaults=defaults, **sink_options)
+        self.incidents = JsonlSink(root / INCIDENT_FILE, defaults=defaults, **sink_options)
+
+    def attach_store(self, store) -> None:
+        """Mirror batches written from now on into an AnalyticsStore."""
+        morgue_seen: Counter = Counter()
+        incidents_seen: Counter = Counter()
+        self.morgue.mirror = lambda batch: store.add_morgue(
+            self.project, batch, self.run_nonce, seen=morgue_seen)
+        self.incidents.mirror = lambda batch: store.add_incidents(
+            self.project, batch, self.run_nonce, seen=incidents_seen)
+
+    def start(self) -> None:
+        self.morgue.start()
+        self.incidents.start()
+
+    async def close(self) -> None:
+        await asyncio.gather(self.morgue.close(), self.incidents.close())
+        if self.morgue.written:
+            logger.info(f"Cleanup morgue: {self.morgue.written} deletions logged to {self.morgue.path}")
+        if self.incidents.written:
+            logger.info(f"Incidents: {self.incidents.written} events logged to {self.incidents.path}")
+
+
+def current_telemetry() -> Optional[RunTelemetry]:
+    return _current.get()
+
+
+@asynccontextmanager
+async def run_telemetry(project_path, run_nonce: str = "", **sink_options):
+    """Scope a RunTelemetry to the current task (and tasks it creates)."""
+    telemetry = RunTelemetry(project_path, run_nonce, **sink_options)
+    telemetry.start()
+    token = _current.set(telemetry)
+    try:
+        yield telemetry
+    finally:
+        _current.reset(token)
+        await telemetry.close()
@@ -84,6 +84,29 @@ def project_with_config(temp_project_dir: Path, sample_config: dict) -> Path:
     return temp_project_dir
 
 
+@pytest.fixture
+def stub_orchestrator(project_with_config: Path):
+    """Factory for a PipelineOrchestrator on project_with_config with in-memory state.
+
+    stub_orchestrator(config=None, client=None, clients=None, **state_fields):
+    config is laid over a minimal {"project_name", "title"}; ``client`` is the
+    default LLM client (also registered as "gpt" unless ``clients`` is given);
+    remaining keywords are PipelineState fields. No initialize(), no I/O.
+    """
+    from stages.pipeline import PipelineOrchestrator, PipelineState
+
+    def make(config: dict = None, client=None, clients: dict = None, **state_fields):
+        config = {"project_name": "test-novel", "title": "Test Novel", **(config or {})}
+        if clients is None:
+            clients = {"gpt": client} if client is not None else {}
+        orch = PipelineOrchestrator(project_with_config, llm_client=client, llm_clients=clients)
+        orch.state = PipelineState(project_name=config["project_name"], project_path=project_with_config,
+                                   config=config, **state_fields)
+        return orch
+
+    return make
+
+
 # ============================================================================
 # Smoke Test Fixtures (for pytest -m smoke)
 # ============================================================================
@@ -139,3 +139,84 @@ class TestDashboardPages:
 
         assert response.status_code == 200
         assert "Settings" in response.text
+
+
+class _FakeSocket:
+    """Minimal WebSocket stand-in recording sent payloads."""
+
+    def __init__(self, delay: float = 0.0):
+        self.sent = []
+        self.delay = delay
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        import asyncio
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(payload)
+
+
+class TestConnectionManagerFanout:
+    """Tests for topic subscriptions, bounded queues and progress coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_topic_filtering(self):
+        import asyncio
+        import json
+        from prometheus_novel.interfaces.web.app import ConnectionManager
+
+        mgr = ConnectionManager(progress_rate_hz=0)
+        a, b, firehose = _FakeSocket(), _FakeSocket(), _FakeSocket()
+        for ws in (a, b, firehose):
+            await mgr.connect(ws)
+        mgr.subscribe(a, "project:alpha")
+        mgr.subscribe(b, "project:beta")
+
+        await mgr.broadcast({"type": "generation_complete", "project": "alpha"})
+        await asyncio.sleep(0.01)
+
+        assert [json.loads(p)["project"] for p in a.sent] == ["alpha"]
+        assert b.sent == []
+        assert len(firehose.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_client_drops_oldest(self):
+        import asyncio
+        import json
+        from prometheus_novel.interfaces.web.app import ConnectionManager
+
+        mgr = ConnectionManager(queue_size=2, progress_rate_hz=0)
+        slow, fast = _FakeSocket(delay=0.05), _FakeSocket()
+        await mgr.connect(slow)
+        await mgr.connect(fast)
+
+        for i in range(6):
+            await mgr.broadcast({"type": "generation_stream", "chunk": str(i)})
+            await asyncio.sleep(0.001)
+        assert len(fast.sent) == 6
+
+        await asyncio.sleep(0.2)
+        chunks = [json.loads(p)["chunk"] for p in slow.sent]
+        assert chunks[-1] == "5"
+        assert len(chunks) < 6
+
+    @pytest.mark.asyncio
+    async def test_progress_coalesced_and_flushed_before_completion(self):
+        import asyncio
+        import json
+        from prometheus_novel.interfaces.web.app import ConnectionManager
+
+        mgr = ConnectionManager(progress_rate_hz=2)
+        ws = _FakeSocket()
+        await mgr.connect(ws)
+
+        for pct in range(10):
+            await mgr.broadcast({"type": "generation_progress", "generation_id": "g1", "progress": pct})
+        await mgr.broadcast({"type": "generation_complete", "generation_id": "g1"})
+        await asyncio.sleep(0.01)
+
+        msgs = [json.loads(p) for p in ws.sent]
+        assert [m.get("progress") for m in msgs] == [0, 9, None]
+        assert msgs[-1]["type"] == "generation_complete"
@@ -1,7 +1,7 @@
 """Full book production runner for Burning Vows.
 
 Runs the ENTIRE pipeline (all 27 stages) using the pipeline's own run() method
-which handles state saving, checkpoint resume, parallel groups, circuit breakers,
+which handles state saving, checkpoint resume, stage scheduling, circuit breakers,
 and all defense infrastructure.
 
 Usage:
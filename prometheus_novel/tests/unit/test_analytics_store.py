@@ -0,0 +1,157 @@
+"""Tests for the SQLite run analytics store (stages.analytics + pipeline wiring)."""
+
+import asyncio
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from stages.analytics import AnalyticsStore, flatten_metrics
+from stages.pipeline import StageResult, StageStatus
+from stages.telemetry import run_telemetry
+
+
+def _metrics(preamble, scenes=10, failed=0):
+    return {"total_scenes_generated": scenes, "scenes_with_preamble": preamble,
+            "per_stage": {"scene_drafting": {"scenes": scenes, "failed": failed}}}
+
+
+def _write_jsonl(path, entries):
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries), encoding="utf-8")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return AnalyticsStore(tmp_path / "analytics.db")
+
+
+class TestStore:
+    def test_flatten_metrics(self):
+        flat = flatten_metrics({"a": 1, "b": {"c": 2.5, "d": True, "e": "x"}})
+        assert flat == {"a": 1.0, "b.c": 2.5}
+
+    def test_run_over_run_delta(self, store):
+        store.record_run("novel", "r1", "2026-01-01T10:00:00", _metrics(2))
+        store.record_run("novel", "r2", "2026-01-02T10:00:00", _metrics(5, failed=3),
+                         budget={"defense_tokens": 100})
+        assert store.previous_run("novel", "r2")["run_nonce"] == "r1"
+        assert store.previous_run("novel", "r1") is None
+        delta = store.run_delta("novel")
+        assert delta["scenes_with_preamble"] == {"previous": 2.0, "current": 5.0, "change": 3.0}
+        assert delta["per_stage.scene_drafting.failed"]["change"] == 3.0
+        assert delta["budget.defense_tokens"]["current"] == 100.0
+        assert "total_scenes_generated" not in delta
+
+    def test_rerecord_replaces_children(self, store):
+        scenes = [{"scene_id": "ch1_s1", "chapter": 1, "content": "one two three"}]
+        store.record_run("novel", "r1", "t1", _metrics(1), scenes=scenes,
+                         stage_results=[{"stage_name": "scene_drafting", "status": "failed"}])
+        store.record_run("novel", "r1", "t1", _metrics(1), scenes=scenes,
+                         stage_results=[{"stage_name": "scene_drafting", "status": "completed"}])
+        assert len(store.runs("novel")) == 1
+        assert store.stage_stats("scene_drafting") == [{
+            "project": "novel", "stage": "scene_drafting", "runs": 1, "failed": 0,
+            "mean_seconds": 0.0, "mean_tokens": 0.0}]
+        with store.connect() as conn:
+            assert conn.execute("SELECT word_count FROM scene_metrics").fetchall()[0][0] == 3
+
+    def test_cross_project_trend(self, store):
+        for project, values in (("a", [1, 2, 3]), ("b", [7])):
+            for i, v in enumerate(values):
+                store.record_run(project, f"{project}{i}", f"2026-01-0{i + 1}", _metrics(v))
+        trend = store.trend("scenes_with_preamble")
+        assert [(r["project"], r["value"]) for r in trend] == [("a", 1), ("a", 2), ("a", 3), ("b", 7)]
+        assert [r["value"] for r in store.trend("scenes_with_preamble", projects=["a"], last=2)] == [2, 3]
+
+    def test_incidents_deduplicated(self, store):
+        entry = {"timestamp": "t", "stage": "scene_drafting", "category": "rollback", "detail": "x"}
+        assert store.add_incidents("novel", [entry, entry], "r1") == 2
+        assert store.add_incidents("novel", [entry, entry], "r1") == 0
+        assert store.add_incidents("novel", [entry, entry, entry], "r1") == 1
+        assert store.add_incidents("novel", [entry], "r2") == 1
+        assert store.incident_counts() == [
+            {"project": "novel", "stage": "scene_drafting", "category": "rollback", "count": 4}]
+
+    def test_seen_continues_across_batches(self, store):
+        entry = {"scene_id": "ch1_s1", "deleted_text": "Sure!"}
+        seen = Counter()
+        assert store.add_morgue("novel", [entry], "r1", seen=seen) == 1
+        assert store.add_morgue("novel", [entry], "r1", seen=seen) == 1
+        assert store.add_morgue("novel", [entry, entry], "r1") == 0
+
+
+class TestImport:
+    def test_import_project_is_idempotent(self, store, tmp_path):
+        project = tmp_path / "novel"
+        project.mkdir()
+        _write_jsonl(project / "artifact_metrics_history.jsonl", [
+            {"run_nonce": "r1", "timestamp": "2026-01-01", "metrics": _metrics(1)},
+            {"run_nonce": "r2", "timestamp": "2026-01-02", "metrics": _metrics(4)},
+        ])
+        repeated = {"stage": "s", "category": "c", "detail": "d", "run_nonce": "r2"}
+        _write_jsonl(project / "incidents.jsonl", [repeated, repeated])
+        (project / "cleanup_morgue.jsonl.old").write_text(
+            json.dumps({"scene_id": "ch1_s1", "deleted_text": "Sure!", "trigger_pattern": "preamble"})
+            + "\nnot json\n", encoding="utf-8")
+
+        assert store.import_project(project) == {"runs": 2, "incidents": 2, "morgue": 1}
+        assert store.import_project(project) == {"runs": 0, "incidents": 0, "morgue": 0}
+        assert store.run_delta("novel")["scenes_with_preamble"]["change"] == 3.0
+        assert list(store.import_projects(tmp_path)) == ["novel"]
+
+
+class TestPipelineWiring:
+    def test_delta_read_from_store(self, project_with_config, stub_orchestrator):
+        first = stub_orchestrator()
+        first.state.artifact_metrics = _metrics(1)
+        first._persist_artifact_metrics()
+
+        second = stub_orchestrator()
+        second.state.artifact_metrics = _metrics(6)
+        second.state.stage_results = [StageResult("scene_drafting", StageStatus.COMPLETED, tokens_used=50)]
+        second._persist_artifact_metrics()
+        (project_with_config / "artifact_metrics_history.jsonl").unlink()  # store is the source now
+
+        delta = second._compute_metrics_delta()
+        assert delta["scenes_with_preamble"]["direction"] == "regressed"
+        store = second._analytics_store()
+        assert store.path == project_with_config.parent / "analytics.db"
+        assert store.stage_stats()[0]["mean_tokens"] == 50
+
+    def test_legacy_history_imported_on_first_use(self, project_with_config, stub_orchestrator):
+        _write_jsonl(project_with_config / "artifact_metrics_history.jsonl",
+                     [{"run_nonce": "old", "timestamp": "2025-12-01", "metrics": _metrics(0)}])
+        orch = stub_orchestrator()
+        orch.state.config["analytics"] = {"db_path": "history.db"}
+        orch.state.artifact_metrics = _metrics(5)
+        orch._persist_artifact_metrics()
+        assert orch._compute_metrics_delta()["scenes_with_preamble"]["previous"] == 0
+        assert [r["run_nonce"] for r in orch._analytics_store().runs(project_with_config.name)] == [
+            orch._run_nonce, "old"]
+
+    def test_disabled(self, stub_orchestrator):
+        orch = stub_orchestrator()
+        orch.state.config["analytics"] = {"enabled": False}
+        assert orch._analytics_store() is None
+
+    @pytest.mark.asyncio
+    async def test_telemetry_mirrored(self, tmp_path, store):
+        project = tmp_path / "novel"
+        project.mkdir()
+        async with run_telemetry(project, "r9") as telemetry:
+            telemetry.attach_store(store)
+            telemetry.incidents.put({"stage": "scene_drafting", "category": "rollback", "detail": "x"})
+            telemetry.morgue.put({"scene_id": "ch1_s1", "deleted_text": "Sure!"})
+            await asyncio.sleep(0)
+            telemetry.morgue.flush_sync()
+            telemetry.morgue.put({"scene_id": "ch1_s1", "deleted_text": "Sure!"})
+        line = json.loads((project / "incidents.jsonl").read_text(encoding="utf-8").splitlines()[0])
+        assert line["run_nonce"] == "r9"
+        with store.connect() as conn:
+            assert conn.execute("SELECT run_nonce FROM incidents").fetchone()[0] == "r9"
+            assert conn.execute("SELECT COUNT(*) FROM morgue").fetchone()[0] == 2
+        assert store.import_project(project) == {"runs": 0, "incidents": 0, "morgue": 0}
@@ -0,0 +1,131 @@
+"""
+Unit Tests for AudiobookEngine synthesis pipeline
+
+Tests concurrent chunk synthesis, the content-addressed chunk cache and
+resumable reruns — with a local TTS stand-in and an in-thread assembler.
+"""
+
+import pytest
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from prometheus_novel.audiobook import engine as audiobook_engine
+from prometheus_novel.audiobook.chunk_cache import ChunkCache, chunk_key
+from prometheus_novel.audiobook.engine import AudiobookEngine
+
+
+class LocalTTS:
+    """Stand-in for TTSClient: returns the SSML as 'audio' bytes."""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_on = fail_on
+
+    async def synthesize(self, ssml, voice_name="en-US-Neural2-D", speaking_rate=0.95, pitch=0.0):
+        self.calls.append(ssml)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if self.fail_on and self.fail_on in ssml:
+            raise RuntimeError("tts down")
+        return f"{voice_name}|{ssml}".encode("utf-8")
+
+
+def _fake_render(chunk_paths, output_path):
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(output_path).write_bytes(b"".join(Path(p).read_bytes() for p in chunk_paths))
+    return {"compliant": True, "issues": [], "duration_minutes": 1.0,
+            "rms_db": -20.0, "peak_db": -3.5}
+
+
+@pytest.fixture(autouse=True)
+def _no_ffmpeg(monkeypatch):
+    monkeypatch.setattr(audiobook_engine, "render_chapter_audio", _fake_render)
+
+
+def _scenes(n_chapters=3, edit=None):
+    scenes = []
+    for ch in range(1, n_chapters + 1):
+        for sc in range(1, 3):
+            text = f"Chapter {ch} scene {sc} prose line."
+            if edit == (ch, sc):
+                text += " Revised."
+            scenes.append({"chapter": ch, "scene_number": sc, "content": text})
+    return scenes
+
+
+def _engine(tmp_path, tts, scenes, **ab):
+    ab_config = {"voice_default": "en-US-Neural2-D", "voice_map": {},
+                 "speaking_rate": 0.95, "pitch": 0, "narrator_credit": "Narrator", **ab}
+    return AudiobookEngine(
+        project_path=tmp_path,
+        config={"project_name": "demo", "title": "Demo"},
+        scenes=scenes,
+        audiobook_config=ab_config,
+        tts_client=tts,
+        output_dir=tmp_path / "audiobook",
+        assembly_executor=ThreadPoolExecutor(max_workers=2),
+    )
+
+
+class TestChunkCache:
+
+    def test_key_covers_voice_settings(self):
+        base = chunk_key("<speak>hi</speak>", "v", 0.95, 0)
+        assert base == chunk_key("<speak>hi</speak>", "v", 0.95, 0.0)
+        assert base != chunk_key("<speak>hi</speak>", "v", 1.0, 0)
+        assert base != chunk_key("<speak>hi</speak>", "w", 0.95, 0)
+
+    def test_put_get_roundtrip(self, tmp_path):
+        cache = ChunkCache(tmp_path)
+        assert cache.get("ab12") is None
+        cache.put("ab12", b"mp3")
+        assert cache.get("ab12").read_bytes() == b"mp3"
+
+
+class TestConcurrentSynthesis:
+
+    @pytest.mark.asyncio
+    async def test_chunks_across_chapters_run_concurrently(self, tmp_path):
+        tts = LocalTTS()
+        engine = _engine(tmp_path, tts, _scenes(), max_concurrent_requests=3)
+        result = await engine.generate_all()
+
+        assert result["errors"] == []
+        assert len(result["generated"]) == 5  # opening + 3 chapters + closing
+        assert set(result["acx_compliance"]) == {"ch01", "ch02", "ch03"}
+        assert 1 < tts.max_in_flight <= 3
+        assert result["chunks_synthesized"] == len(tts.calls)
+
+    @pytest.mark.asyncio
+    async def test_force_rerun_only_resynthesizes_changed_chunks(self, tmp_path):
+        first = LocalTTS()
+        await _engine(tmp_path, first, _scenes()).generate_all()
+
+        second = LocalTTS()
+        engine = _engine(tmp_path, second, _scenes(edit=(2, 1)))
+        result = await engine.generate_all(force=True)
+
+        assert len(second.calls) == 1
+        assert "Revised" in second.calls[0]
+        assert result["chunks_cached"] == len(first.calls) - 1
+        assert result["total_chars"] < sum(len(c) for c in first.calls)
+
+    @pytest.mark.asyncio
+    async def test_failed_chapter_does_not_block_others(self, tmp_path):
+        tts = LocalTTS(fail_on="Chapter 2 scene")
+        result = await _engine(tmp_path, tts, _scenes()).generate_all()
+
+        assert result["errors"] and result["errors"][0].startswith("ch02")
+        assert len(result["generated"]) == 4
+        # Chunks that succeeded are cached for the next run
+        rerun = LocalTTS()
+        await _engine(tmp_path, rerun, _scenes()).generate_all()
+        assert all("Chapter 2" in c for c in rerun.calls)
@@ -0,0 +1,178 @@
+"""
+Unit Tests for BatchEngine
+
+Tests work-queue scheduling, shared model limits, response caching,
+checkpoint resume and the throughput report — with fake orchestrators.
+"""
+
+import pytest
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+import yaml
+
+from prometheus_novel.batch.engine import (
+    BatchEngine,
+    ConcurrencyLimits,
+    ResponseCache,
+    ThrottledClient,
+    FINAL_STAGE,
+)
+
+
+class FakeClient:
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, prompt, system_prompt=None, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return SimpleNamespace(content=f"out:{prompt}", input_tokens=10, output_tokens=5)
+
+
+class FakeOrchestrator:
+    """Stands in for PipelineOrchestrator; duration comes from config."""
+
+    runs = []
+
+    def __init__(self, project_path, llm_client=None, llm_clients=None):
+        self.project_path = project_path
+        self.client = llm_client
+        self.config = yaml.safe_load((project_path / "config.yaml").read_text())
+
+    async def run(self, resume=False):
+        FakeOrchestrator.runs.append((self.project_path.name, resume))
+        if self.config.get("fail"):
+            raise RuntimeError("boom")
+        await self.client.generate("plan", temperature=0.2)
+        await asyncio.sleep(self.config.get("duration", 0.01))
+        return SimpleNamespace(
+            total_tokens=1000,
+            total_cost_usd=0.5,
+            scenes=[{"content": "word " * 500}],
+            completed_stages=["high_concept", FINAL_STAGE],
+        )
+
+
+def _make_project(root: Path, name: str, **config) -> Path:
+    p = root / name
+    p.mkdir(parents=True)
+    config.setdefault("model_defaults", {"api_model": "qwen2.5:7b"})
+    (p / "config.yaml").write_text(yaml.dump(config))
+    return p
+
+
+@pytest.fixture(autouse=True)
+def _reset_runs():
+    FakeOrchestrator.runs = []
+
+
+def _engine(paths, out, clients, **kwargs):
+    def factory(model):
+        clients.setdefault(model, FakeClient(model))
+        return clients[model]
+    return BatchEngine(paths, output_dir=out, client_factory=factory,
+                       orchestrator_factory=FakeOrchestrator, **kwargs)
+
+
+class TestConcurrencyLimits:
+
+    @pytest.mark.asyncio
+    async def test_per_model_limit_enforced(self):
+        limits = ConcurrencyLimits(global_limit=10, per_model={"m": 2})
+        inner = FakeClient("m")
+        client = ThrottledClient(inner, limits)
+        await asyncio.gather(*[client.generate(f"p{i}") for i in range(8)])
+        assert inner.max_in_flight == 2
+        assert client.requests == 8
+
+
+class TestResponseCache:
+
+    @pytest.mark.asyncio
+    async def test_low_temperature_responses_cached(self):
+        cache = ResponseCache()
+        inner = FakeClient("m")
+        client = ThrottledClient(inner, ConcurrencyLimits(), cache)
+        await client.generate("same", temperature=0.1)
+        await client.generate("same", temperature=0.1)
+        assert inner.calls == 1
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_creative_temperature_not_cached(self):
+        inner = FakeClient("m")
+        client = ThrottledClient(inner, ConcurrencyLimits(), ResponseCache())
+        await client.generate("same", temperature=0.9)
+        await client.generate("same", temperature=0.9)
+        assert inner.calls == 2
+
+    def test_lru_bound(self):
+        cache = ResponseCache(max_entries=2)
+        for k in ("a", "b", "c"):
+            cache.put(k, k)
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
+
+
+class TestBatchEngine:
+
+    @pytest.mark.asyncio
+    async def test_work_queue_and_report(self, tmp_path):
+        paths = [_make_project(tmp_path, f"book{i}", duration=0.05 if i == 0 else 0.01)
+                 for i in range(4)]
+        clients = {}
+        engine = _engine(paths, tmp_path / "out", clients, max_books=2)
+        report = await engine.run()
+
+        assert report.books_completed == 4
+        assert report.books_failed == 0
+        assert report.total_words == 2000
+        assert report.cost_per_10k_words == pytest.approx(2.0 * 10000 / 2000)
+        # One shared client per model across all books; identical plan prompt cached
+        assert list(clients) == ["qwen2.5:7b"]
+        assert clients["qwen2.5:7b"].calls == 1
+        assert report.cache_hits == 3
+        assert list((tmp_path / "out").glob("batch_report_*.json"))
+
+    @pytest.mark.asyncio
+    async def test_failed_book_requeued_then_marked_failed(self, tmp_path):
+        good = _make_project(tmp_path, "good")
+        bad = _make_project(tmp_path, "bad", fail=True)
+        engine = _engine([bad, good], tmp_path / "out", {}, max_attempts=2)
+        report = await engine.run()
+
+        assert report.books_completed == 1
+        assert report.books_failed == 1
+        assert [n for n, _ in FakeOrchestrator.runs].count("bad") == 2
+        manifest = json.loads((tmp_path / "out" / "batch_manifest.json").read_text())
+        statuses = {b["name"]: b["status"] for b in manifest["books"]}
+        assert statuses == {"bad": "failed", "good": "completed"}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_resume_and_skip_finished(self, tmp_path):
+        partial = _make_project(tmp_path, "partial")
+        (partial / "pipeline_state.json").write_text(json.dumps(
+            {"completed_stages": ["high_concept"], "total_tokens": 400, "total_cost_usd": 0.2}))
+        finished = _make_project(tmp_path, "finished")
+        (finished / "pipeline_state.json").write_text(json.dumps(
+            {"completed_stages": ["high_concept", FINAL_STAGE]}))
+
+        engine = _engine([partial, finished], tmp_path / "out", {})
+        report = await engine.run()
+
+        assert FakeOrchestrator.runs == [("partial", True)]
+        job = next(j for j in engine.jobs if j.name == "partial")
+        assert job.tokens == 600  # only this run's spend, not the checkpoint's
+        assert report.books_completed == 1
@@ -0,0 +1,81 @@
+"""Tests for lazy CLI / pipeline loading and the startup benchmark helpers."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.bench_cli_startup import build_commands, parse_importtime
+
+ROOT = Path(__file__).parent.parent.parent
+
+HEAVY = ["asyncio", "yaml", "dotenv", "policy", "pydantic", "stages.pipeline",
+         "prometheus_lib.llm.clients", "editor_studio.orchestrator", "stages.quality_meters"]
+
+
+def _loaded_after(code: str, modules):
+    probe = f"{code}\nimport json, sys\nprint(json.dumps([m for m in {list(modules)!r} if m in sys.modules]))"
+    out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _cli(*argv):
+    return subprocess.run([sys.executable, "-m", "interfaces.cli.main", *argv], cwd=ROOT,
+                          capture_output=True, text=True)
+
+
+class TestLazyImports:
+    def test_cli_module_import_is_light(self):
+        assert _loaded_after("import interfaces.cli.main", HEAVY) == []
+
+    def test_pipeline_import_defers_quality_and_policy(self):
+        deferred = ["policy", "pydantic", "prometheus_lib.llm.clients", "editor_studio.orchestrator",
+                    "stages.quality_meters", "quality.quality_contract", "quality.phrase_miner"]
+        assert _loaded_after("import stages.pipeline", deferred) == []
+
+    def test_light_command_skips_runtime_setup(self):
+        code = ("import sys; sys.argv = ['writerai', 'ideas']\n"
+                "from interfaces.cli.main import main; main()")
+        assert _loaded_after(code, ["dotenv", "prometheus_lib.utils.logging_config", "asyncio"]) == []
+
+
+class TestGenerateListStages:
+    def test_lists_stages_without_clients(self, tmp_path):
+        config = tmp_path / "config.yaml"
+        config.write_text("project_name: t\ntitle: T\nmodel_defaults:\n  api_model: no-such-model\n",
+                          encoding="utf-8")
+        code = ("import sys; sys.argv = ['writerai', 'generate', '-c', %r, '--list-stages']\n"
+                "from interfaces.cli.main import main; rc = main()\n"
+                "assert rc == 0, rc" % str(config))
+        assert _loaded_after(code, ["policy", "prometheus_lib.llm.clients"]) == []
+        result = _cli("generate", "-c", str(config), "--list-stages")
+        assert result.returncode == 0
+        assert "scene_drafting" in result.stdout
+
+    def test_unknown_stage_rejected_before_client_setup(self, tmp_path):
+        config = tmp_path / "config.yaml"
+        config.write_text("project_name: t\n", encoding="utf-8")
+        result = _cli("generate", "-c", str(config), "--stage", "nope")
+        assert result.returncode == 1
+        assert "Unknown stage: nope" in result.stdout
+
+
+class TestBenchHelpers:
+    def test_parse_importtime_sorts_by_cumulative(self):
+        stderr = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |   json",
+            "import time:      2000 |      90000 | stages.pipeline",
+            "import time:       500 |       5000 |   yaml",
+            "some other line",
+        ])
+        rows = parse_importtime(stderr, limit=2)
+        assert [r["module"] for r in rows] == ["stages.pipeline", "yaml"]
+        assert rows[0] == {"module": "stages.pipeline", "self_us": 2000, "cumulative_us": 90000}
+
+    def test_generation_commands_not_budgeted(self, tmp_path):
+        commands = {label: budgeted for label, _, budgeted in build_commands(tmp_path)}
+        assert commands["help"] and commands["ideas"] and commands["audit"]
+        assert commands["generate --list-stages"] is False
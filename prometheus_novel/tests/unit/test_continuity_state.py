@@ -230,5 +230,72 @@ class TestBuildContextBlock(unittest.TestCase):
         self.assertIn("ch01_s02", block)
 
 
+# ---------------------------------------------------------------------------
+# Precompiled matchers — info gates, compile-once, timing counters
+# ---------------------------------------------------------------------------
+class TestCompiledMatchers(unittest.TestCase):
+    def _state(self):
+        outline = [
+            {"chapter": 1, "scenes": [{"scene": 1, "scene_id": "ch01_s01"},
+                                      {"scene": 2, "scene_id": "ch01_s02"}]},
+            {"chapter": 2, "scenes": [{"scene": 1, "scene_id": "ch02_s01"}]},
+        ]
+        cs = ContinuityState.from_outline(outline, {"protagonist": "Elena"})
+        cs.info_gates = [
+            InfoGate(fact="Kade is the saboteur", trigger_phrases=["Kade.*sabotag"], reveal_at="ch02_s01"),
+            InfoGate(fact="Jax is the informant", trigger_phrases=["Jax.*informant"], reveal_at="ch02_s01"),
+        ]
+        return cs
+
+    def test_overlapping_gate_matches_both_reported(self):
+        cs = self._state()
+        text = "Kade said Jax was the informant, and that the sabotage was planned."
+        result = cs.validate_content("ch01_s02", text)
+        leaks = [e for e in result["errors"] if e.startswith("Info leak")]
+        self.assertEqual(len(leaks), 2)
+        self.assertIn("Kade", leaks[0])
+
+    def test_revealed_gate_does_not_hide_closed_gate(self):
+        # Triggers sharing the antagonist's name must not shadow each other
+        outline = [{"chapter": ch, "scenes": [{"scene": 1, "scene_id": f"ch{ch:02d}_s01"}]}
+                   for ch in range(1, 10)]
+        cs = ContinuityState.from_outline(outline, {"protagonist": "Elena"})
+        cs.info_gates = [
+            InfoGate(fact="Victor is spy", trigger_phrases=["Victor.*spy"], reveal_at="ch05_s01"),
+            InfoGate(fact="Victor is killer", trigger_phrases=["Victor.*killer"], reveal_at="ch09_s01"),
+        ]
+        result = cs.validate_content("ch06_s01", "Victor the spy, the killer, walked into the hangar.")
+        self.assertEqual(
+            [e for e in result["errors"] if e.startswith("Info leak")],
+            ["Info leak: 'Victor is killer' referenced before reveal in ch09_s01"],
+        )
+
+    def test_gates_open_after_reveal(self):
+        cs = self._state()
+        text = "Kade admitted the sabotage. Jax was the informant."
+        result = cs.validate_content("ch02_s01", text)
+        self.assertTrue(result["ok"], result["errors"])
+
+    def test_compiled_once_and_recompiled_on_change(self):
+        cs = self._state()
+        cs.validate_content("ch01_s01", "A quiet scene.")
+        compiles = cs.stats["compile_calls"]
+        cs.validate_content("ch01_s02", "Another quiet scene.")
+        self.assertEqual(cs.stats["compile_calls"], compiles)
+        cs.setting_bans = ["sunlight"]
+        result = cs.validate_content("ch01_s02", "Sunlight everywhere.")
+        self.assertEqual(cs.stats["compile_calls"], compiles + 1)
+        self.assertTrue(any("Setting violation" in e for e in result["errors"]))
+
+    def test_timing_stats(self):
+        cs = self._state()
+        for _ in range(3):
+            cs.validate_content("ch01_s01", "A quiet scene.")
+        stats = cs.timing_stats()
+        self.assertEqual(stats["validate_calls"], 3)
+        self.assertGreaterEqual(stats["validate_ms"], 0.0)
+        self.assertIn("validate_mean_ms", stats)
+
+
 if __name__ == "__main__":
     unittest.main()
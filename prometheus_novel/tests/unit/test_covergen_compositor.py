@@ -0,0 +1,161 @@
+"""
+Unit Tests for covergen compositor text fitting
+
+Tests the cached font loader and binary-search layout fitter.
+"""
+
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+pytest.importorskip("PIL")
+
+from prometheus_novel.covergen.compositor import (
+    _wrap_text,
+    fit_text_layout,
+    get_font,
+    compose_front_cover,
+)
+
+
+def _fits(layout, max_width, max_height, line_spacing=1.3):
+    font = layout.font
+    ascent, descent = font.getmetrics()
+    height = int((ascent + descent) * line_spacing) * len(layout.lines)
+    return height <= max_height and all(font.getbbox(l)[2] <= max_width for l in layout.lines)
+
+
+class TestFontCache:
+
+    def test_same_object_per_font_and_size(self):
+        assert get_font("Oswald-Bold", 40) is get_font("Oswald-Bold", 40)
+        assert get_font("Oswald-Bold", 40) is not get_font("Oswald-Bold", 41)
+
+
+class TestFitTextLayout:
+
+    def test_largest_fitting_size(self):
+        text = "THE GLASS REGISTRY OF SMALL HOURS"
+        layout = fit_text_layout(text, "Oswald-Bold", 900, 400, start_size=300, min_size=20)
+        assert _fits(layout, 900, 400)
+        # One size larger must not fit
+        bigger = get_font("Oswald-Bold", layout.size + 1)
+        lines = _wrap_text(text, bigger, 900)
+        ascent, descent = bigger.getmetrics()
+        too_tall = int((ascent + descent) * 1.3) * len(lines) > 400
+        too_wide = any(bigger.getbbox(l)[2] > 900 for l in lines)
+        assert too_tall or too_wide
+
+    def test_lines_match_wrap_at_chosen_size(self):
+        text = "A Story About Testing Things Carefully"
+        layout = fit_text_layout(text, "LibreBaskerville-Regular", 500, 300, start_size=120, min_size=12)
+        assert list(layout.lines) == _wrap_text(text, layout.font, 500)
+
+    def test_rescaled_layout_reused_at_other_resolution(self):
+        text = "BURNING VOWS AT MIDNIGHT"
+        small = fit_text_layout(text, "Oswald-Bold", 800, 440, start_size=240, min_size=80)
+        large = fit_text_layout(text, "Oswald-Bold", 1600, 880, start_size=480, min_size=160)
+        assert large.lines == small.lines
+        assert _fits(large, 1600, 880)
+
+    def test_falls_back_to_min_size(self):
+        layout = fit_text_layout("word " * 200, "Oswald-Bold", 100, 50, start_size=60, min_size=10)
+        assert layout.size == 10
+
+
+class TestComposeFrontCover:
+
+    def test_renders_at_artwork_size(self):
+        from PIL import Image
+        art = Image.new("RGB", (400, 640), (20, 20, 20))
+        cover = compose_front_cover(art, "Test Title", "Jane Author")
+        assert cover.size == (400, 640)
+
+
+class TestToneAnalysis:
+
+    def test_luminance_and_contrast(self):
+        from PIL import Image
+        from prometheus_novel.covergen.compositor import analyze_luminance, analyze_tone
+        img = Image.new("L", (10, 10), 0)
+        img.paste(255, (0, 0, 10, 5))
+        tone = analyze_tone(img)
+        assert tone["luminance"] == pytest.approx(0.5)
+        assert tone["contrast"] == pytest.approx(0.5)
+        assert analyze_luminance(img, "top") == pytest.approx(1.0)
+        assert analyze_luminance(img, "bottom") == pytest.approx(0.0)
+
+    def test_regions_match_single_region_calls(self):
+        from PIL import Image
+        from prometheus_novel.covergen.compositor import analyze_luminance, analyze_luminance_regions
+        img = Image.linear_gradient("L").convert("RGB").resize((64, 100))
+        regions = analyze_luminance_regions(img)
+        assert regions["top"] == pytest.approx(analyze_luminance(img, "top"), abs=1e-6)
+        assert regions["bottom"] == pytest.approx(analyze_luminance(img, "bottom"), abs=1e-6)
+
+
+class TestFullWrap:
+
+    def test_bleed_replicates_edges(self):
+        from PIL import Image
+        from prometheus_novel.covergen.compositor import assemble_full_wrap
+        front = Image.new("RGB", (20, 30), (200, 0, 0))
+        back = Image.new("RGB", (20, 30), (0, 0, 200))
+        spine = Image.new("RGB", (4, 30), (0, 200, 0))
+        wrap = assemble_full_wrap(front, spine, back, bleed_px=3)
+        assert wrap.size == (3 + 20 + 4 + 20 + 3, 36)
+        assert wrap.getpixel((0, 10)) == (0, 0, 200)
+        assert wrap.getpixel((wrap.width - 1, 10)) == (200, 0, 0)
+        assert wrap.getpixel((25, 0)) == (0, 200, 0)
+        assert wrap.getpixel((wrap.width - 1, wrap.height - 1)) == (200, 0, 0)
+
+
+class TestCoverEngineParallel:
+
+    @pytest.mark.asyncio
+    async def test_generate_all_runs_llm_steps_concurrently(self, tmp_path, monkeypatch):
+        import asyncio
+        import io
+        from types import SimpleNamespace
+        from PIL import Image
+        from prometheus_novel.covergen import engine as cover_engine
+        from prometheus_novel.covergen.engine import CoverConfig, CoverEngine
+
+        events = []
+
+        async def fake_prompt(**kwargs):
+            events.append("prompt_start")
+            await asyncio.sleep(0.02)
+            events.append("prompt_end")
+            return "a moody skyline"
+
+        async def fake_blurb(**kwargs):
+            events.append("blurb_start")
+            await asyncio.sleep(0.02)
+            events.append("blurb_end")
+            return "A blurb long enough to be used on the back cover of the book."
+
+        async def fake_image(**kwargs):
+            buf = io.BytesIO()
+            Image.new("RGB", (256, 384), (60, 70, 80)).save(buf, format="PNG")
+            return SimpleNamespace(image_bytes=buf.getvalue(), cost_usd=0.1)
+
+        monkeypatch.setattr(cover_engine, "generate_art_prompt", fake_prompt)
+        monkeypatch.setattr(cover_engine, "generate_back_cover_blurb", fake_blurb)
+        monkeypatch.setattr(cover_engine, "generate_cover_image", fake_image)
+
+        cc = CoverConfig(title="Parallel Lines", author_name="A. Writer", page_count=120,
+                         style_preset="cinematic", title_font="Oswald-Bold",
+                         author_font="LibreBaskerville-Regular", output_dir=tmp_path)
+        engine = CoverEngine(project_path=tmp_path, config={"title": "Parallel Lines"}, cover_config=cc)
+        result = await engine.generate_all()
+
+        assert result["errors"] == []
+        assert events.index("blurb_start") < events.index("prompt_end")
+        for name in ("cover_ebook.jpg", "cover_print_front.png", "cover_print_spine.png",
+                     "cover_print_back.png", "cover_print_wrap.png", "cover_print.pdf"):
+            assert name in result["files"]
+        # One print-resolution master served front + back
+        assert len(engine._masters) == 1
@@ -0,0 +1,135 @@
+"""Tests for editor_studio fused mode — one revision call per scene."""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from editor_studio.orchestrator import _fuse_task_blocks, run_editor_studio
+
+
+class RecordingClient:
+    """Returns the scene with a marker appended; records prompts and concurrency."""
+
+    def __init__(self, delay: float = 0.0, reply=None):
+        self.prompts = []
+        self.delay = delay
+        self.reply = reply
+        self.active = 0
+        self.peak = 0
+
+    async def generate(self, prompt, max_tokens=4000, temperature=0.4):
+        self.prompts.append((prompt, temperature))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        if self.reply is not None:
+            return SimpleNamespace(content=self.reply)
+        scene = prompt.split("=== CURRENT SCENE ===\n", 1)[1].split("\n\n=== OUTPUT ===", 1)[0]
+        return SimpleNamespace(content=scene + " Revised.")
+
+
+# Full-scene rewrites only; span patches are covered in test_span_patch.py
+_NO_PATCH = {"span_patch": {"enabled": False}}
+
+
+def _scene(ch, sc, words=80):
+    return {"chapter": ch, "scene_number": sc, "content": " ".join(["word"] * words), "tension_level": 5}
+
+
+def _contracts():
+    return [
+        {"scene_id": "ch01_s01", "warnings": ["DEFLECTION: reflective run", "STAKELESS: no stakes",
+                                              "RHYTHM_FLATLINE: flat"]},
+        {"scene_id": "ch01_s02", "warnings": ["CAUSALITY: connector"]},
+    ]
+
+
+async def _run(tmp_path, client, mode, **kwargs):
+    scenes = [_scene(1, 1), _scene(1, 2), _scene(2, 1)]
+    report = await run_editor_studio(
+        tmp_path, client=client, scenes=scenes, config=_NO_PATCH, contracts=_contracts(),
+        passes_enabled=["deflection", "stakes", "rhythm", "causality", "opening_vary"],
+        skip_persist=True, mode=mode, **kwargs,
+    )
+    return report, scenes
+
+
+class TestFusedMode:
+    @pytest.mark.asyncio
+    async def test_one_call_per_scene(self, tmp_path):
+        client = RecordingClient()
+        report, scenes = await _run(tmp_path, client, "fused")
+        assert len(client.prompts) == 2
+        assert report["scenes_modified"] == 2
+        fused_prompt = next(p for p, _ in client.prompts if "Scene ID: ch01_s01" in p)
+        assert "COMBINED REVISION: 3 fixes" in fused_prompt
+        assert "(deflection)" in fused_prompt and "(stakes)" in fused_prompt and "(rhythm)" in fused_prompt
+        assert scenes[0]["content"].endswith("Revised.")
+        assert not scenes[2]["content"].endswith("Revised.")
+
+    @pytest.mark.asyncio
+    async def test_sequential_rewrites_per_pass(self, tmp_path):
+        client = RecordingClient()
+        report, _ = await _run(tmp_path, client, None)
+        assert len(client.prompts) == 4
+        assert "mode" not in report
+
+    @pytest.mark.asyncio
+    async def test_per_pass_attribution(self, tmp_path):
+        report, _ = await _run(tmp_path, RecordingClient(), "fused")
+        by_pass = {p["pass"]: p for p in report["passes_run"]}
+        assert by_pass["deflection"] == {"pass": "deflection", "scenes_processed": 1, "scenes_modified": 1}
+        assert by_pass["causality"]["scenes_modified"] == 1
+        assert by_pass["opening_vary"]["scenes_processed"] == 0
+        assert report["fused_scenes"][0] == {
+            "scene_id": "ch01_s01", "passes": ["deflection", "stakes", "rhythm"], "modified": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_single_pass_scene_keeps_single_fix_prompt_and_temperature(self, tmp_path):
+        client = RecordingClient()
+        await _run(tmp_path, client, "fused")
+        prompt, temp = next((p, t) for p, t in client.prompts if "Scene ID: ch01_s02" in p)
+        assert "COMBINED REVISION" not in prompt
+        assert "make ONE targeted fix" in prompt
+        assert temp == 0.2
+
+    @pytest.mark.asyncio
+    async def test_length_guard_rejects_fused_output(self, tmp_path):
+        client = RecordingClient(reply=" ".join(["long"] * 500))
+        report, scenes = await _run(tmp_path, client, "fused")
+        assert report["scenes_modified"] == 0
+        assert all(not r["modified"] for r in report["fused_scenes"])
+        assert scenes[0]["content"] == _scene(1, 1)["content"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, tmp_path):
+        client = RecordingClient(delay=0.01)
+        await _run(tmp_path, client, "fused", max_concurrent_scenes=1)
+        assert client.peak == 1
+        client = RecordingClient(delay=0.01)
+        await _run(tmp_path, client, "fused", max_concurrent_scenes=4)
+        assert client.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_mode_from_config(self, tmp_path):
+        client = RecordingClient()
+        scenes = [_scene(1, 1), _scene(1, 2)]
+        report = await run_editor_studio(
+            tmp_path, client=client, scenes=scenes, config={**_NO_PATCH, "editor_studio": {"mode": "fused"}},
+            contracts=_contracts(), passes_enabled=["deflection", "stakes"], skip_persist=True,
+        )
+        assert report["mode"] == "fused"
+        assert len(client.prompts) == 1
+
+
+def test_fuse_task_blocks_numbering():
+    block = _fuse_task_blocks([("stakes", "TASK A"), ("rhythm", "TASK B")])
+    assert "FIX 1 of 2 (stakes)" in block and "FIX 2 of 2 (rhythm)" in block
+    assert block.index("TASK A") < block.index("TASK B")
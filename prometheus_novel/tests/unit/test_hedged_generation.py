@@ -0,0 +1,162 @@
+"""Tests for hedged candidate generation in PipelineOrchestrator._generate_prose."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from prometheus_lib.llm.clients import LLMResponse
+
+CLEAN = ("I pushed the door open and the hallway smelled of rain. Marta waited by the stairs, "
+         "keys in her fist. \"You're late,\" she said. I shrugged off my coat and followed her up. "
+         "The lamp at the landing buzzed once and died. ")
+LONG = " ".join(f"w{i}" for i in range(220))
+
+
+class RacingClient:
+    """Each temperature maps to (delay, text); records every call and cancellation."""
+
+    model_name = "race-model"
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.calls = []
+        self.cancelled = []
+
+    async def generate(self, prompt, **kwargs):
+        temp = kwargs.get("temperature", 0.7)
+        self.calls.append(temp)
+        delay, text = self.plan[temp]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(temp)
+            raise
+        return LLMResponse(content=text, model=self.model_name, input_tokens=10, output_tokens=20)
+
+
+def _orchestrator(stub_orchestrator, hedging=None, failed=5, scenes=10):
+    orch = stub_orchestrator({"enhancements": {"hedged_generation": {"enabled": True, **(hedging or {})}}})
+    orch.state.artifact_metrics = {}
+    for i in range(scenes):
+        orch._record_artifact_metrics("scene_drafting", {}, {"pass": i >= failed, "issues": {}})
+
+    def validate(text, scene_meta=None, continuity_state=None):
+        bad = text.startswith("Sure")
+        return {"pass": not bad, "issues": {"preamble": True} if bad else {},
+                "word_count": len(text.split())}
+    orch._validate_scene_output = validate
+    return orch
+
+
+class TestHedgeWidth:
+    def test_scales_with_failure_rate(self, stub_orchestrator):
+        assert _orchestrator(stub_orchestrator, failed=3)._hedge_width("scene_drafting") == 2
+        assert _orchestrator(stub_orchestrator, failed=5)._hedge_width("scene_drafting") == 3
+        assert _orchestrator(stub_orchestrator, failed=5, hedging={"max_candidates": 2}
+                             )._hedge_width("scene_drafting") == 2
+
+    def test_off_below_threshold_or_without_history(self, stub_orchestrator):
+        assert _orchestrator(stub_orchestrator, failed=1)._hedge_width("scene_drafting") == 1
+        assert _orchestrator(stub_orchestrator, failed=2, scenes=3)._hedge_width("scene_drafting") == 1
+        assert _orchestrator(stub_orchestrator)._hedge_width("final_deai") == 1
+        orch = _orchestrator(stub_orchestrator, hedging={"enabled": False})
+        assert orch._hedge_width("scene_drafting") == 1
+
+    def test_budget_cap(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        orch._budget_tracker["generation_tokens"] = 1000
+        orch._budget_tracker["defense_tokens"] = 900
+        assert orch._hedge_width("scene_drafting") == 1
+
+    def test_failures_recorded(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        orch.state.artifact_metrics = {}
+        orch._record_artifact_metrics("voice_human_pass", {}, {"pass": False, "issues": {}})
+        orch._record_artifact_metrics("voice_human_pass", {}, {"pass": True, "issues": {}})
+        sm = orch.state.artifact_metrics["per_stage"]["voice_human_pass"]
+        assert sm["scenes"] == 2 and sm["failed"] == 1
+
+
+class TestHedgedGenerate:
+    @pytest.mark.asyncio
+    async def test_first_clean_candidate_wins(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        client = RacingClient({
+            0.7: (0.5, CLEAN + "slow"),
+            0.85: (0.01, "Sure, here is the scene. " + CLEAN),
+            0.55: (0.05, CLEAN + "fast"),
+        })
+        response, validation, tokens = await orch._hedged_generate(
+            client, "Write.", "scene_drafting", {"scene_id": "s1"}, None, 3, {"temperature": 0.7})
+
+        assert response.content.endswith("fast")
+        assert validation["pass"]
+        assert sorted(client.calls) == [0.55, 0.7, 0.85]
+        assert client.cancelled == [0.7]
+        cancelled_prompt = orch._token_counter(client).count("Write.")
+        assert tokens == 60 + cancelled_prompt
+        assert orch._budget_tracker["generation_tokens"] == 30
+        assert orch._budget_tracker["defense_tokens"] == 30 + cancelled_prompt
+        assert orch._budget_tracker["hedged_generations"] == 1
+        assert orch._budget_tracker["hedge_cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_only_kept_candidate_recorded_as_generation(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        metrics = orch.state.artifact_metrics
+        before = dict(metrics["per_stage"]["scene_drafting"])
+        client = RacingClient({
+            0.7: (0.05, CLEAN + "kept"),
+            0.85: (0.01, "Sure, here is the scene. " + CLEAN),
+        })
+        await orch._hedged_generate(
+            client, "Write.", "scene_drafting", {}, None, 2, {"temperature": 0.7})
+
+        sm = metrics["per_stage"]["scene_drafting"]
+        assert sm["scenes"] == before["scenes"] + 1
+        assert sm["failed"] == before["failed"]
+        assert sm["preamble"] == before["preamble"]
+        assert sm["hedge_discarded"] == 1
+        assert metrics["total_scenes_generated"] == 11
+        assert metrics["hedge_candidates_discarded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_best_score_when_none_pass(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        client = RacingClient({
+            0.7: (0.01, "Sure. short"),
+            0.85: (0.02, "Sure. " + LONG),
+        })
+        response, validation, _ = await orch._hedged_generate(
+            client, "Write.", "scene_drafting", {}, None, 2, {"temperature": 0.7})
+        assert not validation["pass"]
+        assert response.content == "Sure. " + LONG        # length bonus breaks the tie
+
+    @pytest.mark.asyncio
+    async def test_all_candidates_error(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+
+        class Broken:
+            async def generate(self, prompt, **kwargs):
+                raise RuntimeError("model down")
+        with pytest.raises(RuntimeError, match="model down"):
+            await orch._hedged_generate(Broken(), "Write.", "scene_drafting", {}, None, 2, {})
+
+    @pytest.mark.asyncio
+    async def test_generate_prose_hedges_failure_prone_stage(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator, failed=3)
+        client = RacingClient({0.7: (0.01, CLEAN + "one"), 0.85: (0.3, CLEAN + "two")})
+        content, tokens = await orch._generate_prose(client, "Write.", "scene_drafting",
+                                                     scene_meta={"scene_id": "s1"}, temperature=0.7)
+        assert "one" in content
+        assert client.cancelled == [0.85]
+        counter = orch._token_counter(client)
+        assert tokens == 30 + counter.count("Write.") + counter.count(orch._format_contract)
+
+        client = RacingClient({0.7: (0.01, CLEAN)})
+        await orch._generate_prose(client, "Write.", "final_deai", temperature=0.7)
+        assert client.calls == [0.7]                       # no history: single call
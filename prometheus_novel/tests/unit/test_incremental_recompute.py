@@ -0,0 +1,222 @@
+"""Tests for incremental recompute — per-scene provenance (stages.provenance + orchestrator gates)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from stages.pipeline import PipelineOrchestrator, PipelineState, StageStatus
+from stages.provenance import ProvenanceLedger, content_hash, scene_hashes, scene_keys
+
+ORDER = ["draft", "voice", "hooks", "deai"]
+
+
+def _ledger():
+    return ProvenanceLedger({}, ORDER)
+
+
+class TestLedger:
+    def test_scene_keys(self):
+        scenes = [{"scene_id": "a"}, {"chapter": 2, "scene_number": 3}, {"scene_id": "a"}, "raw"]
+        assert scene_keys(scenes) == ["a", "ch02_s03", "a#2", "idx3"]
+
+    def test_record_and_clean(self):
+        led = _ledger()
+        before = {"s1": content_hash("x")}
+        led.record("voice", before, before, 1, "cfg", "deps")
+        assert led.is_clean("s1", "voice", content_hash("x"), 1, "cfg", "deps")
+        assert not led.is_clean("s1", "voice", content_hash("x"), 2, "cfg", "deps")
+        assert not led.is_clean("s1", "voice", content_hash("x"), 1, "cfg2", "deps")
+        assert not led.is_clean("s1", "voice", content_hash("x"), 1, "cfg", "deps2")
+        assert not led.is_clean("s1", "hooks", content_hash("x"), 1, "cfg", "deps")
+
+    def test_change_invalidates_only_later_stages(self):
+        led = _ledger()
+        h0, h1 = content_hash("v0"), content_hash("v1")
+        for stage in ORDER:
+            led.record(stage, {"s": h0}, {"s": h0}, 1, "c", "d")
+        assert led.record("voice", {"s": h0}, {"s": h1}, 1, "c", "d") == 1
+        assert set(led.data["s"]["stages"]) == {"draft", "voice"}
+        assert led.data["s"]["head"] == h1
+
+    def test_skipped_scene_keeps_record(self):
+        led = _ledger()
+        led.record("voice", {"s": "old"}, {"s": "h"}, 1, "c", "d")
+        led.record("voice", {"s": "h"}, {"s": "h"}, 1, "c", "d", skipped={"s"})
+        assert led.data["s"]["stages"]["voice"]["in"] == "old"
+
+    def test_sync_drops_records_for_untracked_edits(self):
+        led = _ledger()
+        led.record("voice", {"s": "a", "t": "b"}, {"s": "a", "t": "b"}, 1, "c", "d")
+        assert led.sync({"s": "edited", "t": "b"}) == ["s"]
+        assert led.data["s"]["stages"] == {}
+        assert "voice" in led.data["t"]["stages"]
+
+    def test_removed_scenes_pruned(self):
+        led = _ledger()
+        led.record("draft", {}, {"s": "a", "t": "b"}, 1, "c", "d")
+        led.record("voice", {"s": "a", "t": "b"}, {"s": "a"}, 1, "c", "d")
+        assert set(led.data) == {"s"}
+
+    def test_plan_propagates_dirt(self):
+        led = _ledger()
+        hashes = {"s1": "a", "s2": "b", "s3": "c"}
+        for stage in ORDER:
+            led.record(stage, hashes, hashes, 1, "c", "d")
+        expected = {s: (1, "c", "d") for s in ("voice", "hooks", "deai")}
+        expected["hooks"] = (2, "c", "d")  # hooks version bumped
+        plan = led.plan(ORDER, hashes, expected, forced=["s2"])
+        assert plan["voice"] == ["s2"]
+        assert plan["hooks"] == ["s1", "s2", "s3"]
+        assert plan["deai"] == ["s1", "s2", "s3"]
+        assert "draft" not in plan
+
+
+# ---------------------------------------------------------------------------
+# Orchestrator integration
+# ---------------------------------------------------------------------------
+
+_FILLER = "Rain kept falling on the harbor roofs. " * 30
+
+
+def _scenes():
+    return [
+        {"scene_id": "ch01_s01", "chapter": 1, "scene_number": 1, "content": "I found myself at the door. " + _FILLER},
+        {"scene_id": "ch01_s02", "chapter": 1, "scene_number": 2, "content": "I found myself on the stairs. " + _FILLER},
+        {"scene_id": "ch01_s03", "chapter": 1, "scene_number": 3, "content": "The end of the chapter."},
+    ]
+
+
+def _orchestrator(stub_orchestrator, incremental=True):
+    return stub_orchestrator({"incremental": {"enabled": incremental}},
+                             characters=[{"name": "Hero"}], scenes=_scenes())
+
+
+def _mark_processed(orch, stage, indices):
+    """Pretend ``stage`` already processed these scenes with the current inputs."""
+    keys = scene_keys(orch.state.scenes)
+    hashes = {k: h for k, h in scene_hashes(orch.state.scenes).items() if keys.index(k) in indices}
+    orch._provenance().record(stage, hashes, scene_hashes(orch.state.scenes),
+                              *orch._provenance_inputs(stage), skipped=set(keys) - set(hashes))
+
+
+class TestOrchestratorIncremental:
+    @pytest.mark.asyncio
+    async def test_final_deai_skips_clean_scenes(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        _mark_processed(orch, "final_deai", {0})
+
+        result = await orch._run_stage("final_deai")
+
+        assert result.status == StageStatus.COMPLETED
+        assert "I found myself" in orch.state.scenes[0]["content"]       # clean: reused as-is
+        assert "I found myself" not in orch.state.scenes[1]["content"]   # dirty: processed
+        records = orch.state.scene_provenance
+        assert records["ch01_s02"]["stages"]["final_deai"]["in"] == content_hash(_scenes()[1]["content"])
+        assert records["ch01_s02"]["head"] == content_hash(orch.state.scenes[1]["content"])
+
+    @pytest.mark.asyncio
+    async def test_disabled_processes_everything(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator, incremental=False)
+        _mark_processed(orch, "final_deai", {0, 1})
+        await orch._run_stage("final_deai")
+        assert all("I found myself" not in s["content"] for s in orch.state.scenes[:2])
+
+    @pytest.mark.asyncio
+    async def test_upstream_change_dirties_downstream(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        _mark_processed(orch, "final_deai", {0, 1, 2})
+
+        async def fake_voice():
+            scene = orch.state.scenes[1]
+            orch.state.scenes[1] = {**scene, "content": scene["content"] + " Rewritten."}
+            return {}, 0
+        orch._stage_voice_human_pass = fake_voice
+        await orch._run_stage("voice_human_pass")
+
+        assert "final_deai" not in orch.state.scene_provenance["ch01_s02"]["stages"]
+        assert "final_deai" in orch.state.scene_provenance["ch01_s01"]["stages"]
+        assert orch._scene_is_clean("final_deai", 0)
+        assert not orch._scene_is_clean("final_deai", 1)
+
+    def test_hand_edit_between_runs_is_dirty(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        _mark_processed(orch, "chapter_hooks", {0, 1, 2})
+        orch.state.scenes[2]["content"] += " Edited by hand."
+        orch._provenance_begin("chapter_hooks")
+        assert orch._scene_is_clean("chapter_hooks", 0)
+        assert not orch._scene_is_clean("chapter_hooks", 2)
+
+    def test_inputs_and_version_invalidate(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        _mark_processed(orch, "final_deai", {0, 1, 2})
+        assert orch._scene_is_clean("final_deai", 0)
+        orch.state.characters = [{"name": "Hero"}, {"name": "Rival"}]
+        assert not orch._scene_is_clean("final_deai", 0)
+        orch.state.characters = [{"name": "Hero"}]
+        orch.STAGE_VERSIONS = {"final_deai": 2}
+        assert not orch._scene_is_clean("final_deai", 0)
+
+    def test_rewrite_scenes_enables_by_default(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator, incremental=None)
+        _mark_processed(orch, "voice_human_pass", {0, 1, 2})
+        assert not orch._scene_is_clean("voice_human_pass", 0)
+        orch._rewrite_scenes_indices = [1]
+        assert orch._scene_is_clean("voice_human_pass", 0)
+        assert not orch._should_process_scene(0, "voice_human_pass")
+        orch._incremental_suspended = True
+        assert not orch._scene_is_clean("voice_human_pass", 0)
+
+    @pytest.mark.asyncio
+    async def test_rewrite_scenes_redoes_target_with_ledger_present(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator, incremental=None)
+        await orch._run_stage("final_deai")                   # first run records the ledger
+        first = [s["content"] for s in orch.state.scenes]
+        assert "I found myself" not in first[1]
+
+        orch._load_surgical_replacements = lambda: {"harbor roofs": "harbour slates"}
+        plan = orch.incremental_plan(["final_deai"], [1])    # as --rewrite-scenes 1 sets it
+        assert plan["stages"]["final_deai"]["rerun"] == [1]
+        await orch._run_stage("final_deai")
+
+        assert "harbour slates" in orch.state.scenes[1]["content"]
+        assert orch.state.scenes[0]["content"] == first[0]
+
+    def test_only_per_scene_stages_skip(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator)
+        _mark_processed(orch, "quality_polish", {0, 1, 2})
+        assert not orch._scene_is_clean("quality_polish", 0)
+
+    def test_plan_and_checkpoint_round_trip(self, project_with_config, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator, incremental=None)
+        for stage in PipelineOrchestrator.INCREMENTAL_STAGES:
+            _mark_processed(orch, stage, {0, 1, 2})
+        orch.state.save()
+
+        loaded = PipelineState.load(project_with_config)
+        assert loaded.scene_provenance == orch.state.scene_provenance
+        fresh = PipelineOrchestrator(project_with_config)
+        fresh.state = loaded
+        fresh.state.config = orch.state.config
+
+        plan = fresh.incremental_plan(None, [1])
+        assert plan["incremental"] is True
+        assert plan["stages"]["final_deai"] == {"mode": "incremental", "rerun": [1], "reuse": 2}
+        assert plan["stages"]["quality_polish"] == {"mode": "full"}
+        assert plan["stages"]["high_concept"] == {"mode": "no_scenes"}
+
+        full = fresh.incremental_plan(None, None)
+        assert full["stages"]["final_deai"]["rerun"] == [0, 1, 2]
+
+
+def test_cli_prints_rerun_plan(project_with_config, stub_orchestrator, capsys):
+    from interfaces.cli.main import _print_rerun_plan
+
+    orch = _orchestrator(stub_orchestrator, incremental=None)
+    _mark_processed(orch, "final_deai", {0, 1, 2})
+    orch.state.save()
+    assert _print_rerun_plan(project_with_config, ["final_deai"], [2]) == 0
+    out = capsys.readouterr().out
+    assert "final_deai" in out and "1 rerun, 2 reused  [2]" in out
@@ -0,0 +1,122 @@
+"""Tests for quality.mention_index — shared per-scene mention index."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from continuity.facts_ledger import build_facts_for_scene
+from quality.character_roster import _count_dialogue_lines, _extract_named_characters_in_scene
+from quality.continuity_state import ContinuityState
+from quality.entity_tracker import extract_entity_pairs
+from quality.mention_index import MentionIndex, SceneMentions, get_default_index
+
+
+class TestSceneMentions:
+    def test_single_and_multi_word_names(self):
+        m = SceneMentions("Elena Vance entered. Later, elena's voice cut through.")
+        assert m.count("Elena") == 2
+        assert m.contains("Elena Vance")
+        assert not m.contains("Vance Elena")
+
+    def test_whole_word_only(self):
+        m = SceneMentions("She ate a banana with Annabel.")
+        assert not m.contains("Ana")
+        assert not m.contains("Ann")
+        assert m.contains("Annabel")
+
+    def test_name_with_apostrophe(self):
+        m = SceneMentions("O'Brien nodded.")
+        assert m.find("O'Brien") == [0]
+
+    def test_present_keeps_order(self):
+        m = SceneMentions("Silas and Mara argued.")
+        assert m.present(["Mara", "Ghost", "Silas"]) == ["Mara", "Silas"]
+
+    def test_first_location_respects_limit_and_prepositions(self):
+        text = "They waited on Deck Four. Hours later, inside the Engine Room Annex Main Hall."
+        m = SceneMentions(text)
+        assert m.first_location() == "Deck Four"
+        assert m.first_location(prepositions={"inside"}) == "Engine Room Annex Main Hall"
+        assert m.first_location(prepositions={"inside"}, max_words=4) == "Engine Room Annex Main"
+        assert m.first_location(limit=10) is None
+
+    def test_first_time_anchor(self):
+        assert SceneMentions("By Dawn the ship was quiet.").first_time_anchor() == "Dawn"
+        assert SceneMentions("Nothing here.").first_time_anchor() is None
+
+    def test_memo_computes_once(self):
+        m = SceneMentions("text")
+        calls = []
+        m.memo("k", lambda: calls.append(1) or 42)
+        assert m.memo("k", lambda: calls.append(1) or 0) == 42
+        assert calls == [1]
+
+
+class TestMentionIndex:
+    def test_same_content_reuses_entry(self):
+        idx = MentionIndex()
+        a = idx.scene("Mara ran.")
+        b = idx.scene("Mara ran.")
+        assert a is b
+        assert (idx.hits, idx.misses) == (1, 1)
+
+    def test_edited_scene_gets_new_entry(self):
+        idx = MentionIndex()
+        a = idx.scene("Mara ran.")
+        b = idx.scene("Mara walked.")
+        assert a is not b
+        assert len(idx) == 2
+
+    def test_lru_eviction(self):
+        idx = MentionIndex(max_entries=2)
+        idx.scene("one")
+        idx.scene("two")
+        idx.scene("one")
+        idx.scene("three")
+        assert len(idx) == 2
+        idx.scene("one")
+        assert idx.misses == 3  # "one" survived, "two" was evicted
+
+
+class TestConsumers:
+    def test_facts_ledger_uses_whole_word_names(self):
+        scene = {"chapter": 1, "scene_number": 1,
+                 "content": "At dawn, in the Old Archive, Mara found Silas Crane asleep."}
+        facts = build_facts_for_scene(scene, 0, ["Mara", "Silas Crane", "Ana"])
+        assert facts["location"] == "Old Archive"
+        assert facts["time_anchor"] == "dawn"
+        assert facts["characters_present"] == ["Mara", "Silas Crane"]
+
+    def test_roster_candidates_and_dialogue(self):
+        text = '"Stay back," Elena said. Elena whispered a warning. Marco Vitale turned. Elena said nothing.'
+        named = _extract_named_characters_in_scene(text)
+        assert named["elena"] == 6
+        assert named["marco"] == 1
+        assert _count_dialogue_lines(text, "elena") == 4
+
+    def test_roster_candidates_returns_copy(self):
+        text = "Elena said hello. " * 3
+        first = _extract_named_characters_in_scene(text)
+        first["elena"] = 0
+        assert _extract_named_characters_in_scene(text)["elena"] == 4  # first has no preceding space
+
+    def test_entity_pairs_cached_per_content(self):
+        text = "Marco's brother Luca waited."
+        a = extract_entity_pairs(text, "ch1_s1")
+        b = extract_entity_pairs(text, "ch9_s2")
+        assert a[0]["name"] == b[0]["name"] == "Luca"
+        assert (a[0]["scene_id"], b[0]["scene_id"]) == ("ch1_s1", "ch9_s2")
+        assert "entity_pairs" in get_default_index().scene(text)._memo
+
+    def test_entity_pairs_skip_scene_without_role_words(self):
+        assert extract_entity_pairs("Marco walked into the rain.") == []
+
+    def test_location_continuity_from_index(self):
+        state = ContinuityState()
+        state.validate_location_continuity("ch01_s01", "Mara stood in the Engine Room.", ["Mara"])
+        result = state.validate_location_continuity("ch01_s02", "Mara sat aboard Meridian.", ["Mara"])
+        assert not result["pass"]
+        assert "Engine Room" in result["issues"][0]
+        ok = state.validate_location_continuity("ch01_s03", "Mara walked to the bridge, now in Galley.", ["Mara"])
+        assert ok["pass"]
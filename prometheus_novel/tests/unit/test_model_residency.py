@@ -0,0 +1,249 @@
+"""Tests for Ollama model residency (prometheus_lib.llm.residency + scheduler affinity)."""
+
+import asyncio
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from prometheus_lib.llm.clients import OllamaClient
+from batch.engine import ConcurrencyLimits, ThrottledClient
+from prometheus_lib.llm.residency import ModelResidency, native_base_url, residency_of
+from stages.pipeline import StageResult, StageStatus
+
+
+class FakeServer(ModelResidency):
+    """Residency manager whose native API calls are recorded instead of sent."""
+
+    def __init__(self, max_loaded=1, ps=(), load_delay=0.02):
+        super().__init__("http://ollama.test/v1", max_loaded=max_loaded)
+        self.ps = list(ps)
+        self.load_delay = load_delay
+        self.calls = []
+
+    async def _request(self, method, path, payload=None):
+        self.calls.append((method, path, (payload or {}).get("model")))
+        if path == "/api/ps":
+            return {"models": [{"name": m} for m in self.ps]}
+        await asyncio.sleep(self.load_delay)
+        return {}
+
+    def loads(self):
+        return [model for method, path, model in self.calls if path == "/api/generate"]
+
+
+class TestResidency:
+    def test_native_base_url(self):
+        assert native_base_url("http://localhost:11434/v1") == "http://localhost:11434"
+        assert native_base_url("http://gpu:11434/") == "http://gpu:11434"
+
+    @pytest.mark.asyncio
+    async def test_swap_counted_at_capacity(self):
+        res = FakeServer(max_loaded=1)
+        await res.ensure("a")
+        await res.ensure("a")
+        await res.ensure("b")
+        assert res.loads() == ["a", "b"]
+        assert res.stats["loads"] == 2 and res.stats["swaps"] == 1
+        assert res.stats["swap_seconds"] > 0
+        assert list(res.loaded) == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_room_for_two_means_no_swap(self):
+        res = FakeServer(max_loaded=2)
+        for model in ("a", "b", "a"):
+            await res.ensure(model)
+        assert res.stats["swaps"] == 0
+        await res.ensure("c")                       # evicts least recently used: b
+        assert list(res.loaded) == ["a", "c"]
+        assert res.stats["swaps"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_seeds_loaded_models(self):
+        res = FakeServer(ps=["a"])
+        await res.ensure("a")
+        assert res.loads() == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_load(self):
+        res = FakeServer()
+        await asyncio.gather(*(res.ensure("a") for _ in range(5)))
+        assert res.loads() == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_waits_for_busy_model(self):
+        res = FakeServer(max_loaded=1)
+        async with res.use("a"):
+            res.prefetch("b")
+            await asyncio.sleep(0.05)
+            assert res.loads() == ["a"]              # would evict a while in use
+        await asyncio.sleep(0.05)
+        assert res.loads() == ["a", "b"]
+        assert res.stats["prefetches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_immediate_when_room(self):
+        res = FakeServer(max_loaded=2)
+        async with res.use("a"):
+            res.prefetch("b")
+            await asyncio.sleep(0.05)
+            assert list(res.loaded) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_warm_loads_concurrently(self):
+        res = FakeServer(max_loaded=3, load_delay=0.1)
+        started = time.monotonic()
+        warmed = await res.warm(["a", "b", "c", "a"])
+        assert warmed == {"a": True, "b": True, "c": True}
+        assert time.monotonic() - started < 0.25
+
+    @pytest.mark.asyncio
+    async def test_concurrent_warm_respects_capacity(self):
+        res = FakeServer(max_loaded=1)
+        warmed = await res.warm(["a", "b", "c"])
+        assert warmed == {"a": True, "b": False, "c": False}
+        assert res.loads() == ["a"] and list(res.loaded) == ["a"]
+
+        res = FakeServer(max_loaded=1)
+        await asyncio.gather(res.ensure("a"), res.ensure("b"), res.ensure("c"))
+        assert len(res.loaded) == 1
+        assert res.stats["loads"] == 3 and res.stats["swaps"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_load_not_recorded(self):
+        class Unreachable(FakeServer):
+            async def _request(self, method, path, payload=None):
+                return None
+        res = Unreachable(max_loaded=1)
+        assert await res.ensure("model-a") is False
+        assert await res.ensure("model-b") is False
+        assert res.loaded == {}
+        assert (res.stats["loads"], res.stats["swaps"], res.stats["models"]) == (0, 0, {})
+
+    def test_residency_of_looks_through_wrappers_and_import_paths(self, monkeypatch):
+        res = FakeServer()
+        client = OllamaClient("model-a")
+        client.residency = res
+        assert residency_of(client) is res
+        assert residency_of(ThrottledClient(client, ConcurrencyLimits())) is res
+        assert residency_of(SimpleNamespace(model_name="gpt-4o")) is None
+
+        monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[3]))
+        other = importlib.import_module("prometheus_novel.prometheus_lib.llm.clients").OllamaClient("model-b")
+        other.residency = res
+        assert not isinstance(other, OllamaClient)
+        assert residency_of(other) is res
+
+    @pytest.mark.asyncio
+    async def test_ollama_client_goes_through_residency(self):
+        client = OllamaClient("model-a")
+        client.residency = FakeServer()
+        client._initialized = True
+        completion = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Rain."), finish_reason="stop")],
+            model="model-a", usage=SimpleNamespace(prompt_tokens=5, completion_tokens=2),
+        )
+
+        async def create(**kwargs):
+            return completion
+        client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        response = await client.generate("Write.", max_tokens=50)
+        assert response.content == "Rain."
+        assert client.residency.loads() == ["model-a"]
+        assert client.residency.busy == {}
+
+
+# ---------------------------------------------------------------------------
+# Scheduler affinity
+# ---------------------------------------------------------------------------
+
+STAGES = ["high_concept", "world_building", "beat_sheet"]
+
+
+def _orchestrator(stub_orchestrator, residency, enabled=True):
+    clients = {"a": OllamaClient("model-a"), "b": OllamaClient("model-b")}
+    for client in clients.values():
+        client.residency = residency
+    orch = stub_orchestrator({
+        "model_overrides": {"high_concept": "a", "world_building": "b", "beat_sheet": "a"},
+        "ollama_residency": {"enabled": enabled},
+    }, clients=clients)
+    orch.log = []
+
+    async def run_stage(name):
+        model = orch.get_client_for_stage(name).model_name
+        orch.log.append(("start", name))
+        async with residency.use(model):
+            await asyncio.sleep(0.02)
+        orch.log.append(("end", name))
+        return StageResult(stage_name=name, status=StageStatus.COMPLETED)
+    orch._run_stage = run_stage
+    return orch
+
+
+class TestSchedulerAffinity:
+    @pytest.mark.asyncio
+    async def test_same_model_stages_batched(self, project_with_config, stub_orchestrator):
+        res = FakeServer(max_loaded=1)
+        orch = _orchestrator(stub_orchestrator, res)
+        await orch._run_stage_graph(STAGES, 0)
+
+        starts = [name for kind, name in orch.log if kind == "start"]
+        assert starts == ["high_concept", "beat_sheet", "world_building"]
+        # world_building (model b) never overlapped a model-a stage
+        assert orch.log.index(("start", "world_building")) > orch.log.index(("end", "beat_sheet"))
+        assert res.loads() == ["model-a", "model-b"]
+
+        report = json.loads((project_with_config / "output" / "stage_schedule.json").read_text())
+        assert report["model_residency"]["swaps"] == 1
+        assert report["model_residency"]["prefetches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_capacity_two_runs_models_side_by_side(self, stub_orchestrator):
+        res = FakeServer(max_loaded=2)
+        orch = _orchestrator(stub_orchestrator, res)
+        await orch._run_stage_graph(STAGES, 0)
+        log = orch.log
+        assert log.index(("start", "beat_sheet")) < log.index(("end", "world_building"))
+        assert res.stats["swaps"] == 0
+
+    def test_wrapped_clients_keep_residency(self, stub_orchestrator):
+        res = FakeServer()
+        orch = _orchestrator(stub_orchestrator, res)
+        orch.llm_clients = {k: ThrottledClient(c, ConcurrencyLimits()) for k, c in orch.llm_clients.items()}
+        assert orch._residency() is res
+        assert orch._stage_model("world_building") == "model-b"
+
+    def test_disabled_or_no_local_clients(self, stub_orchestrator):
+        orch = _orchestrator(stub_orchestrator, FakeServer(), enabled=False)
+        assert orch._residency() is None
+        orch = stub_orchestrator()
+        assert orch._residency() is None
+
+    @pytest.mark.asyncio
+    async def test_canary_warms_all_models(self, stub_orchestrator):
+        res = FakeServer(max_loaded=2, load_delay=0.1)
+        orch = _orchestrator(stub_orchestrator, res)
+        orch._format_contract = ""
+        orch._stop_sequences = []
+        checked = []
+        for client in orch.llm_clients.values():
+            async def generate(prompt, _model=client.model_name, **kwargs):
+                checked.append(_model)
+                return SimpleNamespace(content="The cat watched the rain. It did not move.")
+            client.generate = generate
+        orch.state.config["model_overrides"]["self_refinement"] = "b"
+        orch.state.config["model_overrides"]["scene_drafting"] = "a"
+
+        started = time.monotonic()
+        await orch._canary_scene_check()
+        assert sorted(res.loads()) == ["model-a", "model-b"]
+        assert time.monotonic() - started < 0.18
+        assert sorted(checked) == ["model-a", "model-b"]
@@ -0,0 +1,120 @@
+"""
+Unit Tests for skeleton-first master outline generation
+
+Tests that a chapter skeleton is planned once, batches expand concurrently
+from it, and scene-name collisions are resolved over the merged outline.
+"""
+
+import pytest
+import asyncio
+import json
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class FakeOutlineClient:
+    model_name = "gpt-4o-mini"
+
+    def __init__(self, skeleton_ok=True):
+        self.skeleton_ok = skeleton_ok
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _resp(self, content):
+        return SimpleNamespace(content=content, input_tokens=10, output_tokens=10)
+
+    async def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        if "CHAPTER-LEVEL SKELETON" in prompt:
+            if not self.skeleton_ok:
+                return self._resp("not json at all")
+            chapters = [{"chapter": c, "act": 1, "purpose": f"purpose {c}", "pov": "Hero",
+                         "key_events": [f"event {c}"]} for c in range(1, 13)]
+            return self._resp(json.dumps({"chapters": chapters}))
+        if "Generate a UNIQUE scene name" in prompt:
+            return self._resp("Fresh Renamed Moment")
+        m = re.search(r"Create chapters (\d+)-(\d+)", prompt)
+        if not m:
+            return self._resp("{}")
+        start, end = int(m.group(1)), int(m.group(2))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        chapters = []
+        for c in range(start, end + 1):
+            name = "Harbor Lantern Vigil" if c in (2, 8) else f"Zeta{c} Omega{c}"
+            chapters.append({"chapter": c, "chapter_title": f"T{c}", "scenes": [
+                {"scene": 1, "scene_name": name, "pov": "Hero", "purpose": f"p{c}"}]})
+        return self._resp(json.dumps({"chapters": chapters}))
+
+
+def _orchestrator(stub_orchestrator, client, mode="auto"):
+    config = {
+        "genre": "sci-fi",
+        "synopsis": "Test",
+        "protagonist": "Hero",
+        "writing_style": "single pov",
+        "master_outline": {"mode": mode},
+    }
+    return stub_orchestrator(
+        config,
+        client=client,
+        high_concept="A test concept",
+        beat_sheet=[{"act": 1, "beat": "Setup"}],
+        characters=[{"name": "Hero", "role": "protagonist"}],
+        target_chapters=12,
+        scenes_per_chapter=1,
+        motif_map={},
+    )
+
+
+def _batch_prompts(client):
+    return [p for p in client.prompts if re.search(r"Create chapters \d+-\d+", p)]
+
+
+class TestSkeletonOutline:
+
+    @pytest.mark.asyncio
+    async def test_batches_expand_concurrently_from_skeleton(self, stub_orchestrator):
+        client = FakeOutlineClient()
+        orchestrator = _orchestrator(stub_orchestrator, client)
+        await orchestrator._stage_master_outline()
+
+        assert client.max_in_flight > 1
+        batch_prompts = _batch_prompts(client)
+        assert len(batch_prompts) == 4
+        assert all("BOOK SKELETON" in p for p in batch_prompts)
+        assert not any("PREVIOUSLY OUTLINED CHAPTERS" in p for p in batch_prompts)
+
+        chapters = [ch["chapter"] for ch in orchestrator.state.master_outline]
+        assert chapters == list(range(1, 13))
+        names = [sc["scene_name"] for ch in orchestrator.state.master_outline for sc in ch["scenes"]]
+        assert names.count("Harbor Lantern Vigil") == 1
+        assert "Fresh Renamed Moment" in names
+        report = orchestrator.state.outline_json_report
+        assert [b["batch_range"] for b in report["batches"]] == ["1-3", "4-6", "7-9", "10-12"]
+
+    @pytest.mark.asyncio
+    async def test_bad_skeleton_falls_back_to_sequential(self, stub_orchestrator):
+        client = FakeOutlineClient(skeleton_ok=False)
+        orchestrator = _orchestrator(stub_orchestrator, client)
+        await orchestrator._stage_master_outline()
+
+        assert client.max_in_flight == 1
+        assert any("PREVIOUSLY OUTLINED CHAPTERS" in p for p in _batch_prompts(client))
+        assert len(orchestrator.state.master_outline) == 12
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_skips_skeleton(self, stub_orchestrator):
+        client = FakeOutlineClient()
+        orchestrator = _orchestrator(stub_orchestrator, client, mode="sequential")
+        await orchestrator._stage_master_outline()
+
+        assert not any("CHAPTER-LEVEL SKELETON" in p for p in client.prompts)
+        assert len(orchestrator.state.master_outline) == 12
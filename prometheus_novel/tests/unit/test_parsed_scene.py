@@ -0,0 +1,126 @@
+"""Tests for the shared ParsedScene representation (quality.parsed_scene)."""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from quality import parsed_scene
+from quality.parsed_scene import ParsedScene, parse_scene
+from quality.quality_contract import _check_rhythm_variance
+from quality.quiet_killers import _classify_paragraph, apply_deflection_grounding
+from quality.tension_density import _split_dialogue_narration
+from quality.voice_heatmap import compute_scene_metrics
+from stages.pipeline import count_words_accurate
+from stages.quality_meters import _extract_dialogue_by_character
+
+SCENE = (
+    "# Chapter 3\n\n"
+    "  The corridor smelled of wet stone.  Somewhere below, a pump coughed twice!\n\n"
+    "\"I told you already,\" Marta said. “We leave at dawn,” she whispered...\n\n"
+    "\n\n"
+    "***\n\n"
+    "I wondered if she knew? I thought about the *letter* in my coat, the way the ink ran.\n\n"
+    "“You never listen to anything I say,” I said. Then nothing"
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    parsed_scene.clear_cache()
+    yield
+    parsed_scene.clear_cache()
+
+
+class TestViews:
+    def test_paragraphs_and_blocks(self):
+        parsed = parse_scene(SCENE)
+        assert parsed.blocks == tuple(SCENE.split("\n\n"))
+        assert list(parsed.paragraphs) == [p.strip() for p in SCENE.split("\n\n") if p.strip()]
+
+    def test_sentences_match_regex_split(self):
+        parsed = parse_scene(SCENE)
+        expected = [s.strip() for s in re.split(r"[.!?]+", SCENE) if s.strip()]
+        assert list(parsed.sentences()) == expected
+        assert list(parsed.sentence_lengths) == [len(s.split()) for s in expected]
+
+    def test_words(self):
+        parsed = ParsedScene(SCENE)
+        bounds = parsed.token_bounds
+        assert [SCENE[bounds[i]:bounds[i + 1]] for i in range(0, len(bounds), 2)] == SCENE.split()
+        assert parsed.word_count == len(SCENE.split())
+        assert parsed.accurate_word_count == count_words_accurate(SCENE)
+        assert parse_scene("").accurate_word_count == 0
+
+    def test_dialogue(self):
+        parsed = parse_scene(SCENE)
+        assert parsed.dialogue_text == "\"I told you already,\" “We leave at dawn,” " \
+                                       "“You never listen to anything I say,”"
+        assert "told you" not in parsed.narration_text and "Marta said" in parsed.narration_text
+        assert _split_dialogue_narration(SCENE) == (parsed.dialogue_text, parsed.narration_text)
+        speakers = [speaker for _, _, speaker in parsed.attributed_quotes]
+        assert speakers == ["marta", "she", "i"]
+
+    def test_labels_memoized_per_classifier(self):
+        calls = []
+
+        def classify(p):
+            calls.append(p)
+            return "X"
+        parsed = parse_scene(SCENE)
+        assert parsed.labels(classify) == ("X",) * len(parsed.paragraphs)
+        parsed.labels(classify)
+        assert len(calls) == len(parsed.paragraphs)
+        assert len(parsed.labels(classify, blocks=True)) == len(parsed.blocks)
+
+
+class TestCache:
+    def test_shared_by_content(self):
+        assert parse_scene(SCENE) is parse_scene("".join(list(SCENE)))
+        assert parse_scene(SCENE) is not parse_scene(SCENE + " ")
+
+    def test_lru_bound(self, monkeypatch):
+        monkeypatch.setattr(parsed_scene, "PARSE_CACHE_SIZE", 2)
+        first = parse_scene("a")
+        parse_scene("b")
+        parse_scene("a")             # refresh "a"
+        parse_scene("c")             # evicts "b"
+        assert parse_scene("a") is first
+        assert len(parsed_scene._cache) == 2 and "b" not in parsed_scene._cache
+
+    def test_compact_storage(self):
+        parsed = parse_scene(SCENE)
+        assert not hasattr(parsed, "__dict__")
+        assert parsed.sentence_bounds.typecode == "I"
+
+
+class TestConsumersUnchanged:
+    def test_rhythm_variance(self):
+        text = "Short one. " + "This sentence has exactly thirteen words in it to sit in band. " * 4
+        has_short, has_long, warnings = _check_rhythm_variance(text)
+        assert has_short and not has_long
+        assert any("4+ consecutive" in w for w in warnings)
+
+    def test_voice_metrics_sentence_filter(self):
+        text = " ".join(["Go.", "Wait here now.", "She ran to the far door quickly."] * 6)
+        lengths = [len(s.split()) for s in (x.strip() for x in re.split(r"[.!?]+", text))
+                   if s and len(s) > 5]
+        mean = sum(lengths) / len(lengths)
+        expected = (sum((x - mean) ** 2 for x in lengths) / len(lengths)) ** 0.5
+        assert compute_scene_metrics(text)["sentence_length_variance"] == pytest.approx(expected)
+
+    def test_deflection_grounding_uses_block_labels(self):
+        text = "I knew it.\n\nThe room was dim.\n\nI thought of her.\n\nShe grabbed the rail."
+        out = apply_deflection_grounding(text, tension_level=8, max_edits=1)
+        assert out.count("\n\n") == text.count("\n\n") + 1
+        assert parse_scene(text).labels(_classify_paragraph, blocks=True)[0] == "INTERNAL"
+
+    def test_dialogue_attribution(self):
+        scenes = [{"content": SCENE, "pov": "elena"}]
+        chars = [{"name": "Marta Voss"}, {"name": "Elena Ruiz"}]
+        found = _extract_dialogue_by_character(scenes, chars)
+        assert found["Marta Voss"] == ["I told you already,", "We leave at dawn,"]  # "she" resolved
+        assert found["Elena Ruiz"] == ["You never listen to anything I say,"]
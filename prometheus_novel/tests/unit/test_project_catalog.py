@@ -0,0 +1,139 @@
+"""Tests for the web dashboard's SQLite project catalog (interfaces.web.catalog)."""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from interfaces.web import catalog as catalog_mod
+from interfaces.web.catalog import ProjectCatalog
+
+
+def _make_project(root: Path, name: str, genre: str = "romance", status: str = "seeded",
+                  scenes=None, run_status=None) -> Path:
+    d = root / name
+    d.mkdir(parents=True, exist_ok=True)
+    (d / "config.yaml").write_text(
+        yaml.dump({"title": name.replace("-", " ").title(), "genre": genre, "status": status}),
+        encoding="utf-8")
+    if scenes is not None:
+        (d / "pipeline_state.json").write_text(json.dumps({"scenes": scenes}), encoding="utf-8")
+    if run_status is not None:
+        (d / "run_status.json").write_text(json.dumps(run_status), encoding="utf-8")
+    return d
+
+
+def _touch_later(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+
+@pytest.fixture
+def projects(tmp_path):
+    root = tmp_path / "projects"
+    _make_project(root, "burning-vows", scenes=[{"content": "one two three"}, {"content": "four"}],
+                  run_status={"last_stage": "scene_drafting", "last_status": "completed",
+                              "completed_stages": ["high_concept", "scene_drafting"],
+                              "total_tokens": 1200, "total_cost_usd": 0.42,
+                              "timestamp": "2026-10-01T10:00:00"})
+    _make_project(root, "the-bends", genre="thriller", status="completed")
+    _make_project(root, "seat-27b", genre="thriller")
+    (root / "not-a-project").mkdir()
+    return root
+
+
+class TestIndexing:
+    def test_scan_indexes_metadata_and_run_status(self, projects, tmp_path):
+        cat = ProjectCatalog(tmp_path / "catalog.db", projects)
+        assert cat.scan() == {"added": 3, "updated": 0, "removed": 0}
+        row = cat.get("burning-vows")
+        assert row["title"] == "Burning Vows" and row["genre"] == "romance"
+        assert row["last_stage"] == "scene_drafting" and row["completed_stages"] == 2
+        assert row["scene_count"] == 2 and row["word_count"] == 4
+        assert row["total_cost_usd"] == pytest.approx(0.42)
+        assert "signature" not in row
+        assert cat.get("not-a-project") is None
+
+    def test_rescan_reads_only_changed_projects(self, projects, tmp_path, monkeypatch):
+        cat = ProjectCatalog(tmp_path / "catalog.db", projects)
+        cat.scan()
+        read = []
+        real = catalog_mod.index_project
+        monkeypatch.setattr(catalog_mod, "index_project", lambda d: read.append(d.name) or real(d))
+
+        assert cat.scan() == {"added": 0, "updated": 0, "removed": 0}
+        assert read == []
+
+        status_file = projects / "the-bends" / "run_status.json"
+        status_file.write_text(json.dumps({"last_stage": "output_validation"}), encoding="utf-8")
+        _make_project(projects, "new-one")
+        shutil.rmtree(projects / "seat-27b")
+        assert cat.scan() == {"added": 1, "updated": 1, "removed": 1}
+        assert sorted(read) == ["new-one", "the-bends"]
+        assert cat.get("the-bends")["last_stage"] == "output_validation"
+        assert cat.get("seat-27b") is None
+
+    def test_refresh_one_project(self, projects, tmp_path):
+        cat = ProjectCatalog(tmp_path / "catalog.db", projects)
+        cat.scan()
+        config = projects / "seat-27b" / "config.yaml"
+        config.write_text(yaml.dump({"genre": "thriller", "status": "completed"}), encoding="utf-8")
+        _touch_later(config)
+        assert cat.refresh(projects / "seat-27b")["status"] == "completed"
+        assert cat.refresh(projects / "gone") is None
+
+
+class TestListing:
+    def test_filter_search_sort_and_paginate(self, projects, tmp_path):
+        cat = ProjectCatalog(tmp_path / "catalog.db", projects)
+        cat.scan()
+        rows, total = cat.list(genre="thriller")
+        assert total == 2 and [r["name"] for r in rows] == ["seat-27b", "the-bends"]
+
+        rows, total = cat.list(sort="-total_cost_usd", limit=1)
+        assert total == 3 and rows[0]["name"] == "burning-vows"
+        rows, _ = cat.list(sort="name", limit=2, offset=2)
+        assert [r["name"] for r in rows] == ["the-bends"]
+
+        assert [r["name"] for r in cat.list(search="VOWS")[0]] == ["burning-vows"]
+        assert cat.list(search="%")[1] == 0          # LIKE wildcards are escaped
+        assert cat.list(status="completed")[1] == 1
+
+    def test_unknown_sort_rejected(self, projects, tmp_path):
+        cat = ProjectCatalog(tmp_path / "catalog.db", projects)
+        with pytest.raises(ValueError):
+            cat.list(sort="path; DROP TABLE projects")
+
+
+class TestAppHandlers:
+    @pytest.mark.asyncio
+    async def test_reads_run_off_the_event_loop(self, projects, tmp_path, monkeypatch):
+        import threading
+        from fastapi import HTTPException
+        from interfaces.web import app as web
+
+        cat = ProjectCatalog(tmp_path / "catalog.db", projects)
+        cat.scan()
+        threads = []
+        for name in ("get", "list"):
+            real = getattr(cat, name)
+            monkeypatch.setattr(cat, name, lambda *a, _real=real, **kw: (
+                threads.append(threading.current_thread()), _real(*a, **kw))[1])
+        monkeypatch.setattr(web.app_state, "catalog", cat)
+
+        page = await web.list_projects(limit=2, sort="name")
+        assert page["total"] == 3 and len(page["projects"]) == 2
+        assert (await web.get_project("the-bends"))["status"] == "completed"
+        with pytest.raises(HTTPException) as missing:
+            await web.get_project("nope")
+        assert missing.value.status_code == 404
+        with pytest.raises(HTTPException) as bad_sort:
+            await web.list_projects(sort="path")
+        assert bad_sort.value.status_code == 400
+        assert len(threads) == 4 and threading.main_thread() not in threads
@@ -0,0 +1,158 @@
+"""Tests for token-budgeted prompt assembly (prometheus_lib.llm.prompt_budget + orchestrator helper)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from prometheus_lib.llm import prompt_budget as pb
+from prometheus_lib.llm.prompt_budget import (
+    TRIM_NOTE,
+    PromptBudget,
+    TokenCounter,
+    compress_text,
+)
+
+
+class WordCounter(TokenCounter):
+    """One token per word; records how often the tokenizer actually ran."""
+
+    def __init__(self):
+        super().__init__("word-counter")
+        self.kind = f"test:{id(self)}"
+        self.calls = 0
+
+    def _encode_len(self, text):
+        self.calls += 1
+        return len(text.split())
+
+
+def _lines(prefix, n, words=5):
+    return "\n".join(f"{prefix}{i} " + "w " * (words - 1) for i in range(n))
+
+
+class TestTokenCounter:
+    def test_counts_cached_by_content(self):
+        counter = WordCounter()
+        assert counter.count("a b c") == 3
+        assert counter.count("a b c") == 3
+        assert counter.calls == 1
+        assert counter.count("") == 0
+        assert counter.calls == 1
+
+    def test_remember_seeds_cache(self):
+        counter = WordCounter()
+        counter.remember("some long prompt", 99)
+        assert counter.count("some long prompt") == 99
+        assert counter.calls == 0
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(pb, "_CACHE_SIZE", 3)
+        monkeypatch.setattr(pb, "_token_cache", pb.OrderedDict())
+        counter = WordCounter()
+        for word in ("a", "b", "c", "d"):
+            counter.count(word)
+        assert len(pb._token_cache) == 3
+        counter.count("a")
+        assert counter.calls == 5
+
+    def test_heuristic_fallback_matches_clients(self):
+        from prometheus_lib.llm.clients import count_tokens
+        text = "The harbor lights flickered as the ferry pulled away."
+        assert TokenCounter("qwen2.5:14b").count(text) == count_tokens(text, "qwen2.5:14b")
+
+
+class TestCompress:
+    def test_head_tail_middle(self):
+        counter = WordCounter()
+        text = _lines("L", 10)
+        head = compress_text(text, counter, 25, "head").splitlines()
+        assert head[0].startswith("L0") and head[-1] == TRIM_NOTE
+        tail = compress_text(text, counter, 25, "tail").splitlines()
+        assert tail[0] == TRIM_NOTE and tail[-1].startswith("L9")
+        middle = compress_text(text, counter, 25, "middle").splitlines()
+        assert middle[0].startswith("L0") and middle[-1].startswith("L9")
+        assert TRIM_NOTE in middle[1:-1]
+
+    def test_single_line_splits_sentences(self):
+        counter = WordCounter()
+        text = " ".join(f"Sentence {i} has five words." for i in range(8))
+        out = compress_text(text, counter, 20, "tail")
+        assert out.startswith(TRIM_NOTE) and out.endswith("Sentence 7 has five words.")
+
+    def test_too_small_target_is_empty(self):
+        assert compress_text(_lines("L", 3), WordCounter(), 2, "head") == ""
+
+
+class TestPromptBudget:
+    def _budget(self, limit):
+        budget = PromptBudget(WordCounter(), limit)
+        slots = {
+            "state": budget.block("state", _lines("S", 10), priority=80, compress="middle"),
+            "prev": budget.block("prev", _lines("P", 10), priority=90, compress="tail"),
+            "style": budget.block("style", _lines("Y", 10), priority=20),
+            "avoid": budget.block("avoid", _lines("A", 10), priority=40, compress="head"),
+        }
+        template = "Fixed header words here.\n{state}\n{prev}\n{style}\n{avoid}\nWrite now.".format(**slots)
+        return budget, template
+
+    def test_fits_without_changes(self):
+        budget, template = self._budget(1000)
+        prompt, report = budget.render(template)
+        assert "\x00" not in prompt
+        assert all(b["action"] == "keep" for b in report["blocks"].values())
+        assert report["total_tokens"] == 6 + 200
+        assert not report["over_budget"]
+
+    def test_lowest_priority_gives_way_first(self):
+        budget, template = self._budget(6 + 160)
+        prompt, report = budget.render(template)
+        blocks = report["blocks"]
+        assert blocks["style"]["action"] == "dropped"     # no compress mode: dropped whole
+        assert blocks["avoid"]["action"] == "keep"
+        assert blocks["state"]["action"] == blocks["prev"]["action"] == "keep"
+        assert "Y0" not in prompt and "A9" in prompt
+        assert report["total_tokens"] <= report["budget"]
+
+    def test_compresses_then_drops_in_priority_order(self):
+        budget, template = self._budget(6 + 140)
+        prompt, report = budget.render(template)
+        blocks = report["blocks"]
+        assert blocks["style"]["action"] == "dropped"
+        assert blocks["avoid"]["action"] == "compressed"
+        assert blocks["state"]["action"] == blocks["prev"]["action"] == "keep"
+        assert "A0" in prompt and "A9" not in prompt
+        assert report["total_tokens"] <= report["budget"]
+
+    def test_system_prompt_counts_against_budget(self):
+        budget, template = self._budget(6 + 200)
+        _, report = budget.render(template, system_prompt="one two three four five six seven")
+        assert report["blocks"]["style"]["action"] == "dropped"
+
+    def test_over_budget_when_fixed_text_alone_overflows(self):
+        budget, template = self._budget(3)
+        _, report = budget.render(template)
+        assert report["over_budget"]
+        assert all(b["kept_tokens"] == 0 for b in report["blocks"].values())
+
+
+class _Client:
+    model_name = "qwen2.5:14b"
+
+
+class TestOrchestratorBudget:
+    def test_budget_from_context_limit(self, stub_orchestrator):
+        orch = stub_orchestrator({"model_defaults": {"model_context_limit": 8192}})
+        assert orch._prompt_budget(_Client(), 3000).max_prompt_tokens == 8192 - 3000 - 256
+
+    def test_config_overrides(self, stub_orchestrator):
+        orch = stub_orchestrator({
+            "prompt_budget": {"max_prompt_tokens": 5000, "per_model": {"qwen2.5:14b": 4000}},
+        })
+        assert orch._prompt_budget(_Client(), 3000).max_prompt_tokens == 4000
+        orch.state.config["prompt_budget"] = {"enabled": False}
+        assert orch._prompt_budget(_Client(), 3000).max_prompt_tokens > 10 ** 6
+
+    def test_counter_reused_per_model(self, stub_orchestrator):
+        orch = stub_orchestrator()
+        assert orch._token_counter(_Client()) is orch._token_counter(_Client())
@@ -0,0 +1,113 @@
+"""Tests for the run-scoped resource registry (stages.resources)."""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from quality.cliche_clusters import load_cluster_config
+from stages.bible_loader import ReferenceBible
+from stages.resources import ResourceRegistry, resources, use_resources
+
+BIBLE = """# Reference Bible
+
+## 2. Character Bible
+
+### MARTA VOSS
+- **Speech pattern:** clipped, never asks questions
+- **DO NOT:** cry in public
+
+## 5. Scene-by-Scene Outline
+
+### Chapter 1
+
+**Scene 1** — Marta arrives at the harbour. KEY BEAT: the ledger is missing.
+"""
+
+
+def _bump_mtime(path: Path, seconds: int = 5) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+class TestInvalidation:
+    def test_loaded_once_until_content_changes(self, tmp_path):
+        path = tmp_path / "cfg.yaml"
+        path.write_text("a: 1\n", encoding="utf-8")
+        reg = ResourceRegistry()
+        assert reg.yaml(path) == {"a": 1}
+        assert reg.yaml(path) == {"a": 1}
+        assert reg.stats()["loads"] == 1
+
+        _bump_mtime(path)                       # touched, same bytes: no reparse
+        assert reg.yaml(path) == {"a": 1}
+        assert reg.stats()["loads"] == 1
+
+        path.write_text("a: 22\n", encoding="utf-8")
+        _bump_mtime(path, 10)
+        assert reg.yaml(path) == {"a": 22}
+        assert reg.stats()["loads"] == 2
+
+    def test_missing_file_and_copies(self, tmp_path):
+        path = tmp_path / "late.yaml"
+        reg = ResourceRegistry()
+        assert reg.yaml(path, default={}) == {}
+        path.write_text("items: [1, 2]\n", encoding="utf-8")
+        data = reg.yaml(path)
+        data["items"].append(3)                  # callers own their copy
+        assert reg.yaml(path) == {"items": [1, 2]}
+        assert reg.yaml(path, copy=False) is reg.yaml(path, copy=False)
+
+    def test_failed_load_not_cached(self, tmp_path):
+        path = tmp_path / "x.txt"
+        path.write_text("x", encoding="utf-8")
+        reg = ResourceRegistry()
+        calls = []
+
+        def loader(p):
+            calls.append(p)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return "ok"
+        try:
+            reg.get("thing", path, loader)
+        except ValueError:
+            pass
+        assert reg.get("thing", path, loader) == "ok"
+        assert reg.get("thing", path, loader) == "ok"
+        assert len(calls) == 2
+
+
+class TestBible:
+    def test_shared_and_memoized(self, tmp_path):
+        path = tmp_path / "reference_bible.md"
+        path.write_text(BIBLE, encoding="utf-8")
+        reg = ResourceRegistry()
+        bible = reg.bible(path)
+        assert isinstance(bible, ReferenceBible) and reg.bible(path) is bible
+
+        rules = bible.get_character_rules(["Marta Voss"])
+        assert "clipped" in rules
+        assert bible.get_character_rules(["Marta Voss"]) is rules
+        assert bible.get_scene_outline(1, 1) == bible.get_scene_outline(1, 1)
+        assert ("character_rules", ("Marta Voss",)) in bible._memo
+
+        path.write_text(BIBLE.replace("clipped", "rambling"), encoding="utf-8")
+        _bump_mtime(path)
+        assert "rambling" in reg.bible(path).get_character_rules(["Marta Voss"])
+        assert reg.bible(tmp_path / "missing.md") is None
+
+
+class TestScoping:
+    def test_run_registry_reaches_quality_modules(self, tmp_path):
+        path = tmp_path / "cliche_clusters.yaml"
+        path.write_text("clusters:\n  gaze: {threshold: 2}\n", encoding="utf-8")
+        run_reg = ResourceRegistry()
+        assert resources() is not run_reg
+        with use_resources(run_reg):
+            assert resources() is run_reg
+            assert load_cluster_config(path)["clusters"]["gaze"]["threshold"] == 2
+            load_cluster_config(path)
+        assert resources() is not run_reg
+        assert run_reg.stats() == {"entries": 1, "hits": 1, "loads": 1}
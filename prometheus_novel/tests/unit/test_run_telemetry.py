@@ -0,0 +1,108 @@
+"""Tests for run-scoped telemetry sinks (stages.telemetry + pipeline morgue/incident logging)."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from stages import pipeline
+from stages.pipeline import PipelineOrchestrator
+from stages.telemetry import JsonlSink, current_telemetry, run_telemetry
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJsonlSink:
+    @pytest.mark.asyncio
+    async def test_background_writer_batches(self, tmp_path):
+        sink = JsonlSink(tmp_path / "x.jsonl", batch_size=3, flush_interval=10)
+        sink.start()
+        for i in range(3):
+            sink.put({"i": i})                  # third put fills a batch and wakes the writer
+        await asyncio.sleep(0.05)
+        assert [e["i"] for e in _read(sink.path)] == [0, 1, 2]
+        sink.put({"i": 3})
+        await sink.close()
+        assert [e["i"] for e in _read(sink.path)] == [0, 1, 2, 3]
+        assert sink.count == sink.written == 4
+
+    def test_bounded_queue_drops_oldest(self, tmp_path):
+        sink = JsonlSink(tmp_path / "x.jsonl", max_queue=2)
+        for i in range(4):
+            sink.put({"i": i})
+        sink.flush_sync()
+        assert [e["i"] for e in _read(sink.path)] == [2, 3]
+        assert sink.dropped == 2
+
+    def test_rotation(self, tmp_path):
+        path = tmp_path / "m.jsonl"
+        path.write_text("x" * 100)
+        sink = JsonlSink(path, max_bytes=50)
+        sink.put({"i": 1})
+        sink.flush_sync()
+        assert (tmp_path / "m.jsonl.old").read_text() == "x" * 100
+        assert _read(path) == [{"i": 1}]
+
+
+class TestRunScope:
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_keep_their_own_records(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pipeline, "_incident_buffer", [])
+        monkeypatch.setattr(pipeline, "_cleanup_morgue", [])
+
+        async def fake_run(name, delay):
+            project = tmp_path / name
+            project.mkdir()
+            async with run_telemetry(project):
+                for i in range(3):
+                    pipeline._log_incident(f"{name}_stage", "test", f"{name} event {i}")
+                    pipeline._log_to_morgue(f"{name}_s{i}", f"deleted text from {name}", "pattern")
+                    await asyncio.sleep(delay)
+                assert pipeline._incident_count() == 3
+            return project
+
+        a, b = await asyncio.gather(fake_run("a", 0.01), fake_run("b", 0.015))
+        for project, name in ((a, "a"), (b, "b")):
+            incidents = _read(project / "incidents.jsonl")
+            morgue = _read(project / "cleanup_morgue.jsonl")
+            assert len(incidents) == 3 and len(morgue) == 3
+            assert all(e["stage"] == f"{name}_stage" for e in incidents)
+            assert all(e["scene_id"].startswith(name) for e in morgue)
+        assert current_telemetry() is None
+        assert not pipeline._incident_buffer and not pipeline._cleanup_morgue
+
+    @pytest.mark.asyncio
+    async def test_stage_tasks_inherit_scope(self, tmp_path):
+        async with run_telemetry(tmp_path) as telemetry:
+            async def stage():
+                pipeline._log_incident("child", "test", "from a task")
+            await asyncio.ensure_future(stage())
+            pipeline._flush_incidents(tmp_path)     # only wakes the writer inside a run
+            assert telemetry.incidents.count == 1
+        assert _read(tmp_path / "incidents.jsonl")[0]["stage"] == "child"
+
+    def test_fallback_outside_run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pipeline, "_incident_buffer", [])
+        pipeline._log_incident("solo", "test", "outside any run")
+        assert pipeline._incident_count() == 1
+        pipeline._flush_incidents(tmp_path)
+        assert _read(tmp_path / "incidents.jsonl")[0]["stage"] == "solo"
+        assert pipeline._incident_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_run_is_scoped(self, project_with_config):
+        orch = PipelineOrchestrator(project_with_config, llm_client=None, llm_clients={})
+
+        async def body(stages, resume, rewrite_scenes_indices):
+            pipeline._log_incident("scene_drafting", "rollback", "run-scoped")
+            return "state"
+        orch._run_pipeline = body
+
+        assert await orch.run() == "state"
+        assert _read(project_with_config / "incidents.jsonl")[0]["detail"] == "run-scoped"
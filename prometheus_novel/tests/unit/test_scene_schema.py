@@ -0,0 +1,137 @@
+"""Tests for scene/chapter schema validation and state codecs (stages.scene_schema)."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from stages import scene_schema
+from stages.scene_schema import (
+    SchemaError,
+    check_chapter,
+    check_scene,
+    dumps_json,
+    load_state_file,
+    loads_json,
+    validate_state,
+)
+
+
+def _scene(**overrides):
+    scene = {"scene_id": "ch01_s01", "chapter": 1, "scene_number": 1,
+             "pov": "Mara", "content": "She lit the lamp.", "refined": True}
+    scene.update(overrides)
+    return scene
+
+
+class TestCheckScene:
+    def test_valid_scene_is_returned_as_is(self):
+        data = _scene()
+        fixed, issues = check_scene(data)
+        assert fixed is data and issues == []
+
+    def test_coerces_field_types(self):
+        data = _scene(chapter="3", scene_number=2.0, pov=7)
+        fixed, issues = check_scene(data)
+        assert (fixed["chapter"], fixed["scene_number"], fixed["pov"]) == (3, 2, "7")
+        assert data["chapter"] == "3" and list(fixed) == list(data)
+        assert fixed["refined"] is True and len(issues) == 3
+
+    def test_strict_rejects_bad_and_missing_fields(self):
+        with pytest.raises(SchemaError, match="chapter"):
+            check_scene(_scene(chapter="three"), strict=True)
+        with pytest.raises(SchemaError, match="missing scene_number"):
+            check_scene({"chapter": 1}, strict=True)
+        with pytest.raises(SchemaError):
+            check_scene(_scene(spice_level=True), strict=True)
+        with pytest.raises(SchemaError, match="missing chapter"):
+            check_chapter({"chapter_title": "Arrival"}, strict=True)
+
+
+class TestValidateState:
+    def test_coerces_without_touching_valid_entries(self):
+        good = _scene()
+        state = {"project_name": "demo", "scenes": [good, _scene(chapter="2")],
+                 "master_outline": [{"chapter": "1", "chapter_title": "Arrival", "scenes": []}]}
+        fixed, issues = validate_state(state)
+        assert list(fixed) == list(state)
+        assert fixed["scenes"][0] is good
+        assert fixed["scenes"][1]["chapter"] == 2 and state["scenes"][1]["chapter"] == "2"
+        assert list(fixed["scenes"][1]) == list(state["scenes"][1])
+        assert fixed["master_outline"][0]["chapter"] == 1
+        assert len(issues) == 2 and all("coerced" in i for i in issues)
+
+    def test_non_dict_entries_kept_and_reported(self):
+        fixed, issues = validate_state({"scenes": [None, _scene(chapter="x")]})
+        assert fixed["scenes"][0] is None
+        assert fixed["scenes"][1]["chapter"] == "x"
+        assert any("scenes[0]: not an object" in i for i in issues)
+        assert any("scenes[1]: invalid chapter" in i for i in issues)
+        with pytest.raises(SchemaError):
+            validate_state({"scenes": [None]}, strict=True)
+
+
+class TestCodecs:
+    def test_json_roundtrip(self):
+        state = {"scenes": [_scene(content="“Quoted” — dash")], "ids": ("a", "b"),
+                 "tags": {"a"}, "by_chapter": {1: "one"}}
+        raw = dumps_json(state)
+        assert isinstance(raw, bytes)
+        data = loads_json(raw)
+        assert data["scenes"] == [_scene(content="“Quoted” — dash")]
+        assert data["tags"] == ["a"] and data["by_chapter"] == {"1": "one"}
+        assert data["ids"] == ["a", "b"]
+        assert loads_json(raw.decode("utf-8")) == data
+
+    def test_indent_matches_stdlib_layout(self):
+        state = {"scenes": [_scene()], "total_tokens": 12}
+        assert dumps_json(state, indent=True).decode("utf-8") == json.dumps(
+            state, indent=2, ensure_ascii=False)
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(scene_schema, "orjson", None)
+        raw = dumps_json({"scene": _scene(), "tags": {"a"}}, indent=True)
+        assert loads_json(raw) == {"scene": _scene(), "tags": ["a"]}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_lone_surrogate_roundtrip(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(scene_schema, "orjson", None)
+        state = {"scenes": [_scene(content="Truncated emoji \ud83d")]}
+        raw = dumps_json(state, indent=True)
+        assert loads_json(raw) == state
+        assert json.loads(raw) == state
+
+    def test_legacy_stdlib_checkpoint_loads(self, tmp_path):
+        path = tmp_path / "pipeline_state.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"scenes": [_scene(content="Cut \ud83d")], "score": float("nan")}, f, indent=2)
+        data = load_state_file(path)
+        assert data["scenes"][0]["content"] == "Cut \ud83d"
+        assert data["score"] != data["score"]                # NaN
+
+    def test_msgpack_missing_is_explicit(self, monkeypatch):
+        monkeypatch.setattr(scene_schema, "msgpack", None)
+        with pytest.raises(RuntimeError, match="msgpack"):
+            scene_schema.dumps_msgpack({})
+        with pytest.raises(RuntimeError, match="msgpack"):
+            scene_schema.loads_msgpack(b"")
+
+
+class TestLoadStateFile:
+    def test_load_validates(self, tmp_path):
+        path = tmp_path / "pipeline_state.json"
+        path.write_text(json.dumps({"scenes": [_scene(scene_number="4")]}), encoding="utf-8")
+        assert load_state_file(path)["scenes"][0]["scene_number"] == 4
+
+    def test_malformed_and_non_object(self, tmp_path):
+        path = tmp_path / "pipeline_state.json"
+        path.write_text("{not json", encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_state_file(path)
+        path.write_text("[]", encoding="utf-8")
+        with pytest.raises(SchemaError):
+            load_state_file(path)
@@ -0,0 +1,94 @@
+"""Tests for the content-addressed pipeline state snapshot store (stages.snapshots)."""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from stages.snapshots import SnapshotStore
+
+
+def _state(n_scenes=4, tag=""):
+    return {
+        "project_name": "demo",
+        "completed_stages": ["high_concept", "scene_drafting"],
+        "master_outline": [{"chapter": 1, "title": "Arrival"}],
+        "scenes": [
+            {"scene_id": f"ch01_s{i:02d}", "chapter": 1, "scene_number": i,
+             "content": f"Scene {i} text. " * 200 + tag}
+            for i in range(1, n_scenes + 1)
+        ],
+        "total_tokens": 1234,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore.for_project(tmp_path)
+
+
+class TestSnapshotRestore:
+    def test_roundtrip_preserves_state_and_key_order(self, store, tmp_path):
+        state = _state()
+        store.snapshot(state, "pre_targeted_refinement")
+        assert store.load("pre_targeted_refinement") == state
+        assert list(store.load("pre_targeted_refinement")) == list(state)
+
+        state_file = tmp_path / "pipeline_state.json"
+        state_file.write_text("{}", encoding="utf-8")
+        store.restore("pre_targeted_refinement", state_file)
+        assert json.loads(state_file.read_text(encoding="utf-8")) == state
+
+    def test_unchanged_scenes_stored_once_and_compressed(self, store):
+        first = store.snapshot(_state(), "a")
+        assert 0 < first["written_bytes"] < first["raw_bytes"] / 5
+        assert store.snapshot(_state(), "b")["written_bytes"] == 0
+
+        edited = _state()
+        edited["scenes"][2]["content"] += " Edited."
+        third = store.snapshot(edited, "c")
+        assert 0 < third["written_bytes"] < first["written_bytes"]
+        assert store.disk_usage()["objects"] == 1 + 4 + 1
+
+    def test_snapshot_file_and_name_refs(self, store, tmp_path):
+        state_file = tmp_path / "pipeline_state.json"
+        state_file.write_text(json.dumps(_state(tag="v1")), encoding="utf-8")
+        older = store.snapshot_file(state_file, "manual")
+        state_file.write_text(json.dumps(_state(tag="v2")), encoding="utf-8")
+        newer = store.snapshot_file(state_file, "manual")
+        assert store.manifest("manual")["id"] == newer["id"]
+        assert store.load(older["id"])["scenes"][0]["content"].endswith("v1")
+        with pytest.raises(KeyError):
+            store.manifest("missing")
+
+
+class TestDiffAndGc:
+    def test_diff_by_scene_key(self, store):
+        before = _state()
+        after = copy.deepcopy(before)
+        after["scenes"][0]["content"] = "Rewritten."
+        del after["scenes"][3]
+        after["scenes"].append({"scene_id": "ch02_s01", "content": "New."})
+        store.snapshot(before, "before")
+        store.snapshot(after, "after")
+        d = store.diff("before", "after")
+        assert d["changed"] == ["ch01_s01"]
+        assert d["removed"] == ["ch01_s04"] and d["added"] == ["ch02_s01"]
+        assert d["unchanged"] == 2 and not d["state_changed"]
+
+    def test_prune_and_gc(self, store):
+        for i in range(3):
+            store.snapshot(_state(tag=f"v{i}"), "pre_editorial_cleanup", keep=2)
+        kept = store.list("pre_editorial_cleanup")
+        assert len(kept) == 2 and kept[0]["scenes"][0] != kept[1]["scenes"][0]
+        assert store.disk_usage()["objects"] == 1 + 4 * 2
+        for m in kept:
+            assert len(store.load(m["id"])["scenes"]) == 4
+
+        store.delete(kept[0]["id"])
+        assert store.gc()["removed_objects"] == 4
+        assert store.gc() == {"removed_objects": 0, "freed_bytes": 0}
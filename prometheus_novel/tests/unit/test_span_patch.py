@@ -0,0 +1,224 @@
+"""Tests for quality.span_patch — span-level patch protocol for surgical rewrites."""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from editor_studio.orchestrator import _pass_patch_indices, _run_pass
+from quality.span_patch import (
+    apply_patches,
+    build_patch_excerpt,
+    paragraph_spans,
+    parse_patches,
+    select_repair_paragraphs,
+    split_paragraphs,
+    tail_indices,
+)
+
+SCENE = "\n\n".join([
+    "Paragraph 1 opens on the harbor where gulls fought over scraps of bait.",
+    "Paragraph 2 follows Hero down the pier, counting boats against the tide.",
+    "Paragraph 3 has the harbormaster refusing to lend a skiff before noon.",
+    "Paragraph 4 sends Hero to the chandlery for rope, tar and a cheap lantern.",
+    "Paragraph 5 finds the lantern cracked and the shopkeeper suddenly absent.",
+    "Paragraph 6 ends with Hero rowing out alone while the fog rolls inland.",
+])
+
+
+class TestParagraphs:
+    def test_spans_skip_blank_runs(self):
+        text = "One.\n\n\n\nTwo.\n\n  \n\nThree."
+        assert split_paragraphs(text) == ["One.", "Two.", "Three."]
+        assert len(paragraph_spans(text)) == 3
+
+    def test_select_matches_mark_repair_spans_rules(self):
+        paras = split_paragraphs(SCENE)
+        assert select_repair_paragraphs(paras, ["final beat / closing paragraphs"]) == {4, 5}
+        assert select_repair_paragraphs(paras, ["opening paragraphs (goal statement)"]) == {0, 1}
+        # Too many targeted -> repair everything
+        assert select_repair_paragraphs(paras, ["opening", "middle section", "final beat"]) == set()
+        assert select_repair_paragraphs(paras[:3], ["final beat"]) == set()
+
+
+class TestExcerpt:
+    def test_editable_context_and_omissions(self):
+        excerpt = build_patch_excerpt(SCENE, {5}, context=1)
+        assert "[P6]\nParagraph 6 ends" in excerpt
+        assert "[CONTEXT P5 — read only, do not patch]" in excerpt
+        assert "[... 4 paragraph(s) omitted ...]" in excerpt
+        assert "Paragraph 1 " not in excerpt
+
+    def test_whole_scene_when_no_indices(self):
+        excerpt = build_patch_excerpt(SCENE)
+        assert excerpt.count("[P") == 6
+        assert "CONTEXT" not in excerpt
+
+
+class TestParse:
+    def test_object_and_fenced(self):
+        body = json.dumps({"patches": [{"anchor": "P2", "text": "New."}]})
+        assert parse_patches(body) == [{"anchor": "P2", "text": "New."}]
+        assert parse_patches(f"```json\n{body}\n```")[0]["anchor"] == "P2"
+        assert parse_patches(f"Sure! {body} Hope that helps.")[0]["anchor"] == "P2"
+
+    def test_bare_list_and_garbage(self):
+        assert parse_patches('[{"anchor": "P1", "text": "x"}]') == [{"anchor": "P1", "text": "x"}]
+        assert parse_patches("The revised scene follows.") is None
+        assert parse_patches("") is None
+
+
+class TestApply:
+    def test_splices_exactly(self):
+        text = "Alpha one.\n\n\nBeta two.\n\nGamma three."
+        result = apply_patches(text, [{"anchor": "P2", "text": "Beta rewritten."}])
+        assert result.ok
+        assert result.content == "Alpha one.\n\n\nBeta rewritten.\n\nGamma three."
+        assert result.applied == ["P2"]
+
+    def test_accepts_bracketed_anchor(self):
+        assert apply_patches(SCENE, [{"anchor": "[P1]", "text": "Short new opening line here."}]).ok
+
+    @pytest.mark.parametrize("patch,error", [
+        ({"anchor": "P9", "text": "x"}, "no such paragraph"),
+        ({"anchor": "P1", "text": "Changed opening paragraph text."}, "not an editable paragraph"),
+        ({"anchor": "X", "text": "x"}, "bad anchor"),
+        ({"anchor": "P6", "text": "  "}, "empty replacement"),
+        ({"anchor": "P6", "text": "[P6] leaked label"}, "labels"),
+        ({"anchor": "P6", "text": "word " * 200}, "grew"),
+        ({"anchor": "P6", "text": "Tiny."}, "shrank"),
+    ])
+    def test_rejects_invalid(self, patch, error):
+        result = apply_patches(SCENE, [patch], allowed={5})
+        assert not result.ok
+        assert result.content == SCENE
+        assert error in result.errors[0]
+
+    def test_all_or_nothing(self):
+        result = apply_patches(SCENE, [
+            {"anchor": "P6", "text": "A fine closing paragraph with words."},
+            {"anchor": "P6", "text": "Duplicate closing paragraph with words."},
+        ])
+        assert not result.ok and "duplicate" in result.errors[0]
+
+    def test_empty_patch_list_is_failure(self):
+        assert not apply_patches(SCENE, []).ok
+        assert not apply_patches(SCENE, None).ok
+
+
+# ---------------------------------------------------------------------------
+# Pipeline + Editor Studio integration
+# ---------------------------------------------------------------------------
+
+class PatchClient:
+    model_name = "gpt-4o-mini"
+
+    def __init__(self, patch_reply=None, full_reply=None):
+        self.patch_reply = patch_reply
+        self.full_reply = full_reply
+        self.calls = []
+
+    async def generate(self, prompt, **kwargs):
+        patch_call = "OUTPUT FORMAT (PATCHES)" in prompt
+        self.calls.append(("patch" if patch_call else "full", prompt, kwargs))
+        content = self.patch_reply if patch_call else self.full_reply
+        return SimpleNamespace(content=content, input_tokens=100, output_tokens=20, finish_reason="stop")
+
+
+def _orchestrator(stub_orchestrator, client, span_patch=None):
+    config = {"genre": "drama", "synopsis": "Test", "protagonist": "Hero", "writing_style": "single pov"}
+    if span_patch is not None:
+        config["span_patch"] = span_patch
+    return stub_orchestrator(config, client=client, characters=[{"name": "Hero", "role": "protagonist"}])
+
+
+class TestPipelinePatchRewrite:
+    @pytest.mark.asyncio
+    async def test_patch_applied_without_full_rewrite(self, stub_orchestrator):
+        reply = json.dumps({"patches": [{"anchor": "P6", "text": "Then the door opened and nothing was the same."}]})
+        client = PatchClient(patch_reply=reply)
+        orch = _orchestrator(stub_orchestrator, client)
+
+        async def full():
+            raise AssertionError("full rewrite should not run")
+
+        content, tokens, mode = await orch._patch_rewrite(
+            "chapter_hooks", client, SCENE, "Add a hook.", full, fix_indices=tail_indices(SCENE, 3),
+        )
+        assert mode == "patch"
+        assert tokens == 120
+        assert "the door opened" in content
+        assert content.startswith("Paragraph 1 opens on the harbor")
+        prompt = client.calls[0][1]
+        assert "Paragraph 1 " not in prompt and "[P6]" in prompt
+        assert orch._span_patch_stats["chapter_hooks"]["patch"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_patch_falls_back(self, stub_orchestrator):
+        client = PatchClient(patch_reply="Here is the whole scene instead.")
+        orch = _orchestrator(stub_orchestrator, client)
+
+        async def full():
+            return "FULL REWRITE", 7
+
+        content, tokens, mode = await orch._patch_rewrite(
+            "final_deai", client, SCENE, "Fix tells.", full, fix_indices={2},
+        )
+        assert (content, mode) == ("FULL REWRITE", "full")
+        assert tokens == 127
+        assert orch._span_patch_stats["final_deai"] == {"patch": 0, "full": 1, "fallback": 1}
+
+    @pytest.mark.asyncio
+    async def test_disabled_or_untargeted_goes_straight_to_full(self, stub_orchestrator):
+        client = PatchClient(patch_reply="{}")
+
+        async def full():
+            return "FULL", 3
+
+        orch = _orchestrator(stub_orchestrator, client, span_patch={"enabled": False})
+        assert (await orch._patch_rewrite("x", client, SCENE, "t", full, fix_indices={1}))[2] == "full"
+        orch = _orchestrator(stub_orchestrator, client)
+        assert (await orch._patch_rewrite("x", client, SCENE, "t", full, fix_indices=set()))[2] == "full"
+        assert client.calls == []
+
+    @pytest.mark.asyncio
+    async def test_chapter_hooks_patches_only_ending(self, stub_orchestrator):
+        reply = json.dumps({"patches": [{"anchor": "P6", "text": "Then the phone rang, and it was her."}]})
+        client = PatchClient(patch_reply=reply)
+        orch = _orchestrator(stub_orchestrator, client)
+        orch.state.scenes = [{"chapter": 1, "scene_number": 1, "pov": "Hero", "content": SCENE}]
+
+        await orch._stage_chapter_hooks()
+
+        assert [kind for kind, _, _ in client.calls] == ["patch"]
+        new = orch.state.scenes[0]["content"]
+        assert new.split("\n\n")[:5] == SCENE.split("\n\n")[:5]
+        assert "phone rang" in new
+
+
+class TestEditorStudioPatch:
+    def test_pass_spans(self):
+        assert _pass_patch_indices(["final_line"], SCENE) == {3, 4, 5}
+        assert _pass_patch_indices(["opening_vary", "final_line"], SCENE) == {0, 1, 2, 3, 4, 5}
+        assert _pass_patch_indices(["final_line", "stakes"], SCENE) is None
+
+    @pytest.mark.asyncio
+    async def test_run_pass_uses_patch(self):
+        reply = json.dumps({"patches": [{"anchor": "P3", "text": "Paragraph 3 now carries the stakes clearly."}]})
+        client = PatchClient(patch_reply=reply)
+        scene = {"chapter": 1, "scene_number": 1, "content": SCENE}
+        out = await _run_pass(client, scene, "TASK", {}, patch=True)
+        assert [kind for kind, _, _ in client.calls] == ["patch"]
+        assert "carries the stakes" in out
+
+    @pytest.mark.asyncio
+    async def test_run_pass_falls_back_to_full_scene(self):
+        client = PatchClient(patch_reply="not json", full_reply="A full rewritten scene.")
+        scene = {"chapter": 1, "scene_number": 1, "content": SCENE}
+        out = await _run_pass(client, scene, "TASK", {}, patch=True, patch_indices={5})
+        assert [kind for kind, _, _ in client.calls] == ["patch", "full"]
+        assert out == "A full rewritten scene."
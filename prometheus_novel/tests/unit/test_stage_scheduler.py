@@ -0,0 +1,206 @@
+"""Tests for the declarative stage DAG scheduler (stages.stage_graph + PipelineOrchestrator)."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from stages.pipeline import PipelineOrchestrator, StageResult, StageStatus
+from stages.stage_graph import (
+    ALL,
+    BARRIER,
+    StageIO,
+    conflicts,
+    critical_path,
+    stage_dependencies,
+)
+
+
+class TestStageGraph:
+    def test_hazards(self):
+        a = StageIO.of(reads=["x"], writes=["y"])
+        assert conflicts(a, StageIO.of(reads=["y"]))              # read-after-write
+        assert conflicts(a, StageIO.of(writes=["x"]))             # write-after-read
+        assert conflicts(a, StageIO.of(writes=["y"]))             # write-after-write
+        assert not conflicts(a, StageIO.of(reads=["x"], writes=["z"]))
+
+    def test_barrier_and_undeclared(self):
+        io = {"a": StageIO.of(writes=["x"]), "c": StageIO.of(reads=["y"])}
+        deps = stage_dependencies(["a", "b", "c"], io)
+        assert deps == {"a": set(), "b": {"a"}, "c": {"b"}}
+        assert conflicts(StageIO.of(reads=["q"]), BARRIER)
+        assert not conflicts(StageIO(), StageIO.of(reads=[ALL]))
+
+    def test_pipeline_planning_stages_overlap(self):
+        order = PipelineOrchestrator.STAGES
+        deps = stage_dependencies(order, PipelineOrchestrator.STAGE_IO)
+        assert deps["world_building"] == deps["beat_sheet"] == {"high_concept"}
+        # emotional_architecture feeds nothing downstream and shares no writes
+        assert "emotional_architecture" not in deps["character_profiles"]
+        assert "emotional_architecture" not in deps["master_outline"]
+        assert "scene_drafting" in deps["roster_gate"]
+        assert set(order[:-1]) == deps["output_validation"]
+
+    def test_every_stage_declared(self):
+        declared = set(PipelineOrchestrator.STAGE_IO)
+        assert set(PipelineOrchestrator.STAGES) <= declared
+        assert {"self_refinement", "dialogue_polish", "prose_polish"} <= declared
+
+
+class TestCriticalPath:
+    def test_follows_latest_dependency(self):
+        spans = {"a": (0, 1), "b": (1, 4), "c": (1, 2), "d": (4, 5)}
+        deps = {"a": set(), "b": {"a"}, "c": {"a"}, "d": {"b", "c"}}
+        path = critical_path(spans, deps)
+        assert [p["stage"] for p in path] == ["a", "b", "d"]
+        assert path[-1]["via"] == "dependency"
+
+    def test_slot_wait(self):
+        # c is independent but had to wait for b to free the only slot
+        spans = {"a": (0, 1), "b": (1, 3), "c": (3, 4)}
+        deps = {"a": set(), "b": {"a"}, "c": {"a"}}
+        path = critical_path(spans, deps)
+        assert [p["stage"] for p in path] == ["a", "b", "c"]
+        assert path[-1]["via"] == "slot"
+
+    def test_ignores_stage_finishing_after_start(self):
+        spans = {"a": (0, 1), "b": (1.0, 1.02), "c": (1.0, 2)}
+        deps = {"a": set(), "b": {"a"}, "c": {"a"}}
+        assert [p["stage"] for p in critical_path(spans, deps)] == ["a", "c"]
+
+
+# ---------------------------------------------------------------------------
+# Orchestrator scheduling
+# ---------------------------------------------------------------------------
+
+PLANNING = ["high_concept", "world_building", "beat_sheet", "emotional_architecture",
+            "character_profiles", "motif_embedding"]
+
+
+def _fake_runner(orch, delay=0.02, fail=(), raise_on=()):
+    orch.log = []
+    orch.active = 0
+    orch.peak = 0
+
+    async def run_stage(name):
+        orch.log.append(("start", name))
+        orch.active += 1
+        orch.peak = max(orch.peak, orch.active)
+        await asyncio.sleep(delay)
+        orch.active -= 1
+        orch.log.append(("end", name))
+        if name in raise_on:
+            raise RuntimeError(f"{name} exploded")
+        status = StageStatus.FAILED if name in fail else StageStatus.COMPLETED
+        return StageResult(stage_name=name, status=status, tokens_used=10, cost_usd=0.0,
+                           error="boom" if name in fail else None)
+    orch._run_stage = run_stage
+
+
+def _order(orch, event="start"):
+    return [name for kind, name in orch.log if kind == event]
+
+
+class TestScheduler:
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self, project_with_config, stub_orchestrator):
+        orch = stub_orchestrator()
+        _fake_runner(orch)
+        await orch._run_stage_graph(PLANNING, 0)
+
+        assert orch.peak == 2
+        assert orch.state.completed_stages == PLANNING
+        assert orch.state.total_tokens == 60
+        log = orch.log
+        # world_building and beat_sheet both start before either ends
+        assert log.index(("start", "beat_sheet")) < log.index(("end", "world_building"))
+        assert log.index(("start", "motif_embedding")) > log.index(("end", "character_profiles"))
+
+        report = json.loads((project_with_config / "output" / "stage_schedule.json").read_text())
+        assert report["max_concurrent"] == 4
+        assert report["parallelism"] > 1.2
+        assert report["critical_path"][0]["stage"] == "high_concept"
+        assert report["critical_path"][-1]["stage"] == "motif_embedding"
+        assert report["stages"]["character_profiles"]["depends_on"] == ["high_concept", "world_building"]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_one_is_sequential(self, stub_orchestrator):
+        orch = stub_orchestrator({"enhancements": {"stage_scheduler": {"max_concurrent": 1}}})
+        _fake_runner(orch, delay=0.005)
+        await orch._run_stage_graph(PLANNING, 0)
+        assert orch.peak == 1
+        assert _order(orch) == PLANNING
+
+        orch = stub_orchestrator({"enhancements": {"stage_scheduler": {"enabled": False}}})
+        _fake_runner(orch, delay=0.005)
+        await orch._run_stage_graph(PLANNING, 0)
+        assert orch.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed(self, stub_orchestrator):
+        orch = stub_orchestrator()
+        orch.state.completed_stages = ["high_concept", "world_building"]
+        _fake_runner(orch)
+        await orch._run_stage_graph(PLANNING, 1)
+        assert sorted(_order(orch)) == sorted(PLANNING[2:])
+
+    @pytest.mark.asyncio
+    async def test_single_requested_stage_reruns(self, stub_orchestrator):
+        orch = stub_orchestrator()
+        orch.state.completed_stages = ["beat_sheet"]
+        _fake_runner(orch)
+        await orch._run_stage_graph(["beat_sheet"], 0)
+        assert _order(orch) == ["beat_sheet"]
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_block_dependents(self, stub_orchestrator):
+        orch = stub_orchestrator()
+        _fake_runner(orch, fail={"world_building"})
+        await orch._run_stage_graph(PLANNING, 0)
+        assert "character_profiles" in _order(orch)
+        assert "world_building" not in orch.state.completed_stages
+        statuses = {r.stage_name: r.status for r in orch.state.stage_results}
+        assert statuses["world_building"] == StageStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_stops_launches(self, stub_orchestrator):
+        orch = stub_orchestrator({"enhancements": {"stage_scheduler": {"max_concurrent": 1}}})
+        orch._get_threshold = lambda key: 2
+        _fake_runner(orch, fail={"world_building", "beat_sheet"})
+        await orch._run_stage_graph(PLANNING, 0)
+        assert _order(orch) == ["high_concept", "world_building", "beat_sheet"]
+
+    @pytest.mark.asyncio
+    async def test_exception_lets_in_flight_stages_finish(self, project_with_config, stub_orchestrator):
+        orch = stub_orchestrator()
+        _fake_runner(orch, raise_on={"world_building"})
+        await orch._run_stage_graph(PLANNING, 0)
+        assert _order(orch) == ["high_concept", "world_building", "beat_sheet"]
+        assert _order(orch, "end") == ["high_concept", "world_building", "beat_sheet"]
+        assert orch.state.completed_stages == ["high_concept", "beat_sheet"]
+        report = json.loads((project_with_config / "output" / "stage_schedule.json").read_text())
+        assert report["stages"]["world_building"]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_cost_kill_switch(self, stub_orchestrator):
+        orch = stub_orchestrator()
+        orch._check_cost_kill_switch = lambda: True
+        _fake_runner(orch)
+        await orch._run_stage_graph(PLANNING, 0)
+        assert _order(orch) == ["high_concept"]
+
+
+class TestStageIOConfig:
+    def test_developmental_audit_narrowed(self, stub_orchestrator):
+        orch = stub_orchestrator()
+        assert "scenes" in orch._stage_io("developmental_audit").writes
+        orch.state.config["enhancements"] = {"developmental_audit": {"fixes_enabled": False}}
+        io = orch._stage_io("developmental_audit")
+        assert "scenes" not in io.writes and "scenes" in io.reads
+        orch.state.config["enhancements"] = {"developmental_audit": {"enabled": False}}
+        assert orch._stage_io("developmental_audit") == StageIO()
+        assert orch._stage_io("not_a_stage") == BARRIER
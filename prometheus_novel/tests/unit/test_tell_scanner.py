@@ -0,0 +1,78 @@
+"""Tests for the compiled AI-tell scanner (quality.tell_scanner + count_ai_tells memo)."""
+
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from quality.tell_scanner import PhraseScanner, get_scanner
+from stages import pipeline
+from stages.pipeline import AI_TELL_PATTERNS, count_ai_tells
+
+
+def _reference_counts(text):
+    """The per-call loop count_ai_tells used before the compiled scanner."""
+    text_lower = text.lower()
+    counts = {}
+    for pattern in AI_TELL_PATTERNS:
+        p_lower = pattern.lower()
+        if "[" in p_lower:
+            rx = re.escape(p_lower)
+            rx = rx.replace(r"\[x\]", r"\w+").replace(r"\[emotion\]", r"\w+").replace(r"\[character\]", r"\w+")
+            count = len(re.findall(rx, text_lower))
+        else:
+            count = text_lower.count(p_lower)
+        if count:
+            counts[pattern] = count
+    return counts
+
+
+SAMPLES = [
+    "",
+    "Suddenly, time seemed to stop. I felt a sense of dread; I felt cold. SUDDENLY it began tonight.",
+    "A mix of anger and fear. A wave of relief. I knew Marta felt it. I was struck by how truly "
+    "utterly completely absolutely wrong it was. Something about him made me laugh.",
+    "The kitchen smelled of burnt coffee and the window rattled in its frame.",
+]
+
+
+class TestPhraseScanner:
+    def test_matches_reference_loop(self):
+        scanner = get_scanner(AI_TELL_PATTERNS)
+        for text in SAMPLES:
+            assert scanner.scan(text) == _reference_counts(text)
+
+    def test_overlap_rules(self):
+        scanner = PhraseScanner(["seemed to", "time seemed to stop", "aa"])
+        # other patterns may overlap; one pattern never overlaps itself (like str.count)
+        assert scanner.scan("Time seemed to stop. aaaa") == {
+            "seemed to": 1, "time seemed to stop": 1, "aa": 2}
+
+    def test_scanner_built_once_per_pattern_list(self):
+        assert get_scanner(AI_TELL_PATTERNS) is get_scanner(list(AI_TELL_PATTERNS))
+
+
+class TestCountAiTellsMemo:
+    def test_unchanged_text_not_rescanned(self, monkeypatch):
+        monkeypatch.setattr(pipeline, "_AI_TELL_CACHE", type(pipeline._AI_TELL_CACHE)())
+        calls = []
+        real = pipeline.count_words_accurate
+        monkeypatch.setattr(pipeline, "count_words_accurate", lambda t: calls.append(t) or real(t))
+
+        first = count_ai_tells(SAMPLES[1])
+        first["patterns_found"]["suddenly"] = 99        # callers may mutate their copy
+        second = count_ai_tells(SAMPLES[1])
+        assert len(calls) == 1
+        assert second["patterns_found"]["suddenly"] == 2
+        assert second["total_tells"] == sum(_reference_counts(SAMPLES[1]).values())
+
+        count_ai_tells(SAMPLES[1] + " More.")
+        assert len(calls) == 2
+
+    def test_cache_bounded(self, monkeypatch):
+        monkeypatch.setattr(pipeline, "_AI_TELL_CACHE", type(pipeline._AI_TELL_CACHE)())
+        monkeypatch.setattr(pipeline, "_AI_TELL_CACHE_SIZE", 2)
+        for i in range(4):
+            count_ai_tells(f"scene {i} suddenly")
+        assert len(pipeline._AI_TELL_CACHE) == 2
@@ -0,0 +1,192 @@
+"""
+Unit Tests for the windowed (map-reduce) continuity audit
+
+Tests window packing, facts digests, deterministic issue merging and the
+orchestrator's windowed audit on a small-context model.
+"""
+
+import pytest
+import json
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from continuity.windowed_audit import (
+    build_chapter_windows,
+    facts_digest,
+    merge_issues,
+    window_label,
+)
+from stages.pipeline import PipelineOrchestrator
+
+
+def _words(text):
+    return len(text.split())
+
+
+def _scenes(chapters=6, per_chapter=2, words=100):
+    return [
+        {"chapter": ch, "scene_number": sc, "content": " ".join(["word"] * words)}
+        for ch in range(1, chapters + 1)
+        for sc in range(1, per_chapter + 1)
+    ]
+
+
+class TestWindows:
+
+    def test_everything_fits_in_one_window(self):
+        windows = build_chapter_windows(_scenes(), token_budget=100000, count_fn=_words)
+        assert len(windows) == 1
+        assert len(windows[0]) == 12
+
+    def test_windows_overlap_by_one_chapter(self):
+        windows = build_chapter_windows(_scenes(), token_budget=450, count_fn=_words)
+        assert len(windows) > 1
+        labels = [window_label(w) for w in windows]
+        assert labels[0] == "Chapters 1-2"
+        for prev, nxt in zip(windows, windows[1:]):
+            assert max(s["chapter"] for s in prev) == min(s["chapter"] for s in nxt)
+        covered = {s["chapter"] for w in windows for s in w}
+        assert covered == set(range(1, 7))
+
+    def test_oversize_chapter_split_into_scene_groups(self):
+        windows = build_chapter_windows(_scenes(chapters=1, per_chapter=4), token_budget=250,
+                                        count_fn=_words)
+        assert all(len(w) <= 2 for w in windows)
+        assert sum(len(w) for w in windows) >= 4
+
+
+class TestFactsDigest:
+
+    def test_only_earlier_chapters_newest_kept(self):
+        entries = [{"chapter": ch, "scene": 1, "location": f"Place{ch}",
+                    "characters_present": ["Mara"]} for ch in range(1, 6)]
+        digest = facts_digest(entries, before_chapter=4, token_budget=1000, count_fn=_words)
+        assert "Place3" in digest and "Place4" not in digest
+
+        tight = facts_digest(entries, before_chapter=4, token_budget=12, count_fn=_words)
+        assert "Place3" in tight and "Place1" not in tight
+        assert "earlier scenes omitted" in tight
+
+
+class TestMergeIssues:
+
+    def test_overlap_duplicates_collapse_and_sort(self):
+        merged = merge_issues([
+            [{"location": "Chapter 3, Scene 1", "type": "timeline",
+              "description": "Mara arrives at dawn but it was already night"}],
+            [{"location": "Ch3 S1", "type": "Timeline",
+              "description": "Mara arrives at dawn although it was already night", "suggested_fix": "x"},
+             {"location": "Chapter 2, Scene 2", "type": "factual",
+              "description": "The car changes colour"},
+             "not an issue"],
+        ])
+        assert [i["location"] for i in merged] == ["Chapter 2, Scene 2", "Chapter 3, Scene 1"]
+        assert all(set(i) >= {"location", "type", "description", "suggested_fix"} for i in merged)
+
+    def test_distinct_issues_same_scene_kept(self):
+        merged = merge_issues([[
+            {"location": "Chapter 1, Scene 1", "type": "factual", "description": "Eyes change from blue to green"},
+            {"location": "Chapter 1, Scene 1", "type": "factual", "description": "The dog is named Rex then Max"},
+        ]])
+        assert len(merged) == 2
+
+
+class FakeAuditClient:
+    model_name = "qwen2.5:7b"
+
+    def __init__(self):
+        self.prompts = []
+
+    async def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        chapters = sorted({int(c) for c in re.findall(r"Chapter (\d+), Scene", prompt)})
+        issues = [{"location": f"Chapter {ch}, Scene 1", "type": "factual",
+                   "description": f"Detail drift in chapter {ch}", "suggested_fix": "fix"}
+                  for ch in chapters]
+        return SimpleNamespace(content=json.dumps({"issues": issues, "passed": False}),
+                               input_tokens=10, output_tokens=5)
+
+
+class TestOrchestratorWindowedAudit:
+
+    @pytest.mark.asyncio
+    async def test_small_context_model_audits_in_windows(self, project_with_config):
+        orchestrator = PipelineOrchestrator(project_with_config)
+        await orchestrator.initialize()
+        orchestrator.state.config["model_defaults"]["model_context_limit"] = 4000
+        orchestrator.state.scenes = _scenes(chapters=8, per_chapter=2, words=400)
+        client = FakeAuditClient()
+
+        def prompt(manuscript, digest, label):
+            return f"AUDIT {label}\nDIGEST:\n{digest}\n{manuscript}"
+
+        report, tokens = await orchestrator._windowed_continuity_audit(
+            "continuity_audit", client, orchestrator.state.scenes, prompt,
+            max_tokens=500, temperature=0.2,
+        )
+
+        assert report["windows"] == len(client.prompts) > 1
+        assert tokens == 15 * len(client.prompts)
+        # Overlapping chapters reported twice are merged to one issue each
+        assert [i["location"] for i in report["issues"]] == [f"Chapter {c}, Scene 1" for c in range(1, 9)]
+        assert report["passed"] is False
+        # Later windows carry a digest of earlier chapters instead of their prose
+        assert "Ch1 S1" in client.prompts[-1]
+
+    @pytest.mark.asyncio
+    async def test_fits_in_context_is_single_call(self, project_with_config):
+        orchestrator = PipelineOrchestrator(project_with_config)
+        await orchestrator.initialize()
+        orchestrator.state.scenes = _scenes(chapters=3, words=50)
+        client = FakeAuditClient()
+
+        report, _ = await orchestrator._windowed_continuity_audit(
+            "continuity_audit_2", client, orchestrator.state.scenes,
+            lambda m, d, label: f"label={label}\n{m}", max_tokens=500, temperature=0.2,
+        )
+        assert report["windows"] == 1
+        assert client.prompts[0].startswith("label=None")
+
+    @pytest.mark.asyncio
+    async def test_single_window_report_returned_as_parsed(self, project_with_config):
+        orchestrator = PipelineOrchestrator(project_with_config)
+        await orchestrator.initialize()
+        orchestrator.state.scenes = _scenes(chapters=2, words=50)
+        parsed = {"issues": [{"description": "Eye colour changes"}], "passed": True, "summary": "Minor"}
+
+        class Client(FakeAuditClient):
+            async def generate(self, prompt, **kwargs):
+                return SimpleNamespace(content=json.dumps(parsed), input_tokens=1, output_tokens=1)
+
+        report, _ = await orchestrator._windowed_continuity_audit(
+            "continuity_recheck", Client(), orchestrator.state.scenes,
+            lambda m, d, label: m, max_tokens=500, temperature=0.2,
+        )
+        assert report == {**parsed, "windows": 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_window_fails_the_audit(self, project_with_config):
+        orchestrator = PipelineOrchestrator(project_with_config)
+        await orchestrator.initialize()
+        orchestrator.state.config["model_defaults"]["model_context_limit"] = 4000
+        orchestrator.state.scenes = _scenes(chapters=8, per_chapter=2, words=400)
+
+        class Client(FakeAuditClient):
+            async def generate(self, prompt, **kwargs):
+                self.prompts.append(prompt)
+                if len(self.prompts) == 2:
+                    raise RuntimeError("timeout")
+                return SimpleNamespace(content=json.dumps({"issues": [], "passed": True}),
+                                       input_tokens=10, output_tokens=5)
+
+        report, _ = await orchestrator._windowed_continuity_audit(
+            "continuity_audit", Client(), orchestrator.state.scenes,
+            lambda m, d, label: f"AUDIT {label}\n{m}", max_tokens=500, temperature=0.2,
+        )
+        assert report["issues"] == []
+        assert report["windows_failed"] == 1
+        assert report["passed"] is False